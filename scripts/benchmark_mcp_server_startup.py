@@ -0,0 +1,166 @@
+"""Benchmark MCP server cold start and report import time per module.
+
+Each run starts a fresh interpreter with ``-X importtime`` that imports
+``med_paper_assistant.interfaces.mcp.server`` and calls ``create_server``, so
+numbers reflect what a new VS Code window pays when the extension spawns the
+server. Heavy optional libraries must not load during start-up; pass
+``--fail-on-heavy`` to turn that into a non-zero exit for CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess  # nosec B404 - runs the current interpreter with a fixed snippet
+import sys
+from dataclasses import dataclass
+
+HEAVY_MODULES = (
+    "pandas",
+    "numpy",
+    "scipy",
+    "matplotlib",
+    "seaborn",
+    "lifelines",
+    "docx",
+    "pypandoc",
+    "citeproc",
+)
+
+_CHILD_SNIPPET = """
+import json, sys, time
+start = time.perf_counter()
+from med_paper_assistant.interfaces.mcp.server import create_server
+imported = time.perf_counter()
+create_server({surface!r})
+created = time.perf_counter()
+print(json.dumps({{
+    "import_s": imported - start,
+    "create_s": created - imported,
+    "heavy": sorted(m for m in {heavy!r} if m in sys.modules),
+}}))
+"""
+
+
+@dataclass(frozen=True)
+class ModuleTiming:
+    name: str
+    self_us: int
+    cumulative_us: int
+
+
+@dataclass(frozen=True)
+class StartupRun:
+    import_s: float
+    create_s: float
+    heavy: tuple[str, ...]
+    modules: list[ModuleTiming]
+
+    @property
+    def total_s(self) -> float:
+        return self.import_s + self.create_s
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Measure MCP server cold-start time and per-module import cost."
+    )
+    parser.add_argument("--surface", choices=("compact", "full"), default="compact")
+    parser.add_argument("--repeat", type=int, default=3, help="Cold starts to run (median kept).")
+    parser.add_argument("--top", type=int, default=25, help="Modules to list by cumulative time.")
+    parser.add_argument(
+        "--prefix",
+        default="",
+        help="Only list modules starting with this prefix (e.g. med_paper_assistant).",
+    )
+    parser.add_argument("--json", action="store_true", help="Emit a JSON report instead of text.")
+    parser.add_argument(
+        "--fail-on-heavy",
+        action="store_true",
+        help=f"Exit 1 if any of {', '.join(HEAVY_MODULES)} is imported during start-up.",
+    )
+    return parser.parse_args()
+
+
+def parse_importtime(stderr: str) -> list[ModuleTiming]:
+    """Parse ``-X importtime`` lines: ``import time: self | cumulative | name``."""
+    timings: list[ModuleTiming] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header row
+        timings.append(
+            ModuleTiming(fields[2].strip(), int(fields[0]), int(fields[1])),
+        )
+    return timings
+
+
+def run_cold_start(surface: str) -> StartupRun:
+    """Start one fresh interpreter and return its timings."""
+    snippet = _CHILD_SNIPPET.format(surface=surface, heavy=HEAVY_MODULES)
+    result = subprocess.run(  # nosec B603 - fixed interpreter and snippet
+        [sys.executable, "-X", "importtime", "-c", snippet],
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        encoding="utf-8",
+        errors="replace",
+        check=False,
+    )
+    if result.returncode != 0:
+        tail = "\n".join(result.stderr.splitlines()[-20:])
+        raise RuntimeError(f"server start-up failed (exit {result.returncode}):\n{tail}")
+    summary = json.loads(result.stdout.strip().splitlines()[-1])
+    return StartupRun(
+        import_s=float(summary["import_s"]),
+        create_s=float(summary["create_s"]),
+        heavy=tuple(summary["heavy"]),
+        modules=parse_importtime(result.stderr),
+    )
+
+
+def main() -> int:
+    args = parse_args()
+    runs = [run_cold_start(args.surface) for _ in range(max(1, args.repeat))]
+    import_s = statistics.median(run.import_s for run in runs)
+    create_s = statistics.median(run.create_s for run in runs)
+    heavy = sorted({module for run in runs for module in run.heavy})
+
+    # Per-module numbers come from the median run by total start-up time.
+    median_run = sorted(runs, key=lambda run: run.total_s)[len(runs) // 2]
+    timings = [t for t in median_run.modules if t.name.startswith(args.prefix)]
+    top = sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[: args.top]
+
+    if args.json:
+        print(
+            json.dumps(
+                {
+                    "surface": args.surface,
+                    "runs": len(runs),
+                    "import_ms": round(import_s * 1000, 1),
+                    "create_server_ms": round(create_s * 1000, 1),
+                    "heavy_modules_loaded": heavy,
+                    "modules": [t.__dict__ for t in top],
+                },
+                indent=2,
+            )
+        )
+    else:
+        print(f"MCP {args.surface} cold start (median of {len(runs)}):")
+        print(f"  import server:  {import_s * 1000:8.1f} ms")
+        print(f"  create_server:  {create_s * 1000:8.1f} ms")
+        print(f"  heavy modules:  {', '.join(heavy) or 'none'}")
+        print(f"\n{'cumulative ms':>14} {'self ms':>9}  module")
+        for t in top:
+            print(f"{t.cumulative_us / 1000:14.1f} {t.self_us / 1000:9.1f}  {t.name}")
+
+    if args.fail_on_heavy and heavy:
+        print(f"Heavy modules imported at start-up: {', '.join(heavy)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -11,10 +11,13 @@ from .content_integrity import (
     RemoveAiWatermarksInspectionAdapter,
     reinspect_content_integrity,
 )
+from .reinspection_cache import ReinspectionCache, reinspect_cached
 
 __all__ = [
     "C2paProvenanceAdapter",
     "ConservativeVisibleWatermarkHeuristic",
+    "ReinspectionCache",
     "RemoveAiWatermarksInspectionAdapter",
+    "reinspect_cached",
     "reinspect_content_integrity",
 ]
@@ -0,0 +1,150 @@
+"""Content-addressed cache for live content-integrity reinspection.
+
+Insertion and Phase 5–7 gates reinspect every reviewed figure on each check,
+re-running the C2PA reader and the pixel-level detectors on unchanged bytes.
+``reinspect_cached`` hashes the current bytes every time and replays the live
+receipt of an earlier, identical adapter run.
+
+The key covers everything the adapters read: SHA-256 of the current bytes, the
+content-signature and filename MIME identities, the filename (the visible
+heuristic screens it), the installed package and adapter versions, and the
+pixel inspection mode.  Receipts with an adapter ``ERROR`` or unpreserved
+bytes are never stored, so transient failures are retried.
+
+Entries are deliberately kept in process only: a cache file would be as
+editable as the YAML receipt that reinspection exists to distrust.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import importlib.metadata
+import mimetypes
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from med_paper_assistant.domain.value_objects.content_integrity import (
+    REMOVAL_PACKAGE_INSPECTION_MODE,
+    REMOVAL_PACKAGE_PROVIDER,
+    ContentIntegrityReceipt,
+    ProvenanceStatus,
+    RemovalPackageStatus,
+    detect_raster_mime_signature,
+)
+
+from .content_integrity import reinspect_content_integrity
+
+DEFAULT_MAX_ENTRIES = 512
+
+ReinspectionKey = tuple[str, ...]
+
+
+class ReinspectionCache:
+    """Thread-safe in-process LRU of live receipts keyed by inspected bytes."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self.counters = {"hits": 0, "misses": 0, "writes": 0}
+        self._entries: OrderedDict[ReinspectionKey, ContentIntegrityReceipt] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: ReinspectionKey) -> ContentIntegrityReceipt | None:
+        with self._lock:
+            receipt = self._entries.get(key)
+            if receipt is None:
+                self.counters["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.counters["hits"] += 1
+            return receipt
+
+    def put(self, key: ReinspectionKey, receipt: ContentIntegrityReceipt) -> None:
+        if not _cacheable(receipt) or receipt.sha256 != key[0]:
+            return
+        with self._lock:
+            self._entries[key] = receipt
+            self._entries.move_to_end(key)
+            self.counters["writes"] += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss/write counters plus the current entry count."""
+        with self._lock:
+            return {**self.counters, "entries": len(self._entries)}
+
+
+REINSPECTION_CACHE = ReinspectionCache()
+
+
+def reinspect_cached(
+    path: str | Path,
+    *,
+    asset_path: str | None = None,
+    cache: ReinspectionCache | None = REINSPECTION_CACHE,
+) -> ContentIntegrityReceipt:
+    """``reinspect_content_integrity`` that replays receipts for byte-identical input.
+
+    A hit is returned with this call's ``asset_path``; ``cache=None`` always
+    runs the adapters.
+    """
+    candidate = Path(path)
+    if cache is None or not candidate.is_file():
+        return reinspect_content_integrity(candidate, asset_path=asset_path)
+
+    key = reinspection_key(candidate)
+    cached = cache.get(key)
+    if cached is not None:
+        return dataclasses.replace(cached, asset_path=asset_path or candidate.as_posix())
+    receipt = reinspect_content_integrity(candidate, asset_path=asset_path)
+    cache.put(key, receipt)
+    return receipt
+
+
+def reinspection_key(candidate: Path) -> ReinspectionKey:
+    """Cache key for the current bytes of ``candidate`` and the installed adapters."""
+    from med_paper_assistant import __version__
+
+    digest = hashlib.sha256()
+    with candidate.open("rb") as stream:
+        content_mime_type = detect_raster_mime_signature(stream.read(16))
+        stream.seek(0)
+        for chunk in iter(lambda: stream.read(1024 * 1024), b""):
+            digest.update(chunk)
+    declared_mime_type = (
+        {".webp": "image/webp"}.get(candidate.suffix.lower())
+        or mimetypes.guess_type(candidate.name)[0]
+        or "application/octet-stream"
+    )
+    return (
+        digest.hexdigest(),
+        content_mime_type or "",
+        declared_mime_type,
+        candidate.name,
+        __version__,
+        _distribution_version("c2pa-python"),
+        _distribution_version(REMOVAL_PACKAGE_PROVIDER),
+        REMOVAL_PACKAGE_INSPECTION_MODE,
+    )
+
+
+def _distribution_version(name: str) -> str:
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return "absent"
+
+
+def _cacheable(receipt: ContentIntegrityReceipt) -> bool:
+    return (
+        receipt.original_preserved
+        and receipt.sha256 == receipt.sha256_after_inspection
+        and receipt.provenance.status is not ProvenanceStatus.ERROR
+        and receipt.removal_package_check.status is not RemovalPackageStatus.ERROR
+    )
@@ -0,0 +1,375 @@
+"""
+Constraint Plan — Compiled evaluator for DomainConstraintEngine.
+
+``validate_against_constraints`` used to interpret every active constraint on
+each call: one ``\\b<pattern>\\b`` regex per forbidden phrase, a heading regex
+per required section, and a fresh section/paragraph split for the duplicate
+check. A ``ConstraintPlan`` is compiled once per (paper type, learned-constraint
+file version):
+
+- every ``anti_ai_vocabulary`` phrase is merged into one shared
+  ``PhraseMatcher`` (same word-bounded semantics, one scan);
+- each rule becomes a small check over a ``ManuscriptView`` that parses
+  headings, section paragraphs and wikilinks at most once per manuscript.
+
+Plans are cached process-wide. The learned file is re-validated with
+``file_freshness.revalidate`` (stat, plus a hash confirmation inside the
+timestamp-granularity window that then re-stamps the entry).
+
+Usage:
+    plan = load_constraint_plan(paper_type, learned_path, compile_fn)
+    violations = plan.evaluate(content, section="manuscript")
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+from med_paper_assistant.infrastructure.persistence.file_freshness import (
+    FileVersion,
+    revalidate,
+)
+
+_HEADING = re.compile(r"^\s*#{1,4}\s+(.+?)\s*$", re.MULTILINE)
+# Same shape within one line, so a bare ``#`` line cannot absorb the heading below it
+_HEADING_LINE = re.compile(r"^[^\S\n]*#{1,4}[^\S\n]+(.+?)[^\S\n]*$", re.MULTILINE)
+_WIKILINK = re.compile(r"\[\[([^\]]+)\]\]")
+_CACHE_SIZE = 64
+
+CONSENT_KEYWORDS = (
+    "informed consent",
+    "patient consent",
+    "written consent",
+    "irb approval",
+    "irb waiver",
+    "ethics committee",
+    "ethical approval",
+    "institutional review board",
+)
+
+# Violation fields other than constraint_id/rule/category/severity
+Finding = dict[str, str]
+
+
+class ManuscriptView:
+    """Lazily computed views of one text, shared by every check in a plan."""
+
+    def __init__(self, content: str) -> None:
+        self.content = content
+
+    @cached_property
+    def lower(self) -> str:
+        return self.content.lower()
+
+    @cached_property
+    def word_count(self) -> int:
+        return len(self.content.split())
+
+    @cached_property
+    def headings(self) -> list[re.Match[str]]:
+        """Heading matches as the overlap check splits sections (may span lines)."""
+        return list(_HEADING.finditer(self.content))
+
+    @cached_property
+    def heading_offsets(self) -> dict[str, int]:
+        """Lower-cased heading text → offset of its first occurrence."""
+        offsets: dict[str, int] = {}
+        for heading in _HEADING_LINE.finditer(self.content):
+            offsets.setdefault(heading.group(1).lower(), heading.start())
+        return offsets
+
+    @cached_property
+    def section_paragraphs(self) -> dict[str, list[str]]:
+        """``{heading: paragraphs of 3+ words}``; a repeated heading keeps its last body."""
+        headings = self.headings
+        sections: dict[str, list[str]] = {}
+        for i, heading in enumerate(headings):
+            end = headings[i + 1].start() if i + 1 < len(headings) else len(self.content)
+            body = self.content[heading.end() : end].strip()
+            sections[heading.group(1).strip()] = [
+                p.strip() for p in body.split("\n\n") if p.strip() and len(p.split()) >= 3
+            ]
+        return sections
+
+    @cached_property
+    def wikilinks(self) -> set[str]:
+        return set(_WIKILINK.findall(self.content))
+
+
+@dataclass(frozen=True)
+class _Check:
+    constraint_id: str
+    rule: str
+    category: str
+    severity: str
+    params: dict[str, Any]
+    evaluate: Callable[[_Check, ManuscriptView, str, frozenset[str]], list[Finding]]
+    manuscript_only: bool = False
+
+
+class ConstraintPlan:
+    """An ordered, pre-compiled evaluation of one active constraint set."""
+
+    def __init__(
+        self,
+        constraints: list[dict[str, Any]],
+        base_count: int,
+        learned_count: int,
+    ) -> None:
+        from .writing_hooks._phrase_matcher import compile_phrases
+
+        self.total = len(constraints)
+        self.base_count = base_count
+        self.learned_count = learned_count
+        self._checks: list[_Check] = []
+        vocabulary: list[str] = []
+        for c in constraints:
+            rule = c.get("rule", "")
+            spec = _RULES.get(rule)
+            if spec is None:
+                continue
+            evaluate, manuscript_only = spec
+            params = c.get("params") or {}
+            if rule == "anti_ai_vocabulary":
+                vocabulary.extend(params.get("forbidden_patterns", []))
+            self._checks.append(
+                _Check(
+                    constraint_id=c.get("id", ""),
+                    rule=rule,
+                    category=c.get("category", ""),
+                    severity=c.get("severity", "WARNING"),
+                    params=params,
+                    evaluate=evaluate,
+                    manuscript_only=manuscript_only,
+                )
+            )
+        self._vocabulary = compile_phrases(tuple(vocabulary)) if vocabulary else None
+
+    def evaluate(self, content: str, section: str = "manuscript") -> list[dict[str, str]]:
+        """Return violation field dicts in constraint order."""
+        view = ManuscriptView(content)
+        forbidden_found = (
+            frozenset(hit.phrase for hit in self._vocabulary.find_all(view.lower))
+            if self._vocabulary is not None
+            else frozenset()
+        )
+        violations: list[dict[str, str]] = []
+        for check in self._checks:
+            if check.manuscript_only and section != "manuscript":
+                continue
+            for finding in check.evaluate(check, view, section, forbidden_found):
+                violations.append(
+                    {
+                        "constraint_id": check.constraint_id,
+                        "rule": check.rule,
+                        "category": check.category,
+                        "severity": check.severity,
+                        **finding,
+                    }
+                )
+        return violations
+
+
+# ── Rule checks ───────────────────────────────────────────────────
+
+
+def _anti_ai_vocabulary(
+    check: _Check, view: ManuscriptView, section: str, found: frozenset[str]
+) -> list[Finding]:
+    return [
+        {
+            "message": f"AI-typical phrase detected: '{pattern}'",
+            "section": section,
+            "suggestion": f"Rephrase to avoid '{pattern}'",
+        }
+        for pattern in check.params.get("forbidden_patterns", [])
+        if pattern.lower() in found
+    ]
+
+
+def _word_count_range(
+    check: _Check, view: ManuscriptView, section: str, _found: frozenset[str]
+) -> list[Finding]:
+    min_w = check.params.get("min_words", 0)
+    max_w = check.params.get("max_words", 999999)
+    if view.word_count < min_w:
+        return [
+            {
+                "message": f"Word count {view.word_count} below minimum {min_w}",
+                "section": section,
+                "suggestion": f"Expand content to at least {min_w} words",
+            }
+        ]
+    if view.word_count > max_w:
+        return [
+            {
+                "message": f"Word count {view.word_count} exceeds maximum {max_w}",
+                "section": section,
+                "suggestion": f"Reduce content to at most {max_w} words",
+            }
+        ]
+    return []
+
+
+def _required_sections(
+    check: _Check, view: ManuscriptView, _section: str, _found: frozenset[str]
+) -> list[Finding]:
+    return [
+        {
+            "message": f"Required section '{name}' not found",
+            "section": "manuscript",
+            "suggestion": f"Add '## {name}' section",
+        }
+        for name in check.params.get("sections", [])
+        if name.lower() not in view.heading_offsets
+    ]
+
+
+def _methods_before_results(
+    check: _Check, view: ManuscriptView, _section: str, _found: frozenset[str]
+) -> list[Finding]:
+    methods = view.heading_offsets.get("methods")
+    results = view.heading_offsets.get("results")
+    if methods is None or results is None or methods < results:
+        return []
+    return [
+        {
+            "message": "Methods section appears after Results",
+            "section": "manuscript",
+            "suggestion": "Move Methods section before Results",
+        }
+    ]
+
+
+def _minimum_references(
+    check: _Check, view: ManuscriptView, section: str, _found: frozenset[str]
+) -> list[Finding]:
+    min_refs = check.params.get("min_references", 0)
+    cited = len(view.wikilinks)
+    if cited >= min_refs:
+        return []
+    return [
+        {
+            "message": f"Only {cited} unique citations found, minimum {min_refs} required",
+            "section": section,
+            "suggestion": f"Add at least {min_refs - cited} more citations",
+        }
+    ]
+
+
+def _patient_consent_mentioned(
+    check: _Check, view: ManuscriptView, _section: str, _found: frozenset[str]
+) -> list[Finding]:
+    if any(keyword in view.lower for keyword in CONSENT_KEYWORDS):
+        return []
+    return [
+        {
+            "message": "No mention of patient consent or IRB approval found",
+            "section": "manuscript",
+            "suggestion": "Add a statement about informed consent or IRB approval/waiver",
+        }
+    ]
+
+
+def _no_overlap_between_sections(
+    check: _Check, view: ManuscriptView, _section: str, _found: frozenset[str]
+) -> list[Finding]:
+    if len(view.headings) < 2:
+        return []
+    findings: list[Finding] = []
+    seen: dict[str, str] = {}  # normalized paragraph -> section name
+    for sec_name, paragraphs in view.section_paragraphs.items():
+        for para in paragraphs:
+            normalized = " ".join(para.lower().split())
+            if normalized in seen:
+                findings.append(
+                    {
+                        "message": (
+                            f"Duplicate paragraph found in '{seen[normalized]}' and '{sec_name}'"
+                        ),
+                        "section": "manuscript",
+                        "suggestion": "Remove or rewrite the duplicated paragraph",
+                    }
+                )
+                break  # One violation per section pair is enough
+            seen[normalized] = sec_name
+    return findings
+
+
+# rule → (check, only evaluated for section == "manuscript")
+_RULES: dict[str, tuple[Callable[..., list[Finding]], bool]] = {
+    "anti_ai_vocabulary": (_anti_ai_vocabulary, False),
+    "word_count_range": (_word_count_range, False),
+    "required_sections": (_required_sections, True),
+    "methods_before_results": (_methods_before_results, True),
+    "minimum_references": (_minimum_references, False),
+    "patient_consent_mentioned": (_patient_consent_mentioned, True),
+    "no_overlap_between_sections": (_no_overlap_between_sections, True),
+}
+
+
+# ── Plan cache ────────────────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class _Entry:
+    version: FileVersion | None  # None: the learned file was missing or unreadable
+    plan: ConstraintPlan
+
+
+_plans: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+_plans_lock = threading.Lock()
+
+
+def load_constraint_plan(
+    paper_type: str,
+    learned_path: Path,
+    compile_plan: Callable[[bytes | None], ConstraintPlan],
+) -> ConstraintPlan:
+    """
+    Return the cached plan for ``paper_type`` + the current ``learned_path``.
+
+    ``compile_plan`` receives the learned file's bytes (None when it does not
+    exist) and is only called when that file changed since the last compile.
+    """
+    key = (paper_type, str(learned_path))
+    with _plans_lock:
+        entry = _plans.get(key)
+    previous = entry.version if entry is not None else None
+    try:
+        st = learned_path.stat()
+        version, raw = revalidate(learned_path, st, previous)
+    except OSError:
+        if entry is not None and entry.version is None:
+            return entry.plan
+        version, raw = None, None
+    else:
+        if entry is not None and previous is not None and raw is None:
+            if version is not previous:
+                _store(key, _Entry(version, entry.plan))
+            return entry.plan
+
+    entry = _Entry(version, compile_plan(raw))
+    _store(key, entry)
+    return entry.plan
+
+
+def clear_constraint_plans() -> None:
+    """Drop every compiled plan."""
+    with _plans_lock:
+        _plans.clear()
+
+
+def _store(key: tuple[str, str], entry: _Entry) -> None:
+    with _plans_lock:
+        _plans[key] = entry
+        _plans.move_to_end(key)
+        while len(_plans) > _CACHE_SIZE:
+            _plans.popitem(last=False)
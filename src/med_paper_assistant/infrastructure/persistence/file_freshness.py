@@ -0,0 +1,100 @@
+"""
+File Freshness — Shared stat + hash validation for file-backed caches.
+
+Filesystem mtimes are updated from a coarse kernel clock, so a rewrite within
+the same tick can keep ``(mtime, size, inode)`` unchanged. A cache entry whose
+file changed less than ``RACY_WINDOW_NS`` before the entry was recorded is
+"racy": its stat match is confirmed by re-hashing the bytes before it is
+trusted. A confirmed entry is re-stamped with the time of the check, so it
+stops being racy once the window has passed instead of being re-hashed on
+every lookup.
+
+Used by ReferenceCatalog, the journal-profile, constraint-plan, dataset and
+reference artifact digest caches, and Foam graph fingerprints.
+
+Usage:
+    version, raw = revalidate(path, path.stat(), previous)
+    if raw is not None:
+        ...  # contents changed (or first read): re-parse raw
+    # else: previous contents confirmed; store ``version`` (it may be re-stamped)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def is_racy(changed_ns: int, recorded_ns: int) -> bool:
+    """Whether a file changed at ``changed_ns`` may be rewritten unseen after ``recorded_ns``."""
+    return recorded_ns - changed_ns <= RACY_WINDOW_NS
+
+
+@dataclass(frozen=True)
+class FileVersion:
+    """Stat identity and SHA-256 of a file as checked at ``recorded_ns``."""
+
+    mtime_ns: int
+    size: int
+    ino: int
+    sha256: str
+    recorded_ns: int
+
+    @classmethod
+    def from_fields(cls, fields: dict[str, Any]) -> FileVersion:
+        return cls(
+            mtime_ns=fields["mtime_ns"],
+            size=fields["size"],
+            ino=fields["ino"],
+            sha256=fields["sha256"],
+            recorded_ns=fields["recorded_ns"],
+        )
+
+    def fields(self) -> dict[str, Any]:
+        return asdict(self)
+
+    def same_stat(self, st: os.stat_result) -> bool:
+        return (self.mtime_ns, self.size, self.ino) == (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def is_settled(self, st: os.stat_result) -> bool:
+        """Stat unchanged and recorded long enough after the last write to be trusted."""
+        return self.same_stat(st) and not is_racy(self.mtime_ns, self.recorded_ns)
+
+
+def revalidate(
+    path: Path,
+    st: os.stat_result,
+    previous: FileVersion | None,
+) -> tuple[FileVersion, bytes | None]:
+    """
+    Check ``path`` (whose current stat is ``st``) against ``previous``.
+
+    Returns ``(version, raw)``. ``raw`` is None when the contents are those of
+    ``previous``; ``version`` is then ``previous`` itself, or a re-stamped copy
+    once a hash confirmation lies outside the racy window (or the stat moved).
+    Otherwise ``raw`` holds the new bytes.
+    Raises ``OSError`` when the file cannot be read.
+    """
+    if previous is not None and previous.is_settled(st):
+        return previous, None
+    recorded_ns = time.time_ns()
+    raw = path.read_bytes()
+    version = FileVersion(
+        mtime_ns=st.st_mtime_ns,
+        size=st.st_size,
+        ino=st.st_ino,
+        sha256=hashlib.sha256(raw).hexdigest(),
+        recorded_ns=recorded_ns,
+    )
+    if previous is not None and previous.sha256 == version.sha256:
+        # Still inside the window: re-stamping would not let the next check skip the hash
+        if previous.same_stat(st) and is_racy(st.st_mtime_ns, recorded_ns):
+            return previous, None
+        return version, None
+    return version, raw
@@ -0,0 +1,257 @@
+"""
+FoamGraphWriter — Incremental, dependency-tracked writer for generated Foam notes.
+
+ReferenceManager regenerates the knowledge-graph notes (context hubs, library
+overview, figure/table notes, draft-section notes, publish bundle, index) after
+every reference save. This writer keeps that cheap:
+
+- Each materialization stage declares its input files; the stage is skipped and
+  its previous result reused while the inputs' stat fingerprint is unchanged and
+  every note it produced is still on disk untouched.
+- Every note write is compared against the last recorded content hash (or the
+  bytes on disk) and skipped when identical, so unchanged notes keep their
+  mtime and Foam does not re-index them.
+
+State is persisted to ``registry/foam-graph.json`` next to the reference catalog.
+
+Usage:
+    writer = FoamGraphWriter(registry_dir / FoamGraphWriter.STATE_FILE)
+    nodes = writer.stage("context", writer.fingerprint(paths), build_context_notes)
+    writer.write_note(path, title=..., note_type=..., aliases=[], tags=[],
+                      extra_fields={}, body="...")
+    writer.save()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, TypeVar
+
+import structlog
+
+from med_paper_assistant.infrastructure.persistence.file_freshness import is_racy
+from med_paper_assistant.shared.yaml_escape import escape_yaml_value
+
+logger = structlog.get_logger()
+
+T = TypeVar("T")
+
+# Bump when note templates change so cached stage results are not reused.
+GRAPH_SCHEMA_VERSION = 1
+
+
+def append_frontmatter_field(lines: List[str], key: str, value: Any) -> None:
+    """Append one YAML frontmatter field in the Foam-friendly house format."""
+    if value is None:
+        return
+
+    if isinstance(value, bool):
+        lines.append(f"{key}: {'true' if value else 'false'}")
+        return
+
+    if isinstance(value, (int, float)):
+        lines.append(f"{key}: {value}")
+        return
+
+    if isinstance(value, list):
+        if not value:
+            lines.append(f"{key}: []")
+            return
+        lines.append(f"{key}:")
+        for item in value:
+            lines.append(f'  - "{escape_yaml_value(str(item))}"')
+        return
+
+    lines.append(f'{key}: "{escape_yaml_value(str(value))}"')
+
+
+def render_graph_note(
+    *,
+    title: str,
+    note_type: str,
+    aliases: List[str],
+    tags: List[str],
+    extra_fields: dict[str, Any],
+    body: str,
+) -> str:
+    """Render a generated graph note (frontmatter + heading + body)."""
+    lines = [
+        "---",
+        f'title: "{escape_yaml_value(title)}"',
+        f'type: "{escape_yaml_value(note_type)}"',
+    ]
+    append_frontmatter_field(lines, "aliases", aliases)
+    append_frontmatter_field(lines, "tags", tags)
+    for key, value in extra_fields.items():
+        append_frontmatter_field(lines, key, value)
+    lines.extend(["---", "", f"# {title}", ""])
+    if body.strip():
+        lines.append(body.strip())
+        lines.append("")
+    return "\n".join(lines)
+
+
+class FoamGraphWriter:
+    """Skip-identical note writes plus stage-level result reuse keyed by inputs."""
+
+    STATE_FILE = "foam-graph.json"
+
+    def __init__(self, state_path: str | Path) -> None:
+        self._state_path = Path(state_path)
+        self._outputs: dict[str, dict[str, Any]] = {}
+        self._stages: dict[str, dict[str, Any]] = {}
+        self._collecting: list[str] | None = None
+        self._loaded = False
+        self._dirty = False
+        self._lock = threading.RLock()
+        self.stats = {"written": 0, "unchanged": 0, "stages_reused": 0, "stages_built": 0}
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            state = json.loads(self._state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(state, dict) or state.get("version") != GRAPH_SCHEMA_VERSION:
+            return
+        self._outputs = dict(state.get("outputs") or {})
+        self._stages = dict(state.get("stages") or {})
+
+    # ── Fingerprints ───────────────────────────────────────────────
+
+    @staticmethod
+    def _stat_token(path: str, now_ns: int) -> list[Any]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return [path, None]
+        token: list[Any] = [path, st.st_mtime_ns, st.st_size]
+        if os.path.isdir(path):
+            with os.scandir(path) as entries:
+                token.append(sorted(entry.name for entry in entries))
+        elif is_racy(st.st_mtime_ns, now_ns):
+            # May share a coarse mtime with a later rewrite: fingerprint the bytes too
+            try:
+                token.append(hashlib.sha256(Path(path).read_bytes()).hexdigest())
+            except OSError:
+                token.append(None)
+        return token
+
+    def fingerprint(self, paths: Iterable[str | Path], extra: Any = None) -> str:
+        """Hash the stat identity of ``paths`` plus any JSON-serializable ``extra``."""
+        now_ns = time.time_ns()
+        tokens = [self._stat_token(os.fspath(path), now_ns) for path in paths]
+        payload = json.dumps(
+            [GRAPH_SCHEMA_VERSION, tokens, extra], sort_keys=True, ensure_ascii=False, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    # ── Stages ─────────────────────────────────────────────────────
+
+    def _output_intact(self, path: str) -> bool:
+        recorded = self._outputs.get(path)
+        if recorded is None:
+            return False
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        return (st.st_mtime_ns, st.st_size) == (recorded["mtime_ns"], recorded["size"])
+
+    def stage(self, name: str, fingerprint: str, build: Callable[[], T]) -> T:
+        """Return the cached result of ``name`` or run ``build`` and record its outputs."""
+        with self._lock:
+            self._load()
+            cached = self._stages.get(name)
+            if (
+                cached is not None
+                and cached.get("inputs") == fingerprint
+                and all(self._output_intact(path) for path in cached.get("outputs", []))
+            ):
+                self.stats["stages_reused"] += 1
+                return cached["result"]
+
+            self._collecting = []
+            try:
+                result = build()
+            finally:
+                outputs, self._collecting = self._collecting, None
+            self.stats["stages_built"] += 1
+            try:
+                json.dumps(result)
+            except (TypeError, ValueError):
+                self._stages.pop(name, None)
+            else:
+                self._stages[name] = {"inputs": fingerprint, "outputs": outputs, "result": result}
+            self._dirty = True
+            return result
+
+    # ── Writes ─────────────────────────────────────────────────────
+
+    def write_text(self, file_path: str | Path, content: str) -> bool:
+        """Write ``content`` unless the file already holds exactly these bytes."""
+        path = os.fspath(file_path)
+        data = content.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            self._load()
+            if self._collecting is not None:
+                self._collecting.append(path)
+            recorded = self._outputs.get(path)
+            if recorded is not None and recorded["sha256"] == digest and self._output_intact(path):
+                self.stats["unchanged"] += 1
+                return False
+            try:
+                unchanged = Path(path).read_bytes() == data
+            except OSError:
+                unchanged = False
+            if not unchanged:
+                Path(path).write_bytes(data)
+                self.stats["written"] += 1
+            else:
+                self.stats["unchanged"] += 1
+            st = os.stat(path)
+            self._outputs[path] = {"sha256": digest, "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+            self._dirty = True
+            return not unchanged
+
+    def write_note(self, file_path: str | Path, **note: Any) -> bool:
+        """Render and write one graph note; see :func:`render_graph_note`."""
+        return self.write_text(file_path, render_graph_note(**note))
+
+    def prune(self, directory: str | Path, expected_paths: Iterable[str | Path]) -> None:
+        """Delete generated ``*.md`` notes in ``directory`` that are no longer expected."""
+        expected = {str(Path(path).resolve()) for path in expected_paths}
+        dir_path = Path(directory)
+        if not dir_path.exists():
+            return
+        with self._lock:
+            for candidate in dir_path.glob("*.md"):
+                if str(candidate.resolve()) not in expected:
+                    candidate.unlink()
+                    self._outputs.pop(os.fspath(candidate), None)
+                    self._dirty = True
+
+    def save(self) -> None:
+        """Persist output hashes and stage results when anything changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            self._state_path.parent.mkdir(parents=True, exist_ok=True)
+            state = {
+                "version": GRAPH_SCHEMA_VERSION,
+                "outputs": self._outputs,
+                "stages": self._stages,
+            }
+            tmp_path = self._state_path.with_name(f"{self._state_path.name}.tmp")
+            tmp_path.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, self._state_path)
+            self._dirty = False
+            logger.debug("foam_graph_writer.saved", **self.stats)
@@ -44,7 +44,14 @@ from med_paper_assistant.infrastructure.external.approval_signatures import (
     REVIEW_APPROVAL_SCHEMA,
     verify_external_approval_signature,
 )
+from med_paper_assistant.infrastructure.persistence.artifact_digest_cache import (
+    artifact_digest,
+    map_reference_dirs,
+)
 from med_paper_assistant.infrastructure.persistence.data_artifact_tracker import DataArtifactTracker
+from med_paper_assistant.infrastructure.persistence.journal_profile_cache import (
+    load_journal_profile,
+)
 from med_paper_assistant.shared.constants import DEFAULT_WORKFLOW_MODE
 from med_paper_assistant.shared.export_integrity import (
     inspect_docx_xml_smoke,
@@ -178,20 +185,17 @@ def derive_reference_source_revision(
     extraction, or metadata-only fallback invalidates stale analysis.
     """
 
-    def _safe_artifact(path: Path) -> tuple[bool, bytes, str]:
+    def _safe_artifact(path: Path) -> tuple[bool, int, str]:
         try:
-            if path.is_symlink() or not path.is_file():
-                return False, b"", "artifact is not a regular file"
-            raw = path.read_bytes()
+            digest = artifact_digest(path)
         except OSError:
-            return False, b"", "artifact is unreadable"
-        if len(raw) < _MIN_REFERENCE_ARTIFACT_BYTES:
-            return (
-                False,
-                raw,
-                (f"artifact is too small ({len(raw)} < {_MIN_REFERENCE_ARTIFACT_BYTES} bytes)"),
-            )
-        return True, raw, hashlib.sha256(raw).hexdigest()
+            return False, 0, "artifact is unreadable"
+        if digest is None:
+            return False, 0, "artifact is not a regular file"
+        size, sha256 = digest
+        if size < (minimum := _MIN_REFERENCE_ARTIFACT_BYTES):
+            return False, size, f"artifact is too small ({size} < {minimum} bytes)"
+        return True, size, sha256
 
     if metadata.get("fulltext_ingested") is True:
         source_artifacts = sorted((ref_dir / "source").glob("*"))
@@ -275,10 +279,10 @@ def derive_reference_source_revision(
                     resolved.relative_to(artifact_root)
                 except (OSError, ValueError):
                     return False, "Asset-Aware artifact escapes its receipt directory", "", ""
-                valid, raw, digest_or_error = _safe_artifact(candidate)
+                valid, size, digest_or_error = _safe_artifact(candidate)
                 if not valid:
                     return False, f"Asset-Aware {relative_path}: {digest_or_error}", "", ""
-                if entry.get("sha256") != digest_or_error or entry.get("bytes") != len(raw):
+                if entry.get("sha256") != digest_or_error or entry.get("bytes") != size:
                     return False, f"Asset-Aware {relative_path} hash/size mismatch", "", ""
             computed_revision = _canonical_json_sha256(
                 {
@@ -1616,15 +1620,8 @@ class PipelineGateValidator:
 
     def _get_paper_type_from_profile(self) -> str:
         """Read paper.type from journal-profile.yaml (default: 'original-research')."""
-        jp_path = self._project_dir / "journal-profile.yaml"
-        if jp_path.is_file():
-            try:
-                with open(jp_path, encoding="utf-8") as f:
-                    profile = yaml.safe_load(f) or {}
-                return profile.get("paper", {}).get("type", "original-research")
-            except Exception:
-                logger.warning("Failed to read paper type from journal-profile.yaml")
-        return "original-research"
+        profile = load_journal_profile(self._project_dir)
+        return profile.paper_type if profile is not None else "original-research"
 
     def _resolve_min_references(self, paper_type: str) -> int:
         """Resolve minimum reference count for a paper type.
@@ -1640,18 +1637,11 @@ class PipelineGateValidator:
         )
 
         # 1. journal-profile.yaml override
-        jp_path = self._project_dir / "journal-profile.yaml"
-        if jp_path.is_file():
-            try:
-                with open(jp_path, encoding="utf-8") as f:
-                    profile = yaml.safe_load(f) or {}
-                min_limits = profile.get("references", {}).get("minimum_reference_limits", {})
-                if isinstance(min_limits, dict):
-                    val = min_limits.get(paper_type)
-                    if val is not None:
-                        return int(val)
-            except (OSError, ValueError, yaml.YAMLError):
-                pass
+        profile = load_journal_profile(self._project_dir)
+        if profile is not None:
+            val = profile.min_reference_limits.get(paper_type)
+            if val is not None:
+                return val
 
         # 2. Built-in defaults per paper type
         if paper_type in DEFAULT_MINIMUM_REFERENCES:
@@ -2215,14 +2205,11 @@ class PipelineGateValidator:
 
         analysis_failures: list[str] = []
         fulltext_failures: list[str] = []
-        for ref_dir, metadata in records:
+        # Artifact hashing dominates; reference directories are independent
+        statuses = map_reference_dirs(lambda r: self._validate_fulltext_status(*r), records)
+        for (ref_dir, metadata), status in zip(records, statuses):
             total_refs += 1
-            (
-                fulltext_valid,
-                fulltext_details,
-                source_revision_sha256,
-                source_kind,
-            ) = self._validate_fulltext_status(ref_dir, metadata)
+            fulltext_valid, fulltext_details, source_revision_sha256, source_kind = status
             if fulltext_valid and metadata.get("fulltext_ingested") is True:
                 ingested_count += 1
             else:
@@ -0,0 +1,227 @@
+"""
+Post-Write Queue — Deferred, coalescing side effects after draft writes.
+
+Every draft write used to rebuild the Foam graph and run 2–4 git
+subprocesses before returning. Those side effects only need to be current
+when something reads them (gates, exports, a project switch), so drafts now
+hand them to this queue instead:
+
+- ``submit(key, action, item)`` records the work under a coalescing key
+  (e.g. ``("foam", project_root)``). Repeated submissions within the debounce
+  window merge into one run; ``action`` receives every submitted ``item``, so
+  ten rapid patches produce one graph refresh and one commit
+  (``queue_auto_commit`` / ``GitAutoCommitter.commit_batch``).
+- A daemon worker runs due work once no mutating tool call holds the queue
+  (``hold()``), so background refreshes never interleave with a write.
+- ``flush()`` is the barrier: it waits for in-flight work, then runs
+  everything pending now; only one batch runs at a time. Gates, exports and project switches call it before reading
+  state; it also runs at interpreter exit.
+
+``MEDPAPER_POST_WRITE_DEBOUNCE_MS`` sets the window (default 500 ms); ``0``
+runs side effects inline, as before. Failures are logged, never raised —
+the same contract as ``GitAutoCommitter``.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+import time
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+
+from .git_auto_committer import AutoCommit, GitAutoCommitter
+
+logger = structlog.get_logger()
+
+DEFAULT_DEBOUNCE_MS = 500.0
+DEBOUNCE_ENV = "MEDPAPER_POST_WRITE_DEBOUNCE_MS"
+# A burst of writes postpones its side effects by at most this many windows.
+_MAX_DELAY_WINDOWS = 10
+
+PostWriteAction = Callable[[list[Any]], object]
+
+
+def resolve_debounce_seconds(debounce_ms: float | None = None) -> float:
+    """Explicit value, else ``MEDPAPER_POST_WRITE_DEBOUNCE_MS``, else the default."""
+    if debounce_ms is None:
+        try:
+            debounce_ms = float(os.environ.get(DEBOUNCE_ENV, DEFAULT_DEBOUNCE_MS))
+        except ValueError:
+            debounce_ms = DEFAULT_DEBOUNCE_MS
+    return max(0.0, debounce_ms) / 1000
+
+
+@dataclass
+class _Pending:
+    action: PostWriteAction
+    first: float
+    due: float
+    items: list[Any] = field(default_factory=list)
+
+
+class PostWriteQueue:
+    """Debounced, coalescing queue of post-write side effects."""
+
+    def __init__(self, debounce_ms: float | None = None) -> None:
+        self.debounce_s = resolve_debounce_seconds(debounce_ms)
+        self._pending: dict[Hashable, _Pending] = {}
+        self._cond = threading.Condition()
+        self._running = False
+        self._holders = 0
+        self._local = threading.local()
+        self._worker: threading.Thread | None = None
+        self.stats = {"submitted": 0, "coalesced": 0, "runs": 0, "failures": 0}
+
+    def submit(self, key: Hashable, action: PostWriteAction, item: Any = None) -> None:
+        """Schedule ``action`` under ``key``; a later submit replaces the action."""
+        if self.debounce_s <= 0:
+            self._run([_Pending(action, 0.0, 0.0, [item])])
+            return
+        now = time.monotonic()
+        with self._cond:
+            self.stats["submitted"] += 1
+            entry = self._pending.get(key)
+            if entry is None:
+                self._pending[key] = _Pending(action, now, now + self.debounce_s, [item])
+            else:
+                self.stats["coalesced"] += 1
+                entry.action = action
+                entry.items.append(item)
+                latest = entry.first + self.debounce_s * _MAX_DELAY_WINDOWS
+                entry.due = min(now + self.debounce_s, latest)
+            self._ensure_worker()
+            self._cond.notify_all()
+
+    def pending(self) -> int:
+        """Number of coalesced work items waiting to run."""
+        with self._cond:
+            return len(self._pending)
+
+    @contextmanager
+    def hold(self) -> Iterator[None]:
+        """Keep the background worker parked while a mutating call runs."""
+        depth = getattr(self._local, "depth", 0)
+        with self._cond:
+            if depth == 0:
+                self._cond.wait_for(lambda: not self._running)
+            self._holders += 1
+        self._local.depth = depth + 1
+        try:
+            yield
+        finally:
+            self._local.depth = depth
+            with self._cond:
+                self._holders -= 1
+                self._cond.notify_all()
+
+    def flush(self) -> None:
+        """
+        Run all pending side effects now and wait for in-flight ones.
+
+        The batch runs on the calling thread (inside a held call the worker is
+        parked anyway) and claims ``_running``, so two flushes never run the
+        same side effects — e.g. two ``git commit``s — at once.
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: not self._running)
+            batch, self._pending = list(self._pending.values()), {}
+            self._running = True
+        try:
+            self._run(batch)
+        finally:
+            with self._cond:
+                self._running = False
+                self._cond.notify_all()
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._work, name="post-write-queue", daemon=True)
+            self._worker.start()
+
+    def _next_batch(self) -> list[_Pending]:
+        """Block until some work is due and no call holds the queue; claim it."""
+        with self._cond:
+            while True:
+                if self._pending and not self._running and not self._holders:
+                    now = time.monotonic()
+                    due = [key for key, entry in self._pending.items() if entry.due <= now]
+                    if due:
+                        self._running = True
+                        return [self._pending.pop(key) for key in due]
+                    timeout = min(entry.due for entry in self._pending.values()) - now
+                    self._cond.wait(timeout)
+                else:
+                    self._cond.wait()
+
+    def _work(self) -> None:
+        while True:
+            batch = self._next_batch()
+            try:
+                self._run(batch)
+            finally:
+                with self._cond:
+                    self._running = False
+                    self._cond.notify_all()
+
+    def _run(self, batch: list[_Pending]) -> None:
+        for entry in batch:
+            try:
+                entry.action(entry.items)
+            except Exception:
+                self.stats["failures"] += 1
+                logger.warning("Post-write side effect failed", exc_info=True)
+            self.stats["runs"] += 1
+
+
+_queue: PostWriteQueue | None = None
+_queue_lock = threading.Lock()
+
+
+def get_post_write_queue() -> PostWriteQueue:
+    """Process-wide post-write queue, flushed at interpreter exit."""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = PostWriteQueue()
+            atexit.register(_queue.flush)
+        return _queue
+
+
+def queue_auto_commit(
+    project_root: str | os.PathLike[str],
+    change: AutoCommit,
+    committer: GitAutoCommitter | None = None,
+) -> None:
+    """Defer a logical auto-commit; those due together become one git commit."""
+    root = os.path.abspath(project_root)
+
+    def commit(changes: list[AutoCommit]) -> bool:
+        # Probing the repo is deferred along with the commit itself.
+        return (committer or GitAutoCommitter(root)).commit_batch(changes)
+
+    get_post_write_queue().submit(("git", root), commit, change)
+
+
+def queue_draft_side_effects(
+    project_root: str | os.PathLike[str],
+    filename: str,
+    reason: str,
+    *,
+    refresh_graph: Callable[[], object] | None = None,
+    committer: GitAutoCommitter | None = None,
+) -> None:
+    """Defer a draft write's Foam graph refresh and git auto-commit.
+
+    Both coalesce per project root: a burst of writes costs one refresh and
+    one commit covering every changed draft.
+    """
+    if refresh_graph is not None:
+        key = ("foam", os.path.abspath(project_root))
+        get_post_write_queue().submit(key, lambda _: refresh_graph())
+    queue_auto_commit(project_root, GitAutoCommitter.draft_change(filename, reason), committer)
@@ -32,6 +32,7 @@ from ...shared.constants import (
 from ...shared.path_guard import normalize_relative_filename, resolve_child_path
 from ...shared.slug import slugify_name
 from ..services.concept_template_reader import ConceptTemplateReader
+from .post_write_queue import get_post_write_queue
 from .project_memory_manager import ProjectMemoryManager
 
 logger = structlog.get_logger()
@@ -316,9 +317,7 @@ class ProjectManager:
         try:
             from .reference_manager import ReferenceManager
 
-            ref_manager = ReferenceManager(project_manager=self)
-            stats = ref_manager.refresh_foam_graph()
-            return {"success": True, **stats}
+            return {"success": True, **ReferenceManager(project_manager=self).refresh_foam_graph()}
         except Exception as e:
             logger.warning("Foam graph refresh failed", error=str(e))
             return {"success": False, "error": str(e)}
@@ -680,6 +679,7 @@ class ProjectManager:
 
     def _save_current_project(self, slug: str) -> None:
         """Save current project to .current_project file."""
+        get_post_write_queue().flush()  # deferred side effects target the active project
         self.state_file.write_text(slug)
 
     def _create_project_config(
@@ -0,0 +1,132 @@
+"""
+ReferenceIdentityRegistry — Content-hash, PMID, and DOI lookups for saved references.
+
+Owns ``registry/by-hash.json``, ``registry/by-pmid.json`` and
+``registry/by-doi.json``, which map secondary identifiers to the canonical
+``references/{unique_id}`` directory used for deduplication and identity
+resolution.
+
+Architecture:
+    Infrastructure layer store owned by ReferenceManager. Outside a batch every
+    upsert/remove rewrites the affected JSON files immediately (the historical
+    behaviour). Inside ``deferred()`` the registries are loaded once, mutated in
+    memory, and each changed file is written exactly once when the block exits,
+    so bulk imports no longer rewrite all three files per reference.
+
+Usage:
+    registry = ReferenceIdentityRegistry(project_root / "registry")
+    registry.lookup("hash", content_hash)
+    with registry.deferred():
+        for payload in payloads:
+            registry.upsert(payload)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+REGISTRY_FILES = {"hash": "by-hash.json", "pmid": "by-pmid.json", "doi": "by-doi.json"}
+
+
+def _identity_keys(payload: Dict[str, Any]) -> Dict[str, str]:
+    keys: Dict[str, str] = {}
+    if payload.get("content_hash"):
+        keys["hash"] = str(payload["content_hash"])
+    if payload.get("pmid"):
+        keys["pmid"] = str(payload["pmid"])
+    if payload.get("doi"):
+        keys["doi"] = str(payload["doi"]).lower()
+    return keys
+
+
+class ReferenceIdentityRegistry:
+    """The three identity registries, with optional write coalescing."""
+
+    def __init__(self, registry_dir: str | os.PathLike[str]) -> None:
+        self._registry_dir = os.fspath(registry_dir)
+        self._buffer: Optional[Dict[str, Dict[str, str]]] = None
+        self._dirty: set[str] = set()
+        self._depth = 0
+        self._lock = threading.RLock()
+
+    def path(self, kind: str) -> str:
+        """Return the JSON path of the ``hash``/``pmid``/``doi`` registry."""
+        return os.path.join(self._registry_dir, REGISTRY_FILES[kind])
+
+    def _load(self, kind: str) -> Dict[str, str]:
+        if self._buffer is not None and kind in self._buffer:
+            return self._buffer[kind]
+        try:
+            with open(self.path(kind), "r", encoding="utf-8") as handle:
+                registry = json.load(handle)
+        except (OSError, ValueError):
+            registry = {}
+        if not isinstance(registry, dict):
+            registry = {}
+        if self._buffer is not None:
+            self._buffer[kind] = registry
+        return registry
+
+    def _store(self, kind: str, registry: Dict[str, str]) -> None:
+        if self._buffer is not None:
+            self._dirty.add(kind)
+            return
+        self._write(kind, registry)
+
+    def _write(self, kind: str, registry: Dict[str, str]) -> None:
+        os.makedirs(self._registry_dir, exist_ok=True)
+        with open(self.path(kind), "w", encoding="utf-8") as handle:
+            json.dump(registry, handle, indent=2, ensure_ascii=False)
+
+    def lookup(self, kind: str, key: str) -> Optional[str]:
+        """Return the reference id registered for ``key``, if any."""
+        with self._lock:
+            return self._load(kind).get(key)
+
+    def remove(self, reference_id: str, payload: Optional[Dict[str, Any]] = None) -> None:
+        """Drop every registry entry that points at ``reference_id``."""
+        explicit = _identity_keys(payload or {})
+        with self._lock:
+            for kind in REGISTRY_FILES:
+                registry = self._load(kind)
+                if not registry:
+                    continue
+                stale = [key for key, value in registry.items() if value == reference_id]
+                if explicit.get(kind) and registry.get(explicit[kind]) == reference_id:
+                    stale.append(explicit[kind])
+                for key in stale:
+                    registry.pop(key, None)
+                if stale:
+                    self._store(kind, registry)
+
+    def upsert(self, payload: Dict[str, Any]) -> None:
+        """Point the payload's hash/PMID/DOI at its ``unique_id``."""
+        with self._lock:
+            if payload.get("unique_id"):
+                self.remove(payload["unique_id"])
+            for kind, key in _identity_keys(payload).items():
+                registry = self._load(kind)
+                registry[key] = payload["unique_id"]
+                self._store(kind, registry)
+
+    @contextmanager
+    def deferred(self) -> Iterator[None]:
+        """Buffer registry writes and flush each changed file once on exit."""
+        with self._lock:
+            if self._buffer is None:
+                self._buffer = {}
+            self._depth += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._depth -= 1
+                if self._depth == 0 and self._buffer is not None:
+                    buffer, dirty = self._buffer, sorted(self._dirty)
+                    self._buffer, self._dirty = None, set()
+                    for kind in dirty:
+                        self._write(kind, buffer[kind])
@@ -3,10 +3,11 @@ import json
 import os
 import re
 import shutil
+from contextlib import contextmanager
 from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional
 
 import structlog
 
@@ -17,6 +18,15 @@ from med_paper_assistant.domain.entities.reference import has_verified_pubmed_pr
 from med_paper_assistant.domain.services.reference_converter import (
     ReferenceConverter,
 )
+from med_paper_assistant.infrastructure.persistence.foam_graph_writer import FoamGraphWriter
+from med_paper_assistant.infrastructure.persistence.reference_batch_import import (
+    ReferenceBatchReport,
+    import_verified_references,
+)
+from med_paper_assistant.infrastructure.persistence.reference_catalog import ReferenceCatalog
+from med_paper_assistant.infrastructure.persistence.reference_identity_registry import (
+    ReferenceIdentityRegistry,
+)
 from med_paper_assistant.shared.path_guard import (
     PathGuardError,
     normalize_relative_filename,
@@ -27,6 +37,16 @@ from med_paper_assistant.shared.yaml_escape import escape_yaml_value
 
 logger = structlog.get_logger()
 
+# Files outside references/ that feed the figure/table graph notes.
+_DATA_ARTIFACT_MANIFESTS = (
+    ".audit/data-artifacts.yaml",
+    "data-artifacts.yaml",
+    "data-artifacts.yml",
+    "data-artifacts/manifest.yaml",
+    "data-artifacts/manifest.yml",
+)
+_ASSET_AWARE_GRAPH_INPUTS = ("manifest.json", "blocks.json", "segmentation.json")
+
 
 class ReferenceManager:
     """
@@ -57,6 +77,10 @@ class ReferenceManager:
         self._project_manager = project_manager
         self._converter = ReferenceConverter()
         self._pubmed_api_url = pubmed_api_url
+        self._catalogs: Dict[tuple[str, str], ReferenceCatalog] = {}
+        self._graph_writers: Dict[str, FoamGraphWriter] = {}
+        self._identity_registries: Dict[str, ReferenceIdentityRegistry] = {}
+        self._deferred_log: Optional[List[str]] = None
         # Note: Directory is created on-demand when saving references,
         # not at initialization to avoid polluting root directory
 
@@ -166,49 +190,30 @@ class ReferenceManager:
             deduped.append(entry)
         return deduped
 
-    def _remove_identity_registry_entries(
-        self, reference_id: str, payload: Optional[Dict[str, Any]] = None
-    ) -> None:
-        payload = payload or {}
-        registry_specs = [
-            (self._hash_registry_path(), [payload.get("content_hash")]),
-            (self._pmid_registry_path(), [str(payload.get("pmid"))] if payload.get("pmid") else []),
-            (
-                self._doi_registry_path(),
-                [str(payload.get("doi")).lower()] if payload.get("doi") else [],
-            ),
-        ]
-
-        for registry_path, explicit_keys in registry_specs:
-            registry = self._read_json_file(registry_path, {})
-            if not registry:
-                continue
-
-            changed = False
-            for key in explicit_keys:
-                if key and registry.get(key) == reference_id:
-                    registry.pop(key, None)
-                    changed = True
-
-            for key, value in list(registry.items()):
-                if value == reference_id:
-                    registry.pop(key, None)
-                    changed = True
-
-            if changed:
-                self._write_json_file(registry_path, registry)
-
     def _registry_dir(self) -> str:
         return os.path.join(self._project_root_dir(), "registry")
 
-    def _hash_registry_path(self) -> str:
-        return os.path.join(self._registry_dir(), "by-hash.json")
+    def _catalog(self) -> ReferenceCatalog:
+        key = (os.path.abspath(self.base_dir), os.path.abspath(self._registry_dir()))
+        if key not in self._catalogs:
+            self._catalogs[key] = ReferenceCatalog(*key)
+        return self._catalogs[key]
+
+    def _identity_registry(self) -> ReferenceIdentityRegistry:
+        registry_dir = os.path.abspath(self._registry_dir())
+        if registry_dir not in self._identity_registries:
+            self._identity_registries[registry_dir] = ReferenceIdentityRegistry(registry_dir)
+        return self._identity_registries[registry_dir]
 
-    def _pmid_registry_path(self) -> str:
-        return os.path.join(self._registry_dir(), "by-pmid.json")
+    def _graph_writer(self) -> FoamGraphWriter:
+        state_path = os.path.join(os.path.abspath(self._registry_dir()), FoamGraphWriter.STATE_FILE)
+        if state_path not in self._graph_writers:
+            self._graph_writers[state_path] = FoamGraphWriter(state_path)
+        return self._graph_writers[state_path]
 
-    def _doi_registry_path(self) -> str:
-        return os.path.join(self._registry_dir(), "by-doi.json")
+    def _iter_reference_metadata(self) -> List[tuple[str, Dict[str, Any]]]:
+        """Sorted ``(ref_id, metadata)`` pairs from the catalog; treat as read-only."""
+        return sorted(self._catalog().snapshot().items())
 
     def _ensure_workspace_scaffolding(self) -> None:
         """Create the minimal directories needed for notes and registries."""
@@ -282,65 +287,11 @@ class ReferenceManager:
             return summary[: max_chars - 3].rstrip() + "..."
         return summary
 
-    def _append_frontmatter_field(self, lines: List[str], key: str, value: Any) -> None:
-        if value is None:
-            return
-
-        if isinstance(value, bool):
-            lines.append(f"{key}: {'true' if value else 'false'}")
-            return
-
-        if isinstance(value, (int, float)):
-            lines.append(f"{key}: {value}")
-            return
-
-        if isinstance(value, list):
-            if not value:
-                lines.append(f"{key}: []")
-                return
-            lines.append(f"{key}:")
-            for item in value:
-                lines.append(f'  - "{self._yaml_escape(str(item))}"')
-            return
-
-        lines.append(f'{key}: "{self._yaml_escape(str(value))}"')
-
-    def _write_graph_note(
-        self,
-        file_path: str,
-        *,
-        title: str,
-        note_type: str,
-        aliases: List[str],
-        tags: List[str],
-        extra_fields: Dict[str, Any],
-        body: str,
-    ) -> None:
-        lines = [
-            "---",
-            f'title: "{self._yaml_escape(title)}"',
-            f'type: "{self._yaml_escape(note_type)}"',
-        ]
-        self._append_frontmatter_field(lines, "aliases", aliases)
-        self._append_frontmatter_field(lines, "tags", tags)
-        for key, value in extra_fields.items():
-            self._append_frontmatter_field(lines, key, value)
-        lines.extend(["---", "", f"# {title}", ""])
-        if body.strip():
-            lines.append(body.strip())
-            lines.append("")
-
-        Path(file_path).write_text("\n".join(lines), encoding="utf-8")
+    def _write_graph_note(self, file_path: str, **note: Any) -> None:
+        self._graph_writer().write_note(file_path, **note)
 
     def _prune_stale_graph_notes(self, directory: str, expected_paths: List[str]) -> None:
-        expected = {str(Path(path).resolve()) for path in expected_paths}
-        dir_path = Path(directory)
-        if not dir_path.exists():
-            return
-
-        for candidate in dir_path.glob("*.md"):
-            if str(candidate.resolve()) not in expected:
-                candidate.unlink()
+        self._graph_writer().prune(directory, expected_paths)
 
     def _extract_first_author_slug(self, payload: Dict[str, Any]) -> str:
         authors_full = payload.get("authors_full", [])
@@ -507,11 +458,7 @@ class ReferenceManager:
         expected_paths: List[str] = []
         project_slug = self._current_project_slug()
 
-        for reference_id in sorted(self.list_references()):
-            metadata = self.get_metadata(reference_id)
-            if not metadata:
-                continue
-
+        for reference_id, metadata in self._iter_reference_metadata():
             citation_key = metadata.get("citation_key") or reference_id
             title = metadata.get("title", reference_id)
             year = str(metadata.get("year", "")).strip()
@@ -797,8 +744,6 @@ class ReferenceManager:
         return {"alias": "library-overview", "title": "Library Overview", "path": note_path}
 
     def _normalize_foam_tag(self, value: str) -> str:
-        import re
-
         normalized = str(value).strip().lower().lstrip("#")
         normalized = normalized.replace("_", "-")
         normalized = re.sub(r"\s+", "-", normalized)
@@ -967,10 +912,7 @@ class ReferenceManager:
         publish_dir = self._publish_notes_dir()
         entries: List[Dict[str, str]] = []
 
-        for ref_id in sorted(self.list_references()):
-            metadata = self.get_metadata(ref_id)
-            if not metadata:
-                continue
+        for ref_id, metadata in self._iter_reference_metadata():
             citation_key = metadata.get("citation_key") or ref_id
             try:
                 note_path = self._reference_dir(ref_id) / self._citation_note_filename(citation_key)
@@ -1247,10 +1189,7 @@ class ReferenceManager:
                     break
         else:
             all_metadata: List[Dict[str, Any]] = []
-            for ref_id in self.list_references():
-                metadata = self.get_metadata(ref_id)
-                if not metadata:
-                    continue
+            for ref_id, metadata in self._iter_reference_metadata():
                 metadata = dict(metadata)
                 metadata["unique_id"] = metadata.get("unique_id") or ref_id
                 all_metadata.append(metadata)
@@ -1597,8 +1536,6 @@ class ReferenceManager:
         elif authors:
             first_author = authors[0].split()[0].lower() if authors[0] else ""
 
-        import re
-
         first_author = re.sub(r"[^a-z0-9]", "", first_author)
         if not first_author:
             first_author = "local"
@@ -1692,39 +1629,42 @@ class ReferenceManager:
 
         return payload
 
-    def _upsert_identity_registry(self, payload: Dict[str, Any]) -> None:
-        if payload.get("unique_id"):
-            self._remove_identity_registry_entries(payload["unique_id"])
-
-        if payload.get("content_hash"):
-            by_hash = self._read_json_file(self._hash_registry_path(), {})
-            by_hash[payload["content_hash"]] = payload["unique_id"]
-            self._write_json_file(self._hash_registry_path(), by_hash)
-
-        if payload.get("pmid"):
-            by_pmid = self._read_json_file(self._pmid_registry_path(), {})
-            by_pmid[str(payload["pmid"])] = payload["unique_id"]
-            self._write_json_file(self._pmid_registry_path(), by_pmid)
-
-        if payload.get("doi"):
-            by_doi = self._read_json_file(self._doi_registry_path(), {})
-            by_doi[str(payload["doi"]).lower()] = payload["unique_id"]
-            self._write_json_file(self._doi_registry_path(), by_doi)
-
     def _append_log(self, event_type: str, payload: Dict[str, Any]) -> None:
-        log_path = os.path.join(self._notes_dir(), "log.md")
-        if not os.path.exists(log_path):
-            with open(log_path, "w", encoding="utf-8") as handle:
-                handle.write("# Knowledge Base Log\n\n")
-
         title = payload.get("title", payload.get("unique_id", "unknown"))
         entry = (
             f"- {payload.get('saved_at', '') or __import__('datetime').datetime.now().isoformat()} "
             f"[{event_type}] {payload.get('unique_id', '')} :: {title} "
             f"(source={payload.get('source', '')}, trust={payload.get('trust_level', '')})\n"
         )
+        if self._deferred_log is not None:
+            self._deferred_log.append(entry)
+        else:
+            self._write_log_entries([entry])
+
+    def _write_log_entries(self, entries: List[str]) -> None:
+        log_path = os.path.join(self._notes_dir(), "log.md")
+        if not os.path.exists(log_path):
+            with open(log_path, "w", encoding="utf-8") as handle:
+                handle.write("# Knowledge Base Log\n\n")
         with open(log_path, "a", encoding="utf-8") as handle:
-            handle.write(entry)
+            handle.writelines(entries)
+
+    @contextmanager
+    def batch_writes(self) -> Iterator[None]:
+        """Defer identity-registry, log.md, and Foam index writes to one commit."""
+        if self._deferred_log is not None:
+            yield
+            return
+        self._deferred_log = []
+        try:
+            with self._identity_registry().deferred():
+                yield
+        finally:
+            entries, self._deferred_log = self._deferred_log, None
+            if entries:
+                self._write_log_entries(entries)
+                self._rebuild_index()
+            self._catalog().flush()
 
     def _extract_wikilinks(self, content: str) -> List[str]:
         seen: set[str] = set()
@@ -1850,11 +1790,7 @@ class ReferenceManager:
 
     def _load_reference_asset_contexts(self) -> List[Dict[str, Any]]:
         contexts: List[Dict[str, Any]] = []
-        for reference_id in self.list_references():
-            metadata = self.get_metadata(reference_id)
-            if not metadata:
-                continue
-
+        for reference_id, metadata in self._iter_reference_metadata():
             artifact_dir = self._asset_aware_artifact_dir(reference_id)
             manifest = self._read_json_file(str(artifact_dir / "manifest.json"), {})
             blocks = self._read_json_file(str(artifact_dir / "blocks.json"), [])
@@ -2427,12 +2363,38 @@ class ReferenceManager:
         self._prune_stale_graph_notes(self._draft_section_notes_dir(), expected_paths)
         return nodes
 
+    def _graph_stages(self) -> tuple[Any, Any, Any, Any]:
+        """Materialize graph notes, reusing each stage while its inputs are unchanged."""
+        writer, root = self._graph_writer(), Path(self._project_root_dir())
+        inputs = [self._current_project_slug(), self._catalog().versions()]
+        context = writer.stage(
+            "context", writer.fingerprint([], inputs), self._materialize_reference_context_notes
+        )
+        overview = writer.stage(
+            "overview",
+            writer.fingerprint([], [inputs, context]),
+            lambda: self._materialize_library_overview(context),
+        )
+        asset_paths = [root / path for path in ("results/manifest.json", *_DATA_ARTIFACT_MANIFESTS)]
+        for folder in ("figures", "tables"):
+            asset_paths += [root / "results" / folder, *sorted(root.glob(f"results/{folder}/**/*"))]
+        for ref_id in inputs[1]:
+            artifact_dir = self._asset_aware_artifact_dir(ref_id)
+            asset_paths += [artifact_dir / name for name in _ASSET_AWARE_GRAPH_INPUTS]
+        assets = writer.stage(
+            "assets", writer.fingerprint(asset_paths, inputs), self._materialize_asset_graph_notes
+        )
+        draft_paths = [root / "drafts", *sorted(root.glob("drafts/*.md"))]
+        drafts = writer.stage(
+            "drafts",
+            writer.fingerprint(draft_paths, [inputs[0], assets.get("aliases", {})]),
+            lambda: self._materialize_draft_section_notes(assets.get("aliases", {})),
+        )
+        return context, overview, assets, drafts
+
     def _rebuild_index(self) -> Dict[str, Any]:
         index_path = os.path.join(self._notes_dir(), "index.md")
-        context_nodes = self._materialize_reference_context_notes()
-        library_overview = self._materialize_library_overview(context_nodes)
-        asset_nodes = self._materialize_asset_graph_notes()
-        draft_section_nodes = self._materialize_draft_section_notes(asset_nodes.get("aliases", {}))
+        context_nodes, library_overview, asset_nodes, draft_section_nodes = self._graph_stages()
         library_pages = self._iter_library_pages()
         lines = [
             "# Knowledge Base Index",
@@ -2460,11 +2422,7 @@ class ReferenceManager:
         lines.extend(["", f"- Context hubs: {context_nodes['count']}"])
         lines.extend(["", "## References", ""])
 
-        for ref_id in sorted(self.list_references()):
-            metadata = self.get_metadata(ref_id)
-            if not metadata:
-                continue
-
+        for ref_id, metadata in self._iter_reference_metadata():
             citation_key = metadata.get("citation_key") or ref_id
             title = metadata.get("title", ref_id)
             year = metadata.get("year", "")
@@ -2539,8 +2497,8 @@ class ReferenceManager:
         for page in publish_pages:
             lines.append(f"- [[{page['alias']}]]: {page['title']} [publish]")
 
-        with open(index_path, "w", encoding="utf-8") as handle:
-            handle.write("\n".join(lines) + "\n")
+        self._graph_writer().write_text(index_path, "\n".join(lines) + "\n")
+        self._graph_writer().save()
         return {
             "references": len(self.list_references()),
             "draft_sections": len(draft_section_nodes),
@@ -2554,7 +2512,9 @@ class ReferenceManager:
     def refresh_foam_graph(self) -> Dict[str, Any]:
         """Regenerate index and graph-facing note nodes for the active project."""
         self._ensure_workspace_scaffolding()
-        return self._rebuild_index()
+        result = self._rebuild_index()
+        self._catalog().flush()
+        return result
 
     def _copy_source_artifact(self, file_path: str | Path, ref_dir: str | Path) -> str:
         source_dir = os.path.join(os.fspath(ref_dir), "source")
@@ -2773,10 +2733,12 @@ class ReferenceManager:
         with open(os.path.join(ref_dir, md_filename), "w", encoding="utf-8") as handle:
             handle.write(content)
 
-        self._upsert_identity_registry(payload)
-        if rebuild_index:
+        self._identity_registry().upsert(payload)
+        self._catalog().record(payload["unique_id"])
+        if rebuild_index and self._deferred_log is None:
             self._rebuild_index()
         self._append_log(log_event, payload)
+        self._catalog().flush()
         return str(ref_dir)
 
     def _update_reference_metadata(
@@ -2916,7 +2878,7 @@ class ReferenceManager:
             return f"Error: Local file not found: {file_path}"
 
         content_hash = self.compute_content_hash(file_path)
-        existing_ref_id = self._read_json_file(self._hash_registry_path(), {}).get(content_hash)
+        existing_ref_id = self._identity_registry().lookup("hash", content_hash)
         if existing_ref_id and self.check_reference_exists(existing_ref_id):
             existing = self.get_metadata(existing_ref_id)
             citation_key = existing.get("citation_key", existing_ref_id)
@@ -2993,7 +2955,7 @@ class ReferenceManager:
             return f"Error: Empty {source_kind} content."
 
         content_hash = self._compute_text_hash(normalized_content)
-        existing_ref_id = self._read_json_file(self._hash_registry_path(), {}).get(content_hash)
+        existing_ref_id = self._identity_registry().lookup("hash", content_hash)
         if existing_ref_id and self.check_reference_exists(existing_ref_id):
             existing = self.get_metadata(existing_ref_id)
             citation_key = existing.get("citation_key", existing_ref_id)
@@ -3352,7 +3314,7 @@ class ReferenceManager:
         )
 
         if source_ref_dir != target_ref_dir and os.path.exists(source_ref_dir):
-            self._remove_identity_registry_entries(reference_id, local_metadata)
+            self._identity_registry().remove(reference_id, local_metadata)
             shutil.rmtree(source_ref_dir)
 
         self._rebuild_index()
@@ -3469,7 +3431,6 @@ class ReferenceManager:
         # Import here to avoid circular dependency
         from med_paper_assistant.infrastructure.services.pubmed_api_client import (
             PubMedVerificationError,
-            VerifiedArticlePayload,
             get_pubmed_api_client,
         )
 
@@ -3512,6 +3473,15 @@ class ReferenceManager:
                 f"Example: unified_search(query='{pmid}[pmid]')"
             )
 
+        return self.save_verified_article(pmid, article, agent_notes=agent_notes)
+
+    def save_verified_article(self, pmid: str, article: object, agent_notes: str = "") -> str:
+        """Persist a ``VerifiedArticlePayload``; any other object is rejected."""
+        from med_paper_assistant.infrastructure.services.pubmed_api_client import (
+            PubMedVerificationError,
+            VerifiedArticlePayload,
+        )
+
         if not isinstance(article, VerifiedArticlePayload):
             logger.warning(
                 "reference_manager.pubmed_verification_rejected",
@@ -3536,6 +3506,19 @@ class ReferenceManager:
         verified_article["_pubmed_transport_payload"] = deepcopy(article.article)
         return self._save_reference_article(verified_article)
 
+    def save_references_mcp(
+        self, pmids: List[str], agent_notes: str = "", fetch_if_missing: bool = True
+    ) -> ReferenceBatchReport:
+        """Save many PMIDs with one bulk fetch and one registry/log/index commit."""
+        from med_paper_assistant.infrastructure.services.pubmed_api_client import (
+            get_pubmed_api_client,
+        )
+
+        client = get_pubmed_api_client(base_url=self._pubmed_api_url)
+        return import_verified_references(
+            self, client, pmids, agent_notes=agent_notes, fetch_if_missing=fetch_if_missing
+        )
+
     def _generate_citation_key(self, article: Dict[str, Any]) -> str:
         """
         Generate a human-friendly citation key with PMID for verification.
@@ -3564,8 +3547,6 @@ class ReferenceManager:
             first_author = "unknown"
 
         # Clean up special characters
-        import re
-
         first_author = re.sub(r"[^a-z]", "", first_author)
 
         # Format: author + year + underscore + PMID for easy verification
@@ -4059,17 +4040,8 @@ class ReferenceManager:
         return content
 
     def list_references(self) -> List[str]:
-        """
-        List all saved references.
-
-        Returns:
-            List of PMIDs.
-        """
-        if not os.path.exists(self.base_dir):
-            return []
-        return [
-            d for d in os.listdir(self.base_dir) if os.path.isdir(os.path.join(self.base_dir, d))
-        ]
+        """List every saved reference directory name (usually the PMID)."""
+        return self._catalog().reference_ids()
 
     def get_metadata(self, pmid: str) -> Dict[str, Any]:
         """
@@ -4082,21 +4054,18 @@ class ReferenceManager:
             Dictionary containing metadata, or empty dict if not found locally.
         """
         try:
-            ref_dir = self._reference_dir(pmid)
+            safe_id = self._reference_dir(pmid).name
         except (PathGuardError, ValueError):
             return {}
-        metadata_path = os.path.join(ref_dir, "metadata.json")
+        return deepcopy(self._catalog().get(safe_id) or {})
 
-        if os.path.exists(metadata_path):
-            try:
-                with open(metadata_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Error reading metadata for {pmid}: {e}")
-                return {}
+    def resolve_reference_id(self, identifier: str) -> Optional[str]:
+        """Map a unique_id, PMID, DOI, or citation key to its reference directory name."""
+        return self._catalog().resolve(identifier)
 
-        # Reference not found locally
-        return {}
+    def resolve_reference_ids(self, identifiers: Iterable[str]) -> Dict[str, str]:
+        """``resolve_reference_id`` for many identifiers against one catalog snapshot."""
+        return self._catalog().resolve_all(identifiers)
 
     def get_reference_details(self, pmid: str) -> Dict[str, Any]:
         """
@@ -4142,23 +4111,25 @@ class ReferenceManager:
             query: Keyword to search in titles and abstracts.
 
         Returns:
-            List of matching metadata dictionaries.
+            Matching metadata dictionaries, best BM25 match first.
         """
-        results = []
         query = query.lower()
+        scores = {hit.reference_id: hit.score for hit in self._catalog().search(query)}
+        results = [
+            (ref_id, meta)
+            for ref_id, meta in self._iter_reference_metadata()
+            if query in meta.get("title", "").lower() or query in meta.get("abstract", "").lower()
+        ]
+        results.sort(key=lambda item: -scores.get(item[0], 0.0))
+        return [deepcopy(meta) for _ref_id, meta in results]
 
-        for pmid in self.list_references():
-            meta = self.get_metadata(pmid)
-            if not meta:
-                continue
-
-            title = meta.get("title", "").lower()
-            abstract = meta.get("abstract", "").lower()
-
-            if query in title or query in abstract:
-                results.append(meta)
-
-        return results
+    def search_ranked(self, terms: str | List[str], limit: int = 20) -> List[Dict[str, Any]]:
+        """BM25-rank the library against a query; hits carry score and matched terms."""
+        catalog = self._catalog()
+        return [
+            {**hit.to_dict(), "metadata": deepcopy(catalog.get(hit.reference_id) or {})}
+            for hit in catalog.search(terms, limit=limit)
+        ]
 
     def check_reference_exists(self, pmid: str) -> bool:
         """
@@ -4316,8 +4287,6 @@ class ReferenceManager:
         Returns:
             Dict with success status and deleted files info.
         """
-        import shutil
-
         try:
             ref_dir = self._reference_dir(pmid)
         except (PathGuardError, ValueError) as exc:
@@ -4367,11 +4336,13 @@ class ReferenceManager:
                     deleted_files.append(rel_path)
 
             metadata = self.get_metadata(pmid)
-            self._remove_identity_registry_entries(pmid, metadata)
+            self._identity_registry().remove(pmid, metadata)
             shutil.rmtree(ref_dir)
+            self._catalog().discard(ref_dir.name)
             self._rebuild_index()
             if metadata:
                 self._append_log("delete_reference", metadata)
+            self._catalog().flush()
 
             return {
                 "success": True,
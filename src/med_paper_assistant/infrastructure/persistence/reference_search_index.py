@@ -0,0 +1,155 @@
+"""
+ReferenceSearchIndex — In-memory inverted index with BM25 ranking over references.
+
+Indexes the searchable metadata fields of every saved reference (title,
+abstract, keywords, MeSH terms, full-text section headings) so local search and
+citation suggestion can score a whole multi-term query against the library in
+one pass instead of re-scanning every reference per term.
+
+Architecture:
+    Infrastructure layer helper owned by ReferenceCatalog. The catalog hands
+    over ``{reference_id: (content_sha256, metadata)}`` on each query and the
+    index re-tokenizes only references whose metadata hash changed, so saves,
+    identity merges, deletions, and hand edits are picked up incrementally.
+
+Scoring:
+    BM25 with field-weighted term frequency (a light BM25F): a title hit counts
+    more than an abstract hit, and document length is the weighted token count.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass
+from typing import Any, Iterable, Mapping
+
+_TOKEN_PATTERN = re.compile(r"[^\W_]+", re.UNICODE)
+
+FIELD_WEIGHTS: dict[str, float] = {
+    "title": 2.0,
+    "keywords": 1.5,
+    "mesh_terms": 1.5,
+    "abstract": 1.0,
+    "fulltext_sections": 0.5,
+}
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-case word tokens of two or more characters."""
+    return [token for token in _TOKEN_PATTERN.findall(text.lower()) if len(token) > 1]
+
+
+def _field_text(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, list):
+        return " ".join(item for item in value if isinstance(item, str))
+    return ""
+
+
+@dataclass(frozen=True)
+class RankedReference:
+    """One BM25 hit: the reference, its score, and the query terms it matched."""
+
+    reference_id: str
+    score: float
+    matched_terms: tuple[str, ...]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for tool output."""
+        return {
+            "reference_id": self.reference_id,
+            "score": self.score,
+            "matched_terms": list(self.matched_terms),
+        }
+
+
+class ReferenceSearchIndex:
+    """Incrementally maintained token → reference postings with BM25 scoring."""
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self) -> None:
+        self._postings: dict[str, dict[str, float]] = {}
+        self._doc_terms: dict[str, tuple[str, ...]] = {}
+        self._doc_length: dict[str, float] = {}
+        self._versions: dict[str, str] = {}
+        self._total_length = 0.0
+
+    def __len__(self) -> int:
+        return len(self._doc_length)
+
+    def sync(self, documents: Mapping[str, tuple[str, Mapping[str, Any]]]) -> None:
+        """Bring the index in line with ``{reference_id: (version, metadata)}``."""
+        for ref_id in [ref_id for ref_id in self._versions if ref_id not in documents]:
+            self.remove(ref_id)
+        for ref_id, (version, metadata) in documents.items():
+            if self._versions.get(ref_id) != version:
+                self.add(ref_id, metadata, version=version)
+
+    def add(self, ref_id: str, metadata: Mapping[str, Any], *, version: str = "") -> None:
+        """Index (or re-index) one reference."""
+        self.remove(ref_id)
+        weighted: dict[str, float] = {}
+        for field_name, weight in FIELD_WEIGHTS.items():
+            for token in tokenize(_field_text(metadata.get(field_name))):
+                weighted[token] = weighted.get(token, 0.0) + weight
+        for token, frequency in weighted.items():
+            self._postings.setdefault(token, {})[ref_id] = frequency
+        length = float(sum(weighted.values()))
+        self._doc_terms[ref_id] = tuple(weighted)
+        self._doc_length[ref_id] = length
+        self._versions[ref_id] = version
+        self._total_length += length
+
+    def remove(self, ref_id: str) -> None:
+        """Drop one reference from every posting list."""
+        for token in self._doc_terms.pop(ref_id, ()):
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.pop(ref_id, None)
+            if not postings:
+                del self._postings[token]
+        self._total_length -= self._doc_length.pop(ref_id, 0.0)
+        self._versions.pop(ref_id, None)
+
+    def search(
+        self, query: str | Iterable[str], *, limit: int | None = None
+    ) -> list[RankedReference]:
+        """Score every reference against all query terms at once.
+
+        ``query`` may be free text or an iterable of terms/phrases; phrases are
+        tokenized and each distinct token contributes once.
+        """
+        texts = [query] if isinstance(query, str) else list(query)
+        terms = list(dict.fromkeys(token for text in texts for token in tokenize(text)))
+        doc_count = len(self._doc_length)
+        if not terms or not doc_count:
+            return []
+        avg_length = (self._total_length / doc_count) or 1.0
+
+        scores: dict[str, float] = {}
+        matched: dict[str, list[str]] = {}
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            df = len(postings)
+            idf = math.log(1.0 + (doc_count - df + 0.5) / (df + 0.5))
+            for ref_id, frequency in postings.items():
+                norm = self.K1 * (1.0 - self.B + self.B * self._doc_length[ref_id] / avg_length)
+                scores[ref_id] = scores.get(ref_id, 0.0) + idf * (
+                    frequency * (self.K1 + 1.0) / (frequency + norm)
+                )
+                matched.setdefault(ref_id, []).append(term)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [
+            RankedReference(ref_id, round(score, 6), tuple(matched[ref_id]))
+            for ref_id, score in ranked
+        ]
@@ -30,6 +30,7 @@ from typing import Any
 
 import structlog
 
+from .journal_profile_cache import JournalProfile, load_journal_profile
 from .writing_hooks._models import HookIssue, HookResult
 
 logger = structlog.get_logger()
@@ -82,33 +83,17 @@ class ReviewHooksEngine:
     def __init__(self, project_dir: str | Path) -> None:
         self._project_dir = Path(project_dir)
         self._audit_dir = self._project_dir / ".audit"
-        self._journal_profile: dict[str, Any] | None = None
         self._load_journal_profile()
 
     def _load_journal_profile(self) -> None:
-        """Load journal-profile.yaml if available."""
-        profile_path = self._project_dir / "journal-profile.yaml"
-        if profile_path.is_file():
-            try:
-                import yaml
-
-                with open(profile_path, encoding="utf-8") as f:
-                    self._journal_profile = yaml.safe_load(f) or {}
-            except Exception:
-                logger.warning("Failed to load journal-profile.yaml")
-                self._journal_profile = None
+        """Load journal-profile.yaml if available (shared, stat-validated cache)."""
+        self._profile: JournalProfile | None = load_journal_profile(self._project_dir)
 
     def _get_max_references(self) -> int | None:
         """Get max references from journal profile (paper-type-specific > global)."""
-        if not self._journal_profile:
+        if self._profile is None:
             return None
-        refs_cfg = self._journal_profile.get("references", {})
-        paper_type = self._journal_profile.get("paper", {}).get("type", "")
-        type_limits = refs_cfg.get("reference_limits", {})
-        if paper_type and paper_type in type_limits:
-            return int(type_limits[paper_type])
-        max_refs = refs_cfg.get("max_references")
-        return int(max_refs) if max_refs is not None else None
+        return self._profile.max_references_for(self._profile.declared_paper_type)
 
     # ── R1: Review Report Depth ────────────────────────────────────
 
@@ -2,7 +2,8 @@
 ToolInvocationStore — Workspace-level persistent telemetry for MCP tool calls.
 
 Records per-tool invocation counts, success/error/misuse rates, and error types.
-Persists to workspace_root/.audit/tool-telemetry.yaml
+Persists to workspace_root/.audit/tool-telemetry.yaml (snapshot) plus
+workspace_root/.audit/tool-telemetry.journal.jsonl (append-only event journal).
 
 Architecture:
     Infrastructure layer service. Workspace-level (not per-project) because
@@ -10,6 +11,17 @@ Architecture:
     Bridged from tool_logging.py via module-level singleton initialized at
     server startup (initialize_tool_tracking).
 
+    Every tool call records two or three events, so recording must not
+    rewrite the YAML file. ``record_*`` bumps the in-memory counters and
+    buffers one compact JSON line; a timer appends the buffer to the journal
+    (``MEDPAPER_TELEMETRY_FLUSH_MS``, default 1000; ``0`` appends on every
+    call). ``compact()`` folds the counters into the snapshot and truncates
+    the journal — when the journal passes ``MEDPAPER_TELEMETRY_COMPACT_BYTES``
+    (default 256 KiB) and at interpreter exit. Loading reads the snapshot and
+    replays the journal, so readers (MetaLearningEngine D9, tool health) see
+    the merged view; a store created in the same process first flushes any
+    live store writing the same journal.
+
 Design rationale (CONSTITUTION §23):
     - Tool self-improvement requires objective usage metrics
     - Metrics survive across sessions via persistent YAML storage
@@ -26,6 +38,11 @@ Usage:
 
 from __future__ import annotations
 
+import atexit
+import json
+import os
+import threading
+import weakref
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -35,6 +52,59 @@ import yaml
 
 logger = structlog.get_logger()
 
+DEFAULT_FLUSH_MS = 1000.0
+FLUSH_ENV = "MEDPAPER_TELEMETRY_FLUSH_MS"
+DEFAULT_COMPACT_BYTES = 256 * 1024
+COMPACT_ENV = "MEDPAPER_TELEMETRY_COMPACT_BYTES"
+
+# Journal event kinds → the counter they bump
+_COUNTERS = {
+    "i": "invocation_count",
+    "s": "success_count",
+    "e": "error_count",
+    "m": "misuse_count",
+}
+
+# Stores with unflushed events, keyed by journal path (flushed on read and exit)
+_live_stores: weakref.WeakValueDictionary[Path, ToolInvocationStore] = weakref.WeakValueDictionary()
+_live_lock = threading.Lock()
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return max(0.0, float(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+def _new_tool() -> dict[str, Any]:
+    return {
+        "invocation_count": 0,
+        "success_count": 0,
+        "error_count": 0,
+        "misuse_count": 0,
+        "error_types": [],
+    }
+
+
+def _apply_event(tools: dict[str, Any], kind: str, tool_name: str, error_type: str = "") -> None:
+    """Apply one journal event to the ``tools`` mapping."""
+    counter = _COUNTERS[kind]
+    entry = tools.get(tool_name)
+    if entry is None:
+        entry = tools[tool_name] = _new_tool()
+    entry[counter] += 1
+    if error_type and error_type not in entry["error_types"]:
+        entry["error_types"].append(error_type)
+
+
+@atexit.register
+def _compact_live_stores() -> None:
+    with _live_lock:
+        stores = list(_live_stores.values())
+    for store in stores:
+        store.compact()
+
 
 class ToolInvocationStore:
     """
@@ -43,21 +113,43 @@ class ToolInvocationStore:
     Tracks per-tool: invocation_count, success_count, error_count,
     misuse_count, and distinct error_types seen.
 
-    Data file: workspace_root/.audit/tool-telemetry.yaml
+    Data files: workspace_root/.audit/tool-telemetry.yaml (snapshot) and
+    workspace_root/.audit/tool-telemetry.journal.jsonl (events since then)
     """
 
     DATA_FILE = "tool-telemetry.yaml"
+    JOURNAL_FILE = "tool-telemetry.journal.jsonl"
 
     def __init__(self, workspace_root: str | Path) -> None:
         self._dir = Path(workspace_root) / ".audit"
         self._path = self._dir / self.DATA_FILE
+        self._journal_path = self._dir / self.JOURNAL_FILE
+        self._key = self._journal_path.resolve()
         self._data: dict[str, Any] | None = None
+        self._lock = threading.RLock()
+        self._buffer: list[str] = []
+        self._timer: threading.Timer | None = None
+        self._flush_s = _env_number(FLUSH_ENV, DEFAULT_FLUSH_MS) / 1000
+        self._compact_bytes = int(_env_number(COMPACT_ENV, DEFAULT_COMPACT_BYTES))
 
     def _load(self) -> dict[str, Any]:
-        """Load or initialize telemetry data. Caches in memory after first load."""
+        """Load the snapshot and replay the journal. Caches in memory after first load."""
         if self._data is not None:
             return self._data
 
+        with _live_lock:
+            live = _live_stores.get(self._key)
+        if live is not None and live is not self:
+            live.flush()
+
+        with self._lock:
+            if self._data is None:
+                data = self._load_snapshot()
+                self._replay_journal(data["tools"])
+                self._data = data
+            return self._data
+
+    def _load_snapshot(self) -> dict[str, Any]:
         if self._path.is_file():
             try:
                 loaded = yaml.safe_load(self._path.read_text(encoding="utf-8"))
@@ -65,39 +157,91 @@ class ToolInvocationStore:
                     # Ensure required keys are present even if file was partially written
                     loaded.setdefault("version", 1)
                     loaded.setdefault("tools", {})
-                    self._data = loaded
-                    return self._data
+                    return loaded
             except (yaml.YAMLError, OSError) as e:
                 logger.warning("tool_invocation_store.load_failed", error=str(e))
 
-        self._data = {
+        return {
             "version": 1,
             "tools": {},
             "created_at": datetime.now().isoformat(),
         }
-        return self._data
 
-    def _save(self) -> None:
-        """Persist telemetry data to disk."""
-        self._dir.mkdir(parents=True, exist_ok=True)
+    def _replay_journal(self, tools: dict[str, Any]) -> None:
+        """Apply journal events written since the last compaction."""
+        if not self._journal_path.is_file():
+            return
+        skipped = 0
+        with self._journal_path.open(encoding="utf-8", errors="replace") as journal:
+            for line in journal:
+                try:
+                    kind, tool_name, *rest = json.loads(line)
+                    _apply_event(tools, kind, tool_name, *rest)
+                except (ValueError, TypeError, KeyError):
+                    skipped += 1  # torn tail from a crash, or a foreign line
+        if skipped:
+            logger.warning("tool_invocation_store.journal_lines_skipped", count=skipped)
+
+    def _record(self, kind: str, tool_name: str, error_type: str = "") -> None:
+        event = [kind, tool_name, error_type] if error_type else [kind, tool_name]
+        line = json.dumps(event, ensure_ascii=False)
         data = self._load()
-        data["updated_at"] = datetime.now().isoformat()
-        self._path.write_text(
-            yaml.dump(data, default_flow_style=False, allow_unicode=True, sort_keys=False),
-            encoding="utf-8",
-        )
-
-    def _ensure_tool(self, tool_name: str) -> None:
-        """Initialize entry for tool_name if not already present."""
+        with self._lock:
+            _apply_event(data["tools"], kind, tool_name, error_type)
+            self._buffer.append(line)
+            if self._flush_s <= 0:
+                self._flush_locked()
+            elif self._timer is None:
+                with _live_lock:
+                    _live_stores[self._key] = self
+                self._timer = threading.Timer(self._flush_s, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Append buffered events to the journal; compact once it is large."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._buffer:
+            return
+        lines, self._buffer = self._buffer, []
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            with self._journal_path.open("a", encoding="utf-8") as journal:
+                journal.write("\n".join(lines) + "\n")
+                size = journal.tell()
+        except OSError as e:
+            logger.warning("tool_invocation_store.flush_failed", error=str(e))
+            return
+        if size >= self._compact_bytes:
+            self._compact_locked()
+
+    def compact(self) -> None:
+        """Fold all events into the YAML snapshot and truncate the journal."""
+        with self._lock:
+            self._flush_locked()
+            if self._data is not None or self._journal_path.is_file():
+                self._compact_locked()
+
+    def _compact_locked(self) -> None:
         data = self._load()
-        if tool_name not in data["tools"]:
-            data["tools"][tool_name] = {
-                "invocation_count": 0,
-                "success_count": 0,
-                "error_count": 0,
-                "misuse_count": 0,
-                "error_types": [],
-            }
+        data["updated_at"] = datetime.now().isoformat()
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            tmp = self._path.with_suffix(".yaml.tmp")
+            tmp.write_text(
+                yaml.dump(data, default_flow_style=False, allow_unicode=True, sort_keys=False),
+                encoding="utf-8",
+            )
+            os.replace(tmp, self._path)
+            self._journal_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("tool_invocation_store.compact_failed", error=str(e))
 
     def record_invocation(self, tool_name: str) -> None:
         """
@@ -106,9 +250,7 @@ class ToolInvocationStore:
         Args:
             tool_name: MCP tool function name
         """
-        self._ensure_tool(tool_name)
-        self._load()["tools"][tool_name]["invocation_count"] += 1
-        self._save()
+        self._record("i", tool_name)
 
     def record_success(self, tool_name: str) -> None:
         """
@@ -117,9 +259,7 @@ class ToolInvocationStore:
         Args:
             tool_name: MCP tool function name
         """
-        self._ensure_tool(tool_name)
-        self._load()["tools"][tool_name]["success_count"] += 1
-        self._save()
+        self._record("s", tool_name)
 
     def record_error(self, tool_name: str, error_type: str | None = None) -> None:
         """
@@ -129,14 +269,7 @@ class ToolInvocationStore:
             tool_name: MCP tool function name
             error_type: Exception class name (e.g., "ValueError"). Deduplicated.
         """
-        self._ensure_tool(tool_name)
-        data = self._load()
-        data["tools"][tool_name]["error_count"] += 1
-        if error_type:
-            existing = data["tools"][tool_name]["error_types"]
-            if error_type not in existing:
-                existing.append(error_type)
-        self._save()
+        self._record("e", tool_name, error_type or "")
 
     def record_misuse(self, tool_name: str) -> None:
         """
@@ -145,9 +278,7 @@ class ToolInvocationStore:
         Args:
             tool_name: MCP tool function name
         """
-        self._ensure_tool(tool_name)
-        self._load()["tools"][tool_name]["misuse_count"] += 1
-        self._save()
+        self._record("m", tool_name)
 
     def get_all_stats(self) -> dict[str, dict[str, Any]]:
         """
@@ -183,6 +314,11 @@ class ToolInvocationStore:
 
     def reset(self) -> None:
         """Clear all telemetry data. For testing only."""
-        self._data = None
-        if self._path.is_file():
-            self._path.unlink()
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._buffer = []
+            self._data = None
+            self._path.unlink(missing_ok=True)
+            self._journal_path.unlink(missing_ok=True)
@@ -3,16 +3,19 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from functools import partial
 from pathlib import Path
 
 from ._applicability import is_applicable, not_applicable_result, type_specific_hook_ids
 from ._data_artifacts import DataArtifactsMixin
 from ._git import GitHooksMixin
+from ._hook_cache import HookCacheMixin, install_hook_cache
 from ._journal_config import JournalConfigMixin
 from ._manuscript import ManuscriptHooksMixin
 from ._models import HookIssue, HookResult
 from ._post_write import PostWriteHooksMixin
 from ._precommit import PreCommitMixin
+from ._runner import HookRunnerMixin, resolve_hook_workers
 from ._section_quality import SectionQualityMixin
 from ._text_utils import TextUtilsMixin
 
@@ -26,6 +29,8 @@ class WritingHooksEngine(
     DataArtifactsMixin,
     PreCommitMixin,
     GitHooksMixin,
+    HookRunnerMixin,
+    HookCacheMixin,
 ):
     """
     Unified engine for all writing-quality hooks.
@@ -38,12 +43,22 @@ class WritingHooksEngine(
     - P-series (PreCommitMixin): P1, P2, P4, P5, P7 — pre-commit integrity
     - G-series (GitHooksMixin): G9 — git status
 
-    Batch runners orchestrate hooks into logical groups.
+    Batch runners orchestrate hooks into logical groups and run each group's
+    independent hooks on a bounded thread pool (``hook_workers``; 1 = serial).
+    Per-hook wall/CPU time of the last batch is available via ``hook_timings()``.
+    Pure hooks replay from ``.audit/hook-cache/``; see ``hook_cache_stats()``.
     """
 
-    def __init__(self, project_dir: Path | str) -> None:
+    def __init__(
+        self,
+        project_dir: Path | str,
+        hook_workers: int | None = None,
+        result_cache: bool | None = None,
+    ) -> None:
         # JournalConfigMixin.__init__ sets _project_dir, _audit_dir, etc.
         JournalConfigMixin.__init__(self, project_dir)
+        self.hook_workers = resolve_hook_workers(hook_workers)
+        self._configure_result_cache(result_cache)  # None → on when .audit/ exists
 
     # ── Batch Runner: Post-Write ───────────────────────────────────
 
@@ -59,21 +74,25 @@ class WritingHooksEngine(
         Returns:
             Dict mapping hook_id -> HookResult.
         """
-        return {
-            "A1": self.check_word_count_compliance(content, section_name=section),
-            "A2": self.check_citation_density(content, section_name=section),
-            "A3": self.check_anti_ai_patterns(content, section=section),
-            "A3b": self.check_ai_writing_signals(content, section=section),
-            "A3c": self.check_voice_consistency(content, section=section),
-            "A4": self.check_wikilink_format(content, section=section),
-            "A5": self.check_language_consistency(content, prefer=prefer_language, section=section),
-            "A6": self.check_overlap(content),
-            "A7": self.check_reference_sufficiency(),
-            "B2": self._run_b2_protected_content(),
-            "B9": self.check_section_tense(content, section=section),
-            "B10": self.check_paragraph_quality(content, section=section),
-            "B15": self.check_hedging_density(content, section=section),
-        }
+        return self._run_hook_batch(
+            {
+                "A1": lambda: self.check_word_count_compliance(content, section_name=section),
+                "A2": lambda: self.check_citation_density(content, section_name=section),
+                "A3": lambda: self.check_anti_ai_patterns(content, section=section),
+                "A3b": lambda: self.check_ai_writing_signals(content, section=section),
+                "A3c": lambda: self.check_voice_consistency(content, section=section),
+                "A4": lambda: self.check_wikilink_format(content, section=section),
+                "A5": lambda: self.check_language_consistency(
+                    content, prefer=prefer_language, section=section
+                ),
+                "A6": lambda: self.check_overlap(content),
+                "A7": self.check_reference_sufficiency,
+                "B2": self._run_b2_protected_content,
+                "B9": lambda: self.check_section_tense(content, section=section),
+                "B10": lambda: self.check_paragraph_quality(content, section=section),
+                "B15": lambda: self.check_hedging_density(content, section=section),
+            }
+        )
 
     def _run_b2_protected_content(self) -> HookResult:
         """Hook B2: Protected content integrity — delegate to P5 with B2 hook_id.
@@ -170,23 +189,26 @@ class WritingHooksEngine(
         Returns:
             Dict mapping hook_id -> HookResult.
         """
-        return {
-            "C2": self.check_submission_checklist(content),
-            "C3": self.check_n_value_consistency(content),
-            "C4": self.check_abbreviation_first_use(content),
-            "C5": self.check_wikilink_resolvable(content),
-            "C6": self.check_total_word_count(content),
-            "C7a": self.check_figure_table_counts(content),
-            "C7b": self.check_asset_plan_coverage(content),
-            "C7d": self.check_cross_references(content),
-            "C9": self.check_supplementary_crossref(content),
-            "C10": self.check_reference_fulltext_status(content),
-            "C11": self.check_citation_distribution(content),
-            "C12": self.check_citation_relevance_audit(content),
-            "C13": self.check_figure_table_quality(content),
-            "C14": self.check_claim_evidence_alignment(content),
-            "F": self.validate_data_artifacts(content),
+        hooks: dict[str, Callable[[str], HookResult]] = {
+            "C2": self.check_submission_checklist,
+            "C3": self.check_n_value_consistency,
+            "C4": self.check_abbreviation_first_use,
+            "C5": self.check_wikilink_resolvable,
+            "C6": self.check_total_word_count,
+            "C7a": self.check_figure_table_counts,
+            "C7b": self.check_asset_plan_coverage,
+            "C7d": self.check_cross_references,
+            "C9": self.check_supplementary_crossref,
+            "C10": self.check_reference_fulltext_status,
+            "C11": self.check_citation_distribution,
+            "C12": self.check_citation_relevance_audit,
+            "C13": self.check_figure_table_quality,
+            "C14": self.check_claim_evidence_alignment,
+            "F": self.validate_data_artifacts,
         }
+        return self._run_hook_batch(
+            {hook_id: partial(hook, content) for hook_id, hook in hooks.items()}
+        )
 
     # ── Batch Runner: Pre-Commit ───────────────────────────────────
 
@@ -205,56 +227,32 @@ class WritingHooksEngine(
         Returns:
             Dict mapping hook_id -> HookResult.
         """
-        # P1: Citation integrity — delegate to C5 with hook_id remap
-        p1_result = self.check_wikilink_resolvable(content)
-        p1_result.hook_id = "P1"
-        for issue in p1_result.issues:
-            issue.hook_id = "P1"
-
-        # P2: Anti-AI scan — delegate to A3 with P2 thresholds
-        p2_result = self.check_anti_ai_patterns(
-            content,
-            section="precommit",
-            warn_threshold=1,
-            critical_threshold=3,
+        results = self._run_hook_batch(
+            {
+                "P1": lambda: self.check_wikilink_resolvable(content),
+                "P2": lambda: self.check_anti_ai_patterns(
+                    content, section="precommit", warn_threshold=1, critical_threshold=3
+                ),
+                "P2b": lambda: self.check_ai_writing_signals(content, section="precommit"),
+                "P2c": lambda: self.check_voice_consistency(content, section="precommit"),
+                "P4": lambda: self.check_word_count_compliance(content, critical_threshold_pct=50),
+                "P5": self.check_protected_content,
+                "P6": self.check_memory_sync,
+                "P7": lambda: self.check_reference_integrity(content),
+            }
         )
-        p2_result.hook_id = "P2"
-        for issue in p2_result.issues:
-            issue.hook_id = "P2"
-
-        # P2b: Structural AI signals — delegate to A3b
-        p2b_result = self.check_ai_writing_signals(content, section="precommit")
-        p2b_result.hook_id = "P2"
-        # Merge A3b issues into P2 result
-        for issue in p2b_result.issues:
-            issue.hook_id = "P2"
-            p2_result.issues.append(issue)
-        if not p2b_result.passed:
-            p2_result.passed = False
-
-        # P2c: Voice consistency — delegate to A3c
-        p2c_result = self.check_voice_consistency(content, section="precommit")
-        p2c_result.hook_id = "P2"
-        for issue in p2c_result.issues:
-            issue.hook_id = "P2"
-            p2_result.issues.append(issue)
-        if not p2c_result.passed:
-            p2_result.passed = False
-
-        # P4: Word count — delegate to A1 with 50% critical threshold
-        p4_result = self.check_word_count_compliance(content, critical_threshold_pct=50)
-        p4_result.hook_id = "P4"
-        for issue in p4_result.issues:
-            issue.hook_id = "P4"
-
-        return {
-            "P1": p1_result,
-            "P2": p2_result,
-            "P4": p4_result,
-            "P5": self.check_protected_content(),
-            "P6": self.check_memory_sync(),
-            "P7": self.check_reference_integrity(content),
-        }
+
+        # Remap delegated hook ids: P1 ← C5, P2 ← A3 (+A3b, A3c), P4 ← A1
+        for key in ("P1", "P2", "P2b", "P2c", "P4"):
+            results[key].hook_id = key[:2]
+            for issue in results[key].issues:
+                issue.hook_id = key[:2]
+
+        # Merge structural AI signals (A3b) and voice consistency (A3c) into P2
+        for extra in (results.pop("P2b"), results.pop("P2c")):
+            results["P2"].issues.extend(extra.issues)
+            results["P2"].passed = results["P2"].passed and extra.passed
+        return results
 
     # ── Hook A7: Reference Sufficiency (pre-write gate) ───────────
 
@@ -322,3 +320,6 @@ class WritingHooksEngine(
             passed=passed,
             issues=issues,
         )
+
+
+install_hook_cache(WritingHooksEngine)
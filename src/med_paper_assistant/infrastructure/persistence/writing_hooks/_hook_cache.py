@@ -0,0 +1,292 @@
+"""Writing Hooks — Content-addressed, persistent hook result cache.
+
+Audit rounds re-run the same hooks on unchanged drafts. Results of hooks whose
+inputs are fully known are stored under ``.audit/hook-cache/`` keyed by
+SHA-256 of (hook id, call arguments including the manuscript text, journal
+profile, references stamp, package version) and replayed when every input is
+identical.
+
+Only hooks listed in ``CACHEABLE_HOOKS`` are cached; each declares the
+project state it reads beyond its arguments. Hooks that read anything else
+(concept.md, memory, data artifacts, asset manifests, git) always run.
+
+Architecture:
+    ``install_hook_cache(WritingHooksEngine)`` wraps the listed check methods,
+    so batch runners, the review facade, and direct callers all share the
+    cache. Entries are JSON files; a hit refreshes the file mtime and the
+    least recently used entries are evicted beyond ``max_entries`` /
+    ``max_bytes``. The cache is enabled automatically for projects that have
+    an ``.audit/`` directory. Batch runners open ``_cache_state_scope()``, so
+    the references stamp is taken once per batch, not once per cached hook.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from ._models import HookResult
+
+logger = structlog.get_logger()
+
+CACHE_DIRNAME = "hook-cache"
+DEFAULT_MAX_ENTRIES = 2048
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+_CACHE_SCHEMA = 1
+
+PROFILE = "profile"
+REFERENCES = "references"
+CITATION_DECISIONS = "citation_decisions"
+
+# check method → (hook id, project state it reads besides its arguments)
+CACHEABLE_HOOKS: dict[str, tuple[str, frozenset[str]]] = {
+    "check_word_count_compliance": ("A1", frozenset({PROFILE})),
+    "check_citation_density": ("A2", frozenset({PROFILE})),
+    "check_anti_ai_patterns": ("A3", frozenset()),
+    "check_ai_writing_signals": ("A3b", frozenset()),
+    "check_voice_consistency": ("A3c", frozenset()),
+    "check_wikilink_format": ("A4", frozenset()),
+    "check_language_consistency": ("A5", frozenset({PROFILE})),
+    "check_overlap": ("A6", frozenset()),
+    "check_data_claim_alignment": ("B8", frozenset()),
+    "check_section_tense": ("B9", frozenset()),
+    "check_paragraph_quality": ("B10", frozenset()),
+    "check_results_interpretation": ("B11", frozenset()),
+    "check_intro_structure": ("B12", frozenset()),
+    "check_discussion_structure": ("B13", frozenset()),
+    "check_ethical_statements": ("B14", frozenset()),
+    "check_hedging_density": ("B15", frozenset()),
+    "check_effect_size_reporting": ("B16", frozenset()),
+    "check_n_value_consistency": ("C3", frozenset()),
+    "check_abbreviation_first_use": ("C4", frozenset()),
+    "check_wikilink_resolvable": ("C5", frozenset({REFERENCES})),
+    "check_total_word_count": ("C6", frozenset({PROFILE})),
+    "check_reference_fulltext_status": ("C10", frozenset({REFERENCES})),
+    "check_citation_distribution": ("C11", frozenset()),
+    "check_citation_relevance_audit": ("C12", frozenset({REFERENCES, CITATION_DECISIONS})),
+    "check_figure_table_quality": ("C13", frozenset()),
+    "check_claim_evidence_alignment": ("C14", frozenset()),
+}
+
+# Files the REFERENCES hooks (C5, C10, C12) read inside each reference directory
+REFERENCE_STATE_FILES = ("metadata.json", "analysis.json")
+
+_outcome = threading.local()
+_shared_state_lock = threading.Lock()
+
+
+def consume_cache_outcome() -> str:
+    """Return and reset the calling thread's last cache outcome (hit/miss/off)."""
+    outcome = getattr(_outcome, "value", "off")
+    _outcome.value = "off"
+    return outcome
+
+
+def references_version(project_dir: Path) -> str:
+    """
+    Stat fingerprint of what the REFERENCES hooks read under ``references/``.
+
+    That is the top-level entries plus each reference's ``REFERENCE_STATE_FILES``;
+    full texts, figures and other artifacts deeper in the tree are not walked.
+    """
+    refs_dir = project_dir / "references"
+    digest = hashlib.sha256()
+    try:
+        with os.scandir(refs_dir) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        return digest.hexdigest()
+    for entry in entries:
+        if entry.is_dir():
+            digest.update(f"{entry.name}/\n".encode())
+            for name in REFERENCE_STATE_FILES:
+                digest.update(f"{name}\0{_file_version(Path(entry.path, name))}\n".encode())
+        else:
+            digest.update(f"{entry.name}\0{_file_version(Path(entry.path))}\n".encode())
+    return digest.hexdigest()
+
+
+def _file_version(path: Path) -> str:
+    try:
+        stat = path.stat()
+    except OSError:
+        return "absent"
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+class HookResultCache:
+    """JSON-file LRU store of ``HookResult`` objects under ``.audit/hook-cache``."""
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.counters = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+        self._sizes: dict[str, int] | None = None
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> HookResult | None:
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            result = HookResult.from_dict(data)
+            os.utime(path)
+        except (OSError, ValueError, KeyError, TypeError):
+            with self._lock:
+                self.counters["misses"] += 1
+            return None
+        with self._lock:
+            self.counters["hits"] += 1
+        return result
+
+    def put(self, key: str, result: HookResult) -> None:
+        data = result.to_dict()
+        try:
+            payload = json.dumps(data, ensure_ascii=False, sort_keys=True)
+        except (TypeError, ValueError):
+            return
+        if json.loads(payload) != data:
+            return  # stats that do not survive JSON (tuples, sets) would replay differently
+        path = self._path(key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp.write_text(payload, encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            logger.debug("hook_cache.write_failed", path=str(path), exc_info=True)
+            return
+        with self._lock:
+            sizes = self._scan()
+            sizes[key] = len(payload.encode("utf-8"))
+            self.counters["writes"] += 1
+            if len(sizes) > self.max_entries or sum(sizes.values()) > self.max_bytes:
+                self._evict(sizes)
+
+    def _scan(self) -> dict[str, int]:
+        if self._sizes is None:
+            self._sizes = {}
+            for path in self.cache_dir.glob("*.json"):
+                try:
+                    self._sizes[path.stem] = path.stat().st_size
+                except OSError:
+                    continue
+        return self._sizes
+
+    def _evict(self, sizes: dict[str, int]) -> None:
+        """Drop least recently used entries down to 90% of both caps."""
+
+        def last_used(key: str) -> int:
+            try:
+                return self._path(key).stat().st_mtime_ns
+            except OSError:
+                return 0
+
+        target_entries, target_bytes = self.max_entries * 9 // 10, self.max_bytes * 9 // 10
+        total = sum(sizes.values())
+        for key in sorted(sizes, key=last_used):
+            if len(sizes) <= target_entries and total <= target_bytes:
+                break
+            total -= sizes.pop(key)
+            self._path(key).unlink(missing_ok=True)
+            self.counters["evictions"] += 1
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            sizes = self._scan()
+            return {**self.counters, "entries": len(sizes), "bytes": sum(sizes.values())}
+
+
+class HookCacheMixin:
+    """Per-engine access to the project's hook result cache."""
+
+    _result_cache: HookResultCache | None = None
+    _shared_state: dict[str, str] | None = None  # set inside _cache_state_scope()
+
+    def _configure_result_cache(self, enabled: bool | None) -> None:
+        audit_dir: Path = getattr(self, "_audit_dir")
+        if enabled is None:
+            enabled = audit_dir.is_dir()
+        self._result_cache = HookResultCache(audit_dir / CACHE_DIRNAME) if enabled else None
+
+    def _cache_key(self, method: str, deps: frozenset[str], args: Any, kwargs: Any) -> str:
+        from med_paper_assistant import __version__
+
+        project_dir: Path = getattr(self, "_project_dir")
+        state: dict[str, Any] = {}
+        if PROFILE in deps:
+            state[PROFILE] = getattr(self, "_journal_profile", None)
+        if REFERENCES in deps:
+            state[REFERENCES] = self._references_version(project_dir)
+        if CITATION_DECISIONS in deps:
+            state[CITATION_DECISIONS] = _file_version(project_dir / "citation_decisions.json")
+        material = [_CACHE_SCHEMA, __version__, method, args, sorted(kwargs.items()), state]
+        encoded = json.dumps(material, sort_keys=True, default=repr, ensure_ascii=False)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    @contextmanager
+    def _cache_state_scope(self) -> Iterator[None]:
+        """Share the references stamp between the hooks of one batch (outermost scope)."""
+        if self._shared_state is not None:
+            yield
+            return
+        self._shared_state = {}
+        try:
+            yield
+        finally:
+            self._shared_state = None
+
+    def _references_version(self, project_dir: Path) -> str:
+        shared = self._shared_state
+        if shared is None:
+            return references_version(project_dir)
+        with _shared_state_lock:
+            if REFERENCES not in shared:
+                shared[REFERENCES] = references_version(project_dir)
+            return shared[REFERENCES]
+
+    def hook_cache_stats(self) -> dict[str, int]:
+        """Hit/miss/write/eviction counters plus current entry count and bytes."""
+        return self._result_cache.stats() if self._result_cache is not None else {}
+
+
+def _cached(method: Callable[..., HookResult], deps: frozenset[str]) -> Callable[..., HookResult]:
+    @functools.wraps(method)
+    def wrapper(self: HookCacheMixin, *args: Any, **kwargs: Any) -> HookResult:
+        cache = self._result_cache
+        if cache is None:
+            return method(self, *args, **kwargs)
+        key = self._cache_key(method.__name__, deps, args, kwargs)
+        cached = cache.get(key)
+        if cached is not None:
+            _outcome.value = "hit"
+            return cached
+        result = method(self, *args, **kwargs)
+        cache.put(key, result)
+        _outcome.value = "miss"
+        return result
+
+    return wrapper
+
+
+def install_hook_cache(engine_cls: type) -> None:
+    """Wrap every ``CACHEABLE_HOOKS`` method of ``engine_cls`` with the result cache."""
+    for name, (_, deps) in CACHEABLE_HOOKS.items():
+        setattr(engine_cls, name, _cached(getattr(engine_cls, name), deps))
@@ -291,22 +291,6 @@ class ManuscriptHooksMixin:
         issues: list[HookIssue] = []
         sections = self._parse_sections(content)
 
-        n_patterns = [
-            (r"\b[Nn]\s*=\s*(\d+)\b", "N="),
-            (
-                r"(\d+)\s+(?:patients|subjects|participants|individuals|cases|controls|samples|enrolled)",
-                "count of",
-            ),
-        ]
-
-        def _extract_n_values(text: str) -> dict[str, set[str]]:
-            result: dict[str, set[str]] = {}
-            for pattern, label in n_patterns:
-                values = set(re.findall(pattern, text, re.IGNORECASE))
-                if values:
-                    result[label] = values
-            return result
-
         methods_key = None
         for key in sections:
             if re.match(r"(?:materials?\s+and\s+)?methods", key, re.IGNORECASE):
@@ -320,7 +304,7 @@ class ManuscriptHooksMixin:
                 stats={"note": "No Methods section found, skipping N-value check"},
             )
 
-        methods_n = _extract_n_values(sections[methods_key])
+        methods_n = self._parsed(sections[methods_key]).numeric_claims
         all_methods_values: set[str] = set()
         for vals in methods_n.values():
             all_methods_values |= vals
@@ -336,7 +320,7 @@ class ManuscriptHooksMixin:
         for sec_name, sec_text in sections.items():
             if sec_name == methods_key:
                 continue
-            sec_n = _extract_n_values(sec_text)
+            sec_n = self._parsed(sec_text).numeric_claims
             for label, values in sec_n.items():
                 for val in values:
                     if val not in all_methods_values and int(val) > 1:
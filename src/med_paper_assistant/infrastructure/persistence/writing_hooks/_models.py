@@ -27,6 +27,17 @@ class HookIssue:
             "suggestion": self.suggestion,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> HookIssue:
+        return cls(
+            hook_id=data["hook_id"],
+            severity=data["severity"],
+            section=data["section"],
+            message=data["message"],
+            location=data.get("location", ""),
+            suggestion=data.get("suggestion", ""),
+        )
+
 
 @dataclass
 class HookResult:
@@ -54,3 +65,13 @@ class HookResult:
             "issues": [i.to_dict() for i in self.issues],
             "stats": self.stats,
         }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> HookResult:
+        """Rebuild a result serialized by :meth:`to_dict` (derived counts are ignored)."""
+        return cls(
+            hook_id=data["hook_id"],
+            passed=data["passed"],
+            issues=[HookIssue.from_dict(issue) for issue in data.get("issues", [])],
+            stats=data.get("stats", {}),
+        )
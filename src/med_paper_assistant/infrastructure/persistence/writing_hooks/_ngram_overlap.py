@@ -0,0 +1,54 @@
+"""Writing Hooks — Inverted n-gram index for paragraph overlap (Hook A6).
+
+Instead of intersecting the n-gram sets of every paragraph pair (O(P²) set
+operations), each n-gram is posted to the paragraphs containing it and only
+pairs that co-occur in some posting list are counted. Shared-n-gram counts are
+exact, so A6 reports exactly what the pairwise scan reported.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from itertools import combinations
+
+# Strip statistical notation to avoid false positives
+# e.g. "F(X,Y) = Z, p < 0.001, η²p = 0.12" → common in Results
+_STATISTICAL_NOTATION = re.compile(
+    r"[FtZrR]\s*\([^)]*\)\s*=\s*[\d.]+"
+    r"|p\s*[<>=]+\s*[\d.]+"
+    r"|η[²2]p?\s*=\s*[\d.]+"
+    r"|\bCI\s*[:=]?\s*\[[^]]*\]"
+    r"|\bd\s*=\s*[\d.]+"
+    r"|\bOR\s*=\s*[\d.]+"
+    r"|\bHR\s*=\s*[\d.]+"
+    r"|\bRR\s*=\s*[\d.]+"
+    r"|\bAOR\s*=\s*[\d.]+"
+    r"|\bβ\s*=\s*[\-\d.]+"
+    r"|\bSD\s*=\s*[\d.]+"
+    r"|\bSE\s*=\s*[\d.]+",
+    re.IGNORECASE,
+)
+_WORD = re.compile(r"\b[a-z]+\b")
+
+
+def extract_ngrams(text: str, n: int) -> set[str]:
+    """Lower-case word n-grams of ``text`` with statistical notation removed."""
+    words = _WORD.findall(_STATISTICAL_NOTATION.sub("", text).lower())
+    return {" ".join(words[i : i + n]) for i in range(len(words) - n + 1)}
+
+
+def shared_ngram_pairs(ngram_sets: list[set[str]], threshold: int) -> list[tuple[int, int, int]]:
+    """Return ``(i, j, shared)`` for paragraph pairs sharing ≥ ``threshold`` n-grams, sorted."""
+    postings: dict[str, list[int]] = defaultdict(list)
+    for index, ngrams in enumerate(ngram_sets):
+        for ngram in ngrams:
+            postings[ngram].append(index)
+
+    shared: dict[tuple[int, int], int] = defaultdict(int)
+    for paragraphs in postings.values():
+        if len(paragraphs) > 1:
+            for pair in combinations(paragraphs, 2):
+                shared[pair] += 1
+
+    return sorted((i, j, count) for (i, j), count in shared.items() if count >= threshold)
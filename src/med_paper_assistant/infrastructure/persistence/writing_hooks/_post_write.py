@@ -14,11 +14,12 @@ from ._constants import (
     AI_NEGATIVE_PARALLELISM_PATTERNS,
     AI_TRANSITION_WORDS,
     AMER_VS_BRIT,
-    ANTI_AI_PARAGRAPH_START_ONLY,
-    ANTI_AI_PHRASES,
     BRIT_VS_AMER,
 )
 from ._models import HookIssue, HookResult
+from ._ngram_overlap import extract_ngrams, shared_ngram_pairs
+from ._parsed_document import split_sentences
+from ._phrase_matcher import anti_ai_phrase_counts, compile_phrases
 
 logger = structlog.get_logger()
 
@@ -123,7 +124,7 @@ class PostWriteHooksMixin:
                 stats={"section": section_name, "threshold": 0, "skipped": True},
             )
 
-        citation_count = len(re.findall(r"\[\[[^\]]+\]\]", content))
+        citation_count = len(self._parsed(content).wikilinks)
         word_count = self._count_words(content)
 
         if word_count == 0:
@@ -184,21 +185,8 @@ class PostWriteHooksMixin:
             critical_threshold: Total matches to trigger CRITICAL (default 3).
         """
         issues: list[HookIssue] = []
-        content_lower = content.lower()
-        phrase_counts: dict[str, int] = {}
-        total_matches = 0
-
-        for phrase in ANTI_AI_PHRASES:
-            count = len(re.findall(rf"\b{re.escape(phrase)}\b", content_lower))
-            if count > 0:
-                phrase_counts[phrase] = count
-                total_matches += count
-
-        for phrase in ANTI_AI_PARAGRAPH_START_ONLY:
-            count = len(re.findall(rf"(?:^|\n\n)\s*{re.escape(phrase)}\b", content, re.IGNORECASE))
-            if count > 0:
-                phrase_counts[f"{phrase} (paragraph start)"] = count
-                total_matches += count
+        phrase_counts = anti_ai_phrase_counts(content)
+        total_matches = sum(phrase_counts.values())
 
         for phrase, count in phrase_counts.items():
             severity = "CRITICAL" if total_matches >= critical_threshold else "WARNING"
@@ -244,15 +232,14 @@ class PostWriteHooksMixin:
         issues: list[HookIssue] = []
 
         # Strip markdown headings and reference wikilinks for prose analysis
-        prose = re.sub(r"^#+\s.*$", "", content, flags=re.MULTILINE)
-        prose = re.sub(r"\[\[[^\]]*\]\]", "", prose)
-        prose = prose.strip()
+        document = self._parsed(content)
+        prose = document.prose
 
         if len(prose) < 200:
             return HookResult(hook_id="A3b", passed=True, issues=[], stats={"skipped": True})
 
         # ── 1. Sentence length uniformity (CV) ──
-        sentences = [s.strip() for s in re.split(r"[.!?]+", prose) if len(s.strip().split()) >= 3]
+        sentences = list(document.sentences)
         sentence_lengths = [len(s.split()) for s in sentences]
         sent_cv = 0.0
         if len(sentence_lengths) >= 5:
@@ -338,9 +325,7 @@ class PostWriteHooksMixin:
             )
 
         # ── 5. Paragraph length uniformity ──
-        paragraphs = [
-            p.strip() for p in re.split(r"\n\s*\n", prose) if len(p.strip().split()) >= 10
-        ]
+        paragraphs = [p for p in document.paragraphs if len(p.split()) >= 10]
         if len(paragraphs) >= 4:
             para_lengths = [len(p.split()) for p in paragraphs]
             mean_para = sum(para_lengths) / len(para_lengths)
@@ -379,13 +364,8 @@ class PostWriteHooksMixin:
             )
 
         # ── 7. Copula avoidance (Pattern 8) ──
-        copula_count = 0
-        copula_found: dict[str, int] = {}
-        for verb in AI_COPULA_AVOIDANCE_VERBS:
-            cnt = len(re.findall(rf"\b{re.escape(verb)}\b", prose, re.IGNORECASE))
-            if cnt > 0:
-                copula_count += cnt
-                copula_found[verb] = cnt
+        copula_found = compile_phrases(tuple(AI_COPULA_AVOIDANCE_VERBS)).counts(prose)
+        copula_count = sum(copula_found.values())
         if copula_count > 3:
             issues.append(
                 HookIssue(
@@ -495,15 +475,8 @@ class PostWriteHooksMixin:
         """
         issues: list[HookIssue] = []
 
-        # Strip markdown headings and wikilinks
-        prose = re.sub(r"^#+\s.*$", "", content, flags=re.MULTILINE)
-        prose = re.sub(r"\[\[[^\]]*\]\]", "", prose)
-        prose = prose.strip()
-
-        # Split into paragraphs (min 20 words to exclude headers/stubs)
-        paragraphs = [
-            p.strip() for p in re.split(r"\n\s*\n", prose) if len(p.strip().split()) >= 20
-        ]
+        # Prose paragraphs without headings/wikilinks (min 20 words to exclude stubs)
+        paragraphs = [p for p in self._parsed(content).paragraphs if len(p.split()) >= 20]
 
         if len(paragraphs) < 4:
             return HookResult(
@@ -516,9 +489,7 @@ class PostWriteHooksMixin:
         # ── Compute per-paragraph metrics ──
         para_metrics: list[dict[str, Any]] = []
         for i, para in enumerate(paragraphs):
-            sentences = [
-                s.strip() for s in re.split(r"[.!?]+", para) if len(s.strip().split()) >= 3
-            ]
+            sentences = split_sentences(para)
             words = para.split()
             n_words = len(words)
 
@@ -659,7 +630,7 @@ class PostWriteHooksMixin:
         """
         issues: list[HookIssue] = []
 
-        all_wikilinks = re.findall(r"\[\[([^\]]+)\]\]", content)
+        all_wikilinks = list(self._parsed(content).wikilinks)
         if not all_wikilinks:
             return HookResult(
                 hook_id="A4",
@@ -799,7 +770,8 @@ class PostWriteHooksMixin:
         Hook A6: Detect internal paragraph overlap (copy-paste residue).
 
         Splits content into paragraphs, extracts n-grams, and finds
-        n-grams that appear in multiple paragraphs.
+        n-grams that appear in multiple paragraphs via an inverted n-gram
+        index, so only paragraph pairs that share an n-gram are compared.
 
         Args:
             content: Full manuscript text.
@@ -829,38 +801,8 @@ class PostWriteHooksMixin:
                 hook_id="A6", passed=True, stats={"paragraphs_checked": len(paragraphs)}
             )
 
-        def _extract_ngrams(text: str, n: int) -> set[str]:
-            # Strip statistical notation to avoid false positives
-            # e.g. "F(X,Y) = Z, p < 0.001, η²p = 0.12" → common in Results
-            cleaned = re.sub(
-                r"[FtZrR]\s*\([^)]*\)\s*=\s*[\d.]+"
-                r"|p\s*[<>=]+\s*[\d.]+"
-                r"|η[²2]p?\s*=\s*[\d.]+"
-                r"|\bCI\s*[:=]?\s*\[[^]]*\]"
-                r"|\bd\s*=\s*[\d.]+"
-                r"|\bOR\s*=\s*[\d.]+"
-                r"|\bHR\s*=\s*[\d.]+"
-                r"|\bRR\s*=\s*[\d.]+"
-                r"|\bAOR\s*=\s*[\d.]+"
-                r"|\bβ\s*=\s*[\-\d.]+"
-                r"|\bSD\s*=\s*[\d.]+"
-                r"|\bSE\s*=\s*[\d.]+",
-                "",
-                text,
-                flags=re.IGNORECASE,
-            )
-            words = re.findall(r"\b[a-z]+\b", cleaned.lower())
-            return {" ".join(words[i : i + n]) for i in range(len(words) - n + 1)}
-
-        para_ngrams: list[set[str]] = [_extract_ngrams(text, min_ngram) for _, text in paragraphs]
-
-        flagged_pairs: list[tuple[int, int, int]] = []
-
-        for i in range(len(paragraphs)):
-            for j in range(i + 1, len(paragraphs)):
-                shared = para_ngrams[i] & para_ngrams[j]
-                if len(shared) >= threshold:
-                    flagged_pairs.append((i, j, len(shared)))
+        para_ngrams = [extract_ngrams(text, min_ngram) for _, text in paragraphs]
+        flagged_pairs = shared_ngram_pairs(para_ngrams, threshold)
 
         for i, j, shared_count in flagged_pairs:
             sec_i, text_i = paragraphs[i]
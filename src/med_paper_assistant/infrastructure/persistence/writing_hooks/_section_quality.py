@@ -247,24 +247,7 @@ class SectionQualityMixin:
         issues: list[HookIssue] = []
         stats: dict[str, Any] = {"total_paragraphs": 0, "too_short": 0, "too_long": 0}
 
-        paragraphs: list[str] = []
-        current: list[str] = []
-        for line in content.split("\n"):
-            stripped = line.strip()
-            if stripped.startswith("#"):
-                if current:
-                    paragraphs.append("\n".join(current))
-                    current = []
-                continue
-            if not stripped:
-                if current:
-                    paragraphs.append("\n".join(current))
-                    current = []
-            else:
-                current.append(line)
-        if current:
-            paragraphs.append("\n".join(current))
-
+        paragraphs = self._parsed(content).line_paragraphs
         stats["total_paragraphs"] = len(paragraphs)
 
         for i, para in enumerate(paragraphs, 1):
@@ -272,10 +255,9 @@ class SectionQualityMixin:
             if not text or text.startswith("|") or text.startswith("- "):
                 continue
 
-            word_count = self._count_words(text)
-            sentences = re.split(r"[.!?]+\s+|[.!?]+$", text)
-            sentences = [s for s in sentences if s.strip()]
-            n_sentences = len(sentences)
+            parsed = self._parsed(text)
+            word_count = parsed.word_count
+            n_sentences = parsed.sentence_count
 
             if word_count > 250:
                 stats["too_long"] = stats.get("too_long", 0) + 1
@@ -415,8 +397,7 @@ class SectionQualityMixin:
         if not intro_text:
             return HookResult(hook_id="B12", passed=True, issues=issues, stats=stats)
 
-        paragraphs = [p.strip() for p in re.split(r"\n\s*\n", intro_text) if p.strip()]
-        paragraphs = [p for p in paragraphs if not p.startswith("|") and not p.startswith("- ")]
+        paragraphs = [p for p in self._parsed(intro_text).blocks if not p.startswith(("|", "- "))]
         stats["paragraph_count"] = len(paragraphs)
 
         if len(paragraphs) < 3:
@@ -530,8 +511,7 @@ class SectionQualityMixin:
             return HookResult(hook_id="B13", passed=True, issues=issues, stats=stats)
 
         disc_lower = discussion_text.lower()
-        paragraphs = [p.strip() for p in re.split(r"\n\s*\n", discussion_text) if p.strip()]
-        paragraphs = [p for p in paragraphs if not p.startswith("|")]
+        paragraphs = [p for p in self._parsed(discussion_text).blocks if not p.startswith("|")]
         stats["paragraph_count"] = len(paragraphs)
 
         # 1. Main findings mentioned early
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import re
 from typing import Any
 
 from ._constants import BODY_SECTIONS
+from ._parsed_document import ParsedManuscript, parse_manuscript, strip_frontmatter
 
 
 class TextUtilsMixin:
@@ -14,32 +14,27 @@ class TextUtilsMixin:
     @staticmethod
     def _strip_frontmatter(text: str) -> str:
         """Strip YAML frontmatter (--- ... ---) from markdown content."""
-        if text.startswith("---"):
-            end = text.find("\n---", 3)
-            if end != -1:
-                text = text[end + 4 :]
-        return text
+        return strip_frontmatter(text)
+
+    @staticmethod
+    def _parsed(content: str) -> ParsedManuscript:
+        """Shared, content-hash-memoized parse of ``content``."""
+        return parse_manuscript(content)
+
+    @staticmethod
+    def _style_prose(content: str) -> str:
+        """Prose for the A3b/A3c style metrics: no headings, no wikilinks."""
+        return parse_manuscript(content).prose
 
     @staticmethod
     def _count_words(text: str) -> int:
         """Count words in text, stripping markdown formatting and frontmatter."""
-        # Strip YAML frontmatter
-        cleaned = TextUtilsMixin._strip_frontmatter(text)
-        # Strip wikilinks
-        cleaned = re.sub(r"\[\[[^\]]*\]\]", "CITE", cleaned)
-        # Strip markdown links [text](url)
-        cleaned = re.sub(r"\[([^\]]*)\]\([^)]*\)", r"\1", cleaned)
-        # Strip bold/italic markers
-        cleaned = re.sub(r"[*_]{1,3}", "", cleaned)
-        # Strip headings markers
-        cleaned = re.sub(r"^#{1,6}\s+", "", cleaned, flags=re.MULTILINE)
-        return len(re.findall(r"\b\w+\b", cleaned))
+        return parse_manuscript(text).word_count
 
     @staticmethod
     def _strip_markdown_tables(text: str) -> str:
         """Remove markdown table rows from text (tables are display items, not counted)."""
-        lines = text.split("\n")
-        return "\n".join(line for line in lines if not re.match(r"^\s*\|.*\|\s*$", line))
+        return parse_manuscript(text).without_tables
 
     def _extract_body_word_count(self, content: str) -> dict[str, Any]:
         """Extract word count for body sections only (academic convention).
@@ -59,15 +54,9 @@ class TextUtilsMixin:
         breakdown: list[dict[str, Any]] = []
         excluded: list[str] = []
 
-        # Check journal profile for custom body sections
-        custom_body: set[str] | None = None
-        if self._journal_profile:
-            paper = self._journal_profile.get("paper", {})
-            profile_sections = paper.get("sections", [])
-            counts_flags = [s for s in profile_sections if s.get("counts_toward_total") is True]
-            if counts_flags:
-                custom_body = {s["name"].lower() for s in counts_flags}
-
+        # Journal profile may declare its own body sections (counts_toward_total)
+        profile = self._profile
+        custom_body = profile.body_sections if profile is not None else None
         body_set = custom_body if custom_body else BODY_SECTIONS
 
         for sec_name, sec_text in sections.items():
@@ -89,24 +78,7 @@ class TextUtilsMixin:
     def _parse_sections(content: str) -> dict[str, str]:
         """Parse markdown content into {section_name: section_text} dict.
 
-        Strips YAML frontmatter before parsing.
+        Strips YAML frontmatter before parsing. Returns a fresh dict backed by
+        the shared parse, so callers may mutate it.
         """
-        content = TextUtilsMixin._strip_frontmatter(content)
-        sections: dict[str, str] = {}
-        current_name: str | None = None
-        current_lines: list[str] = []
-
-        for line in content.split("\n"):
-            heading_match = re.match(r"^#{1,3}\s+(.+)", line)
-            if heading_match:
-                if current_name is not None:
-                    sections[current_name] = "\n".join(current_lines).strip()
-                current_name = heading_match.group(1).strip()
-                current_lines = []
-            elif current_name is not None:
-                current_lines.append(line)
-
-        if current_name is not None:
-            sections[current_name] = "\n".join(current_lines).strip()
-
-        return sections
+        return dict(parse_manuscript(content).sections)
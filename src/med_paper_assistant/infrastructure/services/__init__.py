@@ -4,19 +4,44 @@ Infrastructure Services - Business logic implementations.
 These services implement the core functionality of the application.
 They are used by the MCP tools layer.
 
+Exports are resolved lazily (PEP 562): importing this package, or one light
+submodule such as ``concept_template_reader``, does not import every service.
+Heavy libraries (pandas, scipy, matplotlib, python-docx, pypandoc) are
+imported inside the methods that use them, so they load on the first tool
+call that needs them rather than at MCP server start-up.
+
 Note: Search functionality moved to pubmed-search MCP server.
 """
 
-from .analyzer import Analyzer
-from .citation_assistant import CitationAssistant
-from .concept_template_reader import ConceptTemplateReader
-from .concept_validator import ConceptValidator
-from .drafter import JOURNAL_CITATION_CONFIGS, CitationStyle, Drafter
-from .exporter import WordExporter
-from .formatter import Formatter
-from .prompts import SECTION_PROMPTS
-from .template_reader import TemplateReader
-from .word_writer import WordWriter
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .analyzer import Analyzer
+    from .citation_assistant import CitationAssistant
+    from .concept_template_reader import ConceptTemplateReader
+    from .concept_validator import ConceptValidator
+    from .drafter import JOURNAL_CITATION_CONFIGS, CitationStyle, Drafter
+    from .exporter import WordExporter
+    from .formatter import Formatter
+    from .prompts import SECTION_PROMPTS
+    from .template_reader import TemplateReader
+    from .word_writer import WordWriter
+
+_LAZY_EXPORTS = {
+    "Analyzer": ".analyzer",
+    "CitationAssistant": ".citation_assistant",
+    "ConceptTemplateReader": ".concept_template_reader",
+    "ConceptValidator": ".concept_validator",
+    "Drafter": ".drafter",
+    "CitationStyle": ".drafter",
+    "JOURNAL_CITATION_CONFIGS": ".drafter",
+    "WordExporter": ".exporter",
+    "Formatter": ".formatter",
+    "SECTION_PROMPTS": ".prompts",
+    "TemplateReader": ".template_reader",
+    "WordWriter": ".word_writer",
+}
 
 __all__ = [
     "Analyzer",
@@ -32,3 +57,16 @@ __all__ = [
     "ConceptTemplateReader",
     "ConceptValidator",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_EXPORTS})
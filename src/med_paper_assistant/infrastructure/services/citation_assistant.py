@@ -15,7 +15,7 @@ Citation Assistant - 智慧引用助手
 Architecture:
     CitationAssistant (Application Service)
     ├── _analyze_text_claims() - 分析文字中的 claims
-    ├── _search_local_references() - 本地搜尋
+    ├── _search_local_for_claims() - 本地 BM25 搜尋（單次評分）
     ├── _generate_pubmed_queries() - 生成 PubMed 搜尋建議
     └── suggest_citations() - 主入口
 """
@@ -489,36 +489,27 @@ class CitationAssistant:
         if not all_terms:
             return suggestions
 
-        # 搜尋本地文獻
-        for term in list(all_terms)[:10]:  # 限制搜尋次數
-            results = self.ref_manager.search_local(term)
-
-            for meta in results:
-                pmid = meta.get("pmid", "")
-                if not pmid:
-                    continue
-
-                # 計算相關性
-                title = meta.get("title", "").lower()
-                abstract = meta.get("abstract", "").lower()
-                matching_terms = [t for t in all_terms if t in title or t in abstract]
-
-                if not matching_terms:
-                    continue
-
-                relevance_score = min(len(matching_terms) / len(all_terms), 1.0) if all_terms else 0
-
-                suggestions.append(
-                    CitationSuggestion(
-                        pmid=pmid,
-                        citation_key=meta.get("citation_key", pmid),
-                        title=meta.get("title", "Unknown"),
-                        relevance_score=relevance_score,
-                        relevance_reason=f"Matches {len(matching_terms)} key terms",
-                        matching_terms=matching_terms[:5],
-                        source="local",
-                    )
+        # 一次以 BM25 對整個文獻庫評分（取代逐詞 search_local）
+        for hit in self.ref_manager.search_ranked(sorted(all_terms), limit=50):
+            meta = hit["metadata"]
+            pmid = meta.get("pmid", "")
+            if not pmid:
+                continue
+            text = f"{meta.get('title') or ''} {meta.get('abstract') or ''}".lower()
+            tokens = hit["matched_terms"]
+            matching_terms = [t for t in sorted(all_terms) if t in text or t in tokens]
+
+            suggestions.append(
+                CitationSuggestion(
+                    pmid=pmid,
+                    citation_key=meta.get("citation_key", pmid),
+                    title=meta.get("title", "Unknown"),
+                    relevance_score=len(matching_terms) / len(all_terms),  # 以關鍵詞為單位
+                    relevance_reason=f"Matches {len(matching_terms)} key terms",
+                    matching_terms=matching_terms[:5],
+                    source="local",
                 )
+            )
 
         # 去重並按相關性排序
         seen: set[str] = set()
@@ -13,6 +13,7 @@ from med_paper_assistant.infrastructure.persistence.draft_snapshot_manager impor
     DraftSnapshotManager,
 )
 from med_paper_assistant.infrastructure.persistence.git_auto_committer import GitAutoCommitter
+from med_paper_assistant.infrastructure.persistence.post_write_queue import queue_draft_side_effects
 from med_paper_assistant.infrastructure.persistence.reference_manager import ReferenceManager
 from med_paper_assistant.shared.path_guard import (
     PathGuardError,
@@ -152,17 +153,25 @@ class Drafter:
     @property
     def git_committer(self) -> GitAutoCommitter:
         """Lazy-initialized git auto-committer tied to project root."""
-        # Use parent of drafts_dir (project root) as the repo dir.
-        # This must refresh when the active project changes.
+        # Repo dir = parent of drafts_dir; must follow active project switches.
         project_root = os.path.dirname(self.drafts_dir)
         if self._git_committer is None or self._git_committer_root != project_root:
             self._git_committer = GitAutoCommitter(project_root)
             self._git_committer_root = project_root
         return self._git_committer
 
+    def _queue_side_effects(self, filename: str, reason: str) -> None:
+        """Defer the Foam refresh + auto-commit of a draft write (coalesced per project)."""
+        queue_draft_side_effects(
+            os.path.dirname(self.drafts_dir),
+            filename,
+            reason,
+            refresh_graph=self.ref_manager.refresh_foam_graph,
+            committer=self.git_committer,
+        )
+
     def set_citation_style(self, style: str):
         """Set the citation style."""
-        # Validate style
         valid_styles = [s.value for s in CitationStyle]
         if style not in valid_styles:
             raise ValueError(f"Invalid style: {style}. Valid options: {valid_styles}")
@@ -198,10 +207,7 @@ class Drafter:
         with open(filepath, "w", encoding="utf-8") as f:
             f.write(final_content)
 
-        self.ref_manager.refresh_foam_graph()
-
-        # Auto-commit after successful write
-        self.git_committer.commit_draft(filename, reason="create_draft")
+        self._queue_side_effects(filename, reason="create_draft")
 
         return str(filepath)
 
@@ -292,10 +298,7 @@ class Drafter:
         with open(filepath, "w", encoding="utf-8") as f:
             f.write(final_content)
 
-        self.ref_manager.refresh_foam_graph()
-
-        # Auto-commit after successful write
-        self.git_committer.commit_draft(filename, reason="insert_citation")
+        self._queue_side_effects(filename, reason="insert_citation")
 
         return filepath
 
@@ -631,10 +634,7 @@ class Drafter:
         with open(filepath, "w", encoding="utf-8") as f:
             f.write(final_content)
 
-        self.ref_manager.refresh_foam_graph()
-
-        # Auto-commit after sync
-        self.git_committer.commit_draft(filename, reason="sync_references")
+        self._queue_side_effects(filename, reason="sync_references")
 
         return {
             "success": True,
@@ -0,0 +1,192 @@
+"""
+Verified PubMed payloads — the trusted transport boundary for PubMed metadata.
+
+Only envelopes that pass :func:`validate_article_envelope` become
+``VerifiedArticlePayload`` objects, and only those may be persisted with
+``trust_level: verified``.
+
+Architecture:
+    Infrastructure layer value objects shared by ``PubMedAPIClient`` (single
+    article fetch) and ``pubmed_bulk_fetch`` (batched verified fetch).
+
+Author: u9401066@gap.kmu.edu.tw
+"""
+
+import hashlib
+import json
+from copy import deepcopy
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+import httpx
+
+
+class PubMedVerificationError(ValueError):
+    """Raised when the PubMed HTTP API violates the verified-data contract."""
+
+
+def _canonical_payload_hash(article: Dict[str, Any]) -> str:
+    """Hash strict canonical JSON so the audit anchor is reproducible."""
+    try:
+        canonical_payload = json.dumps(
+            article,
+            allow_nan=False,
+            ensure_ascii=False,
+            sort_keys=True,
+            separators=(",", ":"),
+        ).encode("utf-8")
+    except (TypeError, ValueError) as exc:
+        raise PubMedVerificationError("PubMed transport payload is not canonical JSON.") from exc
+    return hashlib.sha256(canonical_payload).hexdigest()
+
+
+@dataclass(frozen=True)
+class VerifiedArticlePayload:
+    """Article metadata that passed the trusted PubMed transport boundary.
+
+    Callers cannot construct a verified reference by adding a boolean to an
+    arbitrary article dictionary.  Only :func:`validate_article_envelope`
+    (called by ``PubMedAPIClient``) creates this payload after validating the
+    response envelope, PMID identity, and source provenance and after computing
+    a canonical payload hash.
+    """
+
+    article: Dict[str, Any]
+    data_source: str
+    retrieved_at: str
+    source_url: str
+    payload_hash: str
+    provenance: tuple[Dict[str, Any], ...]
+
+    def _attestation_is_intact(self) -> bool:
+        """Recompute the hash and match transport coordinates against provenance."""
+        actual_hash = _canonical_payload_hash(self.article)
+        article_pmid = str(self.article.get("pmid") or "").strip()
+        title = self.article.get("title")
+        try:
+            retrieval_time = datetime.fromisoformat(self.retrieved_at)
+            parsed_source_url = httpx.URL(self.source_url)
+            valid_transport_coordinates = bool(
+                retrieval_time.tzinfo is not None
+                and parsed_source_url.scheme in {"http", "https"}
+                and parsed_source_url.host
+            )
+        except (TypeError, ValueError, httpx.InvalidURL):
+            valid_transport_coordinates = False
+        matching_provenance = any(
+            isinstance(entry, dict)
+            and entry.get("event") == "pubmed_mcp_fetch"
+            and entry.get("source") == "pubmed"
+            and entry.get("data_source") == self.data_source
+            and str(entry.get("requested_pmid") or "") == article_pmid
+            and entry.get("source_url") == self.source_url
+            and entry.get("retrieved_at") == self.retrieved_at
+            and entry.get("payload_hash") == self.payload_hash
+            for entry in self.provenance
+        )
+        return bool(
+            self.data_source == "pubmed_mcp_api"
+            and article_pmid.isdigit()
+            and isinstance(title, str)
+            and title.strip()
+            and actual_hash == self.payload_hash
+            and valid_transport_coordinates
+            and matching_provenance
+        )
+
+    def to_reference_dict(self, *, agent_notes: str = "") -> Dict[str, Any]:
+        """Return the canonical persistence payload with layered trust data.
+
+        Integrity is checked again here so a mutated or manually constructed
+        transport object cannot cross the persistence boundary as VERIFIED.
+        """
+        if not self._attestation_is_intact():
+            raise PubMedVerificationError(
+                "PubMed transport attestation is incomplete or no longer matches its payload."
+            )
+
+        payload = deepcopy(self.article)
+        payload.update(
+            {
+                "verified": True,
+                "data_source": self.data_source,
+                "retrieved_at": self.retrieved_at,
+                "source_url": self.source_url,
+                "payload_hash": self.payload_hash,
+                "provenance": [deepcopy(entry) for entry in self.provenance],
+                "agent_notes": agent_notes,
+                "trust_level": "verified",
+            }
+        )
+        return payload
+
+
+def validate_article_envelope(
+    envelope: Any,
+    *,
+    requested_pmid: str,
+    source_url: str,
+) -> VerifiedArticlePayload:
+    """Validate and normalize one verified PubMed response envelope."""
+    if not isinstance(envelope, dict):
+        raise PubMedVerificationError("Malformed PubMed response: expected a JSON object.")
+
+    if envelope.get("verified") is not True:
+        raise PubMedVerificationError("PubMed response is not explicitly verified.")
+
+    # ``source`` is the upstream API's minimum provenance assertion.  The
+    # current pubmed-search auxiliary API does not emit a separate
+    # provenance object, so a missing or non-PubMed source must fail closed.
+    upstream_source = envelope.get("source")
+    if not isinstance(upstream_source, str) or upstream_source.strip().lower() != "pubmed":
+        raise PubMedVerificationError("PubMed response is missing trusted source provenance.")
+
+    article = envelope.get("data")
+    if not isinstance(article, dict):
+        raise PubMedVerificationError("Malformed PubMed response: 'data' must be a JSON object.")
+
+    response_pmid = str(article.get("pmid") or "").strip()
+    if not response_pmid:
+        raise PubMedVerificationError("Malformed PubMed response: article PMID is missing.")
+    if response_pmid != requested_pmid:
+        raise PubMedVerificationError(
+            f"PubMed identity mismatch: requested PMID {requested_pmid}, "
+            f"received PMID {response_pmid}."
+        )
+    if not isinstance(article.get("title"), str) or not article["title"].strip():
+        raise PubMedVerificationError("Malformed PubMed response: article title is missing.")
+
+    return _mint_verified_payload(
+        article,
+        source=upstream_source.strip().lower(),
+        requested_pmid=requested_pmid,
+        source_url=source_url,
+    )
+
+
+def _mint_verified_payload(
+    article: Dict[str, Any], *, source: str, requested_pmid: str, source_url: str
+) -> VerifiedArticlePayload:
+    payload_hash = _canonical_payload_hash(article)
+    retrieved_at = datetime.now(timezone.utc).isoformat()
+    provenance = (
+        {
+            "event": "pubmed_mcp_fetch",
+            "source": source,
+            "data_source": "pubmed_mcp_api",
+            "requested_pmid": requested_pmid,
+            "source_url": source_url,
+            "retrieved_at": retrieved_at,
+            "payload_hash": payload_hash,
+        },
+    )
+
+    return VerifiedArticlePayload(
+        article=deepcopy(article),
+        data_source="pubmed_mcp_api",
+        retrieved_at=retrieved_at,
+        source_url=source_url,
+        payload_hash=payload_hash,
+        provenance=provenance,
+    )
@@ -0,0 +1,353 @@
+"""
+Table 1 Engine - Baseline characteristics from a few grouped passes.
+
+``build_table_one`` computes every summary with vectorized pandas
+aggregations instead of filtering the frame per variable, group and category:
+
+- one ``groupby().agg`` over all continuous columns (n, mean, SD per group),
+  one ``groupby().quantile`` over the non-normal ones (median, Q1, Q3), and
+  the same reductions on the whole frame for the Overall column;
+- one ``factorize`` + ``bincount`` over (group, category) codes per
+  categorical column; the group column is factorized once.
+
+Tests run on those aggregates: Student's t (``ttest_ind_from_stats``) and
+one-way ANOVA from group n/mean/SD for all continuous columns at once, and
+chi-square from each count matrix. Rendering only needs those aggregates
+(``mean_sd_rows``, ``count_rows``), so ``streaming_stats`` builds the same
+table from chunked reads. Non-normal columns (``nonnormal_cols``)
+are shown as median [Q1, Q3] and tested with Mann-Whitney U / Kruskal-Wallis,
+which need the raw values of that column.
+
+The result is a ``TableOne`` that renders Markdown, CSV and DOCX, so every
+output format shows the same numbers.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import math
+from collections.abc import Collection, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+logger = structlog.get_logger()
+
+TABLE_TITLE = "Table 1. Baseline Characteristics"
+
+
+def format_pvalue(p: float) -> str:
+    """Format p-value according to medical conventions."""
+    if p is None or math.isnan(p):
+        return "N/A"
+    if p < 0.001:
+        return "<0.001"
+    elif p < 0.01:
+        return f"{p:.3f}"
+    elif p < 0.05:
+        return f"{p:.3f}*"
+    else:
+        return f"{p:.3f}"
+
+
+def markdown_table(header: Sequence[str], rows: Sequence[Sequence[str]]) -> str:
+    """Create a padded markdown table from header and rows."""
+    width = len(header)
+    padded = [list(row) + [""] * (width - len(row)) for row in rows]
+    all_rows = [list(header)] + padded
+    col_widths = [max(len(str(row[i])) for row in all_rows) for i in range(width)]
+
+    def line(cells: Sequence[Any]) -> str:
+        return "| " + " | ".join(str(c).ljust(w) for c, w in zip(cells, col_widths)) + " |"
+
+    separator = "|-" + "-|-".join("-" * w for w in col_widths) + "-|"
+    return "\n".join([line(header), separator, *(line(row) for row in padded)])
+
+
+@dataclass
+class TableOne:
+    """Rendered-cell intermediate shared by every output format."""
+
+    header: list[str]
+    rows: list[list[str]]
+    footnotes: list[str]
+
+    def to_markdown(self) -> str:
+        notes = "".join(f"*{note}*\n" for note in self.footnotes)
+        return f"## {TABLE_TITLE}\n\n{markdown_table(self.header, self.rows)}\n\n{notes}"
+
+    def to_csv(self) -> str:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(self.header)
+        writer.writerows(self.rows)
+        return buffer.getvalue()
+
+    def write_docx(self, path: str | Path) -> None:
+        from docx import Document
+
+        doc = Document()
+        doc.add_heading(TABLE_TITLE, level=2)
+        table = doc.add_table(rows=1, cols=len(self.header))
+        table.style = "Table Grid"
+        for cell, text in zip(table.rows[0].cells, self.header):
+            cell.text = text
+        for row in self.rows:
+            for cell, text in zip(table.add_row().cells, row):
+                cell.text = text
+        for note in self.footnotes:
+            doc.add_paragraph().add_run(note).italic = True
+        doc.save(str(path))
+
+    def save(self, path: str | Path) -> None:
+        """Write the table in the format given by the file suffix (.md, .csv, .docx)."""
+        suffix = Path(path).suffix.lower()
+        if suffix == ".docx":
+            self.write_docx(path)
+            return
+        text = self.to_csv() if suffix == ".csv" else self.to_markdown()
+        Path(path).write_text(text, encoding="utf-8")
+
+
+def build_table_one(
+    df: pd.DataFrame,
+    group_col: str,
+    continuous_cols: Sequence[str],
+    categorical_cols: Sequence[str],
+    nonnormal_cols: Collection[str] = (),
+) -> TableOne:
+    """
+    Compute Table 1 for ``df`` stratified by ``group_col``.
+
+    Columns missing from ``df`` are skipped. ``nonnormal_cols`` marks
+    continuous columns to report as median [Q1, Q3].
+    """
+    import numpy as np
+    import pandas as pd
+
+    group_codes, group_index = pd.factorize(df[group_col])
+    groups = list(group_index)
+    grouped = df.groupby(group_col, sort=False)
+    sizes = np.bincount(group_codes[group_codes >= 0], minlength=len(groups))
+
+    continuous = [c for c in continuous_cols if c in df.columns]
+    nonnormal = [c for c in continuous if c in nonnormal_cols]
+    rows = _continuous_rows(df, grouped, groups, continuous, nonnormal)
+    for col in categorical_cols:
+        if col in df.columns:
+            rows.extend(_categorical_rows(df[col], group_codes, sizes))
+
+    return TableOne(
+        header=table_header(len(df), groups, sizes),
+        rows=rows,
+        footnotes=table_footnotes(bool(nonnormal)),
+    )
+
+
+def table_header(total: int, groups: Sequence[Any], sizes: Sequence[int] | np.ndarray) -> list[str]:
+    """Header row: variable, Overall, one column per group, P-value."""
+    header = ["Variable", f"Overall (N={total})"]
+    header += [f"{group} (N={n})" for group, n in zip(groups, sizes)]
+    header.append("P-value")
+    return header
+
+
+def mean_sd_rows(
+    cols: Sequence[str],
+    n: np.ndarray,
+    means: np.ndarray,
+    sds: np.ndarray,
+    overall_means: np.ndarray,
+    overall_sds: np.ndarray,
+) -> list[list[str]]:
+    """Mean ± SD rows with t-test/ANOVA p-values from (groups x cols) summary arrays."""
+    n_groups = n.shape[0]
+    p_values = parametric_tests(n, means, sds)[1] if n_groups >= 2 else []
+    rows = []
+    for j, col in enumerate(cols):
+        cells = [f"{overall_means[j]:.1f} ± {overall_sds[j]:.1f}"]
+        cells += [f"{means[i, j]:.1f} ± {sds[i, j]:.1f}" for i in range(n_groups)]
+        rows.append([col, *cells, format_pvalue(p_values[j]) if n_groups >= 2 else "-"])
+    return rows
+
+
+def _continuous_rows(
+    df: pd.DataFrame,
+    grouped: Any,
+    groups: list[Any],
+    cols: list[str],
+    nonnormal: list[str],
+) -> list[list[str]]:
+    if not cols:
+        return []
+    stats_by_group = grouped[cols].agg(["count", "mean", "std"]).reindex(groups)
+    overall = df[cols].agg(["mean", "std"])
+    rows = mean_sd_rows(
+        cols,
+        stats_by_group.xs("count", axis=1, level=1)[cols].to_numpy(dtype=float),
+        stats_by_group.xs("mean", axis=1, level=1)[cols].to_numpy(dtype=float),
+        stats_by_group.xs("std", axis=1, level=1)[cols].to_numpy(dtype=float),
+        overall.loc["mean", cols].to_numpy(dtype=float),
+        overall.loc["std", cols].to_numpy(dtype=float),
+    )
+    if nonnormal:
+        quartiles = grouped[nonnormal].quantile([0.25, 0.5, 0.75])
+        overall_q = df[nonnormal].quantile([0.25, 0.5, 0.75])
+        p_values = _rank_pvalues(grouped, nonnormal, len(groups))
+        for row in rows:
+            col = row[0]
+            if col in p_values:
+                cells = [_iqr(overall_q[col])]
+                cells += [_iqr(quartiles[col].get(group)) for group in groups]
+                row[1:] = [*cells, format_pvalue(p_values[col]) if len(groups) >= 2 else "-"]
+    return rows
+
+
+def _iqr(q: Any) -> str:
+    if q is None:
+        return "N/A"
+    return f"{q[0.5]:.1f} [{q[0.25]:.1f}, {q[0.75]:.1f}]"
+
+
+def parametric_tests(
+    n: np.ndarray, means: np.ndarray, sds: np.ndarray
+) -> tuple[list[float], list[float]]:
+    """
+    Student's t (2 groups) or one-way ANOVA F (>2) per column from group summaries.
+
+    Arrays are (groups x columns); returns (statistics, p-values).
+    """
+    import numpy as np
+    from scipy import stats
+
+    k = n.shape[0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if k == 2:
+            stat, p = stats.ttest_ind_from_stats(
+                means[0], sds[0], n[0], means[1], sds[1], n[1], equal_var=True
+            )
+        elif k > 2:
+            present = n > 0
+            total = n.sum(axis=0)
+            grand = np.where(present, n * means, 0).sum(axis=0) / total
+            ss_between = np.where(present, n * (means - grand) ** 2, 0).sum(axis=0)
+            ss_within = np.where(n > 1, (n - 1) * sds**2, 0).sum(axis=0)
+            df_between = present.sum(axis=0) - 1
+            df_within = total - present.sum(axis=0)
+            stat = (ss_between / df_between) / (ss_within / df_within)
+            p = stats.f.sf(stat, df_between, df_within)
+        else:
+            return [math.nan] * n.shape[1], [math.nan] * n.shape[1]
+    return [float(v) for v in np.atleast_1d(stat)], [float(v) for v in np.atleast_1d(p)]
+
+
+def _rank_pvalues(grouped: Any, cols: list[str], n_groups: int) -> dict[str, float]:
+    """Mann-Whitney U (2 groups) or Kruskal-Wallis (>2) p-values per column."""
+    from scipy import stats
+
+    p_values: dict[str, float] = {}
+    for col in cols:
+        samples = [values.dropna().to_numpy() for _, values in grouped[col]]
+        try:
+            if n_groups == 2:
+                p_values[col] = float(stats.mannwhitneyu(*samples).pvalue)
+            else:
+                p_values[col] = float(stats.kruskal(*samples).pvalue)
+        except ValueError:
+            logger.debug("Rank test failed for %s", col, exc_info=True)
+            p_values[col] = math.nan
+    return p_values
+
+
+def _factorize(values: pd.Series) -> tuple[np.ndarray, Any]:
+    """Integer codes (-1 = missing) and categories, sorted when comparable."""
+    import pandas as pd
+
+    try:
+        return pd.factorize(values, sort=True)
+    except TypeError:  # mixed, unorderable categories keep first-seen order
+        return pd.factorize(values)
+
+
+def _categorical_rows(
+    values: pd.Series,
+    group_codes: np.ndarray,
+    sizes: np.ndarray,
+) -> list[list[str]]:
+    """Rows for one categorical column from a single bincount over (group, category)."""
+    categories, overall, counts = contingency(values, group_codes, len(sizes))
+    return count_rows(str(values.name), categories, overall, counts, sizes, len(values))
+
+
+def contingency(
+    values: pd.Series, group_codes: np.ndarray, n_groups: int
+) -> tuple[list[Any], np.ndarray, np.ndarray]:
+    """
+    Categories, overall counts and (groups x categories) counts of ``values``.
+
+    ``group_codes`` are ``pd.factorize`` codes of the group column (-1 = missing).
+    """
+    import numpy as np
+
+    codes, categories = _factorize(values)
+    n_cats = len(categories)
+    present = codes >= 0
+    overall = np.bincount(codes[present], minlength=n_cats)
+    paired = present & (group_codes >= 0)
+    counts = np.bincount(
+        group_codes[paired] * n_cats + codes[paired], minlength=n_groups * n_cats
+    ).reshape(n_groups, n_cats)
+    return list(categories), overall, counts
+
+
+def count_rows(
+    name: str,
+    categories: Sequence[Any],
+    overall: np.ndarray,
+    counts: np.ndarray,
+    sizes: Sequence[int] | np.ndarray,
+    total: int,
+) -> list[list[str]]:
+    """n (%) rows for one categorical column from its (groups x categories) counts."""
+    from scipy import stats
+
+    p_cell = "-"
+    if len(sizes) >= 2:
+        try:
+            observed = counts[:, counts.sum(axis=0) > 0]
+            observed = observed[observed.sum(axis=1) > 0]
+            p_cell = format_pvalue(float(stats.chi2_contingency(observed)[1]))
+        except ValueError:
+            logger.debug("Chi-square test failed for %s", name, exc_info=True)
+            p_cell = "N/A"
+
+    rows = []
+    for j, cat in enumerate(categories):
+        row = [f"{name}: {cat}", f"{overall[j]} ({overall[j] / total * 100:.1f}%)"]
+        for i, size in enumerate(sizes):
+            row.append(f"{counts[i, j]} ({counts[i, j] / size * 100 if size else 0:.1f}%)")
+        row.append(p_cell if j == 0 else "")
+        rows.append(row)
+    return rows
+
+
+def table_footnotes(has_nonnormal: bool) -> list[str]:
+    """Footnotes describing the summaries and tests used."""
+    if has_nonnormal:
+        return [
+            "Values are presented as mean ± SD or median [Q1, Q3] for continuous variables "
+            "and n (%) for categorical variables.",
+            "P-values: Student's t-test or ANOVA (Mann-Whitney U or Kruskal-Wallis for "
+            "median [Q1, Q3]) for continuous variables; Chi-square test for categorical variables.",
+        ]
+    return [
+        "Values are presented as mean ± SD for continuous variables and n (%) for categorical variables.",
+        "P-values: Student's t-test or ANOVA for continuous variables; Chi-square test for categorical variables.",
+    ]
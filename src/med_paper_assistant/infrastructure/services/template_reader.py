@@ -5,21 +5,31 @@ This module reads Word templates and extracts structural information,
 allowing the MCP Agent (AI) to make intelligent decisions about content placement.
 """
 
+from __future__ import annotations
+
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
-
-from docx import Document
+from typing import TYPE_CHECKING, List, Optional
 
 from med_paper_assistant.shared.path_guard import resolve_child_path
 from med_paper_assistant.shared.template_paths import get_templates_dir
 
+if TYPE_CHECKING:
+    from docx import Document
+
 
 def _find_project_templates_dir() -> Path:
     """Locate the repository templates directory regardless of caller or bundle depth."""
     return get_templates_dir()
 
 
+def _open_docx(path: Path) -> Document:
+    """Open a .docx file; python-docx is imported on first use, not at start-up."""
+    from docx import Document
+
+    return Document(str(path))
+
+
 @dataclass
 class TemplateSection:
     """Represents a section in the template."""
@@ -82,7 +92,7 @@ class TemplateReader:
         if not resolved_template_path.exists():
             raise FileNotFoundError(f"Template not found: {resolved_template_path}")
 
-        doc = Document(str(resolved_template_path))
+        doc = _open_docx(resolved_template_path)
         sections = []
 
         for i, para in enumerate(doc.paragraphs):
@@ -5,6 +5,7 @@ Shared utilities for MCP tools.
 from .checkpoint import auto_checkpoint_writing
 from .facade_dispatch import (
     get_optional_tool_decorator,
+    invoke_flushed_tool_handler,
     invoke_tool_handler,
     normalize_facade_action,
 )
@@ -34,6 +35,7 @@ from .tool_logging import (
 __all__ = [
     "auto_checkpoint_writing",
     "get_optional_tool_decorator",
+    "invoke_flushed_tool_handler",
     "invoke_tool_handler",
     "normalize_facade_action",
     "facade_schema_json",
@@ -0,0 +1,239 @@
+"""Off-event-loop execution of synchronous MCP tool handlers.
+
+Facade tools are ``async`` but most registered handlers are synchronous and do
+blocking work (pandas loads, pandoc, git subprocesses, Foam rebuilds). Running
+them inline stalls the MCP event loop — and every concurrent request and
+progress notification with it — until they return.
+
+``run_sync_handler`` dispatches a synchronous handler to a bounded worker pool
+(``MEDPAPER_TOOL_WORKERS``, read on first dispatch, default 4; ``0`` runs
+inline on the loop).
+
+Handlers resolve their project through the process-global active project
+(``ensure_project_context`` switches it), so dispatch is gated on the loop
+before a worker is taken:
+
+- calls that may write run alone;
+- read-only calls (handler names starting with ``READ_ONLY_PREFIXES``) run
+  together when they target the same project, or the active one
+  (``project=None``); a read for another project waits until they finish.
+
+Queue depth and wait times are available from ``tool_execution_stats()``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import os
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import structlog
+
+from med_paper_assistant.infrastructure.persistence.post_write_queue import get_post_write_queue
+
+logger = structlog.get_logger()
+
+DEFAULT_TOOL_WORKERS = 4
+TOOL_WORKERS_ENV = "MEDPAPER_TOOL_WORKERS"
+READ_ONLY_PREFIXES = ("list_", "get_", "read_", "show_", "search_", "find_", "describe_")
+_SLOW_WAIT_MS = 1000.0
+
+_executor: ThreadPoolExecutor | None = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+_project_gates: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _ActiveProjectGate] = (
+    weakref.WeakKeyDictionary()
+)
+_stats_lock = threading.Lock()
+_stats: dict[str, float] = {
+    "calls": 0,
+    "queued": 0,
+    "running": 0,
+    "waiting_for_lock": 0,
+    "max_queue_depth": 0,
+    "total_wait_ms": 0.0,
+    "max_wait_ms": 0.0,
+}
+
+
+def resolve_tool_workers() -> int:
+    """``MEDPAPER_TOOL_WORKERS`` (0 = inline), else the default."""
+    try:
+        return max(0, int(os.environ.get(TOOL_WORKERS_ENV, DEFAULT_TOOL_WORKERS)))
+    except ValueError:
+        return DEFAULT_TOOL_WORKERS
+
+
+def is_read_only_handler(handler: Callable[..., Any]) -> bool:
+    """Whether ``handler`` only reads project state, judged by its name."""
+    return getattr(handler, "__name__", "").startswith(READ_ONLY_PREFIXES)
+
+
+def _get_executor(workers: int) -> ThreadPoolExecutor:
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(workers, thread_name_prefix="mcp-tool")
+            _executor_workers = workers
+        return _executor
+
+
+class _ActiveProjectGate:
+    """Readers–writer gate over the process-global active project.
+
+    Readers share the gate while they agree on the project (``None`` joins any
+    group); a writer waits for the gate to empty and blocks new readers.
+    """
+
+    def __init__(self) -> None:
+        self._cond = asyncio.Condition()
+        self._readers = 0
+        self._reader_project: str | None = None
+        self._writing = False
+        self._writers_waiting = 0
+
+    def _can_share(self, project: str | None) -> bool:
+        if self._writing or self._writers_waiting:
+            return False
+        return self._readers == 0 or project is None or project == self._reader_project
+
+    async def acquire(self, *, exclusive: bool, project: str | None) -> None:
+        async with self._cond:
+            if not exclusive:
+                await self._cond.wait_for(lambda: self._can_share(project))
+                if self._readers == 0 or self._reader_project is None:
+                    self._reader_project = project
+                self._readers += 1
+                return
+            self._writers_waiting += 1
+            try:
+                await self._cond.wait_for(lambda: not self._writing and self._readers == 0)
+            finally:
+                self._writers_waiting -= 1
+                self._cond.notify_all()
+            self._writing = True
+
+    async def release(self, *, exclusive: bool) -> None:
+        async with self._cond:
+            if exclusive:
+                self._writing = False
+            else:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._reader_project = None
+            self._cond.notify_all()
+
+
+def _project_gate() -> _ActiveProjectGate:
+    loop = asyncio.get_running_loop()
+    gate = _project_gates.get(loop)
+    if gate is None:
+        gate = _project_gates[loop] = _ActiveProjectGate()
+    return gate
+
+
+def _adjust(**deltas: float) -> None:
+    with _stats_lock:
+        for key, delta in deltas.items():
+            _stats[key] += delta
+        depth = _stats["queued"] + _stats["waiting_for_lock"]
+        _stats["max_queue_depth"] = max(_stats["max_queue_depth"], depth)
+
+
+def _record_wait(tool: str, wait_ms: float) -> None:
+    with _stats_lock:
+        _stats["total_wait_ms"] += wait_ms
+        _stats["max_wait_ms"] = max(_stats["max_wait_ms"], wait_ms)
+    if wait_ms >= _SLOW_WAIT_MS:
+        logger.warning("tool_executor.slow_dispatch", tool=tool, wait_ms=round(wait_ms, 1))
+
+
+class _Call:
+    """One handler invocation; records its queue wait when a worker starts it."""
+
+    def __init__(self, handler: Callable[..., Any], kwargs: dict[str, Any]) -> None:
+        self.handler = handler
+        self.kwargs = kwargs
+        self.read_only = is_read_only_handler(handler)
+        self.submitted = time.perf_counter()
+        self.started = False
+
+    def __call__(self) -> Any:
+        self.started = True
+        tool = getattr(self.handler, "__name__", "tool")
+        _record_wait(tool, (time.perf_counter() - self.submitted) * 1000)
+        _adjust(queued=-1, running=1)
+        try:
+            if self.read_only:
+                return self.handler(**self.kwargs)
+            # Deferred post-write side effects never interleave with a write.
+            with get_post_write_queue().hold():
+                return self.handler(**self.kwargs)
+        finally:
+            _adjust(running=-1)
+
+
+async def _dispatch(call: _Call, workers: int) -> Any:
+    _adjust(queued=1)
+    try:
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(_get_executor(workers), context.run, call)
+    finally:
+        if not call.started:  # cancelled before a worker picked it up
+            _adjust(queued=-1)
+
+
+async def run_sync_handler(
+    handler: Callable[..., Any],
+    kwargs: dict[str, Any],
+    *,
+    project: str | None = None,
+) -> Any:
+    """Run a synchronous handler on the worker pool and return its result.
+
+    Args:
+        handler: Synchronous tool handler.
+        kwargs: Keyword arguments for ``handler``.
+        project: Project slug the call switches to; ``None`` means the active project.
+    """
+    workers = resolve_tool_workers()
+    if workers == 0:
+        return handler(**kwargs)
+
+    call = _Call(handler, kwargs)
+    _adjust(calls=1)
+    gate = _project_gate()
+    exclusive = not call.read_only
+    _adjust(waiting_for_lock=1)
+    try:
+        await gate.acquire(exclusive=exclusive, project=project)
+    finally:
+        _adjust(waiting_for_lock=-1)
+    try:
+        return await _dispatch(call, workers)
+    finally:
+        await gate.release(exclusive=exclusive)
+
+
+def tool_execution_stats() -> dict[str, Any]:
+    """Snapshot of dispatch counters: queue depth, running calls and wait times."""
+    with _stats_lock:
+        snapshot = dict(_stats)
+    calls = snapshot["calls"]
+    return {
+        "workers": _executor_workers or resolve_tool_workers(),
+        "calls": int(calls),
+        "queue_depth": int(snapshot["queued"] + snapshot["waiting_for_lock"]),
+        "waiting_for_lock": int(snapshot["waiting_for_lock"]),
+        "running": int(snapshot["running"]),
+        "max_queue_depth": int(snapshot["max_queue_depth"]),
+        "avg_wait_ms": round(snapshot["total_wait_ms"] / calls, 2) if calls else 0.0,
+        "max_wait_ms": round(snapshot["max_wait_ms"], 2),
+    }
@@ -13,6 +13,19 @@ from ..draft.facade import _auto_run_post_write_hooks, _infer_section_name
 ToolMap = Mapping[str, Callable[..., Any]]
 
 
+def _with_post_insert_hooks(result_text: str, project: Optional[str], draft_filename: str) -> str:
+    """Append post-write hook results after a successful figure/table insertion."""
+    if result_text.lstrip().startswith("❌"):
+        return result_text
+    hook_filename = draft_filename or "manuscript.md"
+    return result_text + _auto_run_post_write_hooks(
+        project=project,
+        filename=hook_filename,
+        section=_infer_section_name(hook_filename),
+        content_hint="",
+    )
+
+
 def register_analysis_facade_tools(
     mcp: MCPServer,
     stats_tools: ToolMap,
@@ -53,6 +66,9 @@ def register_analysis_facade_tools(
         group_col: str = "",
         continuous_cols: str = "",
         categorical_cols: str = "",
+        nonnormal_cols: str = "",
+        streaming: bool = False,
+        correction: str = "fdr_bh",
         project: Optional[str] = None,
     ) -> str:
         """
@@ -64,8 +80,7 @@ def register_analysis_facade_tools(
         - create_plot
         - generate_table_one
         - review_asset
-        - insert_figure
-        - insert_table
+        - insert_figure, insert_table
         - list_assets
         - list
         """
@@ -76,7 +91,6 @@ def register_analysis_facade_tools(
             "plot": "create_plot",
             "table_one": "generate_table_one",
             "review_asset_for_insertion": "review_asset",
-            "review_asset": "review_asset",
             "review": "review_asset",
             "figure": "insert_figure",
             "table": "insert_table",
@@ -92,7 +106,7 @@ def register_analysis_facade_tools(
             "analyze_dataset": (
                 stats_tools,
                 "analyze_dataset",
-                {"filename": filename, "project": project},
+                {"filename": filename, "project": project, "streaming": streaming},
             ),
             "run_statistical_test": (
                 stats_tools,
@@ -103,6 +117,8 @@ def register_analysis_facade_tools(
                     "variables": variables,
                     "group_var": group_var or None,
                     "project": project,
+                    "streaming": streaming,
+                    "correction": correction,
                 },
             ),
             "create_plot": (
@@ -127,6 +143,8 @@ def register_analysis_facade_tools(
                     "group_col": group_col,
                     "continuous_cols": continuous_cols,
                     "categorical_cols": categorical_cols,
+                    "nonnormal_cols": nonnormal_cols,
+                    "streaming": streaming,
                     "output_name": output_name or None,
                     "project": project,
                 },
@@ -170,11 +188,7 @@ def register_analysis_facade_tools(
                     "project": project,
                 },
             ),
-            "list_assets": (
-                figure_tools,
-                "list_assets",
-                {"project": project},
-            ),
+            "list_assets": (figure_tools, "list_assets", {"project": project}),
         }
 
         if normalized == "list":
@@ -197,18 +211,9 @@ def register_analysis_facade_tools(
         if handler is None:
             return f"❌ Analysis facade misconfigured: missing handler '{handler_name}'"
 
-        result = await invoke_tool_handler(handler, **kwargs)
-        result_text = str(result)
-        if normalized in {"insert_figure", "insert_table"} and not result_text.lstrip().startswith(
-            "❌"
-        ):
-            hook_filename = draft_filename or "manuscript.md"
-            result_text += _auto_run_post_write_hooks(
-                project=project,
-                filename=hook_filename,
-                section=_infer_section_name(hook_filename),
-                content_hint="",
-            )
+        result_text = str(await invoke_tool_handler(handler, **kwargs))
+        if normalized in {"insert_figure", "insert_table"}:
+            return _with_post_insert_hooks(result_text, project, draft_filename)
         return result_text
 
     return {"analysis_action": analysis_action}
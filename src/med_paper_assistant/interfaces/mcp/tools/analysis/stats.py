@@ -24,6 +24,28 @@ from .._shared import (
     resolve_project_context,
 )
 
+STATISTICAL_TESTS = (
+    "ttest",
+    "paired_ttest",
+    "anova",
+    "chi2",
+    "correlation",
+    "mann_whitney",
+    "kruskal",
+    "batch",
+    "batch_nonparametric",
+)
+
+
+def _analyzer_provenance(call: str) -> str:
+    """Snippet that reproduces one ``Analyzer`` call and prints its result."""
+    return (
+        "from med_paper_assistant.infrastructure.services.analyzer import Analyzer\n"
+        "analyzer = Analyzer()\n"
+        f"result = analyzer.{call}\n"
+        "print(result)"
+    )
+
 
 def _get_tracker(project_info: dict) -> DataArtifactTracker | None:
     """Create a DataArtifactTracker for the current project, or None if no project."""
@@ -60,13 +82,16 @@ def register_stats_tools(
     tool = get_optional_tool_decorator(mcp, register_public_verbs=register_public_verbs)
 
     @tool()
-    def analyze_dataset(filename: str, project: Optional[str] = None) -> str:
+    def analyze_dataset(
+        filename: str, project: Optional[str] = None, streaming: bool = False
+    ) -> str:
         """
         Get descriptive statistics for a CSV dataset (count, mean, std, missing values).
 
         Args:
             filename: CSV filename in data/ directory
             project: Project slug (uses current if omitted)
+            streaming: Read the file in chunks (large files; no quartiles)
         """
         log_tool_call("analyze_dataset", {"filename": filename, "project": project})
 
@@ -87,7 +112,7 @@ def register_stats_tools(
 
         try:
             active_analyzer = _scoped_analyzer(analyzer, project_info)
-            result = active_analyzer.describe_data(filename)
+            result = active_analyzer.describe_data(filename, streaming=streaming)
 
             # Record provenance
             tracker = _get_tracker(project_info) if project_info else None
@@ -95,14 +120,11 @@ def register_stats_tools(
                 tracker.record_artifact(
                     tool_name="analyze_dataset",
                     artifact_type="descriptive",
-                    parameters={"filename": filename},
+                    parameters={"filename": filename, "streaming": streaming},
                     data_source=filename,
                     result_summary=result[:200] if result else None,
-                    provenance_code=(
-                        f"from med_paper_assistant.infrastructure.services.analyzer import Analyzer\n"
-                        f"analyzer = Analyzer()\n"
-                        f"result = analyzer.describe_data('{filename}')\n"
-                        f"print(result)"
+                    provenance_code=_analyzer_provenance(
+                        f"describe_data('{filename}', streaming={streaming})"
                     ),
                 )
 
@@ -124,16 +146,21 @@ def register_stats_tools(
         variables: str,
         group_var: Optional[str] = None,
         project: Optional[str] = None,
+        streaming: bool = False,
+        correction: str = "fdr_bh",
     ) -> str:
         """
         Run a statistical test on CSV data.
 
         Args:
             filename: CSV filename in data/ directory
-            test_type: "ttest", "paired_ttest", "anova", "chi2", "correlation", "mann_whitney", "kruskal"
+            test_type: "ttest", "paired_ttest", "anova", "chi2", "correlation", "mann_whitney", "kruskal",
+                "batch" / "batch_nonparametric" (every variable vs group_var in one call)
             variables: Comma-separated variable names
             group_var: Grouping variable (required for ttest, anova, etc.)
             project: Project slug (uses current if omitted)
+            streaming: Read the file in chunks (large files; not for mann_whitney/kruskal)
+            correction: Batch p-value adjustment: "fdr_bh", "bonferroni", "none"
         """
         log_tool_call(
             "run_statistical_test",
@@ -161,18 +188,8 @@ def register_stats_tools(
         else:
             is_valid, _, project_info = ensure_project_context()
 
-        # Validate test type
-        valid_tests = [
-            "ttest",
-            "paired_ttest",
-            "anova",
-            "chi2",
-            "correlation",
-            "mann_whitney",
-            "kruskal",
-        ]
-        if test_type not in valid_tests:
-            return f"❌ Unknown test type: {test_type}\n\nSupported tests: {', '.join(valid_tests)}"
+        if test_type not in STATISTICAL_TESTS:
+            return f"❌ Unknown test type: {test_type}\n\nSupported tests: {', '.join(STATISTICAL_TESTS)}"
 
         # Parse variables
         var_list = [v.strip() for v in variables.split(",") if v.strip()]
@@ -186,6 +203,8 @@ def register_stats_tools(
                 test_type=test_type,
                 variables=var_list,
                 group_var=group_var,
+                streaming=streaming,
+                correction=correction,
             )
 
             # Record provenance
@@ -196,24 +215,22 @@ def register_stats_tools(
                     "test_type": test_type,
                     "variables": var_list,
                     "group_var": group_var,
+                    "streaming": streaming,
+                    "correction": correction,
                 }
                 vars_str = ", ".join(f"'{v}'" for v in var_list)
                 group_arg = f", group_var='{group_var}'" if group_var else ""
+                group_arg += ", streaming=True" if streaming else ""
+                group_arg += f", correction='{correction}'" if "batch" in test_type else ""
                 tracker.record_artifact(
                     tool_name="run_statistical_test",
                     artifact_type="statistics",
                     parameters=params,
                     data_source=filename,
                     result_summary=result[:300] if result else None,
-                    provenance_code=(
-                        f"from med_paper_assistant.infrastructure.services.analyzer import Analyzer\n"
-                        f"analyzer = Analyzer()\n"
-                        f"result = analyzer.run_statistical_test(\n"
-                        f"    filename='{filename}',\n"
-                        f"    test_type='{test_type}',\n"
-                        f"    variables=[{vars_str}]{group_arg},\n"
-                        f")\n"
-                        f"print(result)"
+                    provenance_code=_analyzer_provenance(
+                        f"run_statistical_test(\n    filename='{filename}',\n"
+                        f"    test_type='{test_type}',\n    variables=[{vars_str}]{group_arg},\n)"
                     ),
                 )
 
@@ -10,6 +10,7 @@ from med_paper_assistant.infrastructure.persistence import ProjectManager, Refer
 from med_paper_assistant.infrastructure.services import Drafter
 from med_paper_assistant.interfaces.mcp.tool_surface import ToolSurface, uses_compact_tool_surface
 
+from .batch import build_reference_batch_handlers
 from .facade import register_reference_facade_tools
 from .manager import register_reference_manager_tools
 
@@ -33,6 +34,9 @@ def register_reference_tools(
     )
     facade_tools = {}
     if compact_surface:
+        # save_batch is a facade action only: the full surface's public verb
+        # count is pinned by tool-surface-authority.json and its docs.
+        manager_tools.update(build_reference_batch_handlers(ref_manager))
         facade_tools = register_reference_facade_tools(
             mcp,
             reference_tools=manager_tools,
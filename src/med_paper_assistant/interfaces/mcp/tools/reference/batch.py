@@ -0,0 +1,60 @@
+"""
+Reference Batch Tools
+
+Verified PubMed import for many PMIDs in one call (reference_action save_batch).
+"""
+
+from collections.abc import Callable
+from typing import Any, Optional
+
+from med_paper_assistant.infrastructure.persistence import ReferenceManager
+
+from .._shared import (
+    ensure_project_context,
+    get_project_list_for_prompt,
+    log_tool_call,
+    log_tool_result,
+)
+
+
+def build_reference_batch_handlers(
+    ref_manager: ReferenceManager,
+) -> dict[str, Callable[..., Any]]:
+    """Build batch handlers for ``reference_action``; never registered as public tools."""
+
+    def save_references_mcp(
+        pmids: str, agent_notes: str = "", project: Optional[str] = None
+    ) -> str:
+        """
+        🔒 Save many references by PMID with verified pubmed-search metadata.
+
+        Args:
+            pmids: Comma- or newline-separated PubMed IDs
+            agent_notes: Optional AI notes applied to every saved reference
+            project: Project slug (default: current)
+        """
+        log_tool_call("save_references_mcp", {"pmids": pmids, "project": project})
+
+        if project:
+            is_valid, msg, _ = ensure_project_context(project)
+            if not is_valid:
+                return f"❌ {msg}\n\n{get_project_list_for_prompt()}"
+
+        parsed = [p.strip() for chunk in pmids.splitlines() for p in chunk.split(",")]
+        parsed = [p for p in parsed if p]
+        if not parsed:
+            return "❌ save_batch requires comma- or newline-separated `pmids`."
+
+        project_manager = ref_manager._project_manager
+        if project_manager is not None and not project_manager.get_current_project():
+            project_manager.get_or_create_temp_project()
+
+        report = ref_manager.save_references_mcp(parsed, agent_notes=agent_notes)
+        result = report.to_markdown()
+        log_tool_result("save_references_mcp", result, success=not report.error)
+        return result
+
+    return {"save_references_mcp": save_references_mcp}
+
+
+__all__ = ["build_reference_batch_handlers"]
@@ -11,6 +11,32 @@ from .._shared import facade_schema_json, invoke_tool_handler, normalize_facade_
 
 ToolMap = Mapping[str, Callable[..., Any]]
 
+_ACTION_ALIASES = {
+    "actions": "list",
+    "help": "list",
+    "supported": "list",
+    "save": "save_agent",
+    "save_reference": "save_agent",
+    "agent_save": "save_agent",
+    "references": "list_saved",
+    "saved": "list_saved",
+    "list_references": "list_saved",
+    "list_saved_references": "list_saved",
+    "search_local": "search",
+    "search_local_references": "search",
+    "get_reference_details": "details",
+    "read_reference_fulltext": "fulltext",
+    "save_reference_pdf": "save_pdf",
+    "format_references": "format",
+    "rebuild_foam_aliases": "rebuild_aliases",
+    "delete_reference": "delete",
+    "get_reference_for_analysis": "analysis_get",
+    "save_reference_analysis": "analysis_save",
+    "save_references_mcp": "save_batch",
+    "import_pmids": "save_batch",
+    "batch_save": "save_batch",
+}
+
 
 def register_reference_facade_tools(
     mcp: MCPServer,
@@ -44,6 +70,7 @@ def register_reference_facade_tools(
 
         Actions:
         - save_agent (unverified fallback only)
+        - save_batch (verified PubMed saves for comma/newline-separated ``pmids``)
         - list (machine-readable action schema)
         - list_saved
         - search
@@ -58,29 +85,7 @@ def register_reference_facade_tools(
 
         Use the direct ``save_reference_mcp`` tool for verified PubMed saves.
         """
-        aliases = {
-            "actions": "list",
-            "help": "list",
-            "supported": "list",
-            "save": "save_agent",
-            "save_reference": "save_agent",
-            "agent_save": "save_agent",
-            "references": "list_saved",
-            "saved": "list_saved",
-            "list_references": "list_saved",
-            "list_saved_references": "list_saved",
-            "search_local": "search",
-            "search_local_references": "search",
-            "get_reference_details": "details",
-            "read_reference_fulltext": "fulltext",
-            "save_reference_pdf": "save_pdf",
-            "format_references": "format",
-            "rebuild_foam_aliases": "rebuild_aliases",
-            "delete_reference": "delete",
-            "get_reference_for_analysis": "analysis_get",
-            "save_reference_analysis": "analysis_save",
-        }
-        normalized = normalize_facade_action(action, aliases)
+        normalized = normalize_facade_action(action, _ACTION_ALIASES)
 
         format_pmids = pmids or pmid
         action_specs: dict[str, tuple[str, dict[str, Any]]] = {
@@ -104,6 +109,10 @@ def register_reference_facade_tools(
                 "read_reference_fulltext",
                 {"pmid": pmid, "max_chars": max_chars},
             ),
+            "save_batch": (
+                "save_references_mcp",
+                {"pmids": format_pmids, "project": project},
+            ),
             "save_pdf": (
                 "save_reference_pdf",
                 {"pmid": pmid, "pdf_content": pdf_content},
@@ -154,7 +163,7 @@ def register_reference_facade_tools(
             return facade_schema_json(
                 tool="reference_action",
                 actions=actions,
-                aliases=aliases,
+                aliases=_ACTION_ALIASES,
                 notes=[
                     "Use action='list_saved' to list saved references.",
                     "Use direct save_reference_mcp(pmid) for verified saves; "
@@ -2,7 +2,8 @@
 Tool Health Diagnostic — MCP tool for workspace-level tool telemetry inspection.
 
 Provides diagnose_tool_health(), which agents can call at pipeline start to identify
-tools with high error rates, high misuse rates, or zero invocations.
+tools with high error rates, high misuse rates, or zero invocations, plus the
+in-process tool dispatch queue (depth and wait times).
 
 Reads from ToolInvocationStore (workspace-level) — no project context required.
 Output format: TOON (Token-Oriented Object Notation) for token efficiency.
@@ -21,6 +22,7 @@ from med_paper_assistant.infrastructure.persistence.tool_invocation_store import
 )
 
 from .._shared import get_optional_tool_decorator, log_tool_call, log_tool_error, log_tool_result
+from .._shared.tool_executor import tool_execution_stats
 
 # Thresholds for health categorisation
 _ERROR_RATE_THRESHOLD = 0.25  # >25% error rate → high_error
@@ -97,11 +99,7 @@ def register_tool_health_tools(
 
             # Compute health score (0–100)
             total_tools = len(all_stats)
-            problem_tool_names = set()
-            for t, _ in high_error:
-                problem_tool_names.add(t)
-            for t, _ in high_misuse:
-                problem_tool_names.add(t)
+            problem_tool_names = {t for t, _ in high_error + high_misuse}
             problem_count = len(problem_tool_names)
             health_score = max(0, round(100 * (1 - problem_count / max(total_tools, 1))))
 
@@ -110,6 +108,7 @@ def register_tool_health_tools(
                 f"health_score: {health_score}/100",
                 f"tools_tracked: {total_tools}",
                 f"problem_tools: {problem_count}",
+                _format_execution_stats(),
             ]
 
             if high_error:
@@ -162,6 +161,12 @@ def register_tool_health_tools(
     return {"diagnose_tool_health": diagnose_tool_health}
 
 
+def _format_execution_stats() -> str:
+    """One TOON row of the in-process tool dispatch counters (queue depth, waits)."""
+    stats = tool_execution_stats()
+    return "tool_dispatch{" + ",".join(stats) + "}: " + ",".join(str(v) for v in stats.values())
+
+
 def _flush_health_alerts(
     workspace_root: Path,
     high_error: list[tuple[str, dict]],
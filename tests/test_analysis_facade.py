@@ -146,3 +146,33 @@ def test_analysis_action_forwards_watermark_review_on_compact_surface():
         "Reviewer inspected the original and documented the reuse decision."
     )
     assert review_calls["project"] == "demo"
+
+
+def test_analysis_action_forwards_batch_correction_on_compact_surface():
+    stats_calls: dict[str, object] = {}
+
+    def run_statistical_test(**kwargs):
+        stats_calls.update(kwargs)
+        return "stats-ok"
+
+    handlers = register_analysis_facade_tools(
+        MCPServer("analysis-correction-test"),
+        stats_tools={"run_statistical_test": run_statistical_test},
+        table_one_tools={},
+        figure_tools={},
+    )
+    result = __import__("asyncio").run(
+        handlers["analysis_action"](
+            action="stats",
+            filename="cohort.csv",
+            test_type="batch",
+            variables="age,sex",
+            group_var="arm",
+            correction="bonferroni",
+            project="demo",
+        )
+    )
+
+    assert result == "stats-ok"
+    assert stats_calls["correction"] == "bonferroni"
+    assert stats_calls["group_var"] == "arm"
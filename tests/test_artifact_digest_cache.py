@@ -0,0 +1,102 @@
+"""Tests for the stat-keyed reference artifact digest cache."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from med_paper_assistant.infrastructure.persistence import artifact_digest_cache, file_freshness
+from med_paper_assistant.infrastructure.persistence.artifact_digest_cache import (
+    REVISION_WORKERS_ENV,
+    artifact_digest,
+    clear_artifact_digests,
+    map_reference_dirs,
+    resolve_revision_workers,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_artifact_digests()
+    yield
+    clear_artifact_digests()
+
+
+def _count_streams(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    calls: list[Path] = []
+    original = artifact_digest_cache._stream_digest
+
+    def counting(path, key):
+        calls.append(path)
+        return original(path, key)
+
+    monkeypatch.setattr(artifact_digest_cache, "_stream_digest", counting)
+    return calls
+
+
+def test_streams_in_chunks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(artifact_digest_cache, "CHUNK_SIZE", 7)
+    data = b"%PDF-1.7 reference source bytes" * 5
+    path = tmp_path / "paper.pdf"
+    path.write_bytes(data)
+
+    digest = artifact_digest(path)
+
+    assert digest == (len(data), hashlib.sha256(data).hexdigest())
+
+
+def test_non_regular_files(tmp_path: Path) -> None:
+    target = tmp_path / "real.pdf"
+    target.write_bytes(b"x" * 32)
+    link = tmp_path / "link.pdf"
+    link.symlink_to(target)
+
+    assert artifact_digest(link) is None
+    assert artifact_digest(tmp_path) is None
+    assert artifact_digest(tmp_path / "missing.pdf") is None
+
+
+def test_settled_file_is_hashed_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _count_streams(monkeypatch)
+    path = tmp_path / "figure.png"
+    path.write_bytes(b"\x89PNG" + b"0" * 60)
+    first = artifact_digest(path)
+
+    real = time.time_ns
+    monkeypatch.setattr(file_freshness.time, "time_ns", lambda: real() + 3_000_000_000)
+    for _ in range(5):
+        assert artifact_digest(path) == first
+    # First read, then one re-hash that re-stamps the racy entry
+    assert len(calls) == 2
+
+    path.write_bytes(b"\x89PNG" + b"0" * 61)
+    assert artifact_digest(path) == (65, hashlib.sha256(path.read_bytes()).hexdigest())
+    assert len(calls) == 3
+
+
+def test_recent_same_size_rewrite_is_rehashed(tmp_path: Path) -> None:
+    path = tmp_path / "section.md"
+    path.write_bytes(b"A" * 40)
+    stat = path.stat()
+    assert artifact_digest(path) == (40, hashlib.sha256(b"A" * 40).hexdigest())
+
+    # Same size and restored mtime, inside the racy window
+    path.write_bytes(b"B" * 40)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert artifact_digest(path) == (40, hashlib.sha256(b"B" * 40).hexdigest())
+
+
+def test_map_reference_dirs_keeps_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert map_reference_dirs(lambda n: n * n, range(20), max_workers=4) == [
+        n * n for n in range(20)
+    ]
+    assert map_reference_dirs(str, [], max_workers=4) == []
+
+    monkeypatch.setenv(REVISION_WORKERS_ENV, "0")
+    assert resolve_revision_workers() == 1
+    monkeypatch.setenv(REVISION_WORKERS_ENV, "many")
+    assert resolve_revision_workers() == artifact_digest_cache.DEFAULT_REVISION_WORKERS
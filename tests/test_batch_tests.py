@@ -0,0 +1,95 @@
+"""Tests for batch statistical testing with multiple-comparison control."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from med_paper_assistant.infrastructure.services.analyzer import Analyzer
+from med_paper_assistant.infrastructure.services.batch_tests import (
+    adjust_pvalues,
+    run_batch_tests,
+)
+
+
+@pytest.fixture
+def cohort() -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    n = 300
+    df = pd.DataFrame(
+        {
+            "arm": rng.choice(["drug", "placebo"], n),
+            "site": rng.choice(["north", "south", "east"], n),
+            "age": rng.normal(60, 10, n),
+            "bmi": rng.normal(27, 4, n),
+            "sex": rng.choice(["F", "M"], n),
+            "stage": rng.choice([1, 2, 3], n),
+        }
+    )
+    df.loc[df["arm"] == "drug", "bmi"] += 3
+    df.loc[::13, "age"] = np.nan
+    return df
+
+
+@pytest.fixture
+def analyzer(tmp_path: Path, cohort: pd.DataFrame) -> Analyzer:
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    cohort.to_csv(data_dir / "cohort.csv", index=False)
+    return Analyzer(data_dir=str(data_dir), results_dir=str(tmp_path / "results"))
+
+
+class TestAdjustPvalues:
+    def test_fdr_matches_scipy(self) -> None:
+        p = np.random.default_rng(0).uniform(0, 0.2, 25)
+        np.testing.assert_allclose(adjust_pvalues(p), stats.false_discovery_control(p))
+
+    def test_bonferroni_caps_at_one_and_skips_nan(self) -> None:
+        adjusted = adjust_pvalues([0.01, np.nan, 0.4], "bonferroni")
+        assert adjusted[0] == pytest.approx(0.02)
+        assert np.isnan(adjusted[1])
+        assert adjusted[2] == 0.8
+
+    def test_unknown_correction_is_rejected(self) -> None:
+        with pytest.raises(ValueError, match="holm"):
+            adjust_pvalues([0.1], "holm")
+
+
+class TestRunBatchTests:
+    def test_pvalues_match_single_variable_tests(self, cohort: pd.DataFrame) -> None:
+        result = run_batch_tests(cohort, ["age", "bmi", "sex", "stage"], "arm")
+        rows = {row.variable: row for row in result.rows}
+
+        drug, placebo = (cohort[cohort["arm"] == g]["age"].dropna() for g in ("drug", "placebo"))
+        assert rows["age"].test == "t-test"
+        assert rows["age"].p_value == pytest.approx(stats.ttest_ind(drug, placebo).pvalue)
+        table = pd.crosstab(cohort["stage"], cohort["arm"])
+        assert rows["stage"].test == "Chi-square"
+        assert rows["stage"].p_value == pytest.approx(stats.chi2_contingency(table)[1])
+        assert result.significant == ["bmi"]
+
+    def test_nonparametric_uses_rank_tests(self, cohort: pd.DataFrame) -> None:
+        result = run_batch_tests(cohort, ["bmi"], "site", nonparametric=True)
+        samples = [cohort.loc[cohort["site"] == g, "bmi"] for g in ("north", "south", "east")]
+
+        assert result.rows[0].test == "Kruskal-Wallis"
+        assert result.rows[0].p_value == pytest.approx(stats.kruskal(*samples).pvalue)
+
+    def test_missing_column_raises_key_error(self, cohort: pd.DataFrame) -> None:
+        with pytest.raises(KeyError):
+            run_batch_tests(cohort, ["age", "weight"], "arm")
+
+
+class TestAnalyzerBatch:
+    def test_batch_report_lists_every_variable(self, analyzer: Analyzer) -> None:
+        report = analyzer.run_statistical_test(
+            "cohort.csv", "batch", variables=["age", "bmi", "sex"], group_var="arm"
+        )
+        assert "FDR (BH) P" in report
+        assert all(f"| {v} " in report for v in ("age", "bmi", "sex"))
+
+    def test_batch_needs_group_var(self, analyzer: Analyzer) -> None:
+        report = analyzer.run_statistical_test("cohort.csv", "batch", variables=["age"])
+        assert report.startswith("Error")
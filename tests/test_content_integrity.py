@@ -636,3 +636,85 @@ def test_removal_package_detection_requires_human_review():
 
     assert status is IntegrityGateStatus.HUMAN_REVIEW
     assert any("watermark-removal package" in reason for reason in reasons)
+
+
+class _CountingRemovalAdapter:
+    calls = 0
+    status = RemovalPackageStatus.NOT_DETECTED
+
+    def inspect(self, _path, _mime_type):
+        type(self).calls += 1
+        return RemovalPackageAssessment(
+            status=type(self).status,
+            provider="remove-ai-watermarks",
+            provider_version=REMOVAL_PACKAGE_VERSION,
+            summary="counted",
+            checks_completed=REMOVAL_PACKAGE_REQUIRED_CHECKS,
+        )
+
+
+@pytest.fixture()
+def counting_adapters(monkeypatch):
+    from med_paper_assistant.infrastructure.external import content_integrity
+
+    class AbsentProvenance:
+        def inspect(self, _path, _mime_type):
+            return ProvenanceAssessment(
+                status=ProvenanceStatus.ABSENT, provider="test", summary="absent"
+            )
+
+    _CountingRemovalAdapter.calls = 0
+    _CountingRemovalAdapter.status = RemovalPackageStatus.NOT_DETECTED
+    monkeypatch.setattr(content_integrity, "C2paProvenanceAdapter", AbsentProvenance)
+    monkeypatch.setattr(
+        content_integrity, "RemoveAiWatermarksInspectionAdapter", _CountingRemovalAdapter
+    )
+    return _CountingRemovalAdapter
+
+
+def test_reinspection_cache_reuses_receipt_for_identical_bytes(tmp_path: Path, counting_adapters):
+    from med_paper_assistant.infrastructure.external import (
+        ReinspectionCache,
+        reinspect_cached,
+    )
+
+    cache = ReinspectionCache()
+    first_dir, second_dir = tmp_path / "a", tmp_path / "b"
+    first_dir.mkdir()
+    second_dir.mkdir()
+    _write_png(first_dir / "figure.png")
+    _write_png(second_dir / "figure.png")
+
+    first = reinspect_cached(first_dir / "figure.png", asset_path="a.png", cache=cache)
+    second = reinspect_cached(second_dir / "figure.png", asset_path="b.png", cache=cache)
+
+    assert counting_adapters.calls == 1
+    assert second.asset_path == "b.png"
+    assert second.to_dict()["file"] == first.to_dict()["file"]
+    assert cache.stats() == {"hits": 1, "misses": 1, "writes": 1, "entries": 1}
+
+    # New bytes, a new filename, or no cache all force the adapters to run again
+    (first_dir / "figure.png").write_bytes((first_dir / "figure.png").read_bytes() + b"\0")
+    reinspect_cached(first_dir / "figure.png", cache=cache)
+    (second_dir / "figure.png").rename(second_dir / "watermark.png")
+    reinspect_cached(second_dir / "watermark.png", cache=cache)
+    reinspect_cached(second_dir / "watermark.png", cache=None)
+    assert counting_adapters.calls == 4
+
+
+def test_reinspection_cache_skips_adapter_errors(tmp_path: Path, counting_adapters):
+    from med_paper_assistant.infrastructure.external import (
+        ReinspectionCache,
+        reinspect_cached,
+    )
+
+    cache = ReinspectionCache()
+    asset = tmp_path / "figure.png"
+    _write_png(asset)
+    counting_adapters.status = RemovalPackageStatus.ERROR
+
+    reinspect_cached(asset, cache=cache)
+    reinspect_cached(asset, cache=cache)
+
+    assert counting_adapters.calls == 2
+    assert cache.stats()["entries"] == 0
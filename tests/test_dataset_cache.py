@@ -0,0 +1,170 @@
+"""Tests for the content-keyed dataset cache behind Analyzer.load_data."""
+
+import os
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from med_paper_assistant.infrastructure.persistence import file_freshness
+from med_paper_assistant.infrastructure.services import dataset_cache
+from med_paper_assistant.infrastructure.services.analyzer import Analyzer
+from med_paper_assistant.infrastructure.services.dataset_cache import (
+    DatasetCache,
+    infer_dtypes,
+)
+
+
+def _write_csv(path: Path, rows: int = 40, offset: int = 0) -> Path:
+    pd.DataFrame(
+        {
+            "id": [f"P{i:04d}" for i in range(rows)],
+            "arm": ["drug" if i % 2 else "placebo" for i in range(rows)],
+            "age": [40 + (i + offset) % 30 for i in range(rows)],
+        }
+    ).to_csv(path, index=False)
+    return path
+
+
+def _touch_later(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestInferDtypes:
+    def test_repetitive_text_becomes_category(self) -> None:
+        df = infer_dtypes(pd.DataFrame({"arm": ["a", "b"] * 5, "id": list("abcdefghij")}))
+        assert isinstance(df["arm"].dtype, pd.CategoricalDtype)
+        assert not isinstance(df["id"].dtype, pd.CategoricalDtype)
+
+    def test_numeric_columns_are_unchanged(self) -> None:
+        df = infer_dtypes(pd.DataFrame({"flag": [0, 1] * 5, "x": [1.5] * 10}))
+        assert df["flag"].dtype == "int64"
+        assert df["x"].dtype == "float64"
+
+
+class TestDatasetCache:
+    def test_repeated_loads_parse_once(self, tmp_path: Path) -> None:
+        path = _write_csv(tmp_path / "d.csv")
+        cache = DatasetCache(memory_budget_bytes=10_000_000)
+
+        first = cache.load(path)
+        second = cache.load(path)
+
+        assert cache.stats["parses"] == 1
+        assert cache.stats["memory_hits"] == 1
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_mutating_a_loaded_frame_does_not_touch_the_cache(self, tmp_path: Path) -> None:
+        path = _write_csv(tmp_path / "d.csv")
+        cache = DatasetCache(memory_budget_bytes=10_000_000)
+
+        frame = cache.load(path)
+        frame.loc[0, "age"] = -1
+        frame["extra"] = 1
+
+        again = cache.load(path)
+        assert again.loc[0, "age"] == 40
+        assert "extra" not in again.columns
+
+    def test_edited_source_is_reparsed(self, tmp_path: Path) -> None:
+        path = _write_csv(tmp_path / "d.csv")
+        cache = DatasetCache(memory_budget_bytes=10_000_000)
+        cache.load(path)
+
+        _write_csv(path, offset=5)
+        _touch_later(path)
+
+        assert cache.load(path).loc[0, "age"] == 45
+        assert cache.stats["parses"] == 2
+
+    def test_recent_same_size_rewrite_is_reparsed(self, tmp_path: Path) -> None:
+        path = _write_csv(tmp_path / "d.csv")
+        cache_dir = tmp_path / "cache"
+        stat = path.stat()
+        cache = DatasetCache(memory_budget_bytes=10_000_000)
+        assert cache.load(path, cache_dir=cache_dir).loc[0, "age"] == 40
+
+        # Same size and restored mtime, inside the racy window
+        _write_csv(path, offset=1)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert path.stat().st_size == stat.st_size
+
+        assert cache.load(path, cache_dir=cache_dir).loc[0, "age"] == 41
+        fresh = DatasetCache(memory_budget_bytes=10_000_000)
+        assert fresh.load(path, cache_dir=cache_dir).loc[0, "age"] == 41
+
+    def test_zero_budget_keeps_nothing_in_memory(self, tmp_path: Path) -> None:
+        path = _write_csv(tmp_path / "d.csv")
+        cache = DatasetCache(memory_budget_bytes=0)
+
+        cache.load(path)
+        cache.load(path)
+
+        assert cache.stats["parses"] == 2
+
+    def test_least_recently_used_frame_is_evicted(self, tmp_path: Path) -> None:
+        paths = [_write_csv(tmp_path / f"d{i}.csv", offset=i) for i in range(3)]
+        probe = DatasetCache(memory_budget_bytes=10_000_000)
+        size = int(probe.load(paths[0]).memory_usage(deep=True).sum())
+        cache = DatasetCache(memory_budget_bytes=size * 2 + size // 2)
+
+        for path in paths:
+            cache.load(path)
+        cache.load(paths[2])
+        cache.load(paths[0])
+
+        assert cache.stats["evictions"] >= 1
+        assert cache.stats["memory_hits"] == 1
+        assert cache.stats["parses"] == 4
+
+    def test_columnar_copy_survives_a_new_process(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        pytest.importorskip("pyarrow")
+        path = _write_csv(tmp_path / "d.csv")
+        cache_dir = tmp_path / "cache"
+        real = time.time_ns
+        monkeypatch.setattr(file_freshness.time, "time_ns", lambda: real() + 3_000_000_000)
+        DatasetCache(memory_budget_bytes=0).load(path, cache_dir=cache_dir)
+        assert len(list(cache_dir.glob("*.parquet"))) == 1
+
+        hashed: list[Path] = []
+        read_bytes = Path.read_bytes
+        monkeypatch.setattr(Path, "read_bytes", lambda p: hashed.append(p) or read_bytes(p))
+        fresh = DatasetCache(memory_budget_bytes=0)
+        frame = fresh.load(path, cache_dir=cache_dir)
+
+        assert fresh.stats == {"memory_hits": 0, "disk_hits": 1, "parses": 0, "evictions": 0}
+        assert hashed == []  # settled digest came from the manifest
+        assert isinstance(frame["arm"].dtype, pd.CategoricalDtype)
+
+        _write_csv(path, offset=5)
+        _touch_later(path)
+        fresh.load(path, cache_dir=cache_dir)
+        assert len(list(cache_dir.glob("*.parquet"))) == 1
+
+    def test_disk_cache_can_be_disabled(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv(dataset_cache.DISK_CACHE_ENV, "0")
+        path = _write_csv(tmp_path / "d.csv")
+
+        DatasetCache(memory_budget_bytes=0).load(path, cache_dir=tmp_path / "cache")
+
+        assert not (tmp_path / "cache").exists()
+
+
+def test_scoped_analyzers_share_the_process_cache(tmp_path: Path) -> None:
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    _write_csv(data_dir / "cohort.csv", rows=57)
+    cache = dataset_cache.get_dataset_cache()
+    before = cache.stats["parses"]
+
+    for _ in range(3):
+        df = Analyzer(data_dir=str(data_dir)).scoped_to_project(tmp_path).load_data("cohort.csv")
+        assert len(df) == 57
+
+    assert cache.stats["parses"] == before + 1
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import json
+import time
 from pathlib import Path
 
 import pytest
 
 from med_paper_assistant.domain.paper_types import PAPER_TYPES
+from med_paper_assistant.infrastructure.persistence import file_freshness
+from med_paper_assistant.infrastructure.persistence.constraint_plan import load_constraint_plan
 from med_paper_assistant.infrastructure.persistence.domain_constraint_engine import (
     _CORE_ANTI_AI_PATTERNS,
     BASE_CONSTRAINTS,
@@ -566,6 +569,111 @@ class TestValidateAgainstConstraints:
         assert len(overlap) == 0
 
 
+# ── Compiled Constraint Plan ──────────────────────────────────────
+
+
+class TestConstraintPlan:
+    """The compiled plan is shared per learned-file version and keeps constraint order."""
+
+    def test_plan_reused_across_calls(self, engine: DomainConstraintEngine) -> None:
+        first = load_constraint_plan(
+            "original-research", engine._learned_path, engine._compile_plan
+        )
+        engine.validate_against_constraints("Some text.", section="introduction")
+        again = load_constraint_plan(
+            "original-research", engine._learned_path, engine._compile_plan
+        )
+        assert again is first
+
+    def test_learned_file_rewrite_recompiles(self, engine: DomainConstraintEngine) -> None:
+        content = "It goes without saying that we delve into this."
+        before = engine.validate_against_constraints(content, section="introduction")
+        assert before["learned_constraints"] == 0
+
+        engine._learned_path.parent.mkdir(parents=True, exist_ok=True)
+        learned = {
+            "id": "L001",
+            "rule": "anti_ai_vocabulary",
+            "category": "vocabulary",
+            "severity": "CRITICAL",
+            "params": {"forbidden_patterns": ["it goes without saying", "Delve Into"]},
+        }
+        engine._learned_path.write_text(json.dumps({"constraints": [learned]}), encoding="utf-8")
+
+        after = engine.validate_against_constraints(content, section="introduction")
+        assert after["learned_constraints"] == 1
+        assert after["total_constraints"] == before["total_constraints"] + 1
+        learned_hits = [v["message"] for v in after["violations"] if v["constraint_id"] == "L001"]
+        assert learned_hits == [
+            "AI-typical phrase detected: 'it goes without saying'",
+            "AI-typical phrase detected: 'Delve Into'",
+        ]
+        # The shared phrase is still reported by the base constraint first
+        ids = [v["constraint_id"] for v in after["violations"] if "delve" in v["message"].lower()]
+        assert ids[-1] == "L001" and len(ids) == 2
+        assert after["passed"] is False
+
+        engine._learned_path.unlink()
+        assert engine.validate_against_constraints(content)["learned_constraints"] == 0
+
+    def test_learned_file_settles_after_racy_window(
+        self, engine: DomainConstraintEngine, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        engine.evolve(
+            constraint_id="L001",
+            rule="anti_ai_vocabulary",
+            category=ConstraintCategory.VOCABULARY,
+            description="Extra forbidden phrase",
+            params={"forbidden_patterns": ["it goes without saying"]},
+            reason="test",
+        )
+        reads: list[Path] = []
+        original = Path.read_bytes
+
+        def counting(self: Path) -> bytes:
+            if self.name == DomainConstraintEngine.LEARNED_FILE:
+                reads.append(self)
+            return original(self)
+
+        monkeypatch.setattr(Path, "read_bytes", counting)
+        engine.validate_against_constraints("Text.", section="introduction")
+
+        real = time.time_ns
+        monkeypatch.setattr(file_freshness.time, "time_ns", lambda: real() + 3_000_000_000)
+        for _ in range(6):
+            result = engine.validate_against_constraints("Text.", section="introduction")
+            assert result["learned_constraints"] == 1
+        # Compile read, then one confirming hash that re-stamps the entry
+        assert len(reads) == 2
+
+    def test_shared_manuscript_views(self, engine: DomainConstraintEngine) -> None:
+        content = (
+            "# Results\n\nShared paragraph text here.\n\n"
+            "#  methods  \n\nShared   paragraph text here.\n\n"
+            "## Results\n\nUnique closing paragraph words."
+        )
+        result = engine.validate_against_constraints(content, section="manuscript")
+        rules = [v["rule"] for v in result["violations"]]
+        assert "methods_before_results" in rules
+        missing = [v["message"] for v in result["violations"] if v["rule"] == "required_sections"]
+        assert "Required section 'Methods' not found" not in missing
+        assert "Required section 'Introduction' not found" in missing
+        # A repeated heading keeps only its last body, so the first paragraph has no twin
+        assert "no_overlap_between_sections" not in rules
+
+    def test_empty_heading_line_does_not_hide_next_heading(
+        self, engine: DomainConstraintEngine
+    ) -> None:
+        content = (
+            "## \n## Introduction\nIntro.\n\n#\n## Methods\nMethods.\n\n"
+            "## Results\nResults.\n\n## Discussion\nDiscussion.\n\n## Conclusion\nEnd.\n"
+        )
+        result = engine.validate_against_constraints(content, section="manuscript")
+        rules = [v["rule"] for v in result["violations"]]
+        assert "required_sections" not in rules
+        assert "methods_before_results" not in rules
+
+
 # ── Constraint Summary ────────────────────────────────────────────
 
 
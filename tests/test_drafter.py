@@ -3,6 +3,7 @@ import subprocess
 
 import pytest
 
+from med_paper_assistant.infrastructure.persistence.post_write_queue import get_post_write_queue
 from med_paper_assistant.infrastructure.persistence.project_manager import ProjectManager
 from med_paper_assistant.infrastructure.persistence.reference_manager import ReferenceManager
 from med_paper_assistant.infrastructure.services.drafter import (
@@ -480,6 +481,7 @@ def test_create_draft_refreshes_draft_section_graph_notes(tmp_path):
         "results.md",
         "# Results\n\nThis section mentions [[figure-1]] and reports the main outcome.",
     )
+    get_post_write_queue().flush()
 
     graph_note = tmp_path / "notes" / "draft-sections" / "results-results.md"
     assert graph_note.exists()
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from med_paper_assistant.infrastructure.persistence.foam_graph_writer import FoamGraphWriter
+from med_paper_assistant.infrastructure.persistence.reference_manager import ReferenceManager
+
+
+def _manager_with_draft(tmp_path: Path) -> ReferenceManager:
+    (tmp_path / "drafts").mkdir()
+    (tmp_path / "drafts" / "draft.md").write_text(
+        "# Methods\n\nWe enrolled adults.\n\n# Results\n\nMortality fell.\n", encoding="utf-8"
+    )
+    manager = ReferenceManager(base_dir=str(tmp_path / "references"))
+    manager.save_reference(
+        {
+            "pmid": "31415926",
+            "title": "Lactate clearance in sepsis",
+            "authors": ["Doe J"],
+            "year": "2020",
+            "keywords": ["sepsis"],
+        }
+    )
+    return manager
+
+
+def _mtimes(root: Path) -> dict[str, int]:
+    return {str(path): path.stat().st_mtime_ns for path in sorted(root.rglob("*.md"))}
+
+
+def test_writer_skips_identical_content_and_prunes_records(tmp_path: Path) -> None:
+    writer = FoamGraphWriter(tmp_path / "registry" / FoamGraphWriter.STATE_FILE)
+    note = tmp_path / "note.md"
+
+    assert writer.write_text(note, "first") is True
+    before = note.stat().st_mtime_ns
+    assert writer.write_text(note, "first") is False
+    assert note.stat().st_mtime_ns == before
+    assert writer.write_text(note, "second") is True
+
+    writer.prune(tmp_path, [])
+    assert not note.exists()
+    writer.save()
+
+    fresh = FoamGraphWriter(tmp_path / "registry" / FoamGraphWriter.STATE_FILE)
+    assert fresh.write_text(note, "second") is True
+
+
+def test_second_refresh_reuses_every_stage_and_rewrites_nothing(tmp_path: Path) -> None:
+    manager = _manager_with_draft(tmp_path)
+    manager.refresh_foam_graph()
+    before = _mtimes(tmp_path / "notes")
+
+    writer = manager._graph_writer()
+    reused, written = writer.stats["stages_reused"], writer.stats["written"]
+    stats = manager.refresh_foam_graph()
+
+    assert stats["draft_sections"] == 2
+    assert writer.stats["stages_reused"] - reused == 4
+    assert writer.stats["written"] == written
+    assert _mtimes(tmp_path / "notes") == before
+
+    # A new process warm-starts from registry/foam-graph.json.
+    restarted = ReferenceManager(base_dir=str(tmp_path / "references"))
+    restarted.refresh_foam_graph()
+    assert restarted._graph_writer().stats["stages_reused"] == 4
+
+
+def test_draft_edit_rebuilds_only_the_draft_stage(tmp_path: Path) -> None:
+    manager = _manager_with_draft(tmp_path)
+    manager.refresh_foam_graph()
+    writer = manager._graph_writer()
+    built = writer.stats["stages_built"]
+
+    (tmp_path / "drafts" / "draft.md").write_text(
+        "# Methods\n\nWe enrolled adults.\n\n# Discussion\n\nLimits apply.\n", encoding="utf-8"
+    )
+    stats = manager.refresh_foam_graph()
+
+    sections_dir = tmp_path / "notes" / "draft-sections"
+    assert writer.stats["stages_built"] - built == 1
+    assert stats["draft_sections"] == 2
+    assert (sections_dir / "draft-discussion.md").exists()
+    assert not (sections_dir / "draft-results.md").exists()
+
+    # Hand-deleting a generated note forces its stage to run again.
+    (sections_dir / "draft-methods.md").unlink()
+    manager.refresh_foam_graph()
+    assert (sections_dir / "draft-methods.md").exists()
@@ -23,6 +23,13 @@ def _git_log(cwd: Path) -> str:
     return result.stdout or ""
 
 
+def _commit_count(cwd: Path) -> int:
+    result = subprocess.run(
+        ["git", "rev-list", "--count", "HEAD"], cwd=str(cwd), capture_output=True, text=True
+    )
+    return int(result.stdout.strip())
+
+
 @pytest.fixture
 def git_repo(tmp_path):
     """Create a real temporary git repository."""
@@ -114,6 +121,42 @@ class TestCommitDraft:
 
         assert "patch_draft" in _git_log(git_repo)
 
+    def test_commit_batch_folds_logical_commits_into_one(self, git_repo):
+        committer = GitAutoCommitter(git_repo)
+        drafts = git_repo / "drafts"
+        drafts.mkdir()
+        (drafts / "intro.md").write_text("intro", encoding="utf-8")
+        (drafts / "methods.md").write_text("methods", encoding="utf-8")
+        before = _commit_count(git_repo)
+
+        result = committer.commit_batch(
+            [
+                GitAutoCommitter.draft_change("intro.md", "create_draft"),
+                GitAutoCommitter.draft_change("methods.md", "patch_draft"),
+                GitAutoCommitter.draft_change("intro.md", "create_draft"),
+            ]
+        )
+
+        assert result is True
+        assert _commit_count(git_repo) == before + 1
+        assert "auto-batch: 2 changes" in _git_log(git_repo)
+
+    def test_single_process_pair_per_commit(self, git_repo):
+        committer = GitAutoCommitter(git_repo)
+        (git_repo / "drafts").mkdir()
+        (git_repo / "drafts" / "a.md").write_text("a", encoding="utf-8")
+
+        with patch.object(committer, "_run_git", wraps=committer._run_git) as run_git:
+            assert committer.commit_draft("a.md") is True
+            assert committer.commit_draft("a.md") is False
+
+        assert [call.args[0][0] for call in run_git.call_args_list] == [
+            "add",
+            "commit",
+            "add",
+            "commit",
+        ]
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # commit_reference
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+
+from med_paper_assistant.infrastructure.persistence.writing_hooks import (
+    HookResult,
+    WritingHooksEngine,
+    _hook_cache,
+)
+from med_paper_assistant.infrastructure.persistence.writing_hooks._hook_cache import (
+    HookResultCache,
+)
+
+CONTENT = (
+    "# Introduction\n\nFurthermore, it is worth noting the gap [[smith2024_12345678]].\n\n"
+    "# Methods\n\nWe enrolled 40 patients (N = 40).\n"
+)
+
+
+def _project(tmp_path):
+    (tmp_path / ".audit").mkdir()
+    ref_dir = tmp_path / "references" / "smith2024_12345678"
+    ref_dir.mkdir(parents=True)
+    (ref_dir / "metadata.json").write_text(json.dumps({"pmid": "12345678"}), encoding="utf-8")
+    return tmp_path
+
+
+def test_second_engine_replays_identical_results(tmp_path) -> None:
+    project = _project(tmp_path)
+    first = WritingHooksEngine(project).run_post_manuscript_hooks(CONTENT)
+
+    engine = WritingHooksEngine(project)
+    second = engine.run_post_manuscript_hooks(CONTENT)
+
+    assert {k: v.to_dict() for k, v in second.items()} == {k: v.to_dict() for k, v in first.items()}
+    timings = engine.hook_timings()
+    assert timings["C3"]["cache"] == "hit"
+    assert timings["C5"]["cache"] == "hit"
+    assert timings["F"]["cache"] == "off"
+    assert engine.hook_cache_stats()["hits"] == 9  # C3–C6, C10–C14
+    assert engine.hook_cache_stats()["misses"] == 0
+
+
+def test_reference_and_profile_changes_invalidate(tmp_path) -> None:
+    project = _project(tmp_path)
+    WritingHooksEngine(project).run_post_manuscript_hooks(CONTENT)
+
+    (project / "references" / "jones2023_87654321").mkdir()
+    (project / "journal-profile.yaml").write_text(
+        "paper:\n  type: original-research\n", encoding="utf-8"
+    )
+    engine = WritingHooksEngine(project)
+    engine.run_post_manuscript_hooks(CONTENT)
+    timings = engine.hook_timings()
+
+    assert timings["C3"]["cache"] == "hit"
+    assert timings["C5"]["cache"] == "miss"  # references tree changed
+    assert timings["C6"]["cache"] == "miss"  # journal profile changed
+
+
+def test_references_stamp_follows_metadata_not_artifacts(tmp_path, monkeypatch) -> None:
+    project = _project(tmp_path)
+    ref_dir = project / "references" / "smith2024_12345678"
+    WritingHooksEngine(project).run_post_manuscript_hooks(CONTENT)
+    stamps: list[str] = []
+    real_version = _hook_cache.references_version
+    monkeypatch.setattr(
+        _hook_cache,
+        "references_version",
+        lambda project_dir: stamps.append(str(project_dir)) or real_version(project_dir),
+    )
+
+    (ref_dir / "fulltext").mkdir()
+    (ref_dir / "fulltext" / "paper.md").write_text("full text", encoding="utf-8")
+    engine = WritingHooksEngine(project)
+    engine.run_post_manuscript_hooks(CONTENT)
+    assert engine.hook_timings()["C10"]["cache"] == "hit"
+    assert len(stamps) == 1  # one stamp shared by C5, C10 and C12
+
+    (ref_dir / "metadata.json").write_text(
+        json.dumps({"pmid": "12345678", "fulltext_ingested": True}), encoding="utf-8"
+    )
+    engine.run_post_manuscript_hooks(CONTENT)
+    assert engine.hook_timings()["C10"]["cache"] == "miss"
+    assert len(stamps) == 2
+
+
+def test_cache_disabled_without_audit_dir(tmp_path) -> None:
+    engine = WritingHooksEngine(tmp_path)
+    engine.run_post_write_hooks(CONTENT)
+
+    assert engine.hook_cache_stats() == {}
+    assert not (tmp_path / ".audit").exists()
+
+
+def test_lru_eviction_keeps_recently_used_entries(tmp_path) -> None:
+    cache = HookResultCache(tmp_path, max_entries=4)
+    for i in range(4):
+        cache.put(f"k{i}", HookResult(hook_id="A1", passed=True, stats={"i": i}))
+    assert cache.get("k0") is not None  # refresh k0
+
+    cache.put("k4", HookResult(hook_id="A1", passed=True))
+
+    stats = cache.stats()
+    assert stats["entries"] == 3
+    assert stats["evictions"] == 2
+    assert cache.get("k0") is not None
+    assert cache.get("k1") is None
+
+
+def test_results_that_do_not_round_trip_are_not_stored(tmp_path) -> None:
+    cache = HookResultCache(tmp_path)
+    cache.put("tuple", HookResult(hook_id="C3", passed=True, stats={"pair": (1, 2)}))
+
+    assert cache.get("tuple") is None
+    assert cache.stats()["writes"] == 0
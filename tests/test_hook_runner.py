@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from med_paper_assistant.infrastructure.persistence.writing_hooks import (
+    HookResult,
+    WritingHooksEngine,
+)
+from med_paper_assistant.infrastructure.persistence.writing_hooks._runner import (
+    resolve_hook_workers,
+)
+
+CONTENT = (
+    "# Methods\n\nWe enrolled 40 patients. Furthermore, it is worth noting the protocol.\n\n"
+    "# Results\n\nForty patients completed follow-up [[smith2024_12345678]].\n"
+)
+
+
+def test_parallel_batches_match_serial_batches(tmp_path) -> None:
+    serial = WritingHooksEngine(tmp_path, hook_workers=1)
+    parallel = WritingHooksEngine(tmp_path, hook_workers=8)
+
+    for runner in ("run_post_write_hooks", "run_post_manuscript_hooks", "run_precommit_hooks"):
+        expected = getattr(serial, runner)(CONTENT)
+        actual = getattr(parallel, runner)(CONTENT)
+        assert list(actual) == list(expected)
+        assert {k: v.to_dict() for k, v in actual.items()} == {
+            k: v.to_dict() for k, v in expected.items()
+        }
+
+    assert set(parallel.hook_timings()) == {"P1", "P2", "P2b", "P2c", "P4", "P5", "P6", "P7"}
+    assert all(t["wall_ms"] >= 0 and t["cpu_ms"] >= 0 for t in parallel.hook_timings().values())
+
+
+def test_batch_respects_concurrency_limit(tmp_path) -> None:
+    engine = WritingHooksEngine(tmp_path, hook_workers=2)
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def hook() -> HookResult:
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+        return HookResult(hook_id="X", passed=True)
+
+    results = engine._run_hook_batch({f"H{i}": hook for i in range(6)})
+
+    assert list(results) == [f"H{i}" for i in range(6)]
+    assert peak[0] == 2
+
+
+def test_worker_count_resolution(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MEDPAPER_HOOK_WORKERS", "3")
+    assert resolve_hook_workers() == 3
+    assert resolve_hook_workers(0) == 1
+    monkeypatch.setenv("MEDPAPER_HOOK_WORKERS", "many")
+    assert resolve_hook_workers() == 4
@@ -0,0 +1,143 @@
+"""Tests for the shared compiled journal-profile cache."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+
+from med_paper_assistant.infrastructure.persistence import file_freshness
+from med_paper_assistant.infrastructure.persistence.journal_profile_cache import (
+    clear_journal_profile_cache,
+    load_journal_profile,
+)
+from med_paper_assistant.infrastructure.persistence.pipeline_gate_validator import (
+    PipelineGateValidator,
+)
+from med_paper_assistant.infrastructure.persistence.review_hooks import ReviewHooksEngine
+from med_paper_assistant.infrastructure.persistence.writing_hooks import WritingHooksEngine
+
+PROFILE = {
+    "paper": {
+        "type": "case-report",
+        "sections": [
+            {"name": "Introduction", "word_limit": None},
+            {"name": "introduction", "word_limit": 400, "counts_toward_total": True},
+            {"name": "Case", "word_limit": "600", "counts_toward_total": True},
+        ],
+    },
+    "pipeline": {
+        "tolerance": {"word_percent": 10},
+        "writing": {"citation_density": {"introduction": 80, "case": "oops"}},
+    },
+    "word_limits": {"total_manuscript": 1500},
+    "assets": {"figures_max": 3},
+    "references": {
+        "minimum_reference_limits": {"case-report": 8},
+        "reference_limits": {"case-report": 20},
+        "max_references": 40,
+    },
+}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_journal_profile_cache()
+    yield
+    clear_journal_profile_cache()
+
+
+def _write(project_dir: Path, profile: dict) -> Path:
+    path = project_dir / "journal-profile.yaml"
+    path.write_text(yaml.safe_dump(profile), encoding="utf-8")
+    return path
+
+
+def test_compiled_lookups(tmp_path: Path) -> None:
+    _write(tmp_path, PROFILE)
+    profile = load_journal_profile(tmp_path)
+
+    assert profile is not None
+    assert profile.paper_type == "case-report"
+    assert dict(profile.section_word_limits) == {"introduction": 400, "case": 600}
+    assert profile.body_sections == frozenset({"introduction", "case"})
+    assert dict(profile.citation_density) == {"introduction": 80}
+    assert profile.word_tolerance_pct == 10
+    assert profile.total_word_limit == 1500
+    assert (profile.figures_max, profile.tables_max) == (3, None)
+    assert profile.max_references_for("case-report") == 20
+    assert profile.max_references_for("review-article") == 40
+
+
+def test_missing_and_invalid_profiles(tmp_path: Path) -> None:
+    assert load_journal_profile(tmp_path) is None
+
+    (tmp_path / "journal-profile.yaml").write_text("paper: [unclosed", encoding="utf-8")
+    assert load_journal_profile(tmp_path) is None
+
+    (tmp_path / "journal-profile.yaml").write_text("- a list\n", encoding="utf-8")
+    assert load_journal_profile(tmp_path) is None
+
+    (tmp_path / "journal-profile.yaml").write_text("", encoding="utf-8")
+    empty = load_journal_profile(tmp_path)
+    assert empty is not None and empty.paper_type == "original-research"
+
+
+def test_shared_until_file_changes(tmp_path: Path) -> None:
+    _write(tmp_path, PROFILE)
+    first = load_journal_profile(tmp_path)
+    assert load_journal_profile(tmp_path) is first
+
+    # Same size, written within the same mtime tick: caught by the content hash
+    path = _write(tmp_path, {**PROFILE, "word_limits": {"total_manuscript": 1600}})
+    second = load_journal_profile(tmp_path)
+    assert second is not first
+    assert second is not None and second.total_word_limit == 1600
+
+    path.unlink()
+    assert load_journal_profile(tmp_path) is None
+
+
+def test_profile_settles_after_the_racy_window(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _write(tmp_path, PROFILE)
+    reads: list[Path] = []
+    original = Path.read_bytes
+
+    def counting(self: Path) -> bytes:
+        if self.name == "journal-profile.yaml":
+            reads.append(self)
+        return original(self)
+
+    monkeypatch.setattr(Path, "read_bytes", counting)
+    first = load_journal_profile(tmp_path)
+
+    real = time.time_ns
+    monkeypatch.setattr(file_freshness.time, "time_ns", lambda: real() + 3_000_000_000)
+    for _ in range(6):
+        assert load_journal_profile(tmp_path) is first
+    # The first read parses; one more confirms the hash and re-stamps the entry
+    assert len(reads) == 2
+
+
+def test_engines_share_one_profile(tmp_path: Path) -> None:
+    _write(tmp_path, PROFILE)
+    writing = WritingHooksEngine(tmp_path)
+    review = ReviewHooksEngine(tmp_path)
+
+    assert writing._profile is review._profile is load_journal_profile(tmp_path)
+    assert writing._journal_profile is writing._profile.data
+    assert writing._get_section_word_limit("INTRODUCTION") == 400
+    assert writing._get_section_word_limit("Discussion") == 1500  # DEFAULT_WORD_LIMITS
+    assert writing._get_citation_density_threshold("Case") == 0
+    assert writing._get_min_references() == 8
+    assert writing._get_max_references() == 20
+    assert review._get_max_references() == 20
+
+    validator = PipelineGateValidator(tmp_path)
+    paper_type = validator._get_paper_type_from_profile()
+    assert paper_type == "case-report"
+    assert validator._resolve_min_references(paper_type) == 8
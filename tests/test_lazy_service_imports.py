@@ -0,0 +1,47 @@
+"""MCP server start-up must not import heavy analysis/export libraries."""
+
+from __future__ import annotations
+
+import json
+import subprocess  # nosec B404
+import sys
+
+HEAVY = ("pandas", "scipy", "matplotlib", "seaborn", "docx", "pypandoc")
+
+
+def _loaded_after(snippet: str) -> list[str]:
+    code = f"import json, sys\n{snippet}\nprint(json.dumps([m for m in {HEAVY!r} if m in sys.modules]))"
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-c", code],
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_create_server_defers_heavy_imports() -> None:
+    snippet = (
+        "from med_paper_assistant.interfaces.mcp.server import create_server\ncreate_server('full')"
+    )
+    assert _loaded_after(snippet) == []
+
+
+def test_services_package_exports_resolve_lazily() -> None:
+    snippet = (
+        "import med_paper_assistant.infrastructure.services as services\n"
+        "assert 'Analyzer' in dir(services)\n"
+        "assert services.WordWriter.__name__ == 'WordWriter'"
+    )
+    assert _loaded_after(snippet) == []
+
+
+def test_heavy_library_loads_on_first_use(tmp_path) -> None:
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "d.csv").write_text("a,b\n1,2\n", encoding="utf-8")
+    snippet = (
+        "from med_paper_assistant.infrastructure.services import Analyzer\n"
+        f"Analyzer(data_dir={str(tmp_path / 'data')!r}).load_data('d.csv')"
+    )
+    assert _loaded_after(snippet) == ["pandas"]
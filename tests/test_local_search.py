@@ -1,6 +1,11 @@
 import json
 
 from med_paper_assistant.infrastructure.persistence.reference_manager import ReferenceManager
+from med_paper_assistant.infrastructure.services.citation_assistant import (
+    CitationAssistant,
+    ClaimType,
+    TextClaim,
+)
 
 
 def test_local_search(tmp_path):
@@ -61,3 +66,59 @@ def test_local_search(tmp_path):
     # Test 4: Search "heart" -> Should find none
     results = rm.search_local("heart")
     assert len(results) == 0
+
+
+def _write_metadata(ref_dir, pmid, **fields):
+    target = ref_dir / pmid
+    target.mkdir(parents=True, exist_ok=True)
+    (target / "metadata.json").write_text(json.dumps({"pmid": pmid, **fields}), encoding="utf-8")
+
+
+def test_local_search_ranks_title_hits_above_abstract_hits(tmp_path):
+    ref_dir = tmp_path / "references"
+    _write_metadata(ref_dir, "1", title="Outcomes after surgery", abstract="Sepsis was rare.")
+    _write_metadata(ref_dir, "2", title="Sepsis outcomes", abstract="Lactate in sepsis.")
+
+    results = ReferenceManager(base_dir=str(ref_dir)).search_local("sepsis")
+
+    assert [meta["pmid"] for meta in results] == ["2", "1"]
+
+
+def test_search_ranked_scores_all_terms_in_one_pass_and_tracks_edits(tmp_path):
+    ref_dir = tmp_path / "references"
+    _write_metadata(ref_dir, "1", title="Lactate clearance", mesh_terms=["Sepsis"])
+    _write_metadata(ref_dir, "2", title="Lactate in exercise", keywords=["muscle"])
+    rm = ReferenceManager(base_dir=str(ref_dir))
+
+    hits = rm.search_ranked(["sepsis", "lactate"])
+    assert [hit["reference_id"] for hit in hits] == ["1", "2"]
+    assert hits[0]["matched_terms"] == ["sepsis", "lactate"]
+    assert hits[0]["metadata"]["title"] == "Lactate clearance"
+
+    _write_metadata(ref_dir, "2", title="Sepsis lactate kinetics", abstract="Sepsis sepsis.")
+    (ref_dir / "1" / "metadata.json").unlink()
+    (ref_dir / "1").rmdir()
+
+    hits = rm.search_ranked("sepsis lactate")
+    assert [hit["reference_id"] for hit in hits] == ["2"]
+
+
+def test_citation_relevance_counts_claim_key_terms(tmp_path):
+    ref_dir = tmp_path / "references"
+    _write_metadata(ref_dir, "1", title="Sepsis mortality", abstract="Hyperlactatemia in patients.")
+    _write_metadata(ref_dir, "2", title="Lactate in exercise")
+    claim = TextClaim(
+        text="Lactate predicts sepsis mortality in patients.",
+        claim_type=ClaimType.STATISTICAL,
+        key_terms=["mortality", "lactate", "patients", "sepsis"],
+        needs_citation=True,
+        reason="statistic",
+    )
+    assistant = CitationAssistant(ReferenceManager(base_dir=str(ref_dir)))
+
+    by_pmid = {s.pmid: s for s in assistant._search_local_for_claims([claim])}
+
+    # Score and threshold share one unit: the claims' key terms, not BM25 tokens
+    assert by_pmid["1"].matching_terms == ["lactate", "mortality", "patients", "sepsis"]
+    assert by_pmid["1"].relevance_score == 1.0
+    assert by_pmid["2"].relevance_score == 0.25
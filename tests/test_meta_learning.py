@@ -19,6 +19,7 @@ import yaml
 from med_paper_assistant.infrastructure.persistence.hook_effectiveness_tracker import (
     HookEffectivenessTracker,
 )
+from med_paper_assistant.infrastructure.persistence.hook_run_log import HookRunLog
 from med_paper_assistant.infrastructure.persistence.meta_learning_engine import (
     LessonLearned,
     MetaLearningEngine,
@@ -184,6 +185,68 @@ class TestHookEffectivenessTracker:
         stats = tracker.get_stats("A1")
         assert stats["trigger"] == 3
 
+    def test_runs_stored_in_segments_not_snapshot(
+        self, tracker: HookEffectivenessTracker, audit_dir: Path
+    ):
+        for i in range(3):
+            tracker.record_run(f"run-{i}", {"A1": {"trigger": 1, "pass": 1}})
+        tracker.record_run("run-1", {"A1": {"trigger": 9}})  # duplicate ignored
+
+        snapshot = yaml.safe_load((audit_dir / "hook-effectiveness.yaml").read_text())
+        assert "runs" not in snapshot
+        assert snapshot["run_count"] == 3
+        assert list((audit_dir / "hook-runs").glob("*.jsonl"))
+
+        reopened = HookEffectivenessTracker(audit_dir)
+        assert [r["run_id"] for r in reopened.get_runs()] == ["run-0", "run-1", "run-2"]
+        reopened.record_run("run-2", {"A1": {"trigger": 9}})
+        assert reopened.get_stats("A1")["trigger"] == 3
+
+    def test_legacy_runs_list_migrated(self, audit_dir: Path):
+        legacy = {
+            "version": 1,
+            "hooks": {"A1": {"trigger": 2, "pass": 0, "fix": 1, "false_positive": 0}},
+            "runs": [
+                {"run_id": "old-1", "timestamp": "2025-01-05T10:00:00", "results": {}},
+                {"run_id": "old-2", "timestamp": "2025-03-05T10:00:00", "results": {}},
+            ],
+        }
+        (audit_dir / "hook-effectiveness.yaml").write_text(yaml.dump(legacy))
+
+        tracker = HookEffectivenessTracker(audit_dir)
+        assert tracker.get_run_count() == 2
+        assert tracker.get_stats("A1")["trigger"] == 2
+        assert sorted(p.name for p in (audit_dir / "hook-runs").iterdir()) == [
+            "2025-01.jsonl",
+            "2025-03.jsonl",
+        ]
+        assert "runs" not in yaml.safe_load((audit_dir / "hook-effectiveness.yaml").read_text())
+
+    def test_run_log_retention_drops_oldest_segments(self, audit_dir: Path):
+        log = HookRunLog(audit_dir, retention=2)
+        for month in ("2025-01", "2025-02", "2025-03"):
+            log.append(f"run-{month}", {}, f"{month}-10T00:00:00")
+
+        assert [p.stem for p in log.segments()] == ["2025-02", "2025-03"]
+        assert [r["run_id"] for r in log.iter_runs()] == ["run-2025-02", "run-2025-03"]
+        assert log.contains("run-2025-01")  # expired, but still a known run id
+        assert HookRunLog(audit_dir, retention=2).contains("run-2025-01")
+
+    def test_expired_run_is_not_counted_twice(self, audit_dir: Path, monkeypatch):
+        monkeypatch.setenv("MEDPAPER_HOOK_RUN_RETENTION", "1")
+        tracker = HookEffectivenessTracker(audit_dir)
+        tracker.record_run("run-jan", {"A1": {"trigger": 1}})
+        for path in (audit_dir / "hook-runs").glob("*.jsonl"):
+            path.rename(path.with_name("2025-01.jsonl"))
+        tracker.record_run("run-now", {"A1": {"trigger": 1}})  # expires 2025-01
+
+        reopened = HookEffectivenessTracker(audit_dir)
+        reopened.record_run("run-jan", {"A1": {"trigger": 5}})
+
+        assert [r["run_id"] for r in reopened.get_runs()] == ["run-now"]
+        assert reopened.get_stats("A1")["trigger"] == 2
+        assert reopened.get_run_count() == 2
+
     # --- reset ---
 
     def test_reset(self, tracker: HookEffectivenessTracker, audit_dir: Path):
@@ -893,6 +956,21 @@ class TestMetaLearningEngineD9:
         ]
         assert len(matching) == 1
 
+    def test_d9_merges_snapshot_and_journal(
+        self, engine_with_workspace: MetaLearningEngine, workspace: Path
+    ):
+        """Events compacted into the snapshot and still in the journal both count."""
+        store = ToolInvocationStore(workspace)
+        for _ in range(3):
+            store.record_invocation("split_tool")
+        store.record_misuse("split_tool")
+        store.compact()
+        store.record_misuse("split_tool")
+        store.flush()
+
+        suggestions = engine_with_workspace._d9_tool_description_suggestions()
+        assert any(s["target"] == "split_tool" for s in suggestions)
+
     def test_d9_misuse_below_threshold_no_suggestion(
         self, engine_with_workspace: MetaLearningEngine, workspace: Path
     ):
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import random
+
+from med_paper_assistant.infrastructure.persistence.writing_hooks import WritingHooksEngine
+from med_paper_assistant.infrastructure.persistence.writing_hooks._ngram_overlap import (
+    extract_ngrams,
+    shared_ngram_pairs,
+)
+
+
+def _pairwise(ngram_sets: list[set[str]], threshold: int) -> list[tuple[int, int, int]]:
+    return [
+        (i, j, len(ngram_sets[i] & ngram_sets[j]))
+        for i in range(len(ngram_sets))
+        for j in range(i + 1, len(ngram_sets))
+        if len(ngram_sets[i] & ngram_sets[j]) >= threshold
+    ]
+
+
+def test_inverted_index_matches_pairwise_intersection() -> None:
+    rng = random.Random(7)
+    vocabulary = ["sedation", "patients", "propofol", "dose", "outcome", "airway", "trial"]
+    paragraphs = [" ".join(rng.choice(vocabulary) for _ in range(40)) for _ in range(60)]
+    ngram_sets = [extract_ngrams(text, 4) for text in paragraphs]
+
+    for threshold in (1, 3, 8):
+        assert shared_ngram_pairs(ngram_sets, threshold) == _pairwise(ngram_sets, threshold)
+
+
+def test_statistical_notation_is_ignored() -> None:
+    assert extract_ngrams("mortality fell, p < 0.001, OR = 1.2 overall", 3) == {
+        "mortality fell overall"
+    }
+
+
+def test_check_overlap_flags_duplicated_paragraphs(tmp_path) -> None:
+    paragraph = "Propofol sedation reduced recovery time in elderly patients undergoing routine colonoscopy."
+    content = (
+        f"# Methods\n\n{paragraph}\n\n# Discussion\n\nA distinct paragraph here.\n\n{paragraph}"
+    )
+
+    result = WritingHooksEngine(tmp_path).check_overlap(content)
+
+    assert result.passed is False
+    assert result.stats == {"paragraphs_checked": 2, "flagged_pairs": 1, "max_shared_ngrams": 6}
+    assert result.issues[0].section == "Methods ↔ Discussion"
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import pytest
+
+from med_paper_assistant.infrastructure.persistence.writing_hooks import WritingHooksEngine
+from med_paper_assistant.infrastructure.persistence.writing_hooks._parsed_document import (
+    parse_manuscript,
+)
+
+MANUSCRIPT = """---
+title: Demo
+---
+# Methods
+
+We enrolled 120 patients (N = 120) in **this** trial [[smith2024_12345678]].
+
+| Group | n |
+|-------|---|
+| A     | 60 |
+
+# Results
+
+Of the 118 participants analysed, most recovered quickly. See [the appendix](app.md).
+"""
+
+
+def test_parse_is_memoized_by_content_hash_and_read_only() -> None:
+    document = parse_manuscript(MANUSCRIPT)
+
+    assert parse_manuscript(str(MANUSCRIPT)) is document
+    assert list(document.sections) == ["Methods", "Results"]
+    assert document.wikilinks == ("smith2024_12345678",)
+    assert dict(document.numeric_claims) == {"N=": {"120"}, "count of": {"120", "118"}}
+    assert len(document.tables) == 1
+    assert "| Group" not in document.without_tables
+    with pytest.raises(TypeError):
+        document.sections["Methods"] = ""  # type: ignore[index]
+
+
+def test_engine_helpers_return_independent_copies(tmp_path) -> None:
+    engine = WritingHooksEngine(tmp_path)
+
+    sections = engine._parse_sections(MANUSCRIPT)
+    sections["Methods"] = "mutated"
+
+    assert engine._parse_sections(MANUSCRIPT)["Methods"] != "mutated"
+    assert engine._count_words("**Bold** [[ref2024_1]] and [link](x.md)") == 4
+    assert engine._strip_frontmatter(MANUSCRIPT).startswith("\n# Methods")
+
+
+def test_section_quality_views_keep_raw_paragraph_splits() -> None:
+    document = parse_manuscript("# A\nFirst line\nsecond line.\n\n#### Sub\nBody [[ref1]]\n\n\n")
+
+    assert document.line_paragraphs == ("First line\nsecond line.", "Body [[ref1]]")
+    assert document.blocks == ("# A\nFirst line\nsecond line.", "#### Sub\nBody [[ref1]]")
+    assert parse_manuscript("One. Two!  Three? four").sentence_count == 4
+    assert parse_manuscript("No terminal punctuation").sentence_count == 1
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import re
+
+from med_paper_assistant.infrastructure.persistence.writing_hooks import (
+    ANTI_AI_PARAGRAPH_START_ONLY,
+    ANTI_AI_PHRASES,
+    WritingHooksEngine,
+)
+from med_paper_assistant.infrastructure.persistence.writing_hooks._phrase_matcher import (
+    PhraseMatcher,
+    compile_phrases,
+    starts_paragraph,
+)
+
+TEXT = (
+    "In recent years, sedation plays a pivotal role. A pivotal role again; "
+    "It is worth noting the pivotal roles differ.\n\n"
+    "  Moreover, experts believe this. Moreover, mid-paragraph is fine.\n\n"
+    "Furthermore the drug serves as a bridge and acts as an adjunct.\n"
+    "Moreover a single newline is not a new paragraph."
+)
+
+
+def _legacy_counts(text: str) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for phrase in ANTI_AI_PHRASES:
+        count = len(re.findall(rf"\b{re.escape(phrase)}\b", text.lower()))
+        if count:
+            counts[phrase] = count
+    for phrase in ANTI_AI_PARAGRAPH_START_ONLY:
+        count = len(re.findall(rf"(?:^|\n\n)\s*{re.escape(phrase)}\b", text, re.IGNORECASE))
+        if count:
+            counts[f"{phrase} (paragraph start)"] = count
+    return counts
+
+
+def test_matcher_reports_overlapping_and_prefix_phrases_like_per_phrase_scans() -> None:
+    matcher = PhraseMatcher(["plays a pivotal role", "pivotal role", "plays", "it is"])
+
+    counts = matcher.counts("He PLAYS a pivotal role; it is. Pivotal roles, it isn't")
+
+    assert counts == {"plays a pivotal role": 1, "pivotal role": 1, "plays": 1, "it is": 1}
+    assert PhraseMatcher([]).find_all("anything") == []
+    assert compile_phrases(("a", "b")) is compile_phrases(("a", "b"))
+
+
+def test_paragraph_start_requires_blank_line_or_text_start() -> None:
+    assert starts_paragraph("  Moreover", 2)
+    assert starts_paragraph("end.\n\n  Moreover", 8)
+    assert not starts_paragraph("end.\nMoreover", 5)
+    assert not starts_paragraph("end. Moreover", 5)
+
+
+def test_anti_ai_hook_counts_match_legacy_regex_scans(tmp_path) -> None:
+    result = WritingHooksEngine(tmp_path).check_anti_ai_patterns(TEXT)
+
+    assert result.stats["phrase_counts"] == _legacy_counts(TEXT)
+    assert result.stats["total_matches"] == sum(_legacy_counts(TEXT).values())
@@ -0,0 +1,133 @@
+"""Tests for the deferred, coalescing post-write side-effect queue."""
+
+from __future__ import annotations
+
+import subprocess
+import threading
+import time
+
+from med_paper_assistant.infrastructure.persistence.post_write_queue import (
+    PostWriteQueue,
+    get_post_write_queue,
+    queue_draft_side_effects,
+)
+from med_paper_assistant.infrastructure.persistence.reference_manager import ReferenceManager
+from med_paper_assistant.infrastructure.services.drafter import Drafter
+
+
+def test_burst_of_submits_coalesces_into_one_run() -> None:
+    queue = PostWriteQueue(debounce_ms=50)
+    calls: list[list[int]] = []
+
+    for i in range(10):
+        queue.submit("graph", calls.append, i)
+    assert calls == []
+
+    deadline = time.monotonic() + 2
+    while not calls and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert calls == [list(range(10))]
+    assert queue.stats["coalesced"] == 9
+    assert queue.pending() == 0
+
+
+def test_flush_is_a_barrier() -> None:
+    queue = PostWriteQueue(debounce_ms=60_000)
+    calls: list[str] = []
+    queue.submit("foam", lambda _: calls.append("foam"))
+    queue.submit("git", lambda items: calls.append(f"git:{len(items)}"), "a.md")
+
+    queue.flush()
+
+    assert calls == ["foam", "git:1"]
+    assert queue.pending() == 0
+
+
+def test_held_call_parks_the_worker_and_can_flush_inline() -> None:
+    queue = PostWriteQueue(debounce_ms=10)
+    ran = threading.Event()
+
+    with queue.hold():
+        queue.submit("graph", lambda _: ran.set())
+        time.sleep(0.1)
+        assert not ran.is_set()
+        queue.flush()
+        assert ran.is_set()
+
+
+def test_held_flush_waits_for_a_concurrent_flush() -> None:
+    queue = PostWriteQueue(debounce_ms=60_000)
+    release = threading.Event()
+    active: list[str] = []
+    overlaps: list[list[str]] = []
+
+    def slow_commit(items: list[str]) -> None:
+        if active:
+            overlaps.append([*active, *items])
+        active.extend(items)
+        release.wait(2)
+        del active[: len(items)]
+
+    with queue.hold():
+        queue.submit(("git", "root"), slow_commit, "intro.md")
+        other = threading.Thread(target=queue.flush)
+        other.start()
+        deadline = time.monotonic() + 2
+        while not active and time.monotonic() < deadline:
+            time.sleep(0.01)
+        queue.submit(("git", "root"), slow_commit, "methods.md")
+        timer = threading.Timer(0.1, release.set)
+        timer.start()
+        queue.flush()
+    other.join(2)
+    timer.join()
+
+    assert overlaps == []
+    assert queue.stats["runs"] == 2
+
+
+def test_zero_debounce_runs_inline_and_failures_are_contained() -> None:
+    queue = PostWriteQueue(debounce_ms=0)
+    calls: list[object] = []
+
+    queue.submit("graph", calls.extend, "x")
+    queue.submit("git", lambda _: 1 / 0)
+
+    assert calls == ["x"]
+    assert queue.stats["failures"] == 1
+
+
+def test_create_draft_defers_graph_refresh_until_flush(tmp_path, monkeypatch) -> None:
+    drafts_dir = tmp_path / "drafts"
+    ref = ReferenceManager(base_dir=str(tmp_path / "refs"))
+    refreshes: list[int] = []
+    monkeypatch.setattr(ref, "refresh_foam_graph", lambda: refreshes.append(1) or {})
+    queue = get_post_write_queue()
+    monkeypatch.setattr(queue, "debounce_s", 60.0)
+    drafter = Drafter(ref, drafts_dir=str(drafts_dir))
+
+    for i in range(5):
+        drafter.create_draft("intro.md", f"# Introduction\n\nRevision {i}.")
+
+    assert "Revision 4." in (drafts_dir / "intro.md").read_text(encoding="utf-8")
+    assert refreshes == []
+    queue.flush()
+    assert refreshes == [1]
+
+
+def test_queued_auto_commits_land_as_one_commit_on_flush(tmp_path) -> None:
+    for args in (["init"], ["config", "user.email", "t@t"], ["config", "user.name", "T"]):
+        subprocess.run(["git", *args], cwd=tmp_path, capture_output=True, check=True)
+    (tmp_path / "drafts").mkdir()
+    for name in ("intro.md", "methods.md"):
+        (tmp_path / "drafts" / name).write_text(name, encoding="utf-8")
+        queue_draft_side_effects(tmp_path, name, "patch_draft")
+
+    get_post_write_queue().flush()
+
+    log = subprocess.run(
+        ["git", "log", "--format=%s"], cwd=tmp_path, capture_output=True, text=True
+    ).stdout.splitlines()
+    assert len(log) == 1
+    assert "auto-batch: 2 changes" in log[0]
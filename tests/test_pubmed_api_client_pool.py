@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+import pytest
+
+from med_paper_assistant.infrastructure.services import pubmed_api_client
+from med_paper_assistant.infrastructure.services.pubmed_api_client import (
+    PubMedAPIClient,
+    VerifiedArticlePayload,
+)
+
+
+def _article(pmid: str) -> dict[str, Any]:
+    return {"pmid": pmid, "title": f"Article {pmid}", "authors": ["Doe J"], "year": "2024"}
+
+
+def _install_transport(
+    monkeypatch: pytest.MonkeyPatch, *, attested_bulk: bool, missing: set[str] | None = None
+) -> dict[str, Any]:
+    seen: dict[str, Any] = {"paths": [], "clients": 0}
+    missing = missing or set()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["paths"].append(request.url.path)
+        if request.url.path == "/api/cached_articles":
+            pmids = request.url.params["pmids"].split(",")
+            found = {pmid: _article(pmid) for pmid in pmids if pmid not in missing}
+            if "99999999" in found:
+                found["99999999"] = _article("11111111")
+            body: dict[str, Any] = {"found": found, "missing": sorted(missing & set(pmids))}
+            if attested_bulk:
+                body.update({"source": "pubmed", "verified": True})
+            return httpx.Response(200, json=body)
+        pmid = request.url.path.rsplit("/", 1)[-1]
+        if pmid in missing:
+            return httpx.Response(404, json={"detail": "not found"})
+        return httpx.Response(
+            200, json={"source": "pubmed", "verified": True, "data": _article(pmid)}
+        )
+
+    transport = httpx.MockTransport(handler)
+    real_client, real_async_client = httpx.Client, httpx.AsyncClient
+
+    def client_factory(*args: Any, **kwargs: Any) -> httpx.Client:
+        seen["clients"] += 1
+        return real_client(*args, transport=transport, **kwargs)
+
+    def async_client_factory(*args: Any, **kwargs: Any) -> httpx.AsyncClient:
+        seen["clients"] += 1
+        return real_async_client(*args, transport=transport, **kwargs)
+
+    monkeypatch.setattr(pubmed_api_client.httpx, "Client", client_factory)
+    monkeypatch.setattr(pubmed_api_client.httpx, "AsyncClient", async_client_factory)
+    return seen
+
+
+def test_client_reuses_one_pooled_connection_across_requests(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    seen = _install_transport(monkeypatch, attested_bulk=True)
+    client = PubMedAPIClient("https://pubmed.test")
+
+    assert client.check_health() is True
+    for pmid in ("10000001", "10000002", "10000003"):
+        assert isinstance(client.get_cached_article(pmid), VerifiedArticlePayload)
+
+    assert seen["clients"] == 1
+    client.close()
+    client.get_cached_article("10000004")
+    assert seen["clients"] == 2
+
+
+def test_bulk_fetch_validates_every_article_in_two_round_trips(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    seen = _install_transport(monkeypatch, attested_bulk=True, missing={"10000005"})
+    pmids = [str(10000000 + index) for index in range(300)] + ["99999999", "not-a-pmid"]
+
+    batch = PubMedAPIClient("https://pubmed.test").get_verified_articles(pmids)
+
+    assert batch.round_trips == 2
+    assert seen["paths"].count("/api/cached_articles") == 2
+    assert len(batch.articles) == 299
+    assert list(batch.articles)[:2] == ["10000000", "10000001"]
+    assert batch.missing == ("10000005",)
+    assert "identity mismatch" in batch.rejected["99999999"]
+    assert "digits only" in batch.rejected["not-a-pmid"]
+    reference = batch.articles["10000001"].to_reference_dict()
+    assert reference["trust_level"] == "verified"
+    assert reference["provenance"][0]["requested_pmid"] == "10000001"
+
+
+def test_bulk_fetch_falls_back_to_verified_single_endpoint(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    seen = _install_transport(monkeypatch, attested_bulk=False, missing={"10000002"})
+    client = PubMedAPIClient("https://pubmed.test", max_connections=2)
+
+    batch = client.get_verified_articles(["10000001", "10000002", "10000003"])
+
+    assert set(batch.articles) == {"10000001", "10000003"}
+    assert batch.missing == ("10000002",)
+    assert seen["paths"].count("/api/cached_article/10000001") == 1
+    assert batch.articles["10000001"].source_url.startswith(
+        "https://pubmed.test/api/cached_article/10000001"
+    )
+    assert client.get_multiple_articles(["10000003"]) == {"10000003": _article("10000003")}
+
+
+async def test_async_bulk_fetch_uses_pooled_async_client(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    seen = _install_transport(monkeypatch, attested_bulk=False)
+    client = PubMedAPIClient("https://pubmed.test", max_connections=4)
+
+    batch = await client.aget_verified_articles([str(20000000 + i) for i in range(10)])
+    single = await client.aget_cached_article("20000001")
+    await client.aclose()
+
+    assert len(batch.articles) == 10
+    assert batch.round_trips == 11
+    assert isinstance(single, VerifiedArticlePayload)
+    assert seen["clients"] == 1
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+from med_paper_assistant.infrastructure.persistence import reference_identity_registry
+from med_paper_assistant.infrastructure.persistence.reference_manager import ReferenceManager
+from med_paper_assistant.infrastructure.services import pubmed_api_client
+
+
+def _article(pmid: str) -> dict[str, Any]:
+    return {
+        "pmid": pmid,
+        "title": f"Verified batch article {pmid}",
+        "authors": ["Chen Eric"],
+        "authors_full": [{"last_name": "Chen", "first_name": "Eric"}],
+        "year": "2026",
+        "journal": "Journal of Verifiable Research",
+    }
+
+
+def _mock_pubmed_http(monkeypatch: pytest.MonkeyPatch, *, missing: set[str]) -> list[str]:
+    paths: list[str] = []
+    real_client = httpx.Client
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path == "/health":
+            return httpx.Response(200, json={"status": "healthy"})
+        if request.url.path == "/api/cached_articles":
+            pmids = request.url.params["pmids"].split(",")
+            found = {pmid: _article(pmid) for pmid in pmids if pmid not in missing}
+            if "99999999" in found:
+                found["99999999"] = _article("11111111")
+            body = {
+                "source": "pubmed",
+                "verified": True,
+                "found": found,
+                "missing": sorted(missing & set(pmids)),
+            }
+            return httpx.Response(200, json=body)
+        return httpx.Response(404, json={"detail": "not found"})
+
+    def client_factory(*args: Any, **kwargs: Any) -> httpx.Client:
+        return real_client(*args, transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr(pubmed_api_client.httpx, "Client", client_factory)
+    monkeypatch.setattr(pubmed_api_client, "_client", None)
+    return paths
+
+
+def test_batch_import_saves_verified_references_with_one_commit(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    paths = _mock_pubmed_http(monkeypatch, missing={"30000004"})
+    manager = ReferenceManager(
+        base_dir=str(tmp_path / "project" / "references"),
+        pubmed_api_url="https://pubmed.test",
+    )
+    writes: list[str] = []
+    real_write = reference_identity_registry.ReferenceIdentityRegistry._write
+
+    def counting_write(self: Any, kind: str, registry: dict[str, str]) -> None:
+        writes.append(kind)
+        real_write(self, kind, registry)
+
+    monkeypatch.setattr(
+        reference_identity_registry.ReferenceIdentityRegistry, "_write", counting_write
+    )
+    rebuilds: list[int] = []
+    real_rebuild = manager._rebuild_index
+    monkeypatch.setattr(manager, "_rebuild_index", lambda: rebuilds.append(1) or real_rebuild())
+
+    pmids = ["30000001", "30000002", "30000003", "30000004", "99999999", "30000001"]
+    report = manager.save_references_mcp(pmids, agent_notes="Screened in.")
+
+    assert report.requested == 5
+    assert set(report.saved) == {"30000001", "30000002", "30000003"}
+    assert report.missing == ["30000004"]
+    assert "identity mismatch" in report.rejected["99999999"]
+    assert paths.count("/api/cached_articles") == 1
+    assert "pmid" in writes
+    assert len(writes) == len(set(writes))
+    assert len(rebuilds) == 1
+
+    by_pmid = json.loads((tmp_path / "project" / "registry" / "by-pmid.json").read_text())
+    assert set(by_pmid) == {"30000001", "30000002", "30000003"}
+    log = (tmp_path / "project" / "notes" / "log.md").read_text(encoding="utf-8")
+    assert all(pmid in log for pmid in ("30000001", "30000002", "30000003"))
+    metadata = manager.get_metadata("30000002")
+    assert metadata["trust_level"] == "verified"
+    assert metadata["agent_notes"] == "Screened in."
+    assert "[[" in report.to_markdown()
+
+    again = manager.save_references_mcp(["30000001", "30000002"])
+    assert again.existing == ["30000001", "30000002"]
+    assert not again.saved
+    assert paths.count("/api/cached_articles") == 1
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+
+from med_paper_assistant.infrastructure.persistence import file_freshness
+from med_paper_assistant.infrastructure.persistence.reference_catalog import ReferenceCatalog
+from med_paper_assistant.infrastructure.persistence.reference_manager import ReferenceManager
+
+
+def _write_reference(refs_dir: Path, ref_id: str, **fields: object) -> Path:
+    ref_dir = refs_dir / ref_id
+    ref_dir.mkdir(parents=True, exist_ok=True)
+    metadata = {"unique_id": ref_id, "title": f"Reference {ref_id}", **fields}
+    path = ref_dir / "metadata.json"
+    path.write_text(json.dumps(metadata), encoding="utf-8")
+    return path
+
+
+def test_catalog_resolves_secondary_identifiers(tmp_path: Path) -> None:
+    refs_dir = tmp_path / "references"
+    _write_reference(
+        refs_dir, "12345678", pmid="12345678", doi="10.1000/ABC", citation_key="doe2020_12345678"
+    )
+    catalog = ReferenceCatalog(refs_dir, tmp_path / "registry")
+
+    assert catalog.resolve("12345678") == "12345678"
+    assert catalog.resolve("10.1000/abc") == "12345678"
+    assert catalog.resolve("doe2020_12345678") == "12345678"
+    assert catalog.resolve("missing") is None
+
+
+def test_resolve_all_takes_one_snapshot(tmp_path: Path, monkeypatch) -> None:
+    refs_dir = tmp_path / "references"
+    _write_reference(refs_dir, "12345678", pmid="12345678", doi="10.1000/ABC")
+    _write_reference(refs_dir, "doi_10_1000_xyz", pmid="23456789")
+    catalog = ReferenceCatalog(refs_dir, tmp_path / "registry")
+    snapshots: list[int] = []
+    real_snapshot = ReferenceCatalog.snapshot
+    monkeypatch.setattr(
+        ReferenceCatalog, "snapshot", lambda self: snapshots.append(1) or real_snapshot(self)
+    )
+
+    resolved = catalog.resolve_all(["12345678", " 23456789", "10.1000/abc", "", "1", "2", "3"])
+
+    assert resolved == {
+        "12345678": "12345678",
+        "23456789": "doi_10_1000_xyz",
+        "10.1000/abc": "12345678",
+    }
+    assert len(snapshots) == 1
+
+
+def test_catalog_rereads_metadata_edited_outside_the_manager(tmp_path: Path) -> None:
+    refs_dir = tmp_path / "references"
+    path = _write_reference(refs_dir, "111", title="Before")
+    catalog = ReferenceCatalog(refs_dir, tmp_path / "registry")
+    assert catalog.get("111")["title"] == "Before"
+
+    # Same size, same coarse timestamp: only the content hash can tell them apart.
+    stat = path.stat()
+    path.write_text(json.dumps({"unique_id": "111", "title": "Aftera"}), encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert catalog.get("111")["title"] == "Aftera"
+
+
+def _count_metadata_reads(monkeypatch) -> list[str]:
+    reads: list[str] = []
+    original = Path.read_bytes
+
+    def counting(self: Path) -> bytes:
+        if self.name == "metadata.json":
+            reads.append(self.parent.name)
+        return original(self)
+
+    monkeypatch.setattr(Path, "read_bytes", counting)
+    return reads
+
+
+def _advance_clock(monkeypatch, seconds: float) -> None:
+    real = time.time_ns
+    monkeypatch.setattr(file_freshness.time, "time_ns", lambda: real() + int(seconds * 1e9))
+
+
+def test_catalog_journal_warm_starts_a_new_process(tmp_path: Path, monkeypatch) -> None:
+    refs_dir = tmp_path / "references"
+    for ref_id in ("111", "222"):
+        path = _write_reference(refs_dir, ref_id)
+        os.utime(path, ns=(time.time_ns() - 10**10, time.time_ns() - 10**10))
+    first = ReferenceCatalog(refs_dir, tmp_path / "registry")
+    assert set(first.snapshot()) == {"111", "222"}
+    first.flush()
+
+    second = ReferenceCatalog(refs_dir, tmp_path / "registry")
+    reads = _count_metadata_reads(monkeypatch)
+
+    assert set(second.snapshot()) == {"111", "222"}
+    assert reads == []
+
+
+def test_racy_entries_settle_after_the_window(tmp_path: Path, monkeypatch) -> None:
+    manager = ReferenceManager(base_dir=str(tmp_path / "references"))
+    manager.save_reference(
+        {"pmid": "27182818", "title": "Settles", "authors": ["Doe J"], "year": "2021"}
+    )
+    reads = _count_metadata_reads(monkeypatch)
+
+    # Inside the window every lookup must re-hash the freshly written file
+    manager.get_metadata("27182818")
+    assert reads == ["27182818"]
+
+    _advance_clock(monkeypatch, 3)
+    reads.clear()
+    for _ in range(5):
+        assert manager.get_metadata("27182818")["title"] == "Settles"
+        manager.list_references()
+    assert reads == ["27182818"]  # one confirming hash, then re-stamped
+
+    # The re-stamped entry was journaled, so a new process trusts it as well
+    reads.clear()
+    fresh = ReferenceCatalog(tmp_path / "references", tmp_path / "registry")
+    assert set(fresh.snapshot()) == {"27182818"}
+    assert reads == []
+
+
+def test_catalog_drops_deleted_directories(tmp_path: Path) -> None:
+    refs_dir = tmp_path / "references"
+    _write_reference(refs_dir, "111", pmid="111")
+    catalog = ReferenceCatalog(refs_dir, tmp_path / "registry")
+    assert catalog.resolve("111") == "111"
+
+    (refs_dir / "111" / "metadata.json").unlink()
+    (refs_dir / "111").rmdir()
+
+    assert catalog.snapshot() == {}
+    assert catalog.resolve("111") is None
+
+
+def test_reference_manager_keeps_catalog_current_on_save_and_delete(tmp_path: Path) -> None:
+    manager = ReferenceManager(base_dir=str(tmp_path / "references"))
+    manager.save_reference(
+        {"pmid": "31415926", "title": "Catalogued", "authors": ["Doe J"], "year": "2020"}
+    )
+
+    assert manager.list_references() == ["31415926"]
+    assert manager.get_metadata("31415926")["title"] == "Catalogued"
+    assert (tmp_path / "registry" / ReferenceCatalog.FILE_NAME).is_file()
+    citation_key = manager.get_metadata("31415926")["citation_key"]
+    assert manager.resolve_reference_id(citation_key) == "31415926"
+
+    manager.get_metadata("31415926")["title"] = "mutated copy"
+    assert manager.get_metadata("31415926")["title"] == "Catalogued"
+
+    assert manager.delete_reference("31415926", confirm=True)["success"] is True
+    assert manager.get_metadata("31415926") == {}
+    assert manager.resolve_reference_id(citation_key) is None
@@ -55,6 +55,7 @@ def test_compact_reference_surface_keeps_only_safe_direct_verb_and_facade() -> N
         "delete_reference",
         "get_reference_for_analysis",
         "save_reference_analysis",
+        "save_references_mcp",
         "reference_action",
     } == set(handlers)
 
@@ -102,6 +103,7 @@ async def test_reference_action_list_returns_machine_readable_schema() -> None:
     assert payload["tool"] == "reference_action"
     assert {
         "save_agent",
+        "save_batch",
         "list",
         "list_saved",
         "search",
@@ -153,6 +155,12 @@ async def test_reference_action_list_returns_machine_readable_schema() -> None:
             {"pmid": "123", "max_chars": 321},
             {"pmid": "123", "max_chars": 321},
         ),
+        (
+            "save_batch",
+            "save_references_mcp",
+            {"pmids": "123,456", "project": "demo"},
+            {"pmids": "123,456", "project": "demo"},
+        ),
         (
             "save_pdf",
             "save_reference_pdf",
@@ -0,0 +1,158 @@
+"""Tests for chunked (streaming) statistics against the in-memory analysis paths."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from med_paper_assistant.infrastructure.services.analyzer import Analyzer
+from med_paper_assistant.infrastructure.services.streaming_stats import (
+    CHUNK_ROWS_ENV,
+    CoMoments,
+    Moments,
+    stream_describe,
+)
+
+
+@pytest.fixture
+def analyzer(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Analyzer:
+    """Analyzer over a 600-row file read in 64-row chunks, with missing values."""
+    rng = np.random.default_rng(11)
+    n = 600
+    df = pd.DataFrame(
+        {
+            "arm": rng.choice(["A", "B", "C"], n),
+            "pair": rng.choice(["ctl", "trt"], n),
+            "age": rng.normal(60, 12, n),
+            "bmi": rng.normal(27, 4, n),
+            "sbp": rng.normal(130, 15, n),
+            "sex": rng.choice(["F", "M"], n),
+            "stage": rng.choice([1, 2, 3], n),
+        }
+    )
+    df.loc[::11, "age"] = np.nan
+    df.loc[::29, "arm"] = np.nan
+    df.loc[::17, "sex"] = np.nan
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    df.to_csv(data_dir / "cohort.csv", index=False)
+    monkeypatch.setenv(CHUNK_ROWS_ENV, "64")
+    return Analyzer(data_dir=str(data_dir), results_dir=str(tmp_path / "results"))
+
+
+class TestAccumulators:
+    def test_merged_moments_match_numpy(self) -> None:
+        values = np.random.default_rng(0).normal(1e6, 3.0, (1000, 2))
+        values[::7, 1] = np.nan
+        total = Moments.empty(2)
+        for chunk in np.array_split(values, 13):
+            total.merge(Moments.of(chunk))
+
+        np.testing.assert_allclose(total.n, [1000, np.count_nonzero(~np.isnan(values[:, 1]))])
+        np.testing.assert_allclose(total.mean, np.nanmean(values, axis=0))
+        np.testing.assert_allclose(total.sd, np.nanstd(values, axis=0, ddof=1), rtol=1e-9)
+
+    def test_comoments_match_pearsonr(self) -> None:
+        from scipy import stats
+
+        rng = np.random.default_rng(1)
+        x = rng.normal(size=500)
+        y = 0.4 * x + rng.normal(size=500)
+        pair = CoMoments()
+        for xs, ys in zip(np.array_split(x, 7), np.array_split(y, 7)):
+            pair.add(xs, ys)
+
+        expected = stats.pearsonr(x, y)
+        assert pair.pearson() == pytest.approx((expected.statistic, expected.pvalue))
+
+
+class TestStreamingAnalyzer:
+    def test_table_one_matches_in_memory(self, analyzer: Analyzer) -> None:
+        args = ("cohort.csv", "arm", ["age", "bmi"], ["sex", "stage"])
+        assert analyzer.generate_table_one(*args, streaming=True) == analyzer.generate_table_one(
+            *args
+        )
+
+    @pytest.mark.parametrize(
+        ("test_type", "variables", "group_var"),
+        [
+            ("t-test", ["age"], "pair"),
+            ("anova", ["age"], "arm"),
+            ("chi2", ["arm", "sex"], None),
+            ("correlation", ["bmi", "sbp"], None),
+            ("paired_ttest", ["bmi", "sbp"], None),
+        ],
+    )
+    def test_statistical_tests_match_in_memory(
+        self, analyzer: Analyzer, test_type: str, variables: list[str], group_var: str | None
+    ) -> None:
+        expected = analyzer.run_statistical_test(
+            "cohort.csv", test_type, variables=variables, group_var=group_var
+        )
+        streamed = analyzer.run_statistical_test(
+            "cohort.csv", test_type, variables=variables, group_var=group_var, streaming=True
+        )
+        assert streamed == expected
+
+    def test_rank_tests_are_refused(self, analyzer: Analyzer) -> None:
+        result = analyzer.run_statistical_test(
+            "cohort.csv", "kruskal", variables=["age"], group_var="arm", streaming=True
+        )
+        assert result.startswith("Error: 'kruskal'")
+
+    def test_nonnormal_columns_need_in_memory_mode(self, analyzer: Analyzer) -> None:
+        with pytest.raises(ValueError, match="streaming"):
+            analyzer.generate_table_one(
+                "cohort.csv", "arm", ["age"], [], nonnormal_cols=["age"], streaming=True
+            )
+
+    def test_missing_column_raises_key_error(self, analyzer: Analyzer) -> None:
+        with pytest.raises(KeyError):
+            analyzer.generate_table_one("cohort.csv", "site", ["age"], [], streaming=True)
+
+    def test_describe_matches_pandas_without_quartiles(self, analyzer: Analyzer) -> None:
+        path = Path(analyzer.data_dir) / "cohort.csv"
+        expected = pd.read_csv(path).describe().drop(["25%", "50%", "75%"])
+
+        pd.testing.assert_frame_equal(stream_describe(path), expected, check_exact=False)
+        assert "25%" not in analyzer.describe_data("cohort.csv", streaming=True)
+
+
+class TestChunkDtypeDrift:
+    """A later chunk must not re-type a column that earlier chunks parsed as numbers."""
+
+    @pytest.fixture
+    def drifting(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Analyzer:
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        pd.DataFrame(
+            {
+                "arm": ["A", "B"] * 5 + ["A"],
+                "site": [1, 2, 1, 2, 1, 2, 1, 2, 1, "x", 2],
+                "cat": [0, 2, 0, 0, 2, 2, 0, 2, 0, "unknown", 2],
+                "age": [61.0, 58.5, 70.2, 44.1, 52.3, 66.0, 49.9, 71.4, 55.0, 63.3, 47.2],
+                "dose": [1, 2, 3, 4, 5, 6, 7, 8, 9, "n/a", 11],
+            }
+        ).to_csv(data_dir / "drift.csv", index=False)
+        monkeypatch.setenv(CHUNK_ROWS_ENV, "4")
+        return Analyzer(data_dir=str(data_dir), results_dir=str(tmp_path / "results"))
+
+    def test_table_one_matches_in_memory(self, drifting: Analyzer) -> None:
+        args = ("drift.csv", "arm", ["age"], ["cat", "site"])
+        streamed = drifting.generate_table_one(*args, streaming=True)
+
+        assert streamed == drifting.generate_table_one(*args)
+        assert streamed.count("cat: 0") == 1
+
+    def test_chi2_matches_in_memory(self, drifting: Analyzer) -> None:
+        kwargs = {"variables": ["arm", "cat"], "group_var": None}
+        assert drifting.run_statistical_test(
+            "drift.csv", "chi2", streaming=True, **kwargs
+        ) == drifting.run_statistical_test("drift.csv", "chi2", **kwargs)
+
+    def test_describe_skips_columns_with_text_cells(self, drifting: Analyzer) -> None:
+        path = Path(drifting.data_dir) / "drift.csv"
+        expected = pd.read_csv(path).describe().drop(["25%", "50%", "75%"])
+
+        pd.testing.assert_frame_equal(stream_describe(path), expected, check_exact=False)
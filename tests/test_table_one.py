@@ -7,6 +7,7 @@ import pandas as pd
 import pytest
 
 from med_paper_assistant.infrastructure.services.analyzer import Analyzer
+from med_paper_assistant.infrastructure.services.table_one import build_table_one, format_pvalue
 
 
 def _create_sample_clinical_data(data_dir: str) -> None:
@@ -115,6 +116,94 @@ class TestTableOneGenerator:
         assert "1" in result
 
 
+class TestTableOneEngine:
+    """The grouped engine matches per-group scipy tests and renders every format."""
+
+    @pytest.fixture
+    def frame(self) -> pd.DataFrame:
+        rng = np.random.default_rng(7)
+        n = 120
+        df = pd.DataFrame(
+            {
+                "arm": rng.choice(["A", "B", "C"], n),
+                "age": rng.normal(55, 9, n),
+                "los": rng.exponential(4, n),
+                "sex": rng.choice(["F", "M"], n),
+            }
+        )
+        df.loc[::17, "age"] = np.nan
+        df.loc[::23, "arm"] = np.nan
+        return df
+
+    def test_statistics_match_row_by_row_tests(self, frame: pd.DataFrame) -> None:
+        from scipy import stats
+
+        table = build_table_one(frame, "arm", ["age"], ["sex"])
+        groups = list(frame["arm"].dropna().unique())
+        samples = [frame.loc[frame["arm"] == g, "age"].dropna() for g in groups]
+        age_row, sex_first = table.rows[0], table.rows[1]
+
+        assert table.header[1] == f"Overall (N={len(frame)})"
+        assert age_row[2] == f"{samples[0].mean():.1f} ± {samples[0].std():.1f}"
+        assert age_row[-1] == format_pvalue(stats.f_oneway(*samples).pvalue)
+
+        contingency = pd.crosstab(frame["arm"], frame["sex"])
+        assert sex_first[-1] == format_pvalue(stats.chi2_contingency(contingency)[1])
+        count_f = int((frame["sex"] == "F").sum())
+        assert sex_first[1] == f"{count_f} ({count_f / len(frame) * 100:.1f}%)"
+
+        two_arm = frame[frame["arm"].isin(["A", "B"])]
+        t_row = build_table_one(two_arm, "arm", ["age"], []).rows[0]
+        a, b = (two_arm.loc[two_arm["arm"] == g, "age"].dropna() for g in two_arm["arm"].unique())
+        assert t_row[-1] == format_pvalue(stats.ttest_ind(a, b).pvalue)
+
+    def test_group_without_category_values_is_left_out_of_chi_square(self) -> None:
+        from scipy import stats
+
+        df = pd.DataFrame(
+            {
+                "arm": ["a"] * 4 + ["b"] * 4 + ["c"] * 3,
+                "s": ["x", "y", "x", "y", "x", "y", "y", "x", None, None, None],
+            }
+        )
+        row = build_table_one(df, "arm", [], ["s"]).rows[0]
+        expected = stats.chi2_contingency(pd.crosstab(df["arm"], df["s"]))[1]
+        assert row[-1] == format_pvalue(expected) == "1.000"
+        assert row[4] == "0 (0.0%)"
+
+    def test_nonnormal_columns_use_median_iqr(self, frame: pd.DataFrame) -> None:
+        table = build_table_one(frame, "arm", ["age", "los"], [], nonnormal_cols=["los"])
+        q = frame["los"].quantile([0.25, 0.5, 0.75])
+        assert table.rows[1][1] == f"{q[0.5]:.1f} [{q[0.25]:.1f}, {q[0.75]:.1f}]"
+        assert "median [Q1, Q3]" in table.to_markdown()
+
+    def test_csv_and_docx_outputs(self, analyzer) -> None:
+        for name in ("t1.csv", "t1.docx"):
+            result = analyzer.generate_table_one(
+                filename="sample_clinical_trial.csv",
+                group_col="group",
+                continuous_cols=["age"],
+                categorical_cols=["sex"],
+                output_name=name,
+            )
+            assert "saved to" in result
+        tables = os.path.join(analyzer.results_dir, "tables")
+        with open(os.path.join(tables, "t1.csv"), encoding="utf-8") as fh:
+            assert fh.readline().startswith("Variable,Overall (N=40)")
+
+        from docx import Document
+
+        doc = Document(os.path.join(tables, "t1.docx"))
+        assert doc.tables[0].cell(1, 0).text == "age"
+
+    @pytest.fixture
+    def analyzer(self, tmp_path):
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        _create_sample_clinical_data(str(data_dir))
+        return Analyzer(data_dir=str(data_dir), results_dir=str(tmp_path / "results"))
+
+
 class TestTableOneMCPTool:
     """Test Table 1 MCP tool integration."""
 
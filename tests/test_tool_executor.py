@@ -0,0 +1,129 @@
+"""Tests for off-event-loop dispatch of synchronous facade handlers."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from med_paper_assistant.interfaces.mcp.tools._shared import invoke_tool_handler
+from med_paper_assistant.interfaces.mcp.tools._shared.tool_executor import tool_execution_stats
+
+
+def _tracking_handler(name: str, log: list[tuple[str, str]], delay: float = 0.05):
+    def handler(project: str | None = None) -> str:
+        log.append(("start", project or ""))
+        time.sleep(delay)
+        log.append(("end", project or ""))
+        return threading.current_thread().name
+
+    handler.__name__ = name
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_sync_handler_runs_off_the_event_loop() -> None:
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    task = asyncio.create_task(ticker())
+    thread_name = await invoke_tool_handler(_tracking_handler("export_docx", [], 0.1))
+    task.cancel()
+
+    assert thread_name.startswith("mcp-tool")
+    assert ticks >= 5
+
+
+@pytest.mark.asyncio
+async def test_mutating_calls_run_alone() -> None:
+    log: list[tuple[str, str]] = []
+    write = _tracking_handler("write_draft", log)
+
+    await asyncio.gather(
+        invoke_tool_handler(write, project="alpha"),
+        invoke_tool_handler(write, project="alpha"),
+        invoke_tool_handler(_tracking_handler("list_drafts", log)),
+    )
+    assert [event for event, _ in log] == ["start", "end"] * 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writes_to_different_projects_do_not_cross() -> None:
+    """Handlers switch the global active project, as ensure_project_context does."""
+    active = {"slug": "alpha"}
+    landed: list[tuple[str, str]] = []
+
+    def write_draft(project: str | None = None) -> None:
+        if project:
+            active["slug"] = project
+        target = active["slug"]
+        time.sleep(0.05)
+        landed.append((target, active["slug"]))
+
+    def read_draft(project: str | None = None) -> None:
+        if project:
+            active["slug"] = project
+        time.sleep(0.02)
+
+    await asyncio.gather(
+        invoke_tool_handler(write_draft, project="alpha"),
+        invoke_tool_handler(write_draft, project="beta"),
+        invoke_tool_handler(read_draft, project="alpha"),
+        invoke_tool_handler(write_draft),
+        invoke_tool_handler(read_draft, project="beta"),
+    )
+
+    assert len(landed) == 3
+    assert all(target == written for target, written in landed)
+
+
+@pytest.mark.asyncio
+async def test_reads_for_different_projects_do_not_overlap() -> None:
+    log: list[tuple[str, str]] = []
+
+    await asyncio.gather(
+        invoke_tool_handler(_tracking_handler("list_drafts", log), project="alpha"),
+        invoke_tool_handler(_tracking_handler("list_drafts", log), project="beta"),
+    )
+    assert [event for event, _ in log] == ["start", "end", "start", "end"]
+
+
+@pytest.mark.asyncio
+async def test_read_only_calls_run_concurrently_and_are_counted() -> None:
+    log: list[tuple[str, str]] = []
+    before = tool_execution_stats()["calls"]
+
+    await asyncio.gather(
+        *(
+            invoke_tool_handler(_tracking_handler("list_drafts", log), project="alpha")
+            for _ in range(3)
+        )
+    )
+
+    stats = tool_execution_stats()
+    assert [event for event, _ in log][:3] == ["start"] * 3
+    assert stats["calls"] == before + 3
+    assert stats["queue_depth"] == 0
+    assert stats["running"] == 0
+    assert stats["max_wait_ms"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_async_handlers_and_inline_mode_stay_on_the_loop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def get_status(project: str | None = None) -> str:
+        return threading.current_thread().name
+
+    main = threading.current_thread().name
+    assert await invoke_tool_handler(get_status, project="alpha") == main
+
+    monkeypatch.setenv("MEDPAPER_TOOL_WORKERS", "0")
+    assert await invoke_tool_handler(_tracking_handler("write_draft", [], 0)) == main
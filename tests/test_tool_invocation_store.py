@@ -28,10 +28,11 @@ def store(workspace: Path) -> ToolInvocationStore:
 
 
 def test_first_run_no_audit_dir(store: ToolInvocationStore, workspace: Path) -> None:
-    """On first run .audit/ does not exist — created on first save."""
+    """On first run .audit/ does not exist — created on first flush."""
     assert not (workspace / ".audit").exists()
     store.record_invocation("write_draft")
-    assert (workspace / ".audit" / ToolInvocationStore.DATA_FILE).is_file()
+    store.flush()
+    assert (workspace / ".audit" / ToolInvocationStore.JOURNAL_FILE).is_file()
 
 
 def test_fresh_store_get_all_stats_empty(store: ToolInvocationStore) -> None:
@@ -140,6 +141,7 @@ def test_persistence_survives_new_instance(workspace: Path) -> None:
 def test_data_file_is_valid_yaml(workspace: Path) -> None:
     store = ToolInvocationStore(workspace)
     store.record_invocation("some_tool")
+    store.compact()
     raw = (workspace / ".audit" / ToolInvocationStore.DATA_FILE).read_text(encoding="utf-8")
     data = yaml.safe_load(raw)
     assert "version" in data
@@ -149,12 +151,65 @@ def test_data_file_is_valid_yaml(workspace: Path) -> None:
 def test_data_file_has_updated_at(workspace: Path) -> None:
     store = ToolInvocationStore(workspace)
     store.record_invocation("x")
+    store.compact()
     raw = yaml.safe_load(
         (workspace / ".audit" / ToolInvocationStore.DATA_FILE).read_text(encoding="utf-8")
     )
     assert "updated_at" in raw
 
 
+# ── Journal / compaction ──────────────────────────────────────────────
+
+
+def test_recording_does_not_rewrite_snapshot(workspace: Path) -> None:
+    store = ToolInvocationStore(workspace)
+    for _ in range(50):
+        store.record_invocation("hot_tool")
+        store.record_success("hot_tool")
+    store.flush()
+    assert not (workspace / ".audit" / ToolInvocationStore.DATA_FILE).exists()
+    journal = workspace / ".audit" / ToolInvocationStore.JOURNAL_FILE
+    assert len(journal.read_text(encoding="utf-8").splitlines()) == 100
+
+
+def test_reader_merges_snapshot_and_journal(workspace: Path) -> None:
+    s1 = ToolInvocationStore(workspace)
+    s1.record_invocation("t")
+    s1.record_error("t", "ValueError")
+    s1.compact()
+    s1.record_invocation("t")
+    s1.record_error("t", "TypeError")
+    s1.flush()
+    # A torn final line (crash mid-append) is skipped
+    journal = workspace / ".audit" / ToolInvocationStore.JOURNAL_FILE
+    with journal.open("a", encoding="utf-8") as fh:
+        fh.write('["i", "t')
+
+    stats = ToolInvocationStore(workspace).get_tool_stats("t")
+    assert stats["invocation_count"] == 2
+    assert stats["error_count"] == 2
+    assert stats["error_types"] == ["ValueError", "TypeError"]
+
+
+def test_new_instance_sees_unflushed_events(workspace: Path) -> None:
+    """Readers in the same process flush the live writer first."""
+    writer = ToolInvocationStore(workspace)
+    writer.record_misuse("list_projects")
+    assert ToolInvocationStore(workspace).get_tool_stats("list_projects")["misuse_count"] == 1
+
+
+def test_compaction_at_size_threshold(workspace: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MEDPAPER_TELEMETRY_FLUSH_MS", "0")
+    monkeypatch.setenv("MEDPAPER_TELEMETRY_COMPACT_BYTES", "200")
+    store = ToolInvocationStore(workspace)
+    for _ in range(20):
+        store.record_invocation("write_draft")
+
+    journal = workspace / ".audit" / ToolInvocationStore.JOURNAL_FILE
+    assert not journal.exists() or journal.stat().st_size < 200
+    assert ToolInvocationStore(workspace).get_tool_stats("write_draft")["invocation_count"] == 20
+
+
 # ── get_all_stats ─────────────────────────────────────────────────────
 
 
@@ -200,10 +255,15 @@ def test_reset_clears_data(workspace: Path) -> None:
 def test_reset_removes_file(workspace: Path) -> None:
     store = ToolInvocationStore(workspace)
     store.record_invocation("z")
+    store.compact()
+    store.record_invocation("z")
+    store.flush()
     data_path = workspace / ".audit" / ToolInvocationStore.DATA_FILE
-    assert data_path.is_file()
+    journal_path = workspace / ".audit" / ToolInvocationStore.JOURNAL_FILE
+    assert data_path.is_file() and journal_path.is_file()
     store.reset()
     assert not data_path.is_file()
+    assert not journal_path.is_file()
 
 
 # ── Edge cases ────────────────────────────────────────────────────────
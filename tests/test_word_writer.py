@@ -0,0 +1,89 @@
+"""Tests for WordWriter section editing and its heading index."""
+
+from docx import Document
+
+from med_paper_assistant.infrastructure.services.word_writer import (
+    InsertInstruction,
+    SectionIndex,
+    WordWriter,
+)
+
+
+def _template() -> Document:
+    doc = Document()
+    doc.add_paragraph("Title page")
+    for number, name in enumerate(["Introduction", "Methods", "Results"], start=1):
+        doc.add_heading(f"{number}. {name}", level=1)
+        doc.add_paragraph(f"{name} placeholder one")
+        doc.add_paragraph(f"{name} placeholder two")
+    return doc
+
+
+def _texts(doc: Document) -> list[str]:
+    return [p.text for p in doc.paragraphs]
+
+
+class TestSectionIndex:
+    def test_find_ignores_numbering_and_case(self) -> None:
+        doc = _template()
+        assert SectionIndex(doc).find("methods") == (4, 7)
+        assert SectionIndex(doc).find("Results") == (7, 10)
+
+    def test_index_follows_edits(self) -> None:
+        doc = _template()
+        index = SectionIndex(doc)
+        writer = WordWriter()
+
+        writer.insert_content_in_section(doc, "Introduction", ["Only line"], index=index)
+        writer.insert_content_in_section(doc, "Results", ["R1", "R2", "R3"], index=index)
+
+        fresh = SectionIndex(doc)
+        assert index.headings == fresh.headings
+        assert [p.text for p in index.paragraphs] == _texts(doc)
+
+
+class TestWordWriter:
+    def test_replace_and_append(self) -> None:
+        doc = _template()
+        results = WordWriter().execute_instructions(
+            doc,
+            [
+                InsertInstruction("Methods", "First\n\nSecond"),
+                InsertInstruction("Introduction", "Added", position="append"),
+                InsertInstruction("Discussion", "Missing"),
+            ],
+        )
+
+        assert results["Methods"] == 2
+        assert results["Introduction"] == 1
+        assert str(results["Discussion"]).startswith("Error: Section 'Discussion'")
+        assert _texts(doc)[1:9] == [
+            "1. Introduction",
+            "Introduction placeholder one",
+            "Introduction placeholder two",
+            "Added",
+            "2. Methods",
+            "First",
+            "Second",
+            "3. Results",
+        ]
+
+    def test_last_section_is_appended_to(self) -> None:
+        doc = _template()
+        WordWriter().insert_content_in_section(doc, "Results", ["Final"])
+        assert _texts(doc)[-2:] == ["3. Results", "Final"]
+
+    def test_word_counts(self) -> None:
+        writer = WordWriter()
+        assert writer.count_words_in_section(_template(), "Discussion") == 0
+
+        doc = _template()
+        doc.add_heading("", level=2)
+        doc.add_paragraph("three more words")
+
+        assert writer.count_words_in_section(doc, "Methods") == 6
+        assert writer.get_all_word_counts(doc) == {
+            "Introduction": 6,
+            "Methods": 6,
+            "Results": 9,
+        }
@@ -0,0 +1,141 @@
+"""
+Artifact Digest Cache — Stat-keyed SHA-256 of reference source artifacts.
+
+``derive_reference_source_revision`` hashes every ``source/`` file and every
+Asset-Aware manifest artifact of every reference on each Phase 2.1 gate run.
+``artifact_digest`` streams a file through SHA-256 in fixed-size chunks and
+remembers the digest under the file's stat identity, so an unchanged PDF or
+extracted figure is read once per process instead of once per gate.
+
+Invalidation:
+    Entries are keyed by ``(path, size, mtime_ns, inode, ctime_ns)``. The
+    change time is included because ``mtime`` can be set back with
+    ``os.utime``; ``ctime`` cannot. An entry recorded within the racy window
+    of the file's last change (``file_freshness.is_racy``) is re-hashed and
+    re-stamped, and a file whose ``fstat`` changed while it was being read is
+    returned but not cached. Anything that is not a regular file — including
+    symlinks — is reported as such and never followed.
+
+Usage:
+    digest = artifact_digest(path)   # None when not a regular file
+    if digest is not None:
+        digest.size, digest.sha256
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import stat
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import NamedTuple, TypeVar
+
+from med_paper_assistant.infrastructure.persistence.file_freshness import is_racy
+
+DEFAULT_REVISION_WORKERS = 4
+REVISION_WORKERS_ENV = "MEDPAPER_REFERENCE_GATE_WORKERS"
+CHUNK_SIZE = 1024 * 1024
+
+_CACHE_SIZE = 8192
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+class ArtifactDigest(NamedTuple):
+    """Byte count and SHA-256 hex digest of one regular file."""
+
+    size: int
+    sha256: str
+
+
+_StatKey = tuple[str, int, int, int, int]
+
+_digests: OrderedDict[_StatKey, tuple[int, ArtifactDigest]] = OrderedDict()
+_digests_lock = threading.Lock()
+
+
+def artifact_digest(path: Path) -> ArtifactDigest | None:
+    """
+    Return the size and SHA-256 of ``path``, or None when it is not a regular file.
+
+    Symlinks and missing paths yield None; read errors raise ``OSError``.
+    """
+    try:
+        st = path.lstat()
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    key = (str(path), st.st_size, st.st_mtime_ns, st.st_ino, st.st_ctime_ns)
+
+    with _digests_lock:
+        cached = _digests.get(key)
+        if cached is not None:
+            _digests.move_to_end(key)
+    if cached is not None:
+        recorded_ns, digest = cached
+        if not is_racy(max(st.st_mtime_ns, st.st_ctime_ns), recorded_ns):
+            return digest
+
+    recorded_ns = time.time_ns()
+    digest, unchanged = _stream_digest(path, key)
+    if unchanged:
+        with _digests_lock:
+            _digests[key] = (recorded_ns, digest)
+            _digests.move_to_end(key)
+            while len(_digests) > _CACHE_SIZE:
+                _digests.popitem(last=False)
+    return digest
+
+
+def clear_artifact_digests() -> None:
+    """Drop every remembered digest."""
+    with _digests_lock:
+        _digests.clear()
+
+
+def resolve_revision_workers(max_workers: int | None = None) -> int:
+    """Explicit value, else ``MEDPAPER_REFERENCE_GATE_WORKERS``, else the default (min 1)."""
+    if max_workers is None:
+        try:
+            max_workers = int(os.environ.get(REVISION_WORKERS_ENV, DEFAULT_REVISION_WORKERS))
+        except ValueError:
+            max_workers = DEFAULT_REVISION_WORKERS
+    return max(1, max_workers)
+
+
+def map_reference_dirs(
+    func: Callable[[_T], _R],
+    items: Iterable[_T],
+    max_workers: int | None = None,
+) -> list[_R]:
+    """``[func(item) for item in items]`` on a bounded thread pool, in input order."""
+    items = list(items)
+    workers = min(resolve_revision_workers(max_workers), len(items))
+    if workers <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ref-revision") as pool:
+        return list(pool.map(func, items))
+
+
+def _stream_digest(path: Path, key: _StatKey) -> tuple[ArtifactDigest, bool]:
+    """Hash ``path`` in chunks; the flag is False if it changed while being read."""
+    hasher = hashlib.sha256()
+    size = 0
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+    with os.fdopen(fd, "rb") as stream:
+        for chunk in iter(lambda: stream.read(CHUNK_SIZE), b""):
+            hasher.update(chunk)
+            size += len(chunk)
+        after = os.fstat(stream.fileno())
+    unchanged = (
+        stat.S_ISREG(after.st_mode)
+        and (str(path), size, after.st_mtime_ns, after.st_ino, after.st_ctime_ns) == key
+    )
+    return ArtifactDigest(size, hasher.hexdigest()), unchanged
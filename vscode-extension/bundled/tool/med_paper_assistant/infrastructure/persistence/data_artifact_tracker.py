@@ -44,7 +44,7 @@ from med_paper_assistant.domain.value_objects.content_integrity import (
     decide_integrity_gate,
     detect_raster_mime_signature,
 )
-from med_paper_assistant.infrastructure.external import reinspect_content_integrity
+from med_paper_assistant.infrastructure.external import reinspect_cached
 
 logger = structlog.get_logger()
 
@@ -100,7 +100,7 @@ class DataArtifactTracker:
         audit_dir: str | Path,
         project_dir: str | Path,
         *,
-        content_integrity_reinspector: ContentIntegrityReinspector = reinspect_content_integrity,
+        content_integrity_reinspector: ContentIntegrityReinspector = reinspect_cached,
     ) -> None:
         self._audit_dir = Path(audit_dir)
         self._project_dir = Path(project_dir)
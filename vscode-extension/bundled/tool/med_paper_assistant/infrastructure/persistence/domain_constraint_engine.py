@@ -40,6 +40,8 @@ from typing import Any
 
 import structlog
 
+from .constraint_plan import ConstraintPlan, load_constraint_plan
+
 logger = structlog.get_logger()
 
 
@@ -1118,9 +1120,14 @@ class DomainConstraintEngine:
         Returns:
             List of constraint dicts.
         """
-        base = self._get_base_constraints()
-        learned = self._load_learned_constraints()
+        return self._merge_constraints(
+            self._get_base_constraints(), self._load_learned_constraints()
+        )
 
+    @staticmethod
+    def _merge_constraints(
+        base: list[dict[str, Any]], learned: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
         # Merge: learned can escalate severity but not weaken
         base_by_id = {c["id"]: c for c in base}
         merged = list(base)  # Start with all base
@@ -1160,9 +1167,17 @@ class DomainConstraintEngine:
         if not self._learned_path.is_file():
             return []
         try:
-            data = json.loads(self._learned_path.read_text(encoding="utf-8"))
-            return data.get("constraints", [])
-        except (json.JSONDecodeError, OSError):
+            return self._parse_learned_constraints(self._learned_path.read_bytes())
+        except OSError:
+            logger.warning("constraint_load_failed", path=str(self._learned_path))
+            return []
+
+    def _parse_learned_constraints(self, raw: bytes | None) -> list[dict[str, Any]]:
+        if raw is None:
+            return []
+        try:
+            return json.loads(raw.decode("utf-8")).get("constraints", [])
+        except json.JSONDecodeError:
             logger.warning("constraint_load_failed", path=str(self._learned_path))
             return []
 
@@ -1312,214 +1327,27 @@ class DomainConstraintEngine:
         Returns:
             Dict with violations, stats, and passed status.
         """
-        constraints = self.get_active_constraints()
-        violations: list[ConstraintViolation] = []
-
-        content_lower = content.lower()
-        word_count = len(content.split())
-
-        for c in constraints:
-            rule = c.get("rule", "")
-            params = c.get("params") or {}
-            severity = c.get("severity", "WARNING")
-            cid = c.get("id", "")
-            category = c.get("category", "")
-
-            # Anti-AI vocabulary check
-            if rule == "anti_ai_vocabulary":
-                forbidden = params.get("forbidden_patterns", [])
-                for pattern in forbidden:
-                    if re.search(rf"\b{re.escape(pattern.lower())}\b", content_lower):
-                        violations.append(
-                            ConstraintViolation(
-                                constraint_id=cid,
-                                rule=rule,
-                                category=category,
-                                severity=severity,
-                                message=f"AI-typical phrase detected: '{pattern}'",
-                                section=section,
-                                suggestion=f"Rephrase to avoid '{pattern}'",
-                            )
-                        )
-
-            # Word count boundary check
-            elif rule == "word_count_range":
-                min_w = params.get("min_words", 0)
-                max_w = params.get("max_words", 999999)
-                if word_count < min_w:
-                    violations.append(
-                        ConstraintViolation(
-                            constraint_id=cid,
-                            rule=rule,
-                            category=category,
-                            severity=severity,
-                            message=f"Word count {word_count} below minimum {min_w}",
-                            section=section,
-                            suggestion=f"Expand content to at least {min_w} words",
-                        )
-                    )
-                elif word_count > max_w:
-                    violations.append(
-                        ConstraintViolation(
-                            constraint_id=cid,
-                            rule=rule,
-                            category=category,
-                            severity=severity,
-                            message=f"Word count {word_count} exceeds maximum {max_w}",
-                            section=section,
-                            suggestion=f"Reduce content to at most {max_w} words",
-                        )
-                    )
-
-            # Required sections check
-            elif rule == "required_sections" and section == "manuscript":
-                required = params.get("sections", [])
-                for req_section in required:
-                    # Check if section heading exists via regex (any heading level)
-                    heading_pattern = rf"^\s*#{{1,4}}\s+{re.escape(req_section)}\s*$"
-                    found = bool(re.search(heading_pattern, content, re.IGNORECASE | re.MULTILINE))
-                    if not found:
-                        violations.append(
-                            ConstraintViolation(
-                                constraint_id=cid,
-                                rule=rule,
-                                category=category,
-                                severity=severity,
-                                message=f"Required section '{req_section}' not found",
-                                section="manuscript",
-                                suggestion=f"Add '## {req_section}' section",
-                            )
-                        )
-
-            # Methods-before-Results ordering check
-            elif rule == "methods_before_results" and section == "manuscript":
-                methods_match = re.search(
-                    r"^\s*#{1,4}\s+Methods\s*$", content, re.IGNORECASE | re.MULTILINE
-                )
-                results_match = re.search(
-                    r"^\s*#{1,4}\s+Results\s*$", content, re.IGNORECASE | re.MULTILINE
-                )
-                if methods_match and results_match:
-                    if methods_match.start() > results_match.start():
-                        violations.append(
-                            ConstraintViolation(
-                                constraint_id=cid,
-                                rule=rule,
-                                category=category,
-                                severity=severity,
-                                message="Methods section appears after Results",
-                                section="manuscript",
-                                suggestion="Move Methods section before Results",
-                            )
-                        )
-
-            # Minimum references check (count [[wikilink]] citations)
-            elif rule == "minimum_references":
-                min_refs = params.get("min_references", 0)
-                # Count unique wikilink citations [[...]]
-                wikilinks = set(re.findall(r"\[\[([^\]]+)\]\]", content))
-                if len(wikilinks) < min_refs:
-                    violations.append(
-                        ConstraintViolation(
-                            constraint_id=cid,
-                            rule=rule,
-                            category=category,
-                            severity=severity,
-                            message=(
-                                f"Only {len(wikilinks)} unique citations found, "
-                                f"minimum {min_refs} required"
-                            ),
-                            section=section,
-                            suggestion=f"Add at least {min_refs - len(wikilinks)} more citations",
-                        )
-                    )
-
-            # Patient consent mentioned check (case reports)
-            elif rule == "patient_consent_mentioned" and section == "manuscript":
-                consent_keywords = [
-                    "informed consent",
-                    "patient consent",
-                    "written consent",
-                    "irb approval",
-                    "irb waiver",
-                    "ethics committee",
-                    "ethical approval",
-                    "institutional review board",
-                ]
-                found_consent = any(kw in content_lower for kw in consent_keywords)
-                if not found_consent:
-                    violations.append(
-                        ConstraintViolation(
-                            constraint_id=cid,
-                            rule=rule,
-                            category=category,
-                            severity=severity,
-                            message="No mention of patient consent or IRB approval found",
-                            section="manuscript",
-                            suggestion=(
-                                "Add a statement about informed consent or IRB approval/waiver"
-                            ),
-                        )
-                    )
-
-            # No overlap between sections check
-            elif rule == "no_overlap_between_sections" and section == "manuscript":
-                # Split content into sections and detect duplicate paragraphs
-                section_pattern = re.compile(r"^\s*#{1,4}\s+(.+?)\s*$", re.MULTILINE)
-                headings = list(section_pattern.finditer(content))
-                if len(headings) >= 2:
-                    section_texts: dict[str, list[str]] = {}
-                    for i, heading in enumerate(headings):
-                        start = heading.end()
-                        end = headings[i + 1].start() if i + 1 < len(headings) else len(content)
-                        sec_name = heading.group(1).strip()
-                        sec_content = content[start:end].strip()
-                        # Extract paragraphs (non-empty, 3+ words)
-                        paragraphs = [
-                            p.strip()
-                            for p in sec_content.split("\n\n")
-                            if p.strip() and len(p.split()) >= 3
-                        ]
-                        section_texts[sec_name] = paragraphs
-
-                    # Check for duplicate paragraphs across different sections
-                    seen_paragraphs: dict[str, str] = {}  # paragraph -> section_name
-                    for sec_name, paragraphs in section_texts.items():
-                        for para in paragraphs:
-                            # Normalize for comparison
-                            normalized = " ".join(para.lower().split())
-                            if normalized in seen_paragraphs:
-                                violations.append(
-                                    ConstraintViolation(
-                                        constraint_id=cid,
-                                        rule=rule,
-                                        category=category,
-                                        severity=severity,
-                                        message=(
-                                            f"Duplicate paragraph found in "
-                                            f"'{seen_paragraphs[normalized]}' and '{sec_name}'"
-                                        ),
-                                        section="manuscript",
-                                        suggestion="Remove or rewrite the duplicated paragraph",
-                                    )
-                                )
-                                break  # One violation per section pair is enough
-                            seen_paragraphs[normalized] = sec_name
-
+        plan = load_constraint_plan(self._paper_type, self._learned_path, self._compile_plan)
+        violations = [ConstraintViolation(**v) for v in plan.evaluate(content, section)]
         critical_count = sum(1 for v in violations if v.severity == "CRITICAL")
-        passed = critical_count == 0
 
         return {
-            "passed": passed,
-            "total_constraints": len(constraints),
+            "passed": critical_count == 0,
+            "total_constraints": plan.total,
             "violations": [v.to_dict() for v in violations],
             "violation_count": len(violations),
             "critical_count": critical_count,
             "paper_type": self._paper_type,
-            "base_constraints": len(self._get_base_constraints()),
-            "learned_constraints": len(self._load_learned_constraints()),
+            "base_constraints": plan.base_count,
+            "learned_constraints": plan.learned_count,
         }
 
+    def _compile_plan(self, learned_raw: bytes | None) -> ConstraintPlan:
+        """Compile the active set for one version of the learned-constraints file."""
+        base = self._get_base_constraints()
+        learned = self._parse_learned_constraints(learned_raw)
+        return ConstraintPlan(self._merge_constraints(base, learned), len(base), len(learned))
+
     def get_constraint_summary(self) -> dict[str, Any]:
         """
         Get a summary of all active constraints for this project.
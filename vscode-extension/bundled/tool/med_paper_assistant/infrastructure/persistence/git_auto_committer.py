@@ -7,6 +7,10 @@ draft changes, reference saves, and pipeline phase completions.
 Architecture:
   Infrastructure layer service. Called after significant write operations.
   Uses subprocess to call git — no Python git library dependency.
+  Each commit costs two git processes (one ``add`` for every path, one
+  ``commit``); repository detection is a filesystem check, not a process.
+  ``commit_batch`` folds several logical auto-commits into one commit, which
+  the post-write queue uses to commit once per flush interval.
 
 Safety:
   - Only commits within the project directory
@@ -17,7 +21,10 @@ Safety:
 
 from __future__ import annotations
 
+import shutil
 import subprocess  # nosec B404 - subprocess used only for git commands with hardcoded executable
+from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
@@ -39,6 +46,23 @@ _COMMIT_PREFIXES: dict[CommitType, str] = {
     "checkpoint": "🔖 auto-checkpoint",
     "snapshot": "💾 auto-snapshot",
 }
+_BATCH_PREFIX = "🗂️ auto-batch"
+
+# One logical auto-commit: (paths relative to the repo, commit message)
+AutoCommit = tuple[tuple[str, ...], str]
+
+
+@lru_cache(maxsize=1)
+def _git_available() -> bool:
+    return shutil.which("git") is not None
+
+
+def combine_commit_messages(messages: Iterable[str]) -> str:
+    """One message for several auto-commits: the message itself, or a summary + list."""
+    unique = list(dict.fromkeys(messages))
+    if len(unique) == 1:
+        return unique[0]
+    return f"{_BATCH_PREFIX}: {len(unique)} changes\n\n" + "\n".join(f"- {m}" for m in unique)
 
 
 class GitAutoCommitter:
@@ -67,13 +91,20 @@ class GitAutoCommitter:
         return self._enabled
 
     def _check_git_repo(self) -> bool:
-        """Check if the directory is inside a git repository."""
-        try:
-            result = self._run_git(["rev-parse", "--is-inside-work-tree"])
-            return result.returncode == 0
-        except FileNotFoundError:
+        """Check if the directory is inside a git work tree (no subprocess)."""
+        if not _git_available():
             logger.info("Git not found on PATH — auto-commit disabled")
             return False
+        repo_dir = self._repo_dir.resolve()
+        return any((parent / ".git").exists() for parent in (repo_dir, *repo_dir.parents))
+
+    @staticmethod
+    def draft_change(filename: str, reason: str = "") -> AutoCommit:
+        """The auto-commit recorded for one draft write."""
+        msg = f"{_COMMIT_PREFIXES['draft']}: {filename}"
+        if reason:
+            msg += f" ({reason})"
+        return (f"drafts/{filename}", "drafts/.snapshots/"), msg
 
     def commit_draft(self, filename: str, reason: str = "") -> bool:
         """
@@ -83,13 +114,20 @@ class GitAutoCommitter:
             filename: Draft filename (e.g., "introduction.md")
             reason: What triggered the change (e.g., "patch_draft", "sync_references")
         """
-        msg = f"{_COMMIT_PREFIXES['draft']}: {filename}"
-        if reason:
-            msg += f" ({reason})"
-        return self._auto_commit(
-            paths=[f"drafts/{filename}", "drafts/.snapshots/"],
-            message=msg,
-        )
+        return self.commit_batch([self.draft_change(filename, reason)])
+
+    def commit_batch(self, commits: Iterable[AutoCommit]) -> bool:
+        """
+        Make one commit for several logical auto-commits.
+
+        Paths are staged together; the message is the single message, or a
+        summary line listing each one.
+        """
+        commits = list(commits)
+        if not commits:
+            return False
+        paths = list(dict.fromkeys(path for paths, _ in commits for path in paths))
+        return self._auto_commit(paths, combine_commit_messages(m for _, m in commits))
 
     def commit_reference(self, citation_key: str) -> bool:
         """Auto-commit after saving a reference."""
@@ -128,26 +166,22 @@ class GitAutoCommitter:
             return False
 
         try:
-            # Stage specific paths (ignore errors for non-existent paths)
-            for p in paths:
-                full_path = self._repo_dir / p
-                if full_path.exists():
-                    self._run_git(["add", str(full_path)])
-
-            # Check if there's anything to commit
-            status = self._run_git(["diff", "--cached", "--name-only"])
-            if not status.stdout.strip():
-                logger.debug("No staged changes — skipping auto-commit")
-                return False
+            # Stage every existing path in one invocation; ignored paths make
+            # git exit non-zero but the remaining paths are still staged.
+            existing = [str(self._repo_dir / p) for p in paths if (self._repo_dir / p).exists()]
+            if existing:
+                self._run_git(["add", "--", *existing])
 
-            # Commit
+            # Commit; an empty index exits 1 with only a stdout notice
             result = self._run_git(["commit", "-m", message, "--no-verify"])
             if result.returncode == 0:
                 logger.info("Auto-committed: %s", message)
                 return True
-            else:
-                logger.warning("Auto-commit failed: %s", result.stderr)
+            if result.returncode == 1 and not result.stderr.strip():
+                logger.debug("No staged changes — skipping auto-commit")
                 return False
+            logger.warning("Auto-commit failed: %s", result.stderr or result.stdout)
+            return False
 
         except Exception as e:
             logger.warning("Auto-commit error (non-fatal): %s", e)
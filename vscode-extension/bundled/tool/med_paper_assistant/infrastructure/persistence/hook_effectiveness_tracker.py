@@ -2,11 +2,15 @@
 Hook Effectiveness Tracker — Track and analyze Copilot Hook performance.
 
 Records hook trigger/pass/fix/false-positive events across pipeline runs.
-Persists to `.audit/hook-effectiveness.yaml` and generates `.md` reports.
+Persists aggregates to `.audit/hook-effectiveness.yaml` and generates `.md` reports.
 
 Architecture:
   Infrastructure layer service. Called after each hook evaluation.
   Provides data for Hook D meta-learning analysis.
+  The YAML file holds only per-hook counters and a run counter, so saving it
+  costs O(hooks) however many runs a project has seen. Per-run records go to
+  ``HookRunLog`` segments (``.audit/hook-runs/``); a legacy ``runs`` list is
+  moved there on first load.
 
 Design rationale (CONSTITUTION §23):
   - Hook self-improvement requires objective effectiveness metrics
@@ -22,6 +26,8 @@ from typing import Any, Literal
 import structlog
 import yaml
 
+from .hook_run_log import HookRunLog
+
 logger = structlog.get_logger()
 
 EventType = Literal["trigger", "pass", "fix", "false_positive"]
@@ -60,6 +66,7 @@ class HookEffectivenessTracker:
         self._data_path = self._audit_dir / self.DATA_FILE
         self._report_path = self._audit_dir / self.REPORT_FILE
         self._data: dict[str, Any] | None = None
+        self._runs = HookRunLog(self._audit_dir)
 
     def _load(self) -> dict[str, Any]:
         """Load or initialize tracking data."""
@@ -72,6 +79,8 @@ class HookEffectivenessTracker:
                 if loaded is None:
                     loaded = {}
                 self._data = loaded
+                if isinstance(loaded.get("runs"), list):
+                    self._migrate_runs(loaded)
                 return loaded
             except (yaml.YAMLError, OSError) as e:
                 logger.warning("Failed to load hook effectiveness data: %s", e)
@@ -79,11 +88,22 @@ class HookEffectivenessTracker:
         self._data = {
             "version": 1,
             "hooks": {},
-            "runs": [],
+            "run_count": 0,
             "created_at": datetime.now().isoformat(),
         }
         return self._data
 
+    def _migrate_runs(self, data: dict[str, Any]) -> None:
+        """Move a legacy in-document ``runs`` list into run-log segments."""
+        runs = data.pop("runs")
+        for run in runs:
+            if isinstance(run, dict) and not self._runs.contains(str(run.get("run_id"))):
+                timestamp = str(run.get("timestamp") or "") or None
+                self._runs.append(str(run.get("run_id")), run.get("results", {}), timestamp)
+        data["run_count"] = max(data.get("run_count", 0), len(runs))
+        self._save()
+        logger.info("hook_tracker.runs_migrated", count=len(runs))
+
     def _save(self) -> None:
         """Persist tracking data to disk."""
         self._audit_dir.mkdir(parents=True, exist_ok=True)
@@ -124,18 +144,12 @@ class HookEffectivenessTracker:
         data = self._load()
 
         # Guard against duplicate run_id — skip silently if already recorded
-        existing_ids = {r.get("run_id") for r in data.get("runs", [])}
-        if run_id in existing_ids:
+        if self._runs.contains(run_id):
             logger.warning("hook_tracker.duplicate_run", run_id=run_id)
             return
 
-        data["runs"].append(
-            {
-                "run_id": run_id,
-                "timestamp": datetime.now().isoformat(),
-                "results": hook_results,
-            }
-        )
+        self._runs.append(run_id, hook_results)
+        data["run_count"] = data.get("run_count", 0) + 1
 
         # Also accumulate into aggregate stats
         for hook_id, counts in hook_results.items():
@@ -303,12 +317,17 @@ class HookEffectivenessTracker:
         return report
 
     def get_run_count(self) -> int:
-        """Number of recorded pipeline runs."""
-        return len(self._load().get("runs", []))
+        """Number of recorded pipeline runs (including runs past retention)."""
+        return int(self._load().get("run_count", 0))
+
+    def get_runs(self) -> list[dict[str, Any]]:
+        """Retained per-run records, oldest first."""
+        return list(self._runs.iter_runs())
 
     def reset(self) -> None:
         """Clear all tracking data (for testing)."""
         self._data = None
+        self._runs.reset()
         for path in (self._data_path, self._report_path):
             if path.is_file():
                 path.unlink()
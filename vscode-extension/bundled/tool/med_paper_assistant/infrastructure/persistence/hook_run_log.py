@@ -0,0 +1,136 @@
+"""
+Hook Run Log — Time-partitioned, retained per-run hook results.
+
+``HookEffectivenessTracker`` used to keep every pipeline run in the ``runs``
+list of ``hook-effectiveness.yaml``, so each hook event re-read and re-dumped
+the project's whole audit history. Per-run records now live here instead:
+
+- one JSON line per run in ``.audit/hook-runs/<YYYY-MM>.jsonl`` (append-only,
+  one segment per calendar month);
+- only the newest ``MEDPAPER_HOOK_RUN_RETENTION`` segments are kept
+  (default 12, ``0`` keeps all); older segments are deleted on append, and
+  their run ids move to ``expired-run-ids.txt`` so a re-recorded old run is
+  still detected as a duplicate.
+
+The tracker's YAML file keeps only per-hook aggregates and a run counter, so
+stats, recommendations and reports never read run history.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger()
+
+DEFAULT_RETENTION_SEGMENTS = 12
+RETENTION_ENV = "MEDPAPER_HOOK_RUN_RETENTION"
+
+
+def resolve_retention_segments() -> int:
+    """``MEDPAPER_HOOK_RUN_RETENTION`` (0 = keep all), else the default."""
+    try:
+        return max(0, int(os.environ.get(RETENTION_ENV, DEFAULT_RETENTION_SEGMENTS)))
+    except ValueError:
+        return DEFAULT_RETENTION_SEGMENTS
+
+
+class HookRunLog:
+    """
+    Append-only per-run hook results, partitioned into monthly segments.
+
+    Usage:
+        log = HookRunLog(audit_dir)
+        log.append("20260223-1430", {"A1": {"trigger": 2, "pass": 5}})
+        for run in log.iter_runs():
+            ...
+    """
+
+    SEGMENT_DIR = "hook-runs"
+    EXPIRED_IDS_FILE = "expired-run-ids.txt"
+
+    def __init__(self, audit_dir: str | Path, retention: int | None = None) -> None:
+        self._dir = Path(audit_dir) / self.SEGMENT_DIR
+        self._retention = resolve_retention_segments() if retention is None else retention
+        self._run_ids: set[str] | None = None
+
+    def segments(self) -> list[Path]:
+        """Segment files, oldest first."""
+        if not self._dir.is_dir():
+            return []
+        return sorted(self._dir.glob("*.jsonl"))
+
+    def iter_runs(self) -> Iterator[dict[str, Any]]:
+        """Yield retained run records, oldest first. Unreadable lines are skipped."""
+        return self._read(self.segments())
+
+    def _read(self, segments: list[Path]) -> Iterator[dict[str, Any]]:
+        for segment in segments:
+            try:
+                lines = segment.read_text(encoding="utf-8").splitlines()
+            except OSError as e:
+                logger.warning("hook_run_log.read_failed", segment=segment.name, error=str(e))
+                continue
+            for line in lines:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(record, dict):
+                    yield record
+
+    def contains(self, run_id: str) -> bool:
+        """Whether ``run_id`` was ever appended, retained or expired (indexed on first call)."""
+        if self._run_ids is None:
+            self._run_ids = {str(r.get("run_id")) for r in self.iter_runs()}
+            self._run_ids.update(self._expired_ids())
+        return run_id in self._run_ids
+
+    def _expired_ids(self) -> list[str]:
+        try:
+            return (self._dir / self.EXPIRED_IDS_FILE).read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return []
+
+    def append(
+        self,
+        run_id: str,
+        results: dict[str, dict[str, int]],
+        timestamp: str | None = None,
+    ) -> None:
+        """Append one run to the segment for its month, then apply retention."""
+        timestamp = timestamp or datetime.now().isoformat()
+        record = {"run_id": run_id, "timestamp": timestamp, "results": results}
+        self._dir.mkdir(parents=True, exist_ok=True)
+        segment = self._dir / f"{timestamp[:7] or 'undated'}.jsonl"
+        with segment.open("a", encoding="utf-8") as fh:
+            fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+        if self._run_ids is not None:
+            self._run_ids.add(run_id)
+        self._apply_retention()
+
+    def _apply_retention(self) -> None:
+        if self._retention <= 0:
+            return
+        expired = self.segments()[: -self._retention]
+        if not expired:
+            return
+        # Run ids outlive their segment so dedupe does not depend on retention
+        with (self._dir / self.EXPIRED_IDS_FILE).open("a", encoding="utf-8") as fh:
+            fh.writelines(f"{record.get('run_id')}\n" for record in self._read(expired))
+        for segment in expired:
+            segment.unlink(missing_ok=True)
+        logger.info("hook_run_log.segments_expired", count=len(expired))
+
+    def reset(self) -> None:
+        """Delete all segments (for testing)."""
+        for segment in self.segments():
+            segment.unlink()
+        (self._dir / self.EXPIRED_IDS_FILE).unlink(missing_ok=True)
+        self._run_ids = None
@@ -0,0 +1,203 @@
+"""
+Journal Profile Cache — Process-wide compiled ``journal-profile.yaml`` objects.
+
+Writing hooks, review hooks and pipeline gates all read the same
+``journal-profile.yaml``, and each engine used to re-open and YAML-parse it on
+construction (once per ``write_draft``). ``load_journal_profile`` parses a
+project's profile once, compiles the values the hooks look up (section word
+limits, citation densities, reference bounds, tolerances) into dicts, and
+hands the same ``JournalProfile`` to every caller until the file changes.
+
+Invalidation:
+    Entries store the file's ``(mtime_ns, size, inode)`` and SHA-256 and are
+    checked with ``file_freshness.revalidate``: a stat match inside the
+    timestamp-granularity window is confirmed by re-hashing the bytes, and
+    the entry is re-stamped so it settles. Unparseable files are cached as
+    ``None`` under the same rules, so a broken profile is logged once per
+    version rather than once per engine.
+
+Usage:
+    profile = load_journal_profile(project_dir)
+    if profile is not None:
+        profile.section_word_limits.get("introduction")
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping
+
+import structlog
+import yaml
+
+from med_paper_assistant.infrastructure.persistence.file_freshness import (
+    FileVersion,
+    revalidate,
+)
+
+logger = structlog.get_logger()
+
+PROFILE_FILENAME = "journal-profile.yaml"
+DEFAULT_PAPER_TYPE = "original-research"
+
+_CACHE_SIZE = 64
+
+
+@dataclass(frozen=True, eq=False)
+class JournalProfile:
+    """Parsed journal profile with pre-built lookups. Treat ``data`` as read-only."""
+
+    data: dict[str, Any]
+    declared_paper_type: str
+    section_word_limits: Mapping[str, int]
+    body_sections: frozenset[str] | None
+    citation_density: Mapping[str, int]
+    word_tolerance_pct: int | None
+    total_word_limit: int | None
+    figures_max: int | None
+    tables_max: int | None
+    min_reference_limits: Mapping[str, int]
+    reference_limits: Mapping[str, int]
+    max_references: int | None
+
+    @property
+    def paper_type(self) -> str:
+        return self.declared_paper_type or DEFAULT_PAPER_TYPE
+
+    def max_references_for(self, paper_type: str) -> int | None:
+        """Per-type reference limit, else the global ``max_references``."""
+        limit = self.reference_limits.get(paper_type)
+        return limit if limit is not None else self.max_references
+
+
+def compile_journal_profile(data: dict[str, Any]) -> JournalProfile:
+    """Build the lookup tables for one parsed profile."""
+    paper = _mapping(data.get("paper"))
+    pipeline = _mapping(data.get("pipeline"))
+    references = _mapping(data.get("references"))
+    assets = _mapping(data.get("assets"))
+
+    section_limits: dict[str, int] = {}
+    body_sections: set[str] = set()
+    sections = paper.get("sections")
+    for section in sections if isinstance(sections, list) else []:
+        if not isinstance(section, dict):
+            continue
+        name = str(section.get("name", "")).lower()
+        limit = _as_int(section.get("word_limit"))
+        # First section with a usable limit wins, as in the old linear scan
+        if limit is not None and name not in section_limits:
+            section_limits[name] = limit
+        if section.get("counts_toward_total") is True and name:
+            body_sections.add(name)
+
+    return JournalProfile(
+        data=data,
+        declared_paper_type=str(paper.get("type") or ""),
+        section_word_limits=MappingProxyType(section_limits),
+        body_sections=frozenset(body_sections) or None,
+        citation_density=_int_mapping(_mapping(pipeline.get("writing")).get("citation_density")),
+        word_tolerance_pct=_as_int(_mapping(pipeline.get("tolerance")).get("word_percent")),
+        total_word_limit=_as_int(_mapping(data.get("word_limits")).get("total_manuscript")),
+        figures_max=_as_int(assets.get("figures_max")),
+        tables_max=_as_int(assets.get("tables_max")),
+        min_reference_limits=_int_mapping(references.get("minimum_reference_limits")),
+        reference_limits=_int_mapping(references.get("reference_limits")),
+        max_references=_as_int(references.get("max_references")),
+    )
+
+
+def load_journal_profile(project_dir: str | Path) -> JournalProfile | None:
+    """
+    Return the compiled profile of ``project_dir``, or None when it has none.
+
+    A missing, unreadable or non-mapping ``journal-profile.yaml`` yields None.
+    """
+    path = Path(project_dir) / PROFILE_FILENAME
+    key = str(path)
+    try:
+        st = path.stat()
+    except OSError:
+        with _cache_lock:
+            _cache.pop(key, None)
+        return None
+
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is not None:
+            _cache.move_to_end(key)
+    try:
+        version, raw = revalidate(path, st, entry.version if entry is not None else None)
+    except OSError:
+        logger.warning("Failed to read journal-profile.yaml", path=str(path))
+        return None
+    if entry is not None and raw is None:
+        if version is not entry.version:
+            _store(key, _Entry(version, entry.profile))
+        return entry.profile
+
+    entry = _Entry(version, _parse(raw or b"", path))
+    _store(key, entry)
+    return entry.profile
+
+
+def clear_journal_profile_cache() -> None:
+    """Drop every cached profile (tests, or after bulk edits outside the tools)."""
+    with _cache_lock:
+        _cache.clear()
+
+
+@dataclass(frozen=True)
+class _Entry:
+    version: FileVersion
+    profile: JournalProfile | None
+
+
+_cache: OrderedDict[str, _Entry] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _store(key: str, entry: _Entry) -> None:
+    with _cache_lock:
+        _cache[key] = entry
+        _cache.move_to_end(key)
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+
+
+def _parse(raw: bytes, path: Path) -> JournalProfile | None:
+    try:
+        data = yaml.safe_load(raw.decode("utf-8")) or {}
+    except (UnicodeDecodeError, yaml.YAMLError):
+        logger.warning("Failed to load journal-profile.yaml", path=str(path))
+        return None
+    if not isinstance(data, dict):
+        logger.warning("journal-profile.yaml is not a mapping", path=str(path))
+        return None
+    return compile_journal_profile(data)
+
+
+def _mapping(value: Any) -> dict[str, Any]:
+    return value if isinstance(value, dict) else {}
+
+
+def _as_int(value: Any) -> int | None:
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _int_mapping(value: Any) -> Mapping[str, int]:
+    compiled = {}
+    for key, raw in _mapping(value).items():
+        number = _as_int(raw)
+        if number is not None:
+            compiled[str(key)] = number
+    return MappingProxyType(compiled)
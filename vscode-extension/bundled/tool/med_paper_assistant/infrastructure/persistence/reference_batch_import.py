@@ -0,0 +1,147 @@
+"""
+Reference batch import — verified PubMed saves for hundreds of PMIDs at once.
+
+Systematic-review projects import 200–2000 records. Saving them one
+``save_reference_mcp`` call at a time opens a connection per PMID, rewrites the
+three identity registries per reference, appends to ``notes/log.md`` per
+reference, and rebuilds the Foam index per reference.
+
+Architecture:
+    Infrastructure layer workflow driven by ``ReferenceManager.save_references_mcp``.
+    1. PMIDs already in the library (one catalog snapshot) are skipped without
+       a network call.
+    2. The rest are fetched in bulk through ``PubMedAPIClient.get_verified_articles``
+       (pooled, chunked, concurrent single-article fallback).
+    3. Every payload is persisted through ``ReferenceManager.save_verified_article``,
+       the same trust boundary as the single-PMID path, inside
+       ``ReferenceManager.batch_writes()`` so registries, log, and index are
+       committed once at the end.
+
+Usage:
+    report = ref_manager.save_references_mcp(["12345678", "23456789"])
+    print(report.to_markdown())
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List
+
+import structlog
+
+if TYPE_CHECKING:
+    from med_paper_assistant.infrastructure.persistence.reference_manager import (
+        ReferenceManager,
+    )
+
+logger = structlog.get_logger()
+
+_SERVICE_UNAVAILABLE = (
+    "pubmed-search MCP HTTP API is not available. "
+    "Please ensure pubmed-search is running with HTTP API enabled."
+)
+
+
+@dataclass
+class ReferenceBatchReport:
+    """Per-PMID outcome of one batch import."""
+
+    requested: int = 0
+    saved: Dict[str, str] = field(default_factory=dict)
+    existing: List[str] = field(default_factory=list)
+    missing: List[str] = field(default_factory=list)
+    rejected: Dict[str, str] = field(default_factory=dict)
+    round_trips: int = 0
+    error: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for machine-readable tool output."""
+        return asdict(self)
+
+    def to_markdown(self) -> str:
+        """Render the tool response shown to the agent."""
+        if self.error:
+            return f"⚠️ {self.error}"
+        lines = [
+            f"📚 Batch import: {len(self.saved)}/{self.requested} saved "
+            f"({self.round_trips} PubMed round trips)",
+        ]
+        if self.saved:
+            links = ", ".join(f"[[{key}]]" for key in self.saved.values())
+            lines.append(f"- ✅ Saved ({len(self.saved)}): {links}")
+        if self.existing:
+            lines.append(
+                f"- ♻️ Already in library ({len(self.existing)}): {', '.join(self.existing)}"
+            )
+        if self.missing:
+            lines.append(f"- ❓ Not found ({len(self.missing)}): {', '.join(self.missing)}")
+        if self.rejected:
+            lines.append(f"- ❌ Rejected ({len(self.rejected)}):")
+            lines.extend(f"  - PMID:{pmid}: {reason}" for pmid, reason in self.rejected.items())
+        return "\n".join(lines)
+
+
+def _partition_pending(
+    manager: "ReferenceManager", pmids: Iterable[Any], report: ReferenceBatchReport
+) -> List[str]:
+    """Dedupe ``pmids`` and skip those already saved, without a network call."""
+    requested = list(dict.fromkeys(p for p in (str(raw).strip() for raw in pmids) if p))
+    known = manager.resolve_reference_ids(requested)
+    report.requested += len(requested)
+    pending: List[str] = []
+    for pmid in requested:
+        if pmid in known:
+            report.existing.append(pmid)
+        else:
+            pending.append(pmid)
+    return pending
+
+
+def import_verified_references(
+    manager: "ReferenceManager",
+    client: Any,
+    pmids: Iterable[Any],
+    *,
+    agent_notes: str = "",
+    fetch_if_missing: bool = True,
+) -> ReferenceBatchReport:
+    """Fetch, verify, and persist ``pmids`` with one deferred commit."""
+    report = ReferenceBatchReport()
+    pending = _partition_pending(manager, pmids, report)
+    if not pending:
+        return report
+
+    if not client.check_health():
+        report.error = _SERVICE_UNAVAILABLE
+        return report
+
+    batch = client.get_verified_articles(pending, fetch_if_missing=fetch_if_missing)
+    report.round_trips = batch.round_trips
+    report.missing.extend(batch.missing)
+    report.rejected.update(batch.rejected)
+
+    with manager.batch_writes():
+        for pmid, payload in batch.articles.items():
+            try:
+                message = manager.save_verified_article(pmid, payload, agent_notes=agent_notes)
+            except Exception as exc:
+                logger.warning("reference_batch_import.save_failed", pmid=pmid, error=str(exc))
+                report.rejected[pmid] = f"save failed: {exc}"
+                continue
+            if message.startswith("Successfully saved"):
+                metadata = manager.get_metadata(pmid)
+                report.saved[pmid] = str(metadata.get("citation_key") or pmid)
+            elif "already exists" in message:
+                report.existing.append(pmid)
+            else:
+                report.rejected[pmid] = message
+
+    logger.info(
+        "reference_batch_import.completed",
+        requested=report.requested,
+        saved=len(report.saved),
+        existing=len(report.existing),
+        missing=len(report.missing),
+        rejected=len(report.rejected),
+    )
+    return report
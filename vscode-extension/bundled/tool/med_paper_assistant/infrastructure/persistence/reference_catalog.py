@@ -0,0 +1,317 @@
+"""
+ReferenceCatalog — Project-level metadata index for ``references/``.
+
+Keeps one parsed copy of every ``references/{unique_id}/metadata.json`` in
+memory and mirrors it into an append-only JSONL journal so a fresh process can
+warm-start without re-opening every reference directory.
+
+Architecture:
+    Infrastructure layer service owned by ReferenceManager. Lives next to the
+    existing identity registries (``registry/by-*.json``) rather than inside
+    ``references/``, because many readers treat every child directory of
+    ``references/`` as a reference.
+
+Invalidation:
+    metadata.json remains the source of truth. Each cached entry stores the
+    file's ``(mtime_ns, size, inode)`` and SHA-256. A stat mismatch forces a
+    re-read; a stat match inside the timestamp-granularity window ("racy"
+    entry) is confirmed by re-hashing the bytes and then re-stamped, so it is
+    hashed at most once after the window has passed (see ``file_freshness``).
+    Lookups journal re-read and re-stamped entries before returning.
+
+Usage:
+    catalog = ReferenceCatalog(references_dir, registry_dir)
+    catalog.get("12345678")
+    catalog.resolve("10.1000/xyz")
+    catalog.resolve_all(["12345678", "23456789"])
+    catalog.snapshot()
+    catalog.search(["sepsis", "lactate"], limit=10)
+    catalog.record("12345678"); catalog.flush()
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Iterable
+
+import structlog
+
+from med_paper_assistant.infrastructure.persistence.file_freshness import (
+    FileVersion,
+    revalidate,
+)
+from med_paper_assistant.infrastructure.persistence.reference_search_index import (
+    RankedReference,
+    ReferenceSearchIndex,
+)
+
+logger = structlog.get_logger()
+
+_MIN_COMPACT_LINES = 64
+_ENTRY_FIELDS = ("mtime_ns", "size", "ino", "sha256", "recorded_ns", "metadata")
+
+
+class ReferenceCatalog:
+    """Stat- and hash-validated cache of reference metadata with secondary keys."""
+
+    FILE_NAME = "catalog.jsonl"
+    SCHEMA_VERSION = 1
+
+    def __init__(self, references_dir: str | Path, registry_dir: str | Path) -> None:
+        self._references_dir = Path(references_dir)
+        self._path = Path(registry_dir) / self.FILE_NAME
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._by_key: dict[str, str] = {}
+        self._pending: list[dict[str, Any]] = []
+        self._journal_lines = 0
+        self._loaded = False
+        self._index = ReferenceSearchIndex()
+        self._lock = threading.RLock()
+
+    @property
+    def path(self) -> Path:
+        """Return the journal path."""
+        return self._path
+
+    # ── Loading ────────────────────────────────────────────────────
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self._path.is_file():
+            return
+        try:
+            lines = self._path.read_text(encoding="utf-8").splitlines()
+        except OSError as exc:
+            logger.warning("reference_catalog.load_failed", error=str(exc))
+            return
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # torn trailing write; the entry is re-read lazily
+            if not isinstance(record, dict) or record.get("v") != self.SCHEMA_VERSION:
+                continue
+            self._journal_lines += 1
+            ref_id = str(record.get("id") or "")
+            if record.get("op") == "put" and isinstance(record.get("metadata"), dict):
+                self._set_entry(ref_id, {field: record.get(field) for field in _ENTRY_FIELDS})
+            elif record.get("op") == "del":
+                self._drop_entry(ref_id)
+
+    # ── Entry bookkeeping ──────────────────────────────────────────
+
+    @staticmethod
+    def _probes(value: str) -> list[str]:
+        return [f"id:{value}", f"pmid:{value}", f"doi:{value.lower()}", f"key:{value}"]
+
+    @staticmethod
+    def _identity_keys(ref_id: str, metadata: dict[str, Any]) -> list[str]:
+        keys = [f"id:{ref_id}"]
+        if metadata.get("pmid"):
+            keys.append(f"pmid:{metadata['pmid']}")
+        if metadata.get("doi"):
+            keys.append(f"doi:{str(metadata['doi']).lower()}")
+        if metadata.get("citation_key"):
+            keys.append(f"key:{metadata['citation_key']}")
+        return keys
+
+    def _set_entry(self, ref_id: str, entry: dict[str, Any]) -> None:
+        self._drop_entry(ref_id)
+        self._entries[ref_id] = entry
+        for key in self._identity_keys(ref_id, entry["metadata"]):
+            self._by_key[key] = ref_id
+
+    def _drop_entry(self, ref_id: str) -> None:
+        entry = self._entries.pop(ref_id, None)
+        if entry is None:
+            return
+        for key in self._identity_keys(ref_id, entry["metadata"]):
+            if self._by_key.get(key) == ref_id:
+                self._by_key.pop(key, None)
+
+    def _metadata_path(self, ref_id: str) -> Path:
+        return self._references_dir / ref_id / "metadata.json"
+
+    def _stat(self, ref_id: str) -> os.stat_result | None:
+        try:
+            return self._metadata_path(ref_id).stat()
+        except OSError:
+            return None
+
+    def _validate(self, ref_id: str) -> dict[str, Any] | None:
+        """Return the current entry for ``ref_id``, re-reading stale files."""
+        st = self._stat(ref_id)
+        entry = self._entries.get(ref_id)
+        if st is None:
+            if entry is not None:
+                self._drop_entry(ref_id)
+                self._pending.append({"op": "del", "id": ref_id})
+            return None
+        previous = FileVersion.from_fields(entry) if entry is not None else None
+        try:
+            version, raw = revalidate(self._metadata_path(ref_id), st, previous)
+            metadata = json.loads(raw) if raw is not None else entry["metadata"]
+        except (OSError, ValueError) as exc:
+            logger.warning("reference_catalog.read_failed", reference_id=ref_id, error=str(exc))
+            self._drop_entry(ref_id)
+            return None
+        if version is previous:
+            return entry
+        if not isinstance(metadata, dict):
+            self._drop_entry(ref_id)
+            return None
+        # New contents, or a racy entry confirmed by hash and re-stamped
+        fresh = {**version.fields(), "metadata": metadata}
+        self._set_entry(ref_id, fresh)
+        self._pending.append({"op": "put", "id": ref_id, **fresh})
+        return fresh
+
+    # ── Queries ────────────────────────────────────────────────────
+
+    def reference_ids(self) -> list[str]:
+        """List every child directory of ``references/`` (one directory read)."""
+        try:
+            with os.scandir(self._references_dir) as entries:
+                return [entry.name for entry in entries if entry.is_dir()]
+        except OSError:
+            return []
+
+    def get(self, ref_id: str) -> dict[str, Any] | None:
+        """Return cached metadata for one reference (O(1) stat), or None."""
+        with self._lock:
+            self._load()
+            entry = self._validate(ref_id)
+            self._flush_quietly()
+            return entry["metadata"] if entry is not None else None
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return ``{unique_id: metadata}`` for every readable reference.
+
+        The returned dicts are shared with the cache and must be treated as
+        read-only; copy before mutating.
+        """
+        with self._lock:
+            self._load()
+            present = self.reference_ids()
+            for ref_id in set(self._entries) - set(present):
+                self._drop_entry(ref_id)
+                self._pending.append({"op": "del", "id": ref_id})
+            result: dict[str, dict[str, Any]] = {}
+            for ref_id in present:
+                entry = self._validate(ref_id)
+                if entry is not None:
+                    result[ref_id] = entry["metadata"]
+            self._flush_quietly()
+            return result
+
+    def versions(self) -> dict[str, str]:
+        """Return ``{unique_id: metadata sha256}`` for every readable reference."""
+        with self._lock:
+            self.snapshot()
+            return {ref_id: entry["sha256"] for ref_id, entry in sorted(self._entries.items())}
+
+    def resolve(self, identifier: str) -> str | None:
+        """Map a unique_id, PMID, DOI, or citation key to its reference directory."""
+        value = str(identifier or "").strip()
+        if not value:
+            return None
+        probes = self._probes(value)
+        with self._lock:
+            self._load()
+            for attempt in range(2):
+                for probe in probes:
+                    ref_id = self._by_key.get(probe)
+                    if ref_id is None:
+                        continue
+                    entry = self._validate(ref_id)
+                    if entry is not None and probe in self._identity_keys(
+                        ref_id, entry["metadata"]
+                    ):
+                        self._flush_quietly()
+                        return ref_id
+                if attempt == 0:
+                    self.snapshot()
+        return None
+
+    def resolve_all(self, identifiers: Iterable[str]) -> dict[str, str]:
+        """``resolve`` many identifiers against one snapshot; unknown ones are omitted."""
+        resolved: dict[str, str] = {}
+        with self._lock:
+            self.snapshot()
+            for identifier in identifiers:
+                value = str(identifier or "").strip()
+                for probe in self._probes(value) if value else []:
+                    if probe in self._by_key:
+                        resolved[value] = self._by_key[probe]
+                        break
+        return resolved
+
+    def search(
+        self, query: str | Iterable[str], *, limit: int | None = None
+    ) -> list[RankedReference]:
+        """BM25-rank references against a free-text or multi-term query."""
+        with self._lock:
+            self.snapshot()
+            self._index.sync(
+                {
+                    ref_id: (entry["sha256"], entry["metadata"])
+                    for ref_id, entry in self._entries.items()
+                }
+            )
+            return self._index.search(query, limit=limit)
+
+    # ── Mutations ──────────────────────────────────────────────────
+
+    def record(self, ref_id: str) -> None:
+        """Re-index one reference after its metadata.json was written."""
+        with self._lock:
+            self._load()
+            self._entries.pop(ref_id, None)
+            self._validate(ref_id)
+
+    def discard(self, ref_id: str) -> None:
+        """Forget a reference whose directory was removed."""
+        with self._lock:
+            self._load()
+            self._drop_entry(ref_id)
+            self._pending.append({"op": "del", "id": ref_id})
+
+    def flush(self) -> None:
+        """Append pending changes to the journal, compacting when it is mostly stale."""
+        with self._lock:
+            if not self._pending:
+                return
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            records = self._pending
+            self._pending = []
+            if self._journal_lines + len(records) > max(_MIN_COMPACT_LINES, 2 * len(self._entries)):
+                self._compact()
+                return
+            with self._path.open("a", encoding="utf-8") as handle:
+                for record in records:
+                    handle.write(self._encode(record))
+            self._journal_lines += len(records)
+
+    def _flush_quietly(self) -> None:
+        """Journal re-read or re-stamped entries from a read path without failing it."""
+        try:
+            self.flush()
+        except OSError as exc:
+            logger.warning("reference_catalog.flush_failed", error=str(exc))
+
+    def _compact(self) -> None:
+        tmp_path = self._path.with_name(f"{self._path.name}.tmp")
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            for ref_id, entry in sorted(self._entries.items()):
+                handle.write(self._encode({"op": "put", "id": ref_id, **entry}))
+        os.replace(tmp_path, self._path)
+        self._journal_lines = len(self._entries)
+
+    def _encode(self, record: dict[str, Any]) -> str:
+        payload = {"v": self.SCHEMA_VERSION, **record}
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":")) + "\n"
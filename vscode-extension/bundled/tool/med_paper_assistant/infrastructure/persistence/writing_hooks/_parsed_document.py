@@ -0,0 +1,193 @@
+"""Writing Hooks — Immutable parsed-manuscript model shared across hooks.
+
+Every hook in a batch used to re-strip headings and wikilinks, re-split
+paragraphs and sentences, re-count words and re-run section parsing on the
+same text. ``parse_manuscript`` builds one ``ParsedManuscript`` per content
+hash (memoized, bounded LRU); each view is computed lazily on first access and
+then shared by every hook that asks for it, so repeated batches on an
+unchanged manuscript skip all parsing.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cached_property
+from types import MappingProxyType
+from typing import Mapping
+
+_CACHE_SIZE = 256
+
+_HEADING = re.compile(r"^#{1,3}\s+(.+)")
+_HEADING_LINE = re.compile(r"^#+\s.*$", re.MULTILINE)
+_WIKILINK = re.compile(r"\[\[([^\]]*)\]\]")
+_WIKILINK_TARGET = re.compile(r"\[\[([^\]]+)\]\]")
+_MARKDOWN_LINK = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_EMPHASIS = re.compile(r"[*_]{1,3}")
+_HEADING_MARKER = re.compile(r"^#{1,6}\s+", re.MULTILINE)
+_WORD = re.compile(r"\b\w+\b")
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_SENTENCE_BREAK = re.compile(r"[.!?]+")
+_SENTENCE_END = re.compile(r"[.!?]+\s+|[.!?]+$")
+_TABLE_ROW = re.compile(r"^\s*\|.*\|\s*$")
+_N_VALUE_PATTERNS = (
+    (re.compile(r"\b[Nn]\s*=\s*(\d+)\b", re.IGNORECASE), "N="),
+    (
+        re.compile(
+            r"(\d+)\s+(?:patients|subjects|participants|individuals|cases|controls|samples|enrolled)",
+            re.IGNORECASE,
+        ),
+        "count of",
+    ),
+)
+
+
+def strip_frontmatter(text: str) -> str:
+    """Strip YAML frontmatter (--- ... ---) from markdown content."""
+    if text.startswith("---"):
+        end = text.find("\n---", 3)
+        if end != -1:
+            text = text[end + 4 :]
+    return text
+
+
+@dataclass(frozen=True, eq=False)
+class ParsedManuscript:
+    """Read-only structural views of one markdown text, computed on demand."""
+
+    content: str
+    content_hash: str
+
+    @cached_property
+    def sections(self) -> Mapping[str, str]:
+        """``{heading: body}`` for ``#``–``###`` headings, frontmatter stripped."""
+        sections: dict[str, str] = {}
+        current_name: str | None = None
+        current_lines: list[str] = []
+        for line in strip_frontmatter(self.content).split("\n"):
+            heading_match = _HEADING.match(line)
+            if heading_match:
+                if current_name is not None:
+                    sections[current_name] = "\n".join(current_lines).strip()
+                current_name = heading_match.group(1).strip()
+                current_lines = []
+            elif current_name is not None:
+                current_lines.append(line)
+        if current_name is not None:
+            sections[current_name] = "\n".join(current_lines).strip()
+        return MappingProxyType(sections)
+
+    @cached_property
+    def prose(self) -> str:
+        """Text with heading lines and wikilinks removed (style metrics input)."""
+        return _WIKILINK.sub("", _HEADING_LINE.sub("", self.content)).strip()
+
+    @cached_property
+    def paragraphs(self) -> tuple[str, ...]:
+        """Non-empty blank-line-separated prose paragraphs."""
+        return tuple(p.strip() for p in _PARAGRAPH_BREAK.split(self.prose) if p.strip())
+
+    @cached_property
+    def blocks(self) -> tuple[str, ...]:
+        """Non-empty blank-line-separated blocks of the raw text (links kept)."""
+        return tuple(p.strip() for p in _PARAGRAPH_BREAK.split(self.content) if p.strip())
+
+    @cached_property
+    def line_paragraphs(self) -> tuple[str, ...]:
+        """Runs of non-blank lines, also broken at ``#`` lines (which are dropped)."""
+        paragraphs: list[str] = []
+        current: list[str] = []
+        for line in self.content.split("\n"):
+            stripped = line.strip()
+            if stripped and not stripped.startswith("#"):
+                current.append(line)
+            elif current:
+                paragraphs.append("\n".join(current))
+                current = []
+        if current:
+            paragraphs.append("\n".join(current))
+        return tuple(paragraphs)
+
+    @cached_property
+    def sentence_count(self) -> int:
+        """Sentences ending in ``.!?`` (plus any unterminated tail), however short."""
+        return sum(1 for s in _SENTENCE_END.split(self.content) if s.strip())
+
+    @cached_property
+    def sentences(self) -> tuple[str, ...]:
+        """Prose sentences of at least three words."""
+        return split_sentences(self.prose)
+
+    @cached_property
+    def tokens(self) -> tuple[str, ...]:
+        """Word tokens after stripping frontmatter, links and markdown markup."""
+        cleaned = _WIKILINK.sub("CITE", strip_frontmatter(self.content))
+        cleaned = _MARKDOWN_LINK.sub(r"\1", cleaned)
+        cleaned = _HEADING_MARKER.sub("", _EMPHASIS.sub("", cleaned))
+        return tuple(_WORD.findall(cleaned))
+
+    @property
+    def word_count(self) -> int:
+        return len(self.tokens)
+
+    @cached_property
+    def wikilinks(self) -> tuple[str, ...]:
+        """Every ``[[target]]`` in order, duplicates kept."""
+        return tuple(_WIKILINK_TARGET.findall(self.content))
+
+    @cached_property
+    def numeric_claims(self) -> Mapping[str, frozenset[str]]:
+        """Sample-size claims by kind (``N=`` / ``count of``)."""
+        claims: dict[str, frozenset[str]] = {}
+        for pattern, label in _N_VALUE_PATTERNS:
+            values = frozenset(pattern.findall(self.content))
+            if values:
+                claims[label] = values
+        return MappingProxyType(claims)
+
+    @cached_property
+    def tables(self) -> tuple[str, ...]:
+        """Contiguous markdown table blocks."""
+        blocks: list[list[str]] = []
+        previous_was_row = False
+        for line in self.content.split("\n"):
+            is_row = bool(_TABLE_ROW.match(line))
+            if is_row:
+                if not previous_was_row:
+                    blocks.append([])
+                blocks[-1].append(line)
+            previous_was_row = is_row
+        return tuple("\n".join(block) for block in blocks)
+
+    @cached_property
+    def without_tables(self) -> str:
+        """The text with markdown table rows removed (tables are display items)."""
+        return "\n".join(line for line in self.content.split("\n") if not _TABLE_ROW.match(line))
+
+
+def split_sentences(text: str) -> tuple[str, ...]:
+    """Split on ``.!?`` and keep sentences of at least three words."""
+    return tuple(s.strip() for s in _SENTENCE_BREAK.split(text) if len(s.strip().split()) >= 3)
+
+
+_cache: OrderedDict[str, ParsedManuscript] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def parse_manuscript(content: str) -> ParsedManuscript:
+    """Return the shared ``ParsedManuscript`` for ``content``, memoized by SHA-256."""
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    with _cache_lock:
+        document = _cache.get(digest)
+        if document is not None:
+            _cache.move_to_end(digest)
+            return document
+    document = ParsedManuscript(content, digest)
+    with _cache_lock:
+        document = _cache.setdefault(digest, document)
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return document
@@ -0,0 +1,110 @@
+"""Writing Hooks — Compiled multi-phrase matcher shared by the A3-series hooks.
+
+A vocabulary (``ANTI_AI_PHRASES``, ``AI_COPULA_AVOIDANCE_VERBS``, …) is compiled
+once into a single case-insensitive alternation and scanned in one pass,
+instead of one ``re.findall`` (and one pattern compile) per phrase.
+
+The alternation sits inside a zero-width lookahead so hits may overlap, and
+phrases that are word-bounded prefixes of a longer match are still reported.
+Counts therefore equal the historical per-phrase ``\\b<phrase>\\b`` scans.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import NamedTuple
+
+from ._constants import ANTI_AI_PARAGRAPH_START_ONLY, ANTI_AI_PHRASES
+
+_WORD_BOUNDARY = re.compile(r"\b")
+
+
+class PhraseHit(NamedTuple):
+    """One vocabulary phrase found at ``text[start:end]``."""
+
+    phrase: str
+    start: int
+    end: int
+
+
+class PhraseMatcher:
+    """All-occurrence, word-bounded, case-insensitive matcher for a phrase list."""
+
+    def __init__(self, phrases: Iterable[str]) -> None:
+        self.phrases: tuple[str, ...] = tuple(dict.fromkeys(p.lower() for p in phrases if p))
+        longest_first = sorted(self.phrases, key=len, reverse=True)
+        self._pattern = (
+            re.compile(
+                r"\b(?=(" + "|".join(re.escape(p) for p in longest_first) + r")\b)",
+                re.IGNORECASE,
+            )
+            if longest_first
+            else None
+        )
+        # At one start offset the alternation reports only the longest phrase;
+        # shorter phrases that are its prefixes are checked explicitly.
+        self._prefixes = {
+            phrase: [
+                other for other in longest_first if other != phrase and phrase.startswith(other)
+            ]
+            for phrase in longest_first
+        }
+
+    def find_all(self, text: str) -> list[PhraseHit]:
+        """Return every hit in text order (non-overlapping per phrase, like ``re.findall``)."""
+        if self._pattern is None:
+            return []
+        hits: list[PhraseHit] = []
+        last_end: dict[str, int] = {}
+        for match in self._pattern.finditer(text):
+            start, matched = match.start(), match.group(1).lower()
+            candidates = [matched]
+            candidates += [
+                p
+                for p in self._prefixes.get(matched, ())
+                if _WORD_BOUNDARY.match(text, start + len(p))
+            ]
+            for phrase in candidates:
+                if start < last_end.get(phrase, 0):
+                    continue
+                last_end[phrase] = start + len(phrase)
+                hits.append(PhraseHit(phrase, start, start + len(phrase)))
+        return hits
+
+    def counts(self, text: str) -> dict[str, int]:
+        """Return ``{phrase: count}`` for phrases found, in vocabulary order."""
+        found: dict[str, int] = {}
+        for hit in self.find_all(text):
+            found[hit.phrase] = found.get(hit.phrase, 0) + 1
+        return {phrase: found[phrase] for phrase in self.phrases if phrase in found}
+
+
+def starts_paragraph(text: str, offset: int) -> bool:
+    """True when only whitespace separates ``offset`` from the text or a blank-line start."""
+    run_start = offset
+    while run_start > 0 and text[run_start - 1].isspace():
+        run_start -= 1
+    return run_start == 0 or "\n\n" in text[run_start:offset]
+
+
+@lru_cache(maxsize=32)
+def compile_phrases(phrases: tuple[str, ...]) -> PhraseMatcher:
+    """Return the shared matcher for a vocabulary, compiling it on first use."""
+    return PhraseMatcher(phrases)
+
+
+def anti_ai_phrase_counts(content: str) -> dict[str, int]:
+    """A3 phrase counts from one matcher pass; start-only phrases count at paragraph start."""
+    anywhere = [p.lower() for p in ANTI_AI_PHRASES]
+    start_only = [p.lower() for p in ANTI_AI_PARAGRAPH_START_ONLY]
+    found: dict[str, int] = {}
+    for hit in compile_phrases(tuple(anywhere + start_only)).find_all(content):
+        if hit.phrase in anywhere:
+            found[hit.phrase] = found.get(hit.phrase, 0) + 1
+        if hit.phrase in start_only and starts_paragraph(content, hit.start):
+            key = f"{hit.phrase} (paragraph start)"
+            found[key] = found.get(key, 0) + 1
+    ordered = [*anywhere, *(f"{p} (paragraph start)" for p in start_only)]
+    return {key: found[key] for key in ordered if key in found}
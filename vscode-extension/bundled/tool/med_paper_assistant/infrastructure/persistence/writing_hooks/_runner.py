@@ -0,0 +1,110 @@
+"""Writing Hooks — Executor-backed batch runner with per-hook timing.
+
+Batch runners hand over ``{hook_id: zero-arg callable}``; the hooks run on a
+bounded thread pool and come back as the same ordered
+``dict[str, HookResult]`` the sequential dict literals produced. Wall and
+CPU time per hook are kept on ``last_hook_timings`` so slow hooks are visible.
+
+Threads (not processes) are used: the I/O-bound hooks (C5, C10, C12, F, P7)
+release the GIL while reading ``references/`` and ``.audit/``, and the text
+hooks share the in-process parse cache, which a process pool could not.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+import structlog
+
+from ._hook_cache import consume_cache_outcome
+from ._models import HookResult
+
+logger = structlog.get_logger()
+
+DEFAULT_HOOK_WORKERS = 4
+HOOK_WORKERS_ENV = "MEDPAPER_HOOK_WORKERS"
+
+HookTask = Callable[[], HookResult]
+
+
+@dataclass(frozen=True)
+class HookTiming:
+    """Wall-clock and thread CPU time of one hook run, in milliseconds.
+
+    ``cache`` is ``"hit"``/``"miss"`` for result-cached hooks, else ``"off"``.
+    """
+
+    wall_ms: float
+    cpu_ms: float
+    cache: str = "off"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "wall_ms": round(self.wall_ms, 2),
+            "cpu_ms": round(self.cpu_ms, 2),
+            "cache": self.cache,
+        }
+
+
+def resolve_hook_workers(max_workers: int | None = None) -> int:
+    """Explicit value, else ``MEDPAPER_HOOK_WORKERS``, else the default (min 1)."""
+    if max_workers is None:
+        try:
+            max_workers = int(os.environ.get(HOOK_WORKERS_ENV, DEFAULT_HOOK_WORKERS))
+        except ValueError:
+            max_workers = DEFAULT_HOOK_WORKERS
+    return max(1, max_workers)
+
+
+def _timed(task: HookTask) -> tuple[HookResult, HookTiming]:
+    consume_cache_outcome()
+    wall_start, cpu_start = time.perf_counter(), time.thread_time()
+    result = task()
+    wall_ms = (time.perf_counter() - wall_start) * 1000
+    cpu_ms = (time.thread_time() - cpu_start) * 1000
+    return result, HookTiming(wall_ms, cpu_ms, consume_cache_outcome())
+
+
+class HookRunnerMixin:
+    """Runs a batch of independent hooks with a concurrency limit."""
+
+    hook_workers: int = DEFAULT_HOOK_WORKERS
+    last_hook_timings: Mapping[str, HookTiming] = MappingProxyType({})
+
+    def _run_hook_batch(self, tasks: Mapping[str, HookTask]) -> dict[str, HookResult]:
+        """Run ``tasks`` and return their results in ``tasks`` order."""
+        if not tasks:
+            return {}
+        workers = min(self.hook_workers, len(tasks))
+        # HookCacheMixin: project-state fingerprints are taken once per batch
+        with getattr(self, "_cache_state_scope", nullcontext)():
+            if workers <= 1:
+                outcomes = {hook_id: _timed(task) for hook_id, task in tasks.items()}
+            else:
+                with ThreadPoolExecutor(workers, thread_name_prefix="writing-hook") as pool:
+                    futures = {hook_id: pool.submit(_timed, t) for hook_id, t in tasks.items()}
+                    outcomes = {hook_id: future.result() for hook_id, future in futures.items()}
+
+        self.last_hook_timings = MappingProxyType(
+            {hook_id: timing for hook_id, (_, timing) in outcomes.items()}
+        )
+        slowest = max(self.last_hook_timings.items(), key=lambda item: item[1].wall_ms)
+        logger.debug(
+            "writing_hooks.batch_complete",
+            hooks=len(tasks),
+            workers=workers,
+            slowest=slowest[0],
+            slowest_wall_ms=round(slowest[1].wall_ms, 2),
+        )
+        return {hook_id: result for hook_id, (result, _) in outcomes.items()}
+
+    def hook_timings(self) -> dict[str, dict[str, Any]]:
+        """Per-hook ``{wall_ms, cpu_ms, cache}`` of the most recent batch."""
+        return {hook_id: timing.to_dict() for hook_id, timing in self.last_hook_timings.items()}
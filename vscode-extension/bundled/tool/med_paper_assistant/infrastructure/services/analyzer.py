@@ -1,17 +1,79 @@
 import os
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
-import pandas as pd
 import structlog
 
 from med_paper_assistant.shared.path_guard import normalize_relative_filename, resolve_child_path
 
+from .batch_tests import run_batch_tests
+from .dataset_cache import CACHE_DIR as DATASET_CACHE_DIR
+from .dataset_cache import get_dataset_cache
+from .streaming_stats import stream_describe, stream_table_one
+from .streaming_tests import stream_statistical_test
+from .table_one import build_table_one, format_pvalue, markdown_table
+
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = structlog.get_logger()
 
 DATA_SUFFIXES = {".csv", ".tsv", ".txt"}
 FIGURE_SUFFIXES = {".png"}
-TABLE_SUFFIXES = {".md"}
+TABLE_SUFFIXES = {".md", ".csv", ".docx"}
+
+
+def resolve_data_file(data_dir: str, filename: str) -> tuple[Path, str]:
+    """Validated path of a data file under ``data_dir`` and its column separator."""
+    safe_filename = normalize_relative_filename(
+        filename,
+        field_name="Data filename",
+        allowed_suffixes=DATA_SUFFIXES,
+    )
+    filepath = resolve_child_path(data_dir, safe_filename, field_name="Data filename")
+    if not os.path.exists(filepath):
+        raise FileNotFoundError(f"Data file {safe_filename} not found in {data_dir}")
+    return Path(filepath), "\t" if Path(safe_filename).suffix.lower() == ".tsv" else ","
+
+
+def _normalize_test_type(test_type: str) -> str:
+    """Lower-case, underscore form with the "t_test" / "chi_square" spellings folded."""
+    test_type = test_type.lower().replace("-", "_").replace(" ", "_")
+    return {"t_test": "ttest", "chi_square": "chi2"}.get(test_type, test_type)
+
+
+def _batch_report(
+    df: "pd.DataFrame",
+    test_type: str,
+    variables: List[str],
+    group_var: Optional[str],
+    correction: str,
+) -> str:
+    """Markdown table of one ``run_batch_tests`` run (``test_type`` "batch*")."""
+    if not group_var:
+        return "Error: batch tests require a grouping variable (group_var)."
+    nonparametric = test_type == "batch_nonparametric"
+    return run_batch_tests(df, variables, group_var, correction, nonparametric).to_markdown()
+
+
+def _table_output_path(tables_dir: str, output_name: str) -> str:
+    """Validated output path under ``tables_dir``; its parent directory is created."""
+    output_name = normalize_relative_filename(
+        output_name,
+        field_name="Table output filename",
+        default_suffix=".md",
+        allowed_suffixes=TABLE_SUFFIXES,
+    )
+    output_path = str(
+        resolve_child_path(
+            tables_dir,
+            output_name,
+            field_name="Table output filename",
+            allowed_suffixes=TABLE_SUFFIXES,
+        )
+    )
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    return output_path
 
 
 class Analyzer:
@@ -33,28 +95,21 @@ class Analyzer:
     def scoped_to_project(self, project_dir: str | Path) -> "Analyzer":
         """Return an isolated analyzer bound to one validated project directory."""
         root = Path(project_dir)
-        return Analyzer(
-            data_dir=str(root / "data"),
-            results_dir=str(root / "results"),
-        )
-
-    def load_data(self, filename: str) -> pd.DataFrame:
-        """Load data from a CSV file."""
-        safe_filename = normalize_relative_filename(
-            filename,
-            field_name="Data filename",
-            allowed_suffixes=DATA_SUFFIXES,
-        )
-        filepath = str(resolve_child_path(self.data_dir, safe_filename, field_name="Data filename"))
-        if not os.path.exists(filepath):
-            raise FileNotFoundError(f"Data file {safe_filename} not found in {self.data_dir}")
-        sep = "\t" if Path(safe_filename).suffix.lower() == ".tsv" else ","
-        return pd.read_csv(filepath, sep=sep)
-
-    def describe_data(self, filename: str) -> str:
-        """Return descriptive statistics for the dataset."""
-        df = self.load_data(filename)
-        desc = df.describe().to_markdown()
+        return Analyzer(data_dir=str(root / "data"), results_dir=str(root / "results"))
+
+    def load_data(self, filename: str) -> "pd.DataFrame":
+        """Load data from a CSV/TSV file (parsed once per content version, see ``dataset_cache``)."""
+        path, sep = resolve_data_file(self.data_dir, filename)
+        cache_dir = Path(self.data_dir) / DATASET_CACHE_DIR
+        return get_dataset_cache().load(path, sep=sep, cache_dir=cache_dir)
+
+    def describe_data(self, filename: str, streaming: bool = False) -> str:
+        """Return descriptive statistics for the dataset (no quartiles when ``streaming``)."""
+        if streaming:
+            path, sep = resolve_data_file(self.data_dir, filename)
+            desc = stream_describe(path, sep=sep).to_markdown()
+        else:
+            desc = self.load_data(filename).describe().to_markdown()
         return f"### Data Description for {filename}\n\n{desc}"
 
     def run_statistical_test(
@@ -65,41 +120,43 @@ class Analyzer:
         col2: Optional[str] = None,
         variables: Optional[List[str]] = None,
         group_var: Optional[str] = None,
+        streaming: bool = False,
+        correction: str = "fdr_bh",
     ) -> str:
         """
         Run a statistical test.
 
         Args:
             filename: Data file.
-            test_type: "t-test", "ttest", "paired_ttest", "chi-square", "chi2",
-                       "correlation", "anova", "mann_whitney", "kruskal".
+            test_type: "t-test", "ttest", "paired_ttest", "chi-square", "chi2", "correlation",
+                       "anova", "mann_whitney", "kruskal", "batch", "batch_nonparametric".
             col1: First column name (legacy).
             col2: Second column name (legacy).
             variables: List of variable names (new API).
             group_var: Grouping variable (new API).
+            streaming: Compute from chunked reads (``streaming_stats``); rank tests unsupported.
+            correction: "batch" p-value adjustment: "fdr_bh", "bonferroni" or "none".
 
         Returns:
             Formatted result string.
         """
-        df = self.load_data(filename)
-
         # Handle legacy API (col1, col2)
         if variables is None and col1 is not None:
-            variables = [col1]
-            if col2:
-                group_var = col2
+            variables, group_var = [col1], col2 or group_var
 
         if not variables:
             return "Error: No variables specified."
 
+        test_type = _normalize_test_type(test_type)
+        if streaming:
+            path, sep = resolve_data_file(self.data_dir, filename)
+            return stream_statistical_test(path, test_type, variables, group_var, sep=sep)
+
         from scipy import stats
 
-        # Normalize test type
-        test_type = test_type.lower().replace("-", "_").replace(" ", "_")
-        if test_type == "t_test":
-            test_type = "ttest"
-        if test_type == "chi_square":
-            test_type = "chi2"
+        df = self.load_data(filename)
+        if test_type in ("batch", "batch_nonparametric"):
+            return _batch_report(df, test_type, variables, group_var, correction)
 
         if test_type == "ttest":
             # Independent t-test: compare variable between groups
@@ -111,8 +168,7 @@ class Analyzer:
             if len(groups) != 2:
                 return f"Error: t-test requires exactly 2 groups in {group_var}, found {len(groups)}: {list(groups)}"
 
-            group1 = df[df[group_var] == groups[0]][var].dropna()
-            group2 = df[df[group_var] == groups[1]][var].dropna()
+            group1, group2 = (df.loc[df[group_var] == g, var].dropna() for g in groups)
 
             t_stat, p_val = stats.ttest_ind(group1, group2)
             return f"### T-Test Results\n\nComparing {var} by {group_var} ({groups[0]} vs {groups[1]})\n- T-statistic: {t_stat:.4f}\n- P-value: {p_val:.4f}\n- Significant: {'Yes' if p_val < 0.05 else 'No'}"
@@ -128,9 +184,7 @@ class Analyzer:
             if not group_var:
                 return "Error: ANOVA requires a grouping variable (group_var)."
             var = variables[0]
-            groups_data = [
-                df[df[group_var] == g][var].dropna() for g in df[group_var].dropna().unique()
-            ]
+            groups_data = [g.dropna() for _, g in df.groupby(group_var, sort=False)[var]]
             f_stat, p_val = stats.f_oneway(*groups_data)
             return f"### ANOVA Results\n\nComparing {var} across groups in {group_var}\n- F-statistic: {f_stat:.4f}\n- P-value: {p_val:.4f}\n- Significant: {'Yes' if p_val < 0.05 else 'No'}"
 
@@ -138,7 +192,7 @@ class Analyzer:
             if len(variables) < 2:
                 return "Error: chi-square test requires two categorical variables."
             var1, var2 = variables[0], variables[1]
-            contingency = pd.crosstab(df[var1], df[var2])
+            contingency = df.groupby([var1, var2]).size().unstack(fill_value=0)
             chi2, p_val, dof, expected = stats.chi2_contingency(contingency)
             return f"### Chi-Square Test Results\n\nAssociation between {var1} and {var2}\n- Chi-square: {chi2:.4f}\n- P-value: {p_val:.4f}\n- Degrees of freedom: {dof}\n- Significant: {'Yes' if p_val < 0.05 else 'No'}"
 
@@ -156,8 +210,7 @@ class Analyzer:
             groups = df[group_var].dropna().unique()
             if len(groups) != 2:
                 return f"Error: Mann-Whitney requires exactly 2 groups, found {len(groups)}"
-            group1 = df[df[group_var] == groups[0]][var].dropna()
-            group2 = df[df[group_var] == groups[1]][var].dropna()
+            group1, group2 = (df.loc[df[group_var] == g, var].dropna() for g in groups)
             u_stat, p_val = stats.mannwhitneyu(group1, group2)
             return f"### Mann-Whitney U Test Results\n\nComparing {var} by {group_var}\n- U-statistic: {u_stat:.4f}\n- P-value: {p_val:.4f}\n- Significant: {'Yes' if p_val < 0.05 else 'No'}"
 
@@ -165,9 +218,7 @@ class Analyzer:
             if not group_var:
                 return "Error: Kruskal-Wallis test requires a grouping variable."
             var = variables[0]
-            groups_data = [
-                df[df[group_var] == g][var].dropna() for g in df[group_var].dropna().unique()
-            ]
+            groups_data = [g.dropna() for _, g in df.groupby(group_var, sort=False)[var]]
             h_stat, p_val = stats.kruskal(*groups_data)
             return f"### Kruskal-Wallis Test Results\n\nComparing {var} across groups in {group_var}\n- H-statistic: {h_stat:.4f}\n- P-value: {p_val:.4f}\n- Significant: {'Yes' if p_val < 0.05 else 'No'}"
 
@@ -260,7 +311,6 @@ class Analyzer:
             allowed_suffixes=FIGURE_SUFFIXES,
         )
 
-        # Ensure directory exists
         os.makedirs(self.figures_dir, exist_ok=True)
 
         output_path = str(
@@ -283,6 +333,8 @@ class Analyzer:
         continuous_cols: List[str],
         categorical_cols: List[str],
         output_name: Optional[str] = None,
+        nonnormal_cols: Optional[List[str]] = None,
+        streaming: bool = False,
     ) -> str:
         """
         Generate Table 1 (baseline characteristics) for medical papers.
@@ -295,171 +347,36 @@ class Analyzer:
             group_col: Column name for grouping (e.g., "treatment", "group").
             continuous_cols: List of continuous variable column names (e.g., ["age", "weight"]).
             categorical_cols: List of categorical variable column names (e.g., ["sex", "diabetes"]).
-            output_name: Output filename for the table (optional).
+            output_name: Output filename for the table (optional); the suffix
+                selects the format: .md (default), .csv or .docx.
+            nonnormal_cols: Continuous columns to report as median [Q1, Q3]
+                with rank-based tests (optional; not with ``streaming``).
+            streaming: Compute from chunked reads instead of loading the file.
 
         Returns:
             Markdown formatted Table 1.
         """
-        df = self.load_data(filename)
-
-        from scipy import stats
-
-        # Get groups
-        groups = df[group_col].unique()
-        n_groups = len(groups)
-
-        # Initialize results list
-        rows = []
-
-        # Header row
-        header = ["Variable", "Overall (N={})".format(len(df))]
-        for group in groups:
-            n = len(df[df[group_col] == group])
-            header.append(f"{group} (N={n})")
-        header.append("P-value")
-
-        # Process continuous variables
-        for col in continuous_cols:
-            if col not in df.columns:
-                continue
-
-            # Overall stats
-            overall_mean = df[col].mean()
-            overall_std = df[col].std()
-            overall_str = f"{overall_mean:.1f} ± {overall_std:.1f}"
-
-            row = [col, overall_str]
-
-            # Group stats
-            group_data = []
-            for group in groups:
-                group_vals = df[df[group_col] == group][col].dropna()
-                mean_val = group_vals.mean()
-                std_val = group_vals.std()
-                row.append(f"{mean_val:.1f} ± {std_val:.1f}")
-                group_data.append(group_vals)
-
-            # P-value (t-test for 2 groups, ANOVA for >2 groups)
-            if n_groups == 2:
-                try:
-                    _, p_val = stats.ttest_ind(group_data[0], group_data[1])
-                    row.append(self._format_pvalue(p_val))
-                except Exception:
-                    logger.debug("t-test failed for %s", col, exc_info=True)
-                    row.append("N/A")
-            elif n_groups > 2:
-                try:
-                    _, p_val = stats.f_oneway(*group_data)
-                    row.append(self._format_pvalue(p_val))
-                except Exception:
-                    logger.debug("ANOVA failed for %s", col, exc_info=True)
-                    row.append("N/A")
-            else:
-                row.append("-")
-
-            rows.append(row)
-
-        # Process categorical variables
-        for col in categorical_cols:
-            if col not in df.columns:
-                continue
-
-            categories = df[col].dropna().unique()
-
-            for cat in categories:
-                # Overall count
-                overall_count = (df[col] == cat).sum()
-                overall_pct = overall_count / len(df) * 100
-                overall_str = f"{overall_count} ({overall_pct:.1f}%)"
-
-                row = [f"{col}: {cat}", overall_str]
-
-                # Group counts for chi-square
-                contingency_data = []
-                for group in groups:
-                    group_df = df[df[group_col] == group]
-                    count = (group_df[col] == cat).sum()
-                    pct = count / len(group_df) * 100 if len(group_df) > 0 else 0
-                    row.append(f"{count} ({pct:.1f}%)")
-                    contingency_data.append(count)
-
-                # P-value only for first category of each variable
-                if cat == categories[0]:
-                    try:
-                        # Create contingency table
-                        contingency = pd.crosstab(df[group_col], df[col])
-                        chi2, p_val, _, _ = stats.chi2_contingency(contingency)
-                        row.append(self._format_pvalue(p_val))
-                    except Exception:
-                        logger.debug("Chi-square test failed for %s", col, exc_info=True)
-                        row.append("N/A")
-                else:
-                    row.append("")
-
-                rows.append(row)
-
-        # Create markdown table
-        markdown = self._create_markdown_table(header, rows)
-
-        # Add title and footnote
-        table_output = "## Table 1. Baseline Characteristics\n\n"
-        table_output += markdown
-        table_output += "\n\n*Values are presented as mean ± SD for continuous variables and n (%) for categorical variables.*\n"
-        table_output += "*P-values: Student's t-test or ANOVA for continuous variables; Chi-square test for categorical variables.*\n"
-
-        # Save to file if output_name specified
-        if output_name:
-            output_name = normalize_relative_filename(
-                output_name,
-                field_name="Table output filename",
-                default_suffix=".md",
-                allowed_suffixes=TABLE_SUFFIXES,
-            )
-            output_path = str(
-                resolve_child_path(
-                    self.tables_dir,
-                    output_name,
-                    field_name="Table output filename",
-                    allowed_suffixes=TABLE_SUFFIXES,
-                )
+        if streaming and nonnormal_cols:
+            raise ValueError("median [Q1, Q3] needs all values and is not available when streaming")
+        if streaming:
+            path, sep = resolve_data_file(self.data_dir, filename)
+            table = stream_table_one(path, group_col, continuous_cols, categorical_cols, sep=sep)
+        else:
+            df = self.load_data(filename)
+            table = build_table_one(
+                df, group_col, continuous_cols, categorical_cols, nonnormal_cols or ()
             )
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(table_output)
+        table_output = table.to_markdown()
+        if output_name:
+            output_path = _table_output_path(self.tables_dir, output_name)
+            table.save(output_path)
             return f"Table 1 saved to: {output_path}\n\n{table_output}"
-
         return table_output
 
     def _format_pvalue(self, p: float) -> str:
         """Format p-value according to medical conventions."""
-        if p < 0.001:
-            return "<0.001"
-        elif p < 0.01:
-            return f"{p:.3f}"
-        elif p < 0.05:
-            return f"{p:.3f}*"
-        else:
-            return f"{p:.3f}"
+        return format_pvalue(p)
 
     def _create_markdown_table(self, header: List[str], rows: List[List[str]]) -> str:
         """Create a markdown table from header and rows."""
-        # Calculate column widths
-        all_rows = [header] + rows
-        col_widths = [max(len(str(row[i])) for row in all_rows) for i in range(len(header))]
-
-        # Create header
-        header_str = "| " + " | ".join(str(h).ljust(w) for h, w in zip(header, col_widths)) + " |"
-        separator = "|-" + "-|-".join("-" * w for w in col_widths) + "-|"
-
-        # Create rows
-        row_strs = []
-        for row in rows:
-            # Ensure row has correct number of columns
-            while len(row) < len(header):
-                row.append("")
-            row_str = (
-                "| " + " | ".join(str(cell).ljust(w) for cell, w in zip(row, col_widths)) + " |"
-            )
-            row_strs.append(row_str)
-
-        return header_str + "\n" + separator + "\n" + "\n".join(row_strs)
+        return markdown_table(header, rows)
@@ -0,0 +1,217 @@
+"""
+Batch Tests — Screen many variables against one grouping variable.
+
+``run_batch_tests`` replaces one ``run_statistical_test`` call per variable
+with a single pass over the loaded frame:
+
+- the group column is factorized once;
+- continuous variables (numeric with more than ``CATEGORICAL_MAX_LEVELS``
+  distinct values) are summarized by one ``groupby().agg`` and tested with
+  Student's t (2 groups) or one-way ANOVA from those summaries, or with
+  Mann-Whitney U / Kruskal-Wallis when ``nonparametric`` is set;
+- categorical variables get a chi-square test on a ``bincount`` contingency
+  table.
+
+P-values are then adjusted for the number of variables tested, with
+Benjamini-Hochberg FDR (``fdr_bh``, default), ``bonferroni`` or ``none``.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from .table_one import contingency, markdown_table, parametric_tests
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+logger = structlog.get_logger()
+
+CORRECTIONS = ("fdr_bh", "bonferroni", "none")
+# Numeric variables with at most this many levels are tested as categorical,
+# the same cut-off detect_variable_types uses.
+CATEGORICAL_MAX_LEVELS = 10
+ALPHA = 0.05
+
+
+@dataclass
+class BatchTestRow:
+    variable: str
+    test: str
+    statistic: float
+    p_value: float
+    adjusted_p: float = math.nan
+    note: str = ""
+
+
+@dataclass
+class BatchTestResult:
+    group_var: str
+    correction: str
+    rows: list[BatchTestRow] = field(default_factory=list)
+
+    @property
+    def significant(self) -> list[str]:
+        return [row.variable for row in self.rows if row.adjusted_p < ALPHA]
+
+    def to_markdown(self) -> str:
+        label = {"fdr_bh": "FDR (BH)", "bonferroni": "Bonferroni", "none": "Unadjusted"}
+        header = ["Variable", "Test", "Statistic", "P-value", f"{label[self.correction]} P"]
+        header.append("Significant")
+        table = [
+            [
+                row.variable,
+                row.test,
+                _number(row.statistic),
+                _pvalue(row.p_value),
+                _pvalue(row.adjusted_p),
+                row.note or ("Yes" if row.adjusted_p < ALPHA else "No"),
+            ]
+            for row in self.rows
+        ]
+        tested = sum(not math.isnan(row.p_value) for row in self.rows)
+        return (
+            f"### Batch Test Results\n\nComparing {len(self.rows)} variables by "
+            f"{self.group_var}\n\n{markdown_table(header, table)}\n\n"
+            f"*{len(self.significant)} of {tested} tests significant at adjusted "
+            f"p < {ALPHA}.*\n"
+        )
+
+
+def adjust_pvalues(p_values: Sequence[float], correction: str = "fdr_bh") -> list[float]:
+    """Adjust p-values for multiple comparisons; NaN entries are not counted."""
+    import numpy as np
+
+    _check_correction(correction)
+    p = np.asarray(p_values, dtype=float)
+    adjusted = p.copy()
+    valid = ~np.isnan(p)
+    m = int(valid.sum())
+    if correction == "bonferroni":
+        adjusted[valid] = np.minimum(1.0, p[valid] * m)
+    elif correction == "fdr_bh" and m:
+        order = np.argsort(p[valid])
+        scaled = p[valid][order] * m / np.arange(1, m + 1)
+        stepped = np.minimum(1.0, np.minimum.accumulate(scaled[::-1])[::-1])
+        ranked = np.empty(m)
+        ranked[order] = stepped
+        adjusted[valid] = ranked
+    return [float(v) for v in adjusted]
+
+
+def run_batch_tests(
+    df: pd.DataFrame,
+    variables: Sequence[str],
+    group_var: str,
+    correction: str = "fdr_bh",
+    nonparametric: bool = False,
+) -> BatchTestResult:
+    """Test every variable against ``group_var`` and adjust the p-values together."""
+    import pandas as pd
+
+    _check_correction(correction)
+    missing = [v for v in [group_var, *variables] if v not in df.columns]
+    if missing:
+        raise KeyError(missing[0])
+    names = [v for v in dict.fromkeys(variables) if v != group_var]
+    group_codes, groups = pd.factorize(df[group_var])
+    continuous = [v for v in names if _is_continuous(df[v])]
+
+    rows: dict[str, BatchTestRow] = {}
+    if len(groups) < 2:
+        note = f"needs ≥2 groups in {group_var}"
+        rows = {v: BatchTestRow(v, "-", math.nan, math.nan, note=note) for v in names}
+    else:
+        if continuous and nonparametric:
+            rows.update(_rank_rows(df, continuous, group_codes, len(groups)))
+        elif continuous:
+            rows.update(_parametric_rows(df, continuous, group_var, list(groups)))
+        for var in names:
+            if var not in rows:
+                rows[var] = _chi2_row(df[var], group_codes, len(groups))
+
+    result = BatchTestResult(group_var, correction, [rows[v] for v in names])
+    for row, adjusted in zip(
+        result.rows, adjust_pvalues([row.p_value for row in result.rows], correction)
+    ):
+        row.adjusted_p = adjusted
+    logger.info("batch_tests.completed", variables=len(names), groups=len(groups))
+    return result
+
+
+def _is_continuous(values: pd.Series) -> bool:
+    import pandas as pd
+
+    return (
+        pd.api.types.is_numeric_dtype(values)
+        and not pd.api.types.is_bool_dtype(values)
+        and values.nunique() > CATEGORICAL_MAX_LEVELS
+    )
+
+
+def _parametric_rows(
+    df: pd.DataFrame, cols: list[str], group_var: str, groups: list[Any]
+) -> dict[str, BatchTestRow]:
+    summary = df.groupby(group_var, sort=False)[cols].agg(["count", "mean", "std"])
+    summary = summary.reindex(groups)
+    n, means, sds = (
+        summary.xs(stat, axis=1, level=1)[cols].to_numpy(dtype=float)
+        for stat in ("count", "mean", "std")
+    )
+    statistics, p_values = parametric_tests(n, means, sds)
+    test = "t-test" if len(groups) == 2 else "ANOVA"
+    return {col: BatchTestRow(col, test, statistics[j], p_values[j]) for j, col in enumerate(cols)}
+
+
+def _rank_rows(
+    df: pd.DataFrame, cols: list[str], group_codes: np.ndarray, n_groups: int
+) -> dict[str, BatchTestRow]:
+    import numpy as np
+    from scipy import stats
+
+    test = "Mann-Whitney U" if n_groups == 2 else "Kruskal-Wallis"
+    rows = {}
+    for col in cols:
+        values = df[col].to_numpy(dtype=float)
+        samples = [values[(group_codes == g) & ~np.isnan(values)] for g in range(n_groups)]
+        try:
+            if n_groups == 2:
+                outcome = stats.mannwhitneyu(*samples)
+            else:
+                outcome = stats.kruskal(*samples)
+            rows[col] = BatchTestRow(col, test, float(outcome.statistic), float(outcome.pvalue))
+        except ValueError as e:
+            rows[col] = BatchTestRow(col, test, math.nan, math.nan, note=str(e))
+    return rows
+
+
+def _chi2_row(values: pd.Series, group_codes: np.ndarray, n_groups: int) -> BatchTestRow:
+    from scipy import stats
+
+    _, _, counts = contingency(values, group_codes, n_groups)
+    observed = counts[:, counts.sum(axis=0) > 0]
+    observed = observed[observed.sum(axis=1) > 0]
+    try:
+        chi2, p_val, _, _ = stats.chi2_contingency(observed)
+    except ValueError as e:
+        return BatchTestRow(str(values.name), "Chi-square", math.nan, math.nan, note=str(e))
+    return BatchTestRow(str(values.name), "Chi-square", float(chi2), float(p_val))
+
+
+def _number(value: float) -> str:
+    return "N/A" if math.isnan(value) else f"{value:.4f}"
+
+
+def _pvalue(value: float) -> str:
+    return "<0.0001" if value < 0.0001 else _number(value)
+
+
+def _check_correction(correction: str) -> None:
+    if correction not in CORRECTIONS:
+        raise ValueError(f"Unknown correction '{correction}'. Use one of: {', '.join(CORRECTIONS)}")
@@ -0,0 +1,249 @@
+"""
+Dataset Cache — Parse each data file once per content version.
+
+Every analysis tool call used to re-parse its CSV/TSV with ``pd.read_csv``;
+an agent exploring one dataset makes dozens of such calls.
+``Analyzer.load_data`` now goes through ``DatasetCache``, which keeps parsed frames at two levels, both keyed by the SHA-256 of the
+source file (plus the separator):
+
+- an in-memory LRU shared by every ``Analyzer`` in the process, bounded by
+  ``MEDPAPER_DATASET_CACHE_MB`` (default 512; ``0`` disables it);
+- a columnar copy in ``<data_dir>/.cache/datasets/<digest>-<variant>.parquet`` when
+  ``pyarrow`` is installed, read back memory-mapped, so a new server process
+  does not re-parse either. Set ``MEDPAPER_DATASET_DISK_CACHE=0`` to turn it
+  off.
+
+Parsed frames get inferred dtypes before caching: text columns whose values
+repeat (at most half of the rows are distinct) become ``category``.
+Source digests are remembered as ``file_freshness.FileVersion`` entries in
+``.cache/datasets/manifest.json``, so an unchanged file is not re-hashed; a
+stat match recorded inside the racy window is confirmed by hash first.
+Editing the file changes its digest, and the columnar copy of the previous
+version is deleted. Cache failures are logged and fall back to parsing the
+source.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from med_paper_assistant.infrastructure.persistence.file_freshness import (
+    FileVersion,
+    revalidate,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = structlog.get_logger()
+
+CACHE_DIR = Path(".cache") / "datasets"
+MANIFEST_FILE = "manifest.json"
+DEFAULT_MEMORY_BUDGET_MB = 512.0
+MEMORY_BUDGET_ENV = "MEDPAPER_DATASET_CACHE_MB"
+DISK_CACHE_ENV = "MEDPAPER_DATASET_DISK_CACHE"
+# Text columns with at most this share of distinct values become categoricals.
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+# Bump when parsing or dtype inference changes, so old cache files are ignored.
+_FORMAT_VERSION = 1
+
+
+def resolve_memory_budget_bytes() -> int:
+    """``MEDPAPER_DATASET_CACHE_MB`` in bytes (0 = no in-memory cache), else the default."""
+    try:
+        budget_mb = float(os.environ.get(MEMORY_BUDGET_ENV, DEFAULT_MEMORY_BUDGET_MB))
+    except ValueError:
+        budget_mb = DEFAULT_MEMORY_BUDGET_MB
+    return int(max(0.0, budget_mb) * 1024 * 1024)
+
+
+def disk_cache_enabled() -> bool:
+    """Whether columnar copies are written: ``pyarrow`` importable and not disabled."""
+    if os.environ.get(DISK_CACHE_ENV, "1").strip().lower() in {"0", "false", "no", "off"}:
+        return False
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def infer_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert repetitive text columns to ``category``; other columns are unchanged."""
+    import pandas as pd
+
+    limit = max(1, int(len(df) * CATEGORY_MAX_UNIQUE_RATIO))
+    converted = {
+        col: df[col].astype("category")
+        for col in df.columns
+        if (pd.api.types.is_object_dtype(df[col]) or pd.api.types.is_string_dtype(df[col]))
+        and df[col].nunique() <= limit
+    }
+    return df.assign(**converted) if converted else df
+
+
+class DatasetCache:
+    """
+    Two-level cache of parsed data files (process memory, then Parquet).
+
+    Usage:
+        cache = DatasetCache()
+        df = cache.load(Path("data/cohort.csv"), sep=",", cache_dir=Path("data/.cache/datasets"))
+    """
+
+    def __init__(self, memory_budget_bytes: int | None = None) -> None:
+        self.budget = (
+            resolve_memory_budget_bytes() if memory_budget_bytes is None else memory_budget_bytes
+        )
+        self._frames: OrderedDict[tuple[str, str], tuple[pd.DataFrame, int]] = OrderedDict()
+        self._used = 0
+        self._versions: dict[str, FileVersion] = {}
+        self._lock = threading.RLock()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "parses": 0, "evictions": 0}
+
+    def load(self, path: Path, sep: str = ",", cache_dir: Path | None = None) -> pd.DataFrame:
+        """Parsed frame for ``path``; callers get a shallow copy of the cached frame."""
+        import pandas as pd
+
+        digest = self.digest(path, cache_dir)
+        key = (digest, sep)
+        with self._lock:
+            entry = self._frames.get(key)
+            if entry is not None:
+                self._frames.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return entry[0].copy(deep=False)
+
+        columnar = self._columnar_path(cache_dir, digest, sep)
+        df = self._read_columnar(columnar) if columnar else None
+        if df is None:
+            df = infer_dtypes(pd.read_csv(path, sep=sep))
+            self.stats["parses"] += 1
+            if columnar:
+                self._write_columnar(df, columnar)
+        else:
+            self.stats["disk_hits"] += 1
+        self._remember(key, df)
+        return df.copy(deep=False)
+
+    def digest(self, path: Path, cache_dir: Path | None = None) -> str:
+        """Content digest, reused while the file's stat is unchanged and settled."""
+        st = path.stat()
+        name = str(path.resolve())
+        with self._lock:
+            previous = self._versions.get(name)
+        if previous is None and cache_dir is not None:
+            previous = self._manifest_version(cache_dir, name)
+        version, raw = revalidate(path, st, previous)
+        if version is not previous and cache_dir is not None:
+            self._write_manifest(cache_dir, name, version)
+            if raw is not None and previous is not None:
+                # The source changed: its previous columnar copies are dead.
+                for stale in cache_dir.glob(f"{previous.sha256}-*.parquet"):
+                    stale.unlink(missing_ok=True)
+        with self._lock:
+            self._versions[name] = version
+        return version.sha256
+
+    def clear(self) -> None:
+        """Drop every in-memory frame and remembered digest (disk copies stay)."""
+        with self._lock:
+            self._frames.clear()
+            self._versions.clear()
+            self._used = 0
+
+    def _remember(self, key: tuple[str, str], df: pd.DataFrame) -> None:
+        size = int(df.memory_usage(deep=True).sum())
+        if size > self.budget:
+            return
+        with self._lock:
+            previous = self._frames.pop(key, None)
+            if previous is not None:
+                self._used -= previous[1]
+            self._frames[key] = (df, size)
+            self._used += size
+            while self._used > self.budget:
+                _, (_, evicted) = self._frames.popitem(last=False)
+                self._used -= evicted
+                self.stats["evictions"] += 1
+
+    @staticmethod
+    def _columnar_path(cache_dir: Path | None, digest: str, sep: str) -> Path | None:
+        if cache_dir is None or not disk_cache_enabled():
+            return None
+        variant = hashlib.sha256(f"{_FORMAT_VERSION}:{sep}".encode()).hexdigest()[:8]
+        return cache_dir / f"{digest}-{variant}.parquet"
+
+    @staticmethod
+    def _read_columnar(path: Path) -> pd.DataFrame | None:
+        if not path.is_file():
+            return None
+        import pandas as pd
+
+        try:
+            return pd.read_parquet(path, engine="pyarrow", memory_map=True)
+        except Exception as e:
+            logger.warning("dataset_cache.read_failed", path=str(path), error=str(e))
+            return None
+
+    @staticmethod
+    def _write_columnar(df: pd.DataFrame, path: Path) -> None:
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(tmp, engine="pyarrow", index=False)
+            os.replace(tmp, path)
+        except Exception as e:
+            tmp.unlink(missing_ok=True)
+            logger.warning("dataset_cache.write_failed", path=str(path), error=str(e))
+
+    @staticmethod
+    def _read_manifest(cache_dir: Path) -> dict[str, Any]:
+        try:
+            data = json.loads((cache_dir / MANIFEST_FILE).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    @classmethod
+    def _manifest_version(cls, cache_dir: Path, name: str) -> FileVersion | None:
+        entry = cls._read_manifest(cache_dir).get(name)
+        try:
+            return FileVersion.from_fields(entry) if isinstance(entry, dict) else None
+        except KeyError:
+            return None
+
+    def _write_manifest(self, cache_dir: Path, name: str, version: FileVersion) -> None:
+        if not disk_cache_enabled():
+            return
+        with self._lock:
+            manifest = self._read_manifest(cache_dir)
+            manifest[name] = version.fields()
+            tmp = cache_dir / f"{MANIFEST_FILE}.{os.getpid()}.tmp"
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                tmp.write_text(json.dumps(manifest, indent=1), encoding="utf-8")
+                os.replace(tmp, cache_dir / MANIFEST_FILE)
+            except OSError as e:
+                logger.warning("dataset_cache.manifest_failed", error=str(e))
+
+
+_cache: DatasetCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_dataset_cache() -> DatasetCache:
+    """Process-wide dataset cache shared by all analyzers."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = DatasetCache()
+        return _cache
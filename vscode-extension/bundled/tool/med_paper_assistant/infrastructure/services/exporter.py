@@ -1,10 +1,13 @@
+from __future__ import annotations
+
 import os
 import re
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import structlog
-from docx import Document
-from docx.shared import Inches
+
+if TYPE_CHECKING:
+    from docx import Document
 
 logger = structlog.get_logger()
 
@@ -150,6 +153,8 @@ class WordExporter:
         if line.startswith("!["):
             match = re.match(r"!\[(.*?)\]\((.*?)\)", line)
             if match:
+                from docx.shared import Inches
+
                 img_path = match.group(2)
                 if os.path.exists(img_path):
                     try:
@@ -166,6 +171,8 @@ class WordExporter:
         if not os.path.exists(draft_path):
             raise FileNotFoundError(f"Draft file not found: {draft_path}")
 
+        from docx import Document
+
         if template_path and os.path.exists(template_path):
             doc = Document(template_path)
             # Parse draft and fill template
@@ -4,119 +4,49 @@ HTTP Client for MCP-to-MCP communication.
 This module provides a client for mdpaper to communicate directly
 with pubmed-search MCP via HTTP API, bypassing the Agent.
 
+Each client keeps one pooled, keep-alive ``httpx.Client`` (and one
+``httpx.AsyncClient`` per event loop) for its lifetime, so consecutive PMID
+lookups reuse connections instead of paying TCP setup per request.
+
 Author: u9401066@gap.kmu.edu.tw
 """
 
-import hashlib
-import json
+import asyncio
 import os
-from copy import deepcopy
-from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import httpx
 import structlog
 
+from med_paper_assistant.infrastructure.services.pubmed_bulk_fetch import (
+    DEFAULT_BATCH_SIZE,
+    VerifiedArticleBatch,
+    afetch_verified_articles,
+    fetch_verified_articles,
+)
+from med_paper_assistant.infrastructure.services.pubmed_verified_payload import (
+    PubMedVerificationError,
+    VerifiedArticlePayload,
+    validate_article_envelope,
+)
+
 logger = structlog.get_logger()
 
 # Default configuration
 DEFAULT_PUBMED_API_URL = "http://127.0.0.1:8765"
+DEFAULT_MAX_CONNECTIONS = 8
+_KEEPALIVE_EXPIRY_SECONDS = 30.0
+_HEALTH_TIMEOUT_SECONDS = 5.0
 
-
-class PubMedVerificationError(ValueError):
-    """Raised when the PubMed HTTP API violates the verified-data contract."""
-
-
-def _canonical_payload_hash(article: Dict[str, Any]) -> str:
-    """Hash strict canonical JSON so the audit anchor is reproducible."""
-    try:
-        canonical_payload = json.dumps(
-            article,
-            allow_nan=False,
-            ensure_ascii=False,
-            sort_keys=True,
-            separators=(",", ":"),
-        ).encode("utf-8")
-    except (TypeError, ValueError) as exc:
-        raise PubMedVerificationError("PubMed transport payload is not canonical JSON.") from exc
-    return hashlib.sha256(canonical_payload).hexdigest()
-
-
-@dataclass(frozen=True)
-class VerifiedArticlePayload:
-    """Article metadata that passed the trusted PubMed transport boundary.
-
-    Callers cannot construct a verified reference by adding a boolean to an
-    arbitrary article dictionary.  Only ``PubMedAPIClient`` creates this
-    payload after validating the response envelope, PMID identity, and source
-    provenance and after computing a canonical payload hash.
-    """
-
-    article: Dict[str, Any]
-    data_source: str
-    retrieved_at: str
-    source_url: str
-    payload_hash: str
-    provenance: tuple[Dict[str, Any], ...]
-
-    def to_reference_dict(self, *, agent_notes: str = "") -> Dict[str, Any]:
-        """Return the canonical persistence payload with layered trust data.
-
-        Integrity is checked again here so a mutated or manually constructed
-        transport object cannot cross the persistence boundary as VERIFIED.
-        """
-        actual_hash = _canonical_payload_hash(self.article)
-        article_pmid = str(self.article.get("pmid") or "").strip()
-        title = self.article.get("title")
-        try:
-            retrieval_time = datetime.fromisoformat(self.retrieved_at)
-            parsed_source_url = httpx.URL(self.source_url)
-            valid_transport_coordinates = bool(
-                retrieval_time.tzinfo is not None
-                and parsed_source_url.scheme in {"http", "https"}
-                and parsed_source_url.host
-            )
-        except (TypeError, ValueError, httpx.InvalidURL):
-            valid_transport_coordinates = False
-        matching_provenance = any(
-            isinstance(entry, dict)
-            and entry.get("event") == "pubmed_mcp_fetch"
-            and entry.get("source") == "pubmed"
-            and entry.get("data_source") == self.data_source
-            and str(entry.get("requested_pmid") or "") == article_pmid
-            and entry.get("source_url") == self.source_url
-            and entry.get("retrieved_at") == self.retrieved_at
-            and entry.get("payload_hash") == self.payload_hash
-            for entry in self.provenance
-        )
-        if (
-            self.data_source != "pubmed_mcp_api"
-            or not article_pmid.isdigit()
-            or not isinstance(title, str)
-            or not title.strip()
-            or actual_hash != self.payload_hash
-            or not valid_transport_coordinates
-            or not matching_provenance
-        ):
-            raise PubMedVerificationError(
-                "PubMed transport attestation is incomplete or no longer matches its payload."
-            )
-
-        payload = deepcopy(self.article)
-        payload.update(
-            {
-                "verified": True,
-                "data_source": self.data_source,
-                "retrieved_at": self.retrieved_at,
-                "source_url": self.source_url,
-                "payload_hash": self.payload_hash,
-                "provenance": [deepcopy(entry) for entry in self.provenance],
-                "agent_notes": agent_notes,
-                "trust_level": "verified",
-            }
-        )
-        return payload
+__all__ = [
+    "DEFAULT_PUBMED_API_URL",
+    "PubMedAPIClient",
+    "PubMedVerificationError",
+    "VerifiedArticleBatch",
+    "VerifiedArticlePayload",
+    "get_pubmed_api_client",
+]
 
 
 def _resolve_base_url(base_url: Optional[str] = None) -> str:
@@ -137,18 +67,80 @@ class PubMedAPIClient:
     - Prevents Agent from modifying/hallucinating bibliographic data
     """
 
-    def __init__(self, base_url: Optional[str] = None, timeout: float = 30.0):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: float = 30.0,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    ):
         """
         Initialize the API client.
 
         Args:
             base_url: pubmed-search API URL (default from env or localhost:8765)
             timeout: Request timeout in seconds
+            max_connections: Pool size; also bounds concurrent bulk fallbacks
         """
         self.base_url = _resolve_base_url(base_url)
         self.timeout = timeout
+        self.max_connections = max(1, int(max_connections))
+        self._limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_connections,
+            keepalive_expiry=_KEEPALIVE_EXPIRY_SECONDS,
+        )
+        self._client: Optional[httpx.Client] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pool_lock = threading.Lock()
         logger.info(f"PubMedAPIClient initialized with URL: {self.base_url}")
 
+    # ── Connection pools ──────────────────────────────────────────
+
+    def _http(self) -> httpx.Client:
+        """Return the shared keep-alive sync client, creating it on first use."""
+        with self._pool_lock:
+            if self._client is None or self._client.is_closed:
+                self._client = httpx.Client(timeout=self.timeout, limits=self._limits)
+            return self._client
+
+    def _async_http(self) -> httpx.AsyncClient:
+        """Return the keep-alive async client bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._pool_lock:
+            # An AsyncClient's connections belong to the loop that opened them.
+            if (
+                self._async_client is None
+                or self._async_client.is_closed
+                or self._async_loop is not loop
+            ):
+                self._async_client = httpx.AsyncClient(timeout=self.timeout, limits=self._limits)
+                self._async_loop = loop
+            return self._async_client
+
+    def close(self) -> None:
+        """Close the sync connection pool (it is reopened lazily if used again)."""
+        with self._pool_lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    async def aclose(self) -> None:
+        """Close both connection pools."""
+        self.close()
+        with self._pool_lock:
+            client, self._async_client, self._async_loop = self._async_client, None, None
+        if client is not None:
+            await client.aclose()
+
+    def __enter__(self) -> "PubMedAPIClient":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    # ── Single article ────────────────────────────────────────────
+
     @staticmethod
     def _validate_article_response(
         envelope: Any,
@@ -157,58 +149,54 @@ class PubMedAPIClient:
         source_url: str,
     ) -> VerifiedArticlePayload:
         """Validate and normalize one verified PubMed response envelope."""
-        if not isinstance(envelope, dict):
-            raise PubMedVerificationError("Malformed PubMed response: expected a JSON object.")
-
-        if envelope.get("verified") is not True:
-            raise PubMedVerificationError("PubMed response is not explicitly verified.")
-
-        # ``source`` is the upstream API's minimum provenance assertion.  The
-        # current pubmed-search auxiliary API does not emit a separate
-        # provenance object, so a missing or non-PubMed source must fail closed.
-        upstream_source = envelope.get("source")
-        if not isinstance(upstream_source, str) or upstream_source.strip().lower() != "pubmed":
-            raise PubMedVerificationError("PubMed response is missing trusted source provenance.")
-
-        article = envelope.get("data")
-        if not isinstance(article, dict):
-            raise PubMedVerificationError(
-                "Malformed PubMed response: 'data' must be a JSON object."
-            )
+        return validate_article_envelope(
+            envelope, requested_pmid=requested_pmid, source_url=source_url
+        )
 
-        response_pmid = str(article.get("pmid") or "").strip()
-        if not response_pmid:
-            raise PubMedVerificationError("Malformed PubMed response: article PMID is missing.")
-        if response_pmid != requested_pmid:
-            raise PubMedVerificationError(
-                f"PubMed identity mismatch: requested PMID {requested_pmid}, "
-                f"received PMID {response_pmid}."
+    def _article_request(
+        self, pmid: str, fetch_if_missing: bool
+    ) -> Tuple[str, str, Dict[str, str]]:
+        requested_pmid = str(pmid).strip()
+        if not requested_pmid.isdigit():
+            raise PubMedVerificationError("PMID must contain digits only.")
+        url = f"{self.base_url}/api/cached_article/{requested_pmid}"
+        return requested_pmid, url, {"fetch_if_missing": str(fetch_if_missing).lower()}
+
+    def _parse_article_response(
+        self, response: httpx.Response, requested_pmid: str
+    ) -> Optional[VerifiedArticlePayload]:
+        if response.status_code == 200:
+            try:
+                envelope = response.json()
+            except (TypeError, ValueError) as exc:
+                raise PubMedVerificationError("Malformed PubMed response: invalid JSON.") from exc
+
+            verified = self._validate_article_response(
+                envelope,
+                requested_pmid=requested_pmid,
+                source_url=str(response.request.url),
             )
-        if not isinstance(article.get("title"), str) or not article["title"].strip():
-            raise PubMedVerificationError("Malformed PubMed response: article title is missing.")
-
-        payload_hash = _canonical_payload_hash(article)
-        retrieved_at = datetime.now(timezone.utc).isoformat()
-        provenance = (
-            {
-                "event": "pubmed_mcp_fetch",
-                "source": upstream_source.strip().lower(),
-                "data_source": "pubmed_mcp_api",
-                "requested_pmid": requested_pmid,
-                "source_url": source_url,
-                "retrieved_at": retrieved_at,
-                "payload_hash": payload_hash,
-            },
-        )
+            logger.info(f"[MCP-to-MCP] Retrieved verified article PMID:{requested_pmid}")
+            return verified
 
-        return VerifiedArticlePayload(
-            article=deepcopy(article),
-            data_source="pubmed_mcp_api",
-            retrieved_at=retrieved_at,
-            source_url=source_url,
-            payload_hash=payload_hash,
-            provenance=provenance,
-        )
+        if response.status_code == 404:
+            logger.warning(f"[MCP-to-MCP] Article not found: PMID:{requested_pmid}")
+        else:
+            logger.error(f"[MCP-to-MCP] HTTP error {response.status_code}: {response.text}")
+        return None
+
+    def _log_fetch_failure(self, pmid: str, exc: Exception) -> None:
+        if isinstance(exc, PubMedVerificationError):
+            logger.warning(
+                "[MCP-to-MCP] Rejected untrusted PubMed response", pmid=pmid, exc_info=exc
+            )
+        elif isinstance(exc, httpx.RequestError):
+            logger.error(
+                f"[MCP-to-MCP] Cannot connect to pubmed-search API at {self.base_url}. "
+                f"Is pubmed-search MCP running?"
+            )
+        else:
+            logger.error(f"[MCP-to-MCP] Error fetching article: {exc}")
 
     def get_cached_article(
         self, pmid: str, fetch_if_missing: bool = True
@@ -229,58 +217,78 @@ class PubMedAPIClient:
             PubMedVerificationError: If a successful response is unverified,
                 malformed, lacks source provenance, or contains another PMID.
         """
-        requested_pmid = str(pmid).strip()
-        if not requested_pmid.isdigit():
-            raise PubMedVerificationError("PMID must contain digits only.")
-
+        requested_pmid, url, params = self._article_request(pmid, fetch_if_missing)
         try:
-            url = f"{self.base_url}/api/cached_article/{requested_pmid}"
-            params = {"fetch_if_missing": str(fetch_if_missing).lower()}
-
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(url, params=params)
-
-                if response.status_code == 200:
-                    try:
-                        envelope = response.json()
-                    except (TypeError, ValueError) as exc:
-                        raise PubMedVerificationError(
-                            "Malformed PubMed response: invalid JSON."
-                        ) from exc
-
-                    verified = self._validate_article_response(
-                        envelope,
-                        requested_pmid=requested_pmid,
-                        source_url=str(response.request.url),
-                    )
-                    logger.info(f"[MCP-to-MCP] Retrieved verified article PMID:{requested_pmid}")
-                    return verified
-
-                elif response.status_code == 404:
-                    logger.warning(f"[MCP-to-MCP] Article not found: PMID:{requested_pmid}")
-                    return None
-
-                else:
-                    logger.error(f"[MCP-to-MCP] HTTP error {response.status_code}: {response.text}")
-                    return None
-
-        except PubMedVerificationError:
-            logger.warning(
-                "[MCP-to-MCP] Rejected untrusted PubMed response",
-                pmid=requested_pmid,
-                exc_info=True,
-            )
+            response = self._http().get(url, params=params)
+            return self._parse_article_response(response, requested_pmid)
+        except PubMedVerificationError as exc:
+            self._log_fetch_failure(requested_pmid, exc)
             raise
-        except httpx.RequestError:
-            logger.error(
-                f"[MCP-to-MCP] Cannot connect to pubmed-search API at {self.base_url}. "
-                f"Is pubmed-search MCP running?"
-            )
+        except Exception as exc:
+            self._log_fetch_failure(requested_pmid, exc)
             return None
-        except Exception as e:
-            logger.error(f"[MCP-to-MCP] Error fetching article: {e}")
+
+    async def aget_cached_article(
+        self, pmid: str, fetch_if_missing: bool = True
+    ) -> Optional[VerifiedArticlePayload]:
+        """Async counterpart of :meth:`get_cached_article` on the pooled async client."""
+        requested_pmid, url, params = self._article_request(pmid, fetch_if_missing)
+        try:
+            response = await self._async_http().get(url, params=params)
+            return self._parse_article_response(response, requested_pmid)
+        except PubMedVerificationError as exc:
+            self._log_fetch_failure(requested_pmid, exc)
+            raise
+        except Exception as exc:
+            self._log_fetch_failure(requested_pmid, exc)
             return None
 
+    # ── Bulk ──────────────────────────────────────────────────────
+
+    def get_verified_articles(
+        self,
+        pmids: Iterable[str],
+        fetch_if_missing: bool = True,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> VerifiedArticleBatch:
+        """
+        Fetch many PMIDs in ``ceil(len / batch_size)`` bulk round trips.
+
+        Every article is validated exactly like :meth:`get_cached_article`.
+        PMIDs the bulk endpoint cannot attest are retried on the single-article
+        endpoint over the same pool, at most ``max_connections`` at a time.
+
+        Returns:
+            VerifiedArticleBatch with ``articles`` (PMID → VerifiedArticlePayload,
+            in request order), ``missing`` PMIDs, and ``rejected`` PMID → reason.
+        """
+        return fetch_verified_articles(
+            self._http(),
+            self.base_url,
+            pmids,
+            fetch_one=lambda pmid: self.get_cached_article(pmid, fetch_if_missing),
+            fetch_if_missing=fetch_if_missing,
+            batch_size=batch_size,
+            max_concurrency=self.max_connections,
+        )
+
+    async def aget_verified_articles(
+        self,
+        pmids: Iterable[str],
+        fetch_if_missing: bool = True,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> VerifiedArticleBatch:
+        """Async counterpart of :meth:`get_verified_articles`."""
+        return await afetch_verified_articles(
+            self._async_http(),
+            self.base_url,
+            pmids,
+            fetch_one=lambda pmid: self.aget_cached_article(pmid, fetch_if_missing),
+            fetch_if_missing=fetch_if_missing,
+            batch_size=batch_size,
+            max_concurrency=self.max_connections,
+        )
+
     def get_multiple_articles(
         self, pmids: List[str], fetch_if_missing: bool = False
     ) -> Dict[str, Dict[str, Any]]:
@@ -292,35 +300,15 @@ class PubMedAPIClient:
             fetch_if_missing: If True, fetch missing articles from NCBI
 
         Returns:
-            Dict mapping PMID to article metadata
+            Dict mapping PMID to article metadata (verified articles only)
         """
-        try:
-            url = f"{self.base_url}/api/cached_articles"
-            params = {"pmids": ",".join(pmids), "fetch_if_missing": str(fetch_if_missing).lower()}
-
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(url, params=params)
+        batch = self.get_verified_articles(pmids, fetch_if_missing=fetch_if_missing)
+        if batch.missing:
+            logger.warning(f"[MCP-to-MCP] Missing articles: {list(batch.missing)}")
+        logger.info(f"[MCP-to-MCP] Retrieved {len(batch.articles)}/{len(pmids)} articles")
+        return {pmid: dict(payload.article) for pmid, payload in batch.articles.items()}
 
-                if response.status_code == 200:
-                    data = response.json()
-                    found = data.get("found", {})
-                    missing = data.get("missing", [])
-
-                    if missing:
-                        logger.warning(f"[MCP-to-MCP] Missing articles: {missing}")
-
-                    logger.info(f"[MCP-to-MCP] Retrieved {len(found)}/{len(pmids)} articles")
-                    return found
-                else:
-                    logger.error(f"[MCP-to-MCP] HTTP error {response.status_code}")
-                    return {}
-
-        except httpx.ConnectError:
-            logger.error("[MCP-to-MCP] Cannot connect to pubmed-search API")
-            return {}
-        except Exception as e:
-            logger.error(f"[MCP-to-MCP] Error: {e}")
-            return {}
+    # ── Service endpoints ─────────────────────────────────────────
 
     def check_health(self) -> bool:
         """
@@ -331,9 +319,8 @@ class PubMedAPIClient:
         """
         try:
             url = f"{self.base_url}/health"
-            with httpx.Client(timeout=5.0) as client:
-                response = client.get(url)
-                return response.status_code == 200
+            response = self._http().get(url, timeout=_HEALTH_TIMEOUT_SECONDS)
+            return response.status_code == 200
         except Exception:
             logger.debug("PubMed API health check failed", exc_info=True)
             return False
@@ -347,11 +334,10 @@ class PubMedAPIClient:
         """
         try:
             url = f"{self.base_url}/api/session/summary"
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(url)
-                if response.status_code == 200:
-                    return response.json()
-                return None
+            response = self._http().get(url)
+            if response.status_code == 200:
+                return response.json()
+            return None
         except Exception:
             logger.debug("Failed to get session summary", exc_info=True)
             return None
@@ -378,6 +364,8 @@ def get_pubmed_api_client(
 
     resolved_base_url = _resolve_base_url(base_url)
     if _client is None or force_new or _client.base_url != resolved_base_url:
+        if _client is not None:
+            _client.close()
         _client = PubMedAPIClient(base_url=resolved_base_url)
 
     return _client
@@ -0,0 +1,219 @@
+"""
+Bulk verified PubMed fetch — many PMIDs in a few pooled round trips.
+
+Requests PMIDs in chunks from pubmed-search's ``/api/cached_articles``
+endpoint and validates every returned article through the same envelope check
+as the single-article endpoint, so bulk results never bypass the verified-data
+contract.
+
+Architecture:
+    Infrastructure layer helpers driven by ``PubMedAPIClient``. The client
+    hands over its pooled ``httpx.Client``/``httpx.AsyncClient`` and its
+    single-article fetch. PMIDs the bulk endpoint cannot attest (endpoint
+    missing, unverified envelope, transport error) fall back to the verified
+    single-article endpoint over the same keep-alive pool with bounded
+    concurrency.
+
+Usage:
+    batch = client.get_verified_articles(["12345678", "23456789"])
+    batch.articles["12345678"].to_reference_dict()
+    batch.missing, batch.rejected
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+import httpx
+import structlog
+
+from med_paper_assistant.infrastructure.services.pubmed_verified_payload import (
+    PubMedVerificationError,
+    VerifiedArticlePayload,
+    validate_article_envelope,
+)
+
+logger = structlog.get_logger()
+
+DEFAULT_BATCH_SIZE = 200
+
+SingleFetch = Callable[[str], Optional[VerifiedArticlePayload]]
+AsyncSingleFetch = Callable[[str], Awaitable[Optional[VerifiedArticlePayload]]]
+
+
+@dataclass(frozen=True)
+class VerifiedArticleBatch:
+    """Outcome of one bulk fetch, keyed by requested PMID."""
+
+    articles: Dict[str, VerifiedArticlePayload]
+    missing: tuple[str, ...]
+    rejected: Dict[str, str]
+    round_trips: int
+
+
+@dataclass
+class _BatchCollector:
+    """Accumulates bulk responses and remembers which PMIDs need a single fetch."""
+
+    base_url: str
+    fetch_if_missing: bool
+    articles: Dict[str, VerifiedArticlePayload] = field(default_factory=dict)
+    missing: List[str] = field(default_factory=list)
+    rejected: Dict[str, str] = field(default_factory=dict)
+    retry: List[str] = field(default_factory=list)
+    round_trips: int = 0
+
+    def request(self, chunk: List[str]) -> tuple[str, Dict[str, str]]:
+        self.round_trips += 1
+        params = {"pmids": ",".join(chunk), "fetch_if_missing": str(self.fetch_if_missing).lower()}
+        return f"{self.base_url}/api/cached_articles", params
+
+    def absorb(self, response: Optional[httpx.Response], chunk: List[str]) -> None:
+        """Validate one bulk response; anything it cannot attest is retried singly."""
+        if response is None or response.status_code != 200:
+            self.retry.extend(chunk)
+            return
+        try:
+            data = response.json()
+        except (TypeError, ValueError):
+            data = None
+        found = data.get("found") if isinstance(data, dict) else None
+        if not isinstance(data, dict) or not isinstance(found, dict):
+            self.retry.extend(chunk)
+            return
+        reported_missing = {str(pmid) for pmid in data.get("missing") or []}
+        for pmid in chunk:
+            value = found.get(pmid)
+            if value is None:
+                (self.missing if pmid in reported_missing else self.retry).append(pmid)
+                continue
+            envelope = (
+                value
+                if isinstance(value, dict) and "data" in value
+                else {"source": data.get("source"), "verified": data.get("verified"), "data": value}
+            )
+            if envelope.get("verified") is not True or not envelope.get("source"):
+                self.retry.append(pmid)
+                continue
+            try:
+                self.articles[pmid] = validate_article_envelope(
+                    envelope, requested_pmid=pmid, source_url=str(response.request.url)
+                )
+            except PubMedVerificationError as exc:
+                self.rejected[pmid] = str(exc)
+
+    def settle(self, pmid: str, outcome: Any) -> None:
+        """Record the result of a single-article fallback fetch."""
+        self.round_trips += 1
+        if isinstance(outcome, VerifiedArticlePayload):
+            self.articles[pmid] = outcome
+        elif isinstance(outcome, PubMedVerificationError):
+            self.rejected[pmid] = str(outcome)
+        elif isinstance(outcome, BaseException):
+            self.rejected[pmid] = f"PubMed fetch failed: {outcome}"
+        else:
+            self.missing.append(pmid)
+
+    def result(self, order: List[str]) -> VerifiedArticleBatch:
+        rank = {pmid: index for index, pmid in enumerate(order)}
+        if self.missing or self.rejected:
+            logger.warning(
+                "pubmed_bulk_fetch.incomplete",
+                missing=len(self.missing),
+                rejected=len(self.rejected),
+            )
+        return VerifiedArticleBatch(
+            articles={pmid: self.articles[pmid] for pmid in order if pmid in self.articles},
+            missing=tuple(sorted(self.missing, key=lambda pmid: rank.get(pmid, 0))),
+            rejected=self.rejected,
+            round_trips=self.round_trips,
+        )
+
+
+def _prepare(pmids: Iterable[Any], collector: _BatchCollector) -> List[str]:
+    order: List[str] = []
+    for raw in pmids:
+        pmid = str(raw).strip()
+        if not pmid.isdigit():
+            collector.rejected[pmid] = "PMID must contain digits only."
+        elif pmid not in order:
+            order.append(pmid)
+    return order
+
+
+def _chunks(order: List[str], batch_size: int) -> List[List[str]]:
+    size = max(1, batch_size)
+    return [order[start : start + size] for start in range(0, len(order), size)]
+
+
+def fetch_verified_articles(
+    http: httpx.Client,
+    base_url: str,
+    pmids: Iterable[Any],
+    *,
+    fetch_one: SingleFetch,
+    fetch_if_missing: bool = True,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_concurrency: int = 8,
+) -> VerifiedArticleBatch:
+    """Fetch and verify ``pmids`` over a pooled sync client."""
+    collector = _BatchCollector(base_url, fetch_if_missing)
+    order = _prepare(pmids, collector)
+    for chunk in _chunks(order, batch_size):
+        url, params = collector.request(chunk)
+        try:
+            response: Optional[httpx.Response] = http.get(url, params=params)
+        except httpx.RequestError:
+            response = None
+        collector.absorb(response, chunk)
+
+    def attempt(pmid: str) -> Any:
+        try:
+            return fetch_one(pmid)
+        except Exception as exc:
+            return exc
+
+    if collector.retry:
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as pool:
+            for pmid, outcome in zip(collector.retry, pool.map(attempt, collector.retry)):
+                collector.settle(pmid, outcome)
+    return collector.result(order)
+
+
+async def afetch_verified_articles(
+    http: httpx.AsyncClient,
+    base_url: str,
+    pmids: Iterable[Any],
+    *,
+    fetch_one: AsyncSingleFetch,
+    fetch_if_missing: bool = True,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_concurrency: int = 8,
+) -> VerifiedArticleBatch:
+    """Fetch and verify ``pmids`` over a pooled async client."""
+    collector = _BatchCollector(base_url, fetch_if_missing)
+    order = _prepare(pmids, collector)
+    gate = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def bulk(chunk: List[str]) -> Optional[httpx.Response]:
+        url, params = collector.request(chunk)
+        async with gate:
+            try:
+                return await http.get(url, params=params)
+            except httpx.RequestError:
+                return None
+
+    chunks = _chunks(order, batch_size)
+    for chunk, response in zip(chunks, await asyncio.gather(*(bulk(c) for c in chunks))):
+        collector.absorb(response, chunk)
+
+    async def single(pmid: str) -> Any:
+        async with gate:
+            return await fetch_one(pmid)
+
+    retry = list(collector.retry)
+    outcomes = await asyncio.gather(*(single(pmid) for pmid in retry), return_exceptions=True)
+    for pmid, outcome in zip(retry, outcomes):
+        collector.settle(pmid, outcome)
+    return collector.result(order)
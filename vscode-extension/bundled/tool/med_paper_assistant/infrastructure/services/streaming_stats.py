@@ -0,0 +1,397 @@
+"""
+Streaming Statistics — Chunked analysis for data files larger than memory.
+
+The in-memory analysis paths load the whole file into one DataFrame.
+Streaming mode reads only the columns it needs, in chunks of
+``MEDPAPER_STREAMING_CHUNK_ROWS`` rows (default 200,000), and folds each chunk
+into mergeable accumulators:
+
+- ``Moments``: count, mean and sum of squared deviations per column, merged
+  with Chan et al.'s parallel form of Welford's update (numerically stable,
+  ddof=1 variance);
+- ``CoMoments``: the same for pairs of columns plus their co-moment, for
+  Pearson correlation;
+- exact ``(group, category)`` counts for contingency tables, capped at
+  ``MAX_CATEGORIES`` distinct values per column so memory stays bounded.
+
+Memory therefore grows with the number of groups and categories, not rows.
+
+Chunks must not infer their own dtypes (one ``unknown`` cell would turn ``0``
+into ``"0"`` mid-file): group and categorical columns are read as text and
+re-keyed after the pass (``text_labels``); numeric ones go through ``to_numeric``.
+
+``stream_describe`` reports count, mean, SD, min and max; Table 1 reuses the
+renderers in ``table_one``; t-test, ANOVA, chi-square, paired t-test and
+correlation use the statistics of their in-memory counterparts. Medians, quartiles and rank tests need every value at once and
+are not available in streaming mode.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from collections.abc import Collection, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from .table_one import (
+    TableOne,
+    count_rows,
+    mean_sd_rows,
+    table_footnotes,
+    table_header,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+logger = structlog.get_logger()
+
+DEFAULT_CHUNK_ROWS = 200_000
+CHUNK_ROWS_ENV = "MEDPAPER_STREAMING_CHUNK_ROWS"
+MAX_CATEGORIES = 10_000
+
+
+def resolve_chunk_rows(chunk_rows: int | None = None) -> int:
+    """Explicit value, else ``MEDPAPER_STREAMING_CHUNK_ROWS``, else the default."""
+    if chunk_rows is None:
+        try:
+            chunk_rows = int(os.environ.get(CHUNK_ROWS_ENV, DEFAULT_CHUNK_ROWS))
+        except ValueError:
+            chunk_rows = DEFAULT_CHUNK_ROWS
+    return max(1, chunk_rows)
+
+
+def read_columns(path: Path, sep: str = ",") -> list[str]:
+    """Column names from the header row only."""
+    import pandas as pd
+
+    return [str(c) for c in pd.read_csv(path, sep=sep, nrows=0).columns]
+
+
+def iter_chunks(
+    path: Path,
+    columns: Sequence[str],
+    sep: str = ",",
+    chunk_rows: int | None = None,
+    text_columns: Collection[str] = (),
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield ``columns`` of ``path`` in chunks of at most ``chunk_rows`` rows.
+
+    ``text_columns`` are read as strings (missing cells stay NaN), so their
+    values do not depend on which chunk they fall in.
+    """
+    import pandas as pd
+
+    missing = [c for c in columns if c not in read_columns(path, sep)]
+    if missing:
+        raise KeyError(missing[0])
+    with pd.read_csv(
+        path,
+        sep=sep,
+        usecols=list(dict.fromkeys(columns)),
+        chunksize=resolve_chunk_rows(chunk_rows),
+        dtype={c: str for c in text_columns},
+    ) as reader:
+        yield from reader
+
+
+def numeric_values(chunk: pd.DataFrame, cols: Sequence[str]) -> np.ndarray:
+    """(rows x cols) float array; cells that are not numbers become NaN."""
+    import numpy as np
+    import pandas as pd
+
+    if not cols:
+        return np.empty((len(chunk), 0))
+    return chunk[list(cols)].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+
+
+def text_labels(raw: Iterable[str], has_missing: bool) -> dict[str, Any]:
+    """
+    Map a column's distinct text values to the labels of a whole-file ``read_csv``.
+
+    All-numeric columns become ints (floats when any cell is missing), so
+    ``"1"`` and ``"1.0"`` share one key; anything else keeps its text.
+    """
+    import pandas as pd
+
+    keys = list(raw)
+    numeric = pd.to_numeric(pd.Series(keys, dtype=object), errors="coerce")
+    if not keys or numeric.isna().any():
+        return {key: key for key in keys}
+    if has_missing:
+        numeric = numeric.astype(float)
+    return dict(zip(keys, numeric.tolist()))
+
+
+@dataclass
+class Moments:
+    """Mergeable count / mean / M2 for a vector of columns."""
+
+    n: np.ndarray
+    mean: np.ndarray
+    m2: np.ndarray
+
+    @classmethod
+    def empty(cls, width: int) -> Moments:
+        import numpy as np
+
+        return cls(np.zeros(width), np.zeros(width), np.zeros(width))
+
+    @classmethod
+    def of(cls, values: np.ndarray) -> Moments:
+        """Moments of a (rows x columns) float array, ignoring NaN per column."""
+        import numpy as np
+
+        n = (~np.isnan(values)).sum(axis=0).astype(float)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(n > 0, np.nansum(values, axis=0) / np.maximum(n, 1), 0.0)
+            m2 = np.nansum((values - mean) ** 2, axis=0)
+        return cls(n, mean, m2)
+
+    def merge(self, other: Moments) -> None:
+        import numpy as np
+
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        with np.errstate(invalid="ignore", divide="ignore"):
+            share = np.where(n > 0, other.n / np.maximum(n, 1), 0.0)
+            self.m2 = self.m2 + other.m2 + delta**2 * self.n * share
+        self.mean = self.mean + delta * share
+        self.n = n
+
+    @property
+    def sd(self) -> np.ndarray:
+        import numpy as np
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.n > 1, np.sqrt(self.m2 / (self.n - 1)), np.nan)
+
+
+@dataclass
+class CoMoments:
+    """Mergeable moments of two columns over rows where both are present."""
+
+    n: float = 0.0
+    mean_x: float = 0.0
+    mean_y: float = 0.0
+    m2_x: float = 0.0
+    m2_y: float = 0.0
+    c_xy: float = 0.0
+
+    def add(self, x: np.ndarray, y: np.ndarray) -> None:
+        import numpy as np
+
+        both = ~(np.isnan(x) | np.isnan(y))
+        x, y = x[both], y[both]
+        n_b = float(len(x))
+        if not n_b:
+            return
+        mx, my = float(x.mean()), float(y.mean())
+        n = self.n + n_b
+        dx, dy = mx - self.mean_x, my - self.mean_y
+        share = self.n * n_b / n
+        self.m2_x += float(((x - mx) ** 2).sum()) + dx * dx * share
+        self.m2_y += float(((y - my) ** 2).sum()) + dy * dy * share
+        self.c_xy += float(((x - mx) * (y - my)).sum()) + dx * dy * share
+        self.mean_x += dx * n_b / n
+        self.mean_y += dy * n_b / n
+        self.n = n
+
+    def pearson(self) -> tuple[float, float]:
+        """Pearson r and its two-sided p-value (t distribution, n - 2 df)."""
+        from scipy import stats
+
+        if self.n < 3 or not self.m2_x or not self.m2_y:
+            return math.nan, math.nan
+        r = max(-1.0, min(1.0, self.c_xy / math.sqrt(self.m2_x * self.m2_y)))
+        if abs(r) == 1.0:
+            return r, 0.0
+        t = r * math.sqrt((self.n - 2) / (1 - r * r))
+        return r, float(2 * stats.t.sf(abs(t), self.n - 2))
+
+
+@dataclass
+class CategoryCounts:
+    """Exact counts of one column's categories, overall and per group."""
+
+    name: str
+    overall: dict[Any, int] = field(default_factory=dict)
+    by_group: dict[tuple[Any, Any], int] = field(default_factory=dict)
+    missing: int = 0
+
+    def add(self, values: pd.Series, groups: pd.Series) -> None:
+        self.missing += int(values.isna().sum())
+        for cat, count in values.value_counts().items():
+            self.overall[cat] = self.overall.get(cat, 0) + int(count)
+        pairs = values.groupby(groups, sort=False).value_counts()
+        for (group, cat), count in pairs.items():
+            self.by_group[(group, cat)] = self.by_group.get((group, cat), 0) + int(count)
+        if len(self.overall) > MAX_CATEGORIES:
+            raise ValueError(
+                f"'{self.name}' has more than {MAX_CATEGORIES} distinct values; "
+                "it is not categorical enough for streaming mode."
+            )
+
+    def relabel(self, group_labels: Mapping[Any, Any] | None = None) -> None:
+        """Re-key text categories (and groups) with ``text_labels``, summing merged keys."""
+        labels = text_labels(self.overall, self.missing > 0)
+        groups = group_labels or {}
+        overall: dict[Any, int] = {}
+        for cat, count in self.overall.items():
+            overall[labels[cat]] = overall.get(labels[cat], 0) + count
+        by_group: dict[tuple[Any, Any], int] = {}
+        for (group, cat), count in self.by_group.items():
+            key = (groups.get(group, group), labels[cat])
+            by_group[key] = by_group.get(key, 0) + count
+        self.overall, self.by_group = overall, by_group
+
+    def categories(self, with_group: bool = False) -> list[Any]:
+        """Categories sorted when comparable, as in the in-memory paths."""
+        seen = dict.fromkeys(c for _, c in self.by_group) if with_group else self.overall
+        return _sorted_if_comparable(seen)
+
+    def groups(self) -> list[Any]:
+        """Groups with at least one counted value, sorted when comparable."""
+        return _sorted_if_comparable(dict.fromkeys(g for g, _ in self.by_group))
+
+    def matrix(self, groups: Sequence[Any], categories: Sequence[Any]) -> np.ndarray:
+        import numpy as np
+
+        return np.array(
+            [[self.by_group.get((g, c), 0) for c in categories] for g in groups], dtype=int
+        )
+
+
+class GroupedMoments:
+    """Moments per group (first-seen order) and overall for a list of columns."""
+
+    def __init__(self, cols: Sequence[str]) -> None:
+        self.cols = list(cols)
+        self.overall = Moments.empty(len(self.cols))
+        self.groups: dict[Any, Moments] = {}
+        self.sizes: dict[Any, int] = {}
+        self.rows = 0
+
+    def add(self, chunk: pd.DataFrame, group_col: str) -> None:
+        import pandas as pd
+
+        self.rows += len(chunk)
+        values = numeric_values(chunk, self.cols)
+        self.overall.merge(Moments.of(values))
+        codes, uniques = pd.factorize(chunk[group_col])
+        for code, group in enumerate(uniques):
+            mask = codes == code
+            self.sizes[group] = self.sizes.get(group, 0) + int(mask.sum())
+            self.groups.setdefault(group, Moments.empty(len(self.cols))).merge(
+                Moments.of(values[mask])
+            )
+
+    def relabel(self) -> dict[Any, Any]:
+        """Re-key text groups with ``text_labels``, merging moments; returns the mapping."""
+        labels = text_labels(self.groups, self.rows > sum(self.sizes.values()))
+        groups: dict[Any, Moments] = {}
+        sizes: dict[Any, int] = {}
+        for raw, moments in self.groups.items():
+            key = labels[raw]
+            groups.setdefault(key, Moments.empty(len(self.cols))).merge(moments)
+            sizes[key] = sizes.get(key, 0) + self.sizes[raw]
+        self.groups, self.sizes = groups, sizes
+        return labels
+
+    def arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(groups x cols) n, mean and SD arrays."""
+        import numpy as np
+
+        moments = list(self.groups.values())
+        width = len(self.cols)
+        if not moments:
+            return np.zeros((0, width)), np.zeros((0, width)), np.zeros((0, width))
+        return (
+            np.vstack([m.n for m in moments]),
+            np.vstack([m.mean for m in moments]),
+            np.vstack([m.sd for m in moments]),
+        )
+
+
+def stream_describe(path: Path, sep: str = ",", chunk_rows: int | None = None) -> pd.DataFrame:
+    """count / mean / std / min / max (``describe()`` minus quartiles) of all-number columns."""
+    import numpy as np
+    import pandas as pd
+
+    cols = read_columns(path, sep)
+    numeric = np.ones(len(cols), dtype=bool)
+    moments = Moments.empty(len(cols))
+    low, high = np.full(len(cols), np.inf), np.full(len(cols), -np.inf)
+    for chunk in iter_chunks(path, cols, sep, chunk_rows, text_columns=cols):
+        values = numeric_values(chunk, cols)
+        numeric &= ~(np.isnan(values) & chunk[cols].notna().to_numpy()).any(axis=0)
+        moments.merge(Moments.of(values))
+        low = np.fmin(low, np.fmin.reduce(values, axis=0, initial=np.inf))
+        high = np.fmax(high, np.fmax.reduce(values, axis=0, initial=-np.inf))
+    seen = moments.n > 0
+    summary = np.vstack(
+        [moments.n, np.where(seen, moments.mean, np.nan), moments.sd]
+        + [np.where(seen, low, np.nan), np.where(seen, high, np.nan)]
+    )
+    return pd.DataFrame(
+        summary[:, numeric],
+        index=["count", "mean", "std", "min", "max"],
+        columns=[c for c, keep in zip(cols, numeric) if keep],
+    )
+
+
+def stream_table_one(
+    path: Path,
+    group_col: str,
+    continuous_cols: Sequence[str],
+    categorical_cols: Sequence[str],
+    sep: str = ",",
+    chunk_rows: int | None = None,
+) -> TableOne:
+    """Table 1 (mean ± SD, n (%)) from one chunked pass over ``path``."""
+    import numpy as np
+
+    available = set(read_columns(path, sep))
+    continuous = [c for c in continuous_cols if c in available]
+    categorical = [c for c in categorical_cols if c in available]
+    moments = GroupedMoments(continuous)
+    counts = [CategoryCounts(col) for col in categorical]
+
+    columns = [group_col, *continuous, *categorical]
+    for chunk in iter_chunks(path, columns, sep, chunk_rows, [group_col, *categorical]):
+        moments.add(chunk, group_col)
+        for counter in counts:
+            counter.add(chunk[counter.name], chunk[group_col])
+
+    group_labels = moments.relabel()
+    for counter in counts:
+        counter.relabel(group_labels)
+
+    groups = list(moments.groups)
+    sizes = [moments.sizes[g] for g in groups]
+    n, means, sds = moments.arrays()
+    rows = mean_sd_rows(continuous, n, means, sds, moments.overall.mean, moments.overall.sd)
+    for counter in counts:
+        categories = counter.categories()
+        overall = np.array([counter.overall[c] for c in categories], dtype=int)
+        matrix = counter.matrix(groups, categories)
+        rows.extend(count_rows(counter.name, categories, overall, matrix, sizes, moments.rows))
+    logger.info("streaming_stats.table_one", path=path.name, rows=moments.rows)
+    return TableOne(
+        header=table_header(moments.rows, groups, sizes),
+        rows=rows,
+        footnotes=table_footnotes(False),
+    )
+
+
+def _sorted_if_comparable(values: Iterable[Any]) -> list[Any]:
+    try:
+        return sorted(values)
+    except TypeError:  # mixed, unorderable values keep first-seen order
+        return list(values)
@@ -0,0 +1,145 @@
+"""
+Streaming Tests — Hypothesis tests from one chunked pass over a data file.
+
+``stream_statistical_test`` is the streaming counterpart of
+``Analyzer.run_statistical_test``: it folds chunks into the accumulators of
+``streaming_stats`` and returns the same report text. The statistics match
+the in-memory tests:
+
+- t-test / ANOVA: Student's t and one-way F from per-group n, mean and SD;
+- paired t-test: moments of the per-row differences;
+- chi-square: the exact contingency table;
+- correlation: Pearson r from pairwise-complete co-moments.
+
+Mann-Whitney U and Kruskal-Wallis rank all values at once and are refused.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from pathlib import Path
+
+from .streaming_stats import (
+    CategoryCounts,
+    CoMoments,
+    GroupedMoments,
+    Moments,
+    iter_chunks,
+    numeric_values,
+    text_labels,
+)
+from .table_one import parametric_tests
+
+STREAMING_TESTS = ("ttest", "paired_ttest", "anova", "chi2", "correlation")
+
+
+def stream_statistical_test(
+    path: Path,
+    test_type: str,
+    variables: Sequence[str],
+    group_var: str | None = None,
+    sep: str = ",",
+    chunk_rows: int | None = None,
+) -> str:
+    """Run a normalized ``test_type`` from one chunked pass; same report as in memory."""
+    if test_type not in STREAMING_TESTS:
+        return (
+            f"Error: '{test_type}' needs all values at once and is not available in "
+            f"streaming mode. Streaming tests: {', '.join(STREAMING_TESTS)}."
+        )
+    if test_type in ("ttest", "anova"):
+        return _grouped_test(path, test_type, variables[0], group_var, sep, chunk_rows)
+    if len(variables) < 2:
+        return f"Error: {test_type} requires two variables."
+    var1, var2 = variables[0], variables[1]
+    if test_type == "chi2":
+        counter = CategoryCounts(var2)
+        for chunk in iter_chunks(path, [var1, var2], sep, chunk_rows, [var1, var2]):
+            counter.add(chunk[var2], chunk[var1])
+        counter.relabel(text_labels(counter.groups(), has_missing=False))
+        return _chi2_report(var1, var2, counter)
+    if test_type == "paired_ttest":
+        diff = Moments.empty(1)
+        for chunk in iter_chunks(path, [var1, var2], sep, chunk_rows):
+            values = numeric_values(chunk, [var1, var2])
+            diff.merge(Moments.of((values[:, 0] - values[:, 1])[:, None]))
+        return _paired_report(var1, var2, diff)
+    pair = CoMoments()
+    for chunk in iter_chunks(path, [var1, var2], sep, chunk_rows):
+        values = numeric_values(chunk, [var1, var2])
+        pair.add(values[:, 0], values[:, 1])
+    corr, p_val = pair.pearson()
+    return (
+        f"### Correlation Results\n\nPearson correlation between {var1} and {var2}\n"
+        f"- Coefficient: {corr:.4f}\n- P-value: {p_val:.4f}"
+    )
+
+
+def _grouped_test(
+    path: Path,
+    test_type: str,
+    var: str,
+    group_var: str | None,
+    sep: str,
+    chunk_rows: int | None,
+) -> str:
+    if not group_var:
+        name = "t-test" if test_type == "ttest" else "ANOVA"
+        return f"Error: {name} requires a grouping variable (group_var)."
+    moments = GroupedMoments([var])
+    for chunk in iter_chunks(path, [group_var, var], sep, chunk_rows, [group_var]):
+        moments.add(chunk, group_var)
+    moments.relabel()
+    groups = list(moments.groups)
+    n, means, sds = moments.arrays()
+    if test_type == "ttest":
+        if len(groups) != 2:
+            return (
+                f"Error: t-test requires exactly 2 groups in {group_var}, "
+                f"found {len(groups)}: {groups}"
+            )
+        t_stat, p_val = (values[0] for values in parametric_tests(n, means, sds))
+        return (
+            f"### T-Test Results\n\nComparing {var} by {group_var} ({groups[0]} vs {groups[1]})\n"
+            f"- T-statistic: {t_stat:.4f}\n- P-value: {p_val:.4f}\n"
+            f"- Significant: {_significant(p_val)}"
+        )
+    f_stat, p_val = (values[0] for values in parametric_tests(n, means, sds))
+    return (
+        f"### ANOVA Results\n\nComparing {var} across groups in {group_var}\n"
+        f"- F-statistic: {f_stat:.4f}\n- P-value: {p_val:.4f}\n"
+        f"- Significant: {_significant(p_val)}"
+    )
+
+
+def _chi2_report(var1: str, var2: str, counter: CategoryCounts) -> str:
+    from scipy import stats
+
+    observed = counter.matrix(counter.groups(), counter.categories(with_group=True))
+    chi2, p_val, dof, _ = stats.chi2_contingency(observed)
+    return (
+        f"### Chi-Square Test Results\n\nAssociation between {var1} and {var2}\n"
+        f"- Chi-square: {chi2:.4f}\n- P-value: {p_val:.4f}\n- Degrees of freedom: {dof}\n"
+        f"- Significant: {_significant(p_val)}"
+    )
+
+
+def _paired_report(var1: str, var2: str, diff: Moments) -> str:
+    from scipy import stats
+
+    n, mean, sd = float(diff.n[0]), float(diff.mean[0]), float(diff.sd[0])
+    if n < 2 or not sd:
+        t_stat, p_val = math.nan, math.nan
+    else:
+        t_stat = mean / (sd / math.sqrt(n))
+        p_val = float(2 * stats.t.sf(abs(t_stat), n - 1))
+    return (
+        f"### Paired T-Test Results\n\nComparing {var1} vs {var2}\n"
+        f"- T-statistic: {t_stat:.4f}\n- P-value: {p_val:.4f}\n"
+        f"- Significant: {_significant(p_val)}"
+    )
+
+
+def _significant(p_val: float) -> str:
+    return "Yes" if p_val < 0.05 else "No"
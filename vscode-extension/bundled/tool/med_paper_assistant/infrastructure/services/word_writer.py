@@ -6,16 +6,24 @@ allowing the MCP Agent (AI) to specify exactly where content should be placed.
 The Agent makes decisions, this module executes them.
 """
 
+from __future__ import annotations
+
 import os
 import re
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
 import structlog
-from docx import Document
+
+if TYPE_CHECKING:
+    from docx import Document
+    from docx.oxml.text.paragraph import CT_P
 
 logger = structlog.get_logger()
 
+# Section numbering such as "1. " or "2 " in front of a heading
+_NUMBER_PREFIX = re.compile(r"^\d+\.?\s*")
+
 
 @dataclass
 class InsertInstruction:
@@ -27,6 +35,80 @@ class InsertInstruction:
     style: Optional[str] = None
 
 
+class SectionIndex:
+    """
+    Heading positions over a document's body paragraphs, built in one pass.
+
+    ``paragraphs`` holds the ``w:p`` elements that ``doc.paragraphs`` would
+    wrap, in order; ``headings`` holds ``(position, text)`` for every paragraph
+    whose style name contains "heading". Style names are resolved once per
+    style id instead of once per paragraph. ``insert`` and ``remove`` edit the
+    document and shift the positions in place, so a batch of instructions
+    reuses one index instead of rescanning the document for each lookup.
+    """
+
+    def __init__(self, doc: Document) -> None:
+        from docx.enum.style import WD_STYLE_TYPE
+
+        default = doc.styles.default(WD_STYLE_TYPE.PARAGRAPH)
+        self._default_is_heading = default is not None and _is_heading_style(default.name)
+        self._heading_styles = {
+            style.style_id: _is_heading_style(style.name)
+            for style in doc.styles
+            if style.type == WD_STYLE_TYPE.PARAGRAPH
+        }
+        self.paragraphs: List[CT_P] = list(doc.element.body.p_lst)
+        self.headings: List[Tuple[int, str]] = [
+            (i, p.text) for i, p in enumerate(self.paragraphs) if self.is_heading(p)
+        ]
+
+    def is_heading(self, paragraph: CT_P) -> bool:
+        style_id = paragraph.style
+        if style_id is None:
+            return self._default_is_heading
+        return self._heading_styles.get(style_id, self._default_is_heading)
+
+    def find(self, section_name: str) -> Tuple[int, int]:
+        """(header index, next header index or paragraph count) of the first matching section."""
+        section_lower = section_name.lower()
+        for k, (start_idx, title) in enumerate(self.headings):
+            # Normalize: remove numbers like "1. "
+            normalized = _NUMBER_PREFIX.sub("", title.lower()).strip()
+            if section_lower in normalized or normalized in section_lower:
+                end_idx = (
+                    self.headings[k + 1][0] if k + 1 < len(self.headings) else len(self.paragraphs)
+                )
+                return start_idx, end_idx
+        raise ValueError(f"Section '{section_name}' not found in document")
+
+    def remove(self, start: int, end: int) -> int:
+        """Delete paragraphs ``start:end`` from the document; returns how many."""
+        removed = self.paragraphs[start:end]
+        for element in removed:
+            element.getparent().remove(element)
+        del self.paragraphs[start:end]
+        self.headings = [
+            (pos - len(removed) if pos >= end else pos, title)
+            for pos, title in self.headings
+            if not start <= pos < end
+        ]
+        return len(removed)
+
+    def insert(self, position: int, elements: List[CT_P]) -> None:
+        """Record ``elements``, already placed in the document, at ``position``."""
+        self.paragraphs[position:position] = elements
+        shifted = [(pos + len(elements) if pos >= position else pos, t) for pos, t in self.headings]
+        added = [(position + i, p.text) for i, p in enumerate(elements) if self.is_heading(p)]
+        self.headings = sorted(shifted + added)
+
+    def word_count(self, start: int, end: int) -> int:
+        return sum(len(p.text.split()) for p in self.paragraphs[start:end])
+
+
+def _is_heading_style(name: Optional[str]) -> bool:
+    return "heading" in (name or "").lower()
+
+
 class WordWriter:
     """
     Executes content insertion into Word documents.
@@ -42,71 +124,46 @@ class WordWriter:
         """Load a template as a new document."""
         if not os.path.exists(template_path):
             raise FileNotFoundError(f"Template not found: {template_path}")
+        from docx import Document
+
         return Document(template_path)
 
     def create_blank_document(self) -> Document:
         """Create a new blank document."""
+        from docx import Document
+
         return Document()
 
-    def find_section_indices(self, doc: Document, section_name: str) -> Tuple[int, int]:
+    def find_section_indices(
+        self, doc: Document, section_name: str, index: Optional[SectionIndex] = None
+    ) -> Tuple[int, int]:
         """
         Find the start and end paragraph indices for a section.
 
         Args:
             doc: The Word document.
             section_name: Name of the section to find (case-insensitive, partial match).
+            index: Heading index to reuse (built from ``doc`` if omitted).
 
         Returns:
             Tuple of (start_index, end_index) where:
             - start_index is the header paragraph index
             - end_index is the index of the next header (or end of doc)
         """
-        section_lower = section_name.lower()
-        start_idx = None
-        end_idx = len(doc.paragraphs)
+        return (index or SectionIndex(doc)).find(section_name)
 
-        for i, para in enumerate(doc.paragraphs):
-            style_name = para.style.name.lower()
-            is_heading = "heading" in style_name
-
-            if is_heading:
-                text_lower = para.text.lower()
-                # Normalize: remove numbers like "1. "
-                text_normalized = re.sub(r"^\d+\.?\s*", "", text_lower).strip()
-
-                if start_idx is not None:
-                    # We've found our section, now looking for the next header
-                    end_idx = i
-                    break
-                elif section_lower in text_normalized or text_normalized in section_lower:
-                    start_idx = i
-
-        if start_idx is None:
-            raise ValueError(f"Section '{section_name}' not found in document")
-
-        return start_idx, end_idx
-
-    def clear_section_content(self, doc: Document, section_name: str) -> int:
+    def clear_section_content(
+        self, doc: Document, section_name: str, index: Optional[SectionIndex] = None
+    ) -> int:
         """
         Clear all content from a section (keeping the header).
 
         Returns:
             Number of paragraphs removed.
         """
-        start_idx, end_idx = self.find_section_indices(doc, section_name)
-
-        removed = 0
-        # Remove paragraphs from start_idx+1 to end_idx-1 (keep header and next header)
-        # We need to remove in reverse to avoid index shifting issues
-        paragraphs_to_remove = []
-        for i in range(start_idx + 1, end_idx):
-            paragraphs_to_remove.append(doc.paragraphs[i])
-
-        for para in paragraphs_to_remove:
-            para._element.getparent().remove(para._element)
-            removed += 1
-
-        return removed
+        index = index or SectionIndex(doc)
+        start_idx, end_idx = index.find(section_name)
+        return index.remove(start_idx + 1, end_idx)
 
     def insert_content_in_section(
         self,
@@ -114,46 +171,39 @@ class WordWriter:
         section_name: str,
         content_paragraphs: List[str],
         clear_existing: bool = True,
+        index: Optional[SectionIndex] = None,
     ) -> int:
         """
-        Insert content into a specific section.
+        Insert content at the end of a specific section.
 
         Args:
             doc: The Word document.
             section_name: Target section name.
             content_paragraphs: List of paragraph texts to insert.
             clear_existing: If True, clear existing content first.
+            index: Heading index to reuse and keep up to date (built if omitted).
 
         Returns:
             Number of paragraphs inserted.
         """
+        index = index or SectionIndex(doc)
         if clear_existing:
-            self.clear_section_content(doc, section_name)
-
-        # Re-find indices after clearing (indices may have shifted)
-        start_idx, end_idx = self.find_section_indices(doc, section_name)
-
-        # After clearing, the next section header (if any) is now at start_idx + 1
-        # We need to insert before it
-        inserted = 0
-        if start_idx + 1 < len(doc.paragraphs):
-            insert_before = doc.paragraphs[start_idx + 1]
-            # Insert in NORMAL order - insert_paragraph_before inserts directly
-            # before the target, preserving previous insertions
-            for para_text in content_paragraphs:
-                para_text = para_text.strip()
-                if para_text:
-                    insert_before.insert_paragraph_before(para_text)
-                    inserted += 1
-        else:
-            # Section is at end of document, just append
-            for para_text in content_paragraphs:
-                para_text = para_text.strip()
-                if para_text:
-                    doc.add_paragraph(para_text)
-                    inserted += 1
-
-        return inserted
+            self.clear_section_content(doc, section_name, index)
+
+        _, end_idx = index.find(section_name)
+        # Insert before the next header; a section at the end of the document is appended to
+        anchor = index.paragraphs[end_idx] if end_idx < len(index.paragraphs) else None
+        inserted = []
+        for para_text in content_paragraphs:
+            para_text = para_text.strip()
+            if para_text:
+                element = doc.add_paragraph(para_text)._element
+                if anchor is not None:
+                    anchor.addprevious(element)
+                inserted.append(element)
+
+        index.insert(end_idx, inserted)
+        return len(inserted)
 
     def execute_instructions(
         self, doc: Document, instructions: List[InsertInstruction]
@@ -172,6 +222,7 @@ class WordWriter:
             Dict mapping section names to number of paragraphs inserted.
         """
         results: Dict[str, Union[int, str]] = {}
+        index = SectionIndex(doc)
 
         for instr in instructions:
             try:
@@ -180,11 +231,11 @@ class WordWriter:
 
                 if instr.position == "replace":
                     count = self.insert_content_in_section(
-                        doc, instr.section_name, paragraphs, clear_existing=True
+                        doc, instr.section_name, paragraphs, clear_existing=True, index=index
                     )
                 elif instr.position == "append":
                     count = self.insert_content_in_section(
-                        doc, instr.section_name, paragraphs, clear_existing=False
+                        doc, instr.section_name, paragraphs, clear_existing=False, index=index
                     )
                 else:
                     count = 0
@@ -211,47 +262,26 @@ class WordWriter:
         """Extract all text from the document for verification."""
         return "\n".join([para.text for para in doc.paragraphs if para.text.strip()])
 
-    def count_words_in_section(self, doc: Document, section_name: str) -> int:
+    def count_words_in_section(
+        self, doc: Document, section_name: str, index: Optional[SectionIndex] = None
+    ) -> int:
         """Count words in a specific section."""
+        index = index or SectionIndex(doc)
         try:
-            start_idx, end_idx = self.find_section_indices(doc, section_name)
+            start_idx, end_idx = index.find(section_name)
         except ValueError:
             return 0
+        return index.word_count(start_idx + 1, end_idx)
 
-        word_count = 0
-        for i in range(start_idx + 1, end_idx):
-            text = doc.paragraphs[i].text
-            # Simple word count
-            words = [w for w in text.split() if w.strip()]
-            word_count += len(words)
-
-        return word_count
+    def get_all_word_counts(
+        self, doc: Document, index: Optional[SectionIndex] = None
+    ) -> Dict[str, int]:
+        """Get word counts for all sections (headings without text do not start one)."""
+        index = index or SectionIndex(doc)
+        bounds = [(pos, title) for pos, title in index.headings if title.strip()]
+        bounds.append((len(index.paragraphs), ""))
 
-    def get_all_word_counts(self, doc: Document) -> Dict[str, int]:
-        """Get word counts for all sections."""
         counts = {}
-        current_section = None
-        current_words = 0
-
-        for para in doc.paragraphs:
-            style_name = para.style.name.lower()
-            is_heading = "heading" in style_name
-
-            if is_heading and para.text.strip():
-                # Save previous section
-                if current_section:
-                    counts[current_section] = current_words
-
-                # Start new section
-                section_name = re.sub(r"^\d+\.?\s*", "", para.text.strip())
-                current_section = section_name
-                current_words = 0
-            elif current_section:
-                words = [w for w in para.text.split() if w.strip()]
-                current_words += len(words)
-
-        # Save last section
-        if current_section:
-            counts[current_section] = current_words
-
+        for (start_idx, title), (end_idx, _) in zip(bounds, bounds[1:]):
+            counts[_NUMBER_PREFIX.sub("", title.strip())] = index.word_count(start_idx + 1, end_idx)
         return counts
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import functools
 import inspect
 from collections.abc import Callable, Mapping
 from typing import Any
 
 from mcp.server import MCPServer
 
+from med_paper_assistant.infrastructure.persistence.post_write_queue import get_post_write_queue
+
+from .tool_executor import run_sync_handler
+
 
 def normalize_facade_action(action: str, aliases: Mapping[str, str] | None = None) -> str:
     """Normalize a facade action name and resolve aliases."""
@@ -23,13 +28,36 @@ def compact_kwargs(kwargs: dict[str, Any]) -> dict[str, Any]:
 
 
 async def invoke_tool_handler(handler: Callable[..., Any], **kwargs: Any) -> Any:
-    """Call a registered MCP tool helper whether it is sync or async."""
-    result = handler(**compact_kwargs(kwargs))
+    """Call a registered MCP tool helper whether it is sync or async.
+
+    Async handlers are awaited on the event loop; synchronous handlers run on
+    the tool worker pool (see ``tool_executor``) so blocking work does not
+    stall concurrent requests.
+    """
+    call_kwargs = compact_kwargs(kwargs)
+    if inspect.iscoroutinefunction(handler):
+        return await handler(**call_kwargs)
+    result = await run_sync_handler(handler, call_kwargs, project=call_kwargs.get("project"))
     if inspect.isawaitable(result):
         return await result
     return result
 
 
+async def invoke_flushed_tool_handler(handler: Callable[..., Any], **kwargs: Any) -> Any:
+    """``invoke_tool_handler`` after settling deferred post-write side effects.
+
+    Gates, quality checks and exports read the Foam graph and git history, so
+    pending refreshes and auto-commits from recent draft writes land first.
+    """
+
+    @functools.wraps(handler)
+    def flushed(**call_kwargs: Any) -> Any:
+        get_post_write_queue().flush()
+        return handler(**call_kwargs)
+
+    return await invoke_tool_handler(flushed, **kwargs)
+
+
 def get_optional_tool_decorator(
     mcp: MCPServer,
     *,
@@ -13,7 +13,7 @@ from typing import Any, Optional
 from mcp.server import MCPServer
 
 from med_paper_assistant.infrastructure.persistence.data_artifact_tracker import DataArtifactTracker
-from med_paper_assistant.infrastructure.services.analyzer import Analyzer
+from med_paper_assistant.infrastructure.services.analyzer import TABLE_SUFFIXES, Analyzer
 
 from .._shared import (
     ensure_project_context,
@@ -25,6 +25,43 @@ from .._shared import (
     resolve_project_context,
 )
 
+_TABLE_ONE_TIPS = (
+    "\n\n---\n"
+    "💡 **Next Steps:**\n"
+    "1. Copy this table to your Methods or Results section\n"
+    "2. Use `write_draft` to insert into your manuscript\n"
+    "3. Verify variable labels match your study protocol\n"
+)
+
+
+def _table_output_rel(output_name: Optional[str]) -> str | None:
+    """Project-relative path the analyzer saves ``output_name`` to (``.md`` by default)."""
+    if not output_name:
+        return None
+    suffix = Path(output_name).suffix.lower()
+    return f"results/tables/{output_name if suffix in TABLE_SUFFIXES else output_name + '.md'}"
+
+
+def _table_one_provenance(params: dict[str, Any]) -> str:
+    """Snippet that reproduces one ``Analyzer.generate_table_one`` call."""
+    cont_str = ", ".join(f"'{c}'" for c in params["continuous_cols"])
+    cat_str = ", ".join(f"'{c}'" for c in params["categorical_cols"])
+    out_arg = f", output_name='{params['output_name']}'" if params["output_name"] else ""
+    if params["nonnormal_cols"]:
+        out_arg += f", nonnormal_cols={params['nonnormal_cols']!r}"
+    out_arg += ", streaming=True" if params["streaming"] else ""
+    return (
+        f"from med_paper_assistant.infrastructure.services.analyzer import Analyzer\n"
+        f"analyzer = Analyzer()\n"
+        f"result = analyzer.generate_table_one(\n"
+        f"    filename='{params['filename']}',\n"
+        f"    group_col='{params['group_col']}',\n"
+        f"    continuous_cols=[{cont_str}],\n"
+        f"    categorical_cols=[{cat_str}]{out_arg},\n"
+        f")\n"
+        f"print(result)"
+    )
+
 
 def _get_tracker(project_info: dict) -> DataArtifactTracker | None:
     """Create a DataArtifactTracker for the current project, or None if no project."""
@@ -59,6 +96,8 @@ def register_table_one_tools(
         categorical_cols: str,
         output_name: Optional[str] = None,
         project: Optional[str] = None,
+        nonnormal_cols: str = "",
+        streaming: bool = False,
     ) -> str:
         """
         Generate Table 1 (baseline characteristics) with mean±SD, n(%), and p-values.
@@ -68,8 +107,10 @@ def register_table_one_tools(
             group_col: Grouping column name (e.g., "treatment")
             continuous_cols: Comma-separated continuous variables
             categorical_cols: Comma-separated categorical variables
-            output_name: Output filename (optional, saves to tables/)
+            output_name: Output filename (optional, saves to tables/; .md, .csv or .docx)
             project: Project slug (uses current if omitted)
+            nonnormal_cols: Comma-separated continuous variables to show as median [Q1, Q3]
+            streaming: Read the file in chunks (large files; mean ± SD and n (%) only)
         """
         log_tool_call(
             "generate_table_one",
@@ -100,6 +141,7 @@ def register_table_one_tools(
         # Parse column lists
         continuous_list = [c.strip() for c in continuous_cols.split(",") if c.strip()]
         categorical_list = [c.strip() for c in categorical_cols.split(",") if c.strip()]
+        nonnormal_list = [c.strip() for c in nonnormal_cols.split(",") if c.strip()]
 
         if not continuous_list and not categorical_list:
             return "❌ Please specify at least one continuous or categorical column."
@@ -112,6 +154,8 @@ def register_table_one_tools(
                 continuous_cols=continuous_list,
                 categorical_cols=categorical_list,
                 output_name=output_name,
+                nonnormal_cols=nonnormal_list,
+                streaming=streaming,
             )
 
             # Record provenance
@@ -123,16 +167,10 @@ def register_table_one_tools(
                     "continuous_cols": continuous_list,
                     "categorical_cols": categorical_list,
                     "output_name": output_name,
+                    "nonnormal_cols": nonnormal_list,
+                    "streaming": streaming,
                 }
-                # Compute output path if saved to file
-                output_rel = None
-                if output_name:
-                    oname = output_name if output_name.endswith(".md") else output_name + ".md"
-                    output_rel = f"results/tables/{oname}"
-
-                cont_str = ", ".join(f"'{c}'" for c in continuous_list)
-                cat_str = ", ".join(f"'{c}'" for c in categorical_list)
-                out_arg = f", output_name='{output_name}'" if output_name else ""
+                output_rel = _table_output_rel(output_name)
                 tracker.record_artifact(
                     tool_name="generate_table_one",
                     artifact_type="table",
@@ -140,28 +178,11 @@ def register_table_one_tools(
                     output_path=output_rel,
                     data_source=filename,
                     result_summary=result[:200] if result else None,
-                    provenance_code=(
-                        f"from med_paper_assistant.infrastructure.services.analyzer import Analyzer\n"
-                        f"analyzer = Analyzer()\n"
-                        f"result = analyzer.generate_table_one(\n"
-                        f"    filename='{filename}',\n"
-                        f"    group_col='{group_col}',\n"
-                        f"    continuous_cols=[{cont_str}],\n"
-                        f"    categorical_cols=[{cat_str}]{out_arg},\n"
-                        f")\n"
-                        f"print(result)"
-                    ),
+                    provenance_code=_table_one_provenance(params),
                 )
 
-            # Add usage tips
-            tips = "\n\n---\n"
-            tips += "💡 **Next Steps:**\n"
-            tips += "1. Copy this table to your Methods or Results section\n"
-            tips += "2. Use `write_draft` to insert into your manuscript\n"
-            tips += "3. Verify variable labels match your study protocol\n"
-
             log_tool_result("generate_table_one", "success", success=True)
-            return result + tips
+            return result + _TABLE_ONE_TIPS
 
         except FileNotFoundError as e:
             error_msg = f"❌ Data file not found: {e}\n\nMake sure '{filename}' exists in the data/ directory."
@@ -350,7 +371,7 @@ def register_table_one_tools(
 
             try:
                 if f.endswith(".csv"):
-                    df = pd.read_csv(filepath)
+                    df = _scoped_analyzer(analyzer, project_info).load_data(f)
                 else:
                     df = pd.read_excel(filepath)
                 output += f"| {f} | {len(df)} | {len(df.columns)} | {size_str} |\n"
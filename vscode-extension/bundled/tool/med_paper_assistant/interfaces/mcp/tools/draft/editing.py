@@ -22,7 +22,7 @@ from med_paper_assistant.domain.services.wikilink_validator import (
 from med_paper_assistant.infrastructure.persistence.draft_snapshot_manager import (
     DraftSnapshotManager,
 )
-from med_paper_assistant.infrastructure.persistence.git_auto_committer import GitAutoCommitter
+from med_paper_assistant.infrastructure.persistence.post_write_queue import queue_draft_side_effects
 from med_paper_assistant.infrastructure.services import Drafter
 from med_paper_assistant.infrastructure.services.drafter import normalize_draft_filename
 from med_paper_assistant.shared.path_guard import resolve_child_path
@@ -357,11 +357,11 @@ def register_editing_tools(
         # Auto-checkpoint writing session for compaction recovery
         auto_checkpoint_writing(os.path.basename(filepath), new_content, "patch")
 
-        # Auto-commit after successful write
+        # Auto-commit after successful write (deferred, coalesced per project)
         if drafts_dir:
-            project_root = os.path.dirname(drafts_dir)
-            git_committer = GitAutoCommitter(project_root)
-            git_committer.commit_draft(os.path.basename(filepath), reason="patch_draft")
+            queue_draft_side_effects(
+                os.path.dirname(drafts_dir), os.path.basename(filepath), "patch_draft"
+            )
 
         # 6. Build result report
         output = "✅ **Draft patched successfully**\n\n"
@@ -156,24 +156,15 @@ def _enforce_reference_sufficiency() -> tuple[bool, str]:
     paper_type = current_info.get("paper_type", "original-research")
 
     # Check journal-profile.yaml override first
+    from med_paper_assistant.infrastructure.persistence.journal_profile_cache import (
+        load_journal_profile,
+    )
+
     min_refs = None
-    jp_path = project_dir / "journal-profile.yaml"
-    if jp_path.is_file():
-        try:
-            import yaml
-
-            with open(jp_path, encoding="utf-8") as f:
-                profile = yaml.safe_load(f) or {}
-            paper_type_from_profile = profile.get("paper", {}).get("type")
-            if paper_type_from_profile:
-                paper_type = paper_type_from_profile
-            min_limits = profile.get("references", {}).get("minimum_reference_limits", {})
-            if isinstance(min_limits, dict):
-                val = min_limits.get(paper_type)
-                if val is not None:
-                    min_refs = int(val)
-        except Exception:  # nosec B110 - fallback to defaults below
-            pass
+    profile = load_journal_profile(project_dir)
+    if profile is not None:
+        paper_type = profile.declared_paper_type or paper_type
+        min_refs = profile.min_reference_limits.get(paper_type)
 
     if min_refs is None:
         min_refs = DEFAULT_MINIMUM_REFERENCES.get(paper_type, DEFAULT_MIN_REFERENCES)
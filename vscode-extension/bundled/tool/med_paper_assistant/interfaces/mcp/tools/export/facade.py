@@ -7,7 +7,7 @@ from typing import Any, Optional
 
 from mcp.server import MCPServer
 
-from .._shared import facade_schema_json, invoke_tool_handler, normalize_facade_action
+from .._shared import facade_schema_json, invoke_flushed_tool_handler, normalize_facade_action
 
 ToolMap = Mapping[str, Callable[..., Any]]
 
@@ -129,7 +129,7 @@ def register_export_facade_tools(
         if handler is None:
             return f"❌ Export facade misconfigured: missing handler '{handler_name}'"
 
-        return await invoke_tool_handler(handler, **kwargs)
+        return await invoke_flushed_tool_handler(handler, **kwargs)
 
     @mcp.tool()
     async def inspect_export(
@@ -223,7 +223,7 @@ def register_export_facade_tools(
         if handler is None:
             return f"❌ Export facade misconfigured: missing handler '{handler_name}'"
 
-        return await invoke_tool_handler(handler, **kwargs)
+        return await invoke_flushed_tool_handler(handler, **kwargs)
 
     return {
         "export_document": export_document,
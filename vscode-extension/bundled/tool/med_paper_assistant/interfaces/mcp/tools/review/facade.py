@@ -8,7 +8,7 @@ from typing import Any, Optional
 from mcp.server import MCPServer
 from mcp.server.mcpserver import Context
 
-from .._shared import facade_schema_json, invoke_tool_handler, normalize_facade_action
+from .._shared import facade_schema_json, invoke_flushed_tool_handler, normalize_facade_action
 
 ToolMap = Mapping[str, Callable[..., Any]]
 
@@ -294,7 +294,7 @@ def register_review_facade_tools(
         if handler is None:
             return f"❌ Review facade misconfigured: missing handler '{handler_name}'"
 
-        return await invoke_tool_handler(handler, **kwargs)
+        return await invoke_flushed_tool_handler(handler, **kwargs)
 
     @mcp.tool()
     async def pipeline_action(
@@ -565,7 +565,7 @@ def register_review_facade_tools(
         if handler is None:
             return f"❌ Pipeline facade misconfigured: missing handler '{handler_name}'"
 
-        return await invoke_tool_handler(handler, **kwargs)
+        return await invoke_flushed_tool_handler(handler, **kwargs)
 
     return {
         "run_quality_checks": run_quality_checks,